@@ -0,0 +1,69 @@
+"""FlowerStats.advance（閉形式の一括進行）の所要時間
+
+実行: python -m benchmarks.bench_advance（python benchmarks/bench_advance.py でも可）
+
+単体テストは時間ではなくループの回数で確かめ、実際の所要時間はここで測る。
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# スクリプトとして直接実行した時もリポジトリのルートから src を読めるようにする
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.game.data.config import config
+from src.game.entities.flower import FlowerStats
+
+REPEAT = 20
+DAY = 86_400.0
+
+
+def _advance_ms(seconds: float) -> float:
+    """advance(seconds) 1回あたり（ミリ秒、REPEAT 回の最小値）"""
+    best = float("inf")
+    for _ in range(REPEAT):
+        stats = FlowerStats(water_level=100.0, is_light_on=True)
+        start = time.perf_counter()
+        stats.advance(seconds)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def _ticks_ms(seconds: float) -> float:
+    """比較用: update(sim_tick) を積み上げた場合（ミリ秒）"""
+    tick = config.game.sim_tick
+    stats = FlowerStats(water_level=100.0, is_light_on=True)
+    start = time.perf_counter()
+    for _ in range(int(seconds / tick)):
+        stats.update(tick)
+    return (time.perf_counter() - start) * 1e3
+
+
+def _catch_up_ms(days: int) -> float:
+    """オフライン進行の上限（30日）相当: 枯れずに雑草/害虫が上限まで出る場合（ミリ秒）"""
+    game = config.game
+    saved = (game.water_decay_rate, game.weed_growth_chance, game.pest_growth_chance)
+    game.water_decay_rate = 0.0
+    game.weed_growth_chance = game.pest_growth_chance = 0.01
+    try:
+        return _advance_ms(days * DAY)
+    finally:
+        game.water_decay_rate, game.weed_growth_chance, game.pest_growth_chance = saved
+
+
+def main() -> None:
+    print("--- 1回あたり（ms）---")
+    ticked = _ticks_ms(DAY)
+    rows = [
+        ("update x ティック数（1日）", ticked),
+        ("advance（1日）", _advance_ms(DAY)),
+        ("advance（30日のオフライン進行）", _catch_up_ms(30)),
+    ]
+    for label, ms in rows:
+        print(f"{label:<30}{ms:10.3f}  (x{ticked / ms:.0f})")
+
+
+if __name__ == "__main__":
+    main()
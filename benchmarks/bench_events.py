@@ -0,0 +1,100 @@
+"""イベント発行のスループット計測（1秒あたりのイベント数）
+
+実行: python -m benchmarks.bench_events（python benchmarks/bench_events.py でも可）
+"""
+
+import sys
+import timeit
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# スクリプトとして直接実行した時もリポジトリのルートから src を読めるようにする
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.game.core.event_system import EventBus, EventType, GrowthChanged
+
+COUNT = 300_000
+
+# 比較用: 以前の EventType（メンバーをそのまま辞書のキーにして引く）
+_LegacyEventType = Enum("_LegacyEventType", [member.name for member in EventType])
+
+
+@dataclass
+class _LegacyEvent:
+    """比較用: 以前の Event（dataclass + data 辞書）"""
+
+    type: _LegacyEventType
+    data: Optional[Dict[str, Any]] = None
+
+    def __post_init__(self):
+        if self.data is None:
+            self.data = {}
+
+
+class _LegacyBus:
+    """比較用: 以前の EventBus（配信のたびに辞書を引き、グローバルは別ループ）"""
+
+    def __init__(self):
+        self._listeners = {}
+        self._global_listeners = []
+
+    def subscribe(self, event_type, callback):
+        self._listeners.setdefault(event_type, []).append(callback)
+
+    def emit(self, event):
+        if event.type in self._listeners:
+            for callback in self._listeners[event.type]:
+                try:
+                    callback(event)
+                except Exception:
+                    pass
+        for callback in self._global_listeners:
+            try:
+                callback(event)
+            except Exception:
+                pass
+
+    def emit_simple(self, event_type, **kwargs):
+        self.emit(_LegacyEvent(event_type, kwargs))
+
+
+def _handler(event) -> None:
+    pass
+
+
+def _events_per_second(stmt: str, bus, event_types=EventType) -> float:
+    names = {**globals(), "bus": bus, "EventType": event_types}
+    return COUNT / timeit.timeit(stmt, number=COUNT, globals=names)
+
+
+def main() -> None:
+    legacy = _LegacyBus()
+    typed = EventBus()
+    for bus, event_types in ((legacy, _LegacyEventType), (typed, EventType)):
+        bus.subscribe(event_types.NAV_RIGHT, _handler)
+        bus.subscribe(event_types.FLOWER_GROWTH_CHANGED, _handler)
+
+    growth_simple = (
+        "bus.emit_simple(EventType.FLOWER_GROWTH_CHANGED, old_stage='種', new_stage='芽')"
+    )
+    rows = [
+        ("旧 emit_simple(NAV_RIGHT)",
+         _events_per_second("bus.emit_simple(EventType.NAV_RIGHT)", legacy, _LegacyEventType)),
+        ("emit_simple(NAV_RIGHT)",
+         _events_per_second("bus.emit_simple(EventType.NAV_RIGHT)", typed)),
+        ("旧 emit_simple(GROWTH_CHANGED)",
+         _events_per_second(growth_simple, legacy, _LegacyEventType)),
+        ("emit_simple(GROWTH_CHANGED)", _events_per_second(growth_simple, typed)),
+        ("emit(GrowthChanged(...))",
+         _events_per_second("bus.emit(GrowthChanged('種', '芽'))", typed)),
+    ]
+    print("--- 1秒あたりの配信イベント数 ---")
+    for label, rate in rows:
+        print(f"{label:<36}{rate / 1e6:8.2f} M/s")
+
+
+if __name__ == "__main__":
+    main()
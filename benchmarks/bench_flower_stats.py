@@ -0,0 +1,88 @@
+"""FlowerStats のメモリ使用量とシリアライズ速度の計測
+
+実行: python -m benchmarks.bench_flower_stats（python benchmarks/bench_flower_stats.py でも可）
+"""
+
+import dataclasses
+import random
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+# スクリプトとして直接実行した時もリポジトリのルートから src を読めるようにする
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.game.entities.flower import FlowerStats
+from src.game.entities.flower_batch import FlowerBatch
+
+COUNT = 10_000
+FLOAT_FIELDS = ("age_seconds", "water_level", "light_level", "environment_level", "mental_level")
+
+# 比較用: __slots__ なしの同じフィールド構成
+PlainStats = dataclasses.make_dataclass(
+    "PlainStats",
+    [
+        (f.name, f.type, dataclasses.field(default=f.default))
+        for f in dataclasses.fields(FlowerStats)
+    ],
+)
+
+
+def _randomized(cls):
+    stats = cls()
+    for name in FLOAT_FIELDS:
+        setattr(stats, name, random.random() * 100)
+    return stats
+
+
+def _bytes_per_item(factory) -> float:
+    random.seed(0)
+    tracemalloc.start()
+    items = [factory() for _ in range(COUNT)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return current / COUNT
+
+
+def _batch_bytes_per_flower() -> float:
+    tracemalloc.start()
+    batch = FlowerBatch(COUNT)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del batch
+    return current / COUNT
+
+
+def main() -> None:
+    print("--- メモリ（1本あたり, bytes）---")
+    plain = _bytes_per_item(lambda: _randomized(PlainStats))
+    rows = [
+        ("dataclass（__slots__なし）", plain),
+        ("FlowerStats（__slots__）", _bytes_per_item(lambda: _randomized(FlowerStats))),
+        ("FlowerStats.tobytes()", _bytes_per_item(lambda: _randomized(FlowerStats).tobytes())),
+        ("FlowerBatch（SoA）", _batch_bytes_per_flower()),
+    ]
+    for label, size in rows:
+        print(f"{label:<28} {size:8.1f}  (x{plain / size:.2f})")
+
+    print("--- シリアライズ（1万回, 秒）---")
+    stats = _randomized(FlowerStats)
+    data = stats.to_dict()
+    raw = stats.tobytes()
+    timings = [
+        ("dataclasses.asdict", timeit.timeit(lambda: dataclasses.asdict(stats), number=COUNT)),
+        ("to_dict", timeit.timeit(stats.to_dict, number=COUNT)),
+        ("from_dict", timeit.timeit(lambda: FlowerStats.from_dict(data), number=COUNT)),
+        ("tobytes", timeit.timeit(stats.tobytes, number=COUNT)),
+        ("frombytes", timeit.timeit(lambda: FlowerStats.frombytes(raw), number=COUNT)),
+    ]
+    baseline = timings[0][1]
+    for label, seconds in timings:
+        print(f"{label:<28} {seconds:8.4f}  (x{baseline / seconds:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""乱数1個あたりのコスト計測（ティック処理の経路）
+
+実行: python -m benchmarks.bench_rng（python benchmarks/bench_rng.py でも可）
+
+ティック処理（FlowerStats.update）は花ごとのストリームから雑草・害虫の2個を
+draw_pair() でまとめて引く。以前（バッファなし）は1個ごとに Python のメソッドと
+NumPy のスカラー生成を通っていた。下の「ティック処理の乱数1個あたり」でその差を、
+「FlowerStats.update 1ティックあたり」で乱数以外も含めた全体を比べる。
+"""
+
+import random
+import sys
+import threading
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+# スクリプトとして直接実行した時もリポジトリのルートから src を読めるようにする
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.game.data.config import config
+from src.game.entities.flower import FlowerStats
+from src.game.utils.random_manager import RandomManager, get_rng, use_rng
+from src.game.utils.rng_streams import FlowerStreams
+
+COUNT = 1_000_000
+
+
+class _LegacyManager:
+    """比較用: 以前の RandomManager（random.Random のラッパー）"""
+
+    _instance = None
+
+    def __init__(self, seed=None):
+        self._rng = random.Random(seed)
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = _LegacyManager(0)
+        return cls._instance
+
+    def random(self):
+        return self._rng.random()
+
+
+class _LegacyStream:
+    """比較用: 以前の RngStream（1個ごとに NumPy のスカラーを生成）"""
+
+    __slots__ = ("_draws", "_generator")
+
+    def __init__(self, seed: int):
+        self._draws = 0
+        self._generator = np.random.Generator(np.random.Philox(seed))
+
+    def random(self) -> float:
+        self._draws += 1
+        return float(self._generator.random())
+
+
+class _LegacyStreams:
+    """比較用: 以前の FlowerStreams（draw_pair なし）"""
+
+    __slots__ = ("weeds", "pests")
+
+    def __init__(self):
+        self.weeds = _LegacyStream(0)
+        self.pests = _LegacyStream(1)
+
+    def draw_pair(self):
+        return self.weeds.random(), self.pests.random()
+
+
+_legacy_local = threading.local()
+
+
+def _legacy_get_rng():
+    override = getattr(_legacy_local, "rng", None)
+    return override if override is not None else _LegacyManager.get_instance()
+
+
+def _per_draw_ns(stmt, number: int = COUNT, **names) -> float:
+    """stmt（文字列）1回あたりの時間。lambda を挟まないよう文字列で計測する"""
+    return timeit.timeit(stmt, number=number, globals={**globals(), **names}) / number * 1e9
+
+
+def main() -> None:
+    get_rng().set_seed(0)
+    generator = np.random.Generator(np.random.PCG64(0))
+    stats = FlowerStats(rng_streams=FlowerStreams.for_flower(0))
+
+    print("--- 一様乱数1個あたり（ns）---")
+    rows = [
+        ("旧 get_rng().random()", _per_draw_ns("_legacy_get_rng().random()")),
+        ("numpy Generator.random()", _per_draw_ns("g.random()", g=generator)),
+        ("get_rng().random()（バッファ）", _per_draw_ns("get_rng().random()")),
+        ("花ごとのストリーム", _per_draw_ns("s.rng_streams.weeds.random()", s=stats)),
+        (
+            "random_array(4096)",
+            _per_draw_ns("get_rng().random_array(4096)", COUNT // 4096) / 4096,
+        ),
+    ]
+    baseline = rows[0][1]
+    for label, ns in rows:
+        print(f"{label:<32} {ns:8.1f}  (x{baseline / ns:.1f})")
+
+    # update の中で乱数を引く式そのもの（1ティックで雑草・害虫の2個）
+    print("--- ティック処理の乱数1個あたり（ns）---")
+    legacy = FlowerStats()
+    legacy.rng_streams = _LegacyStreams()
+    shared = FlowerStats()
+    with use_rng(_LegacyManager(0)):
+        shared_ns = _per_draw_ns(
+            "f._stream('weeds').random(); f._stream('pests').random()",
+            COUNT // 2, f=shared,
+        ) / 2
+    legacy_ns = _per_draw_ns(
+        "f._stream('weeds').random(); f._stream('pests').random()", COUNT // 2, f=legacy
+    ) / 2
+    pair_ns = _per_draw_ns("w, p = f.rng_streams.draw_pair()", COUNT // 2, f=stats) / 2
+    print(f"{'旧 共有の RandomManager':<32} {shared_ns:8.1f}")
+    print(f"{'旧 花ごとのストリーム':<32} {legacy_ns:8.1f}")
+    print(
+        f"{'draw_pair()':<32} {pair_ns:8.1f}  "
+        f"(x{legacy_ns / pair_ns:.1f}, 共有比 x{shared_ns / pair_ns:.1f})"
+    )
+
+    print("--- FlowerStats.update 1ティックあたり（ns）---")
+    saved = config.game.weed_growth_chance
+    config.game.weed_growth_chance = 1e-6  # 雑草が上限に達して抽選が止まらないように
+    try:
+        legacy = FlowerStats(is_light_on=True, water_level=100.0)
+        legacy.rng_streams = _LegacyStreams()
+        legacy_tick = _per_draw_ns("f.update(0.0)", COUNT // 10, f=legacy)
+        print(f"{'旧 花ごとのストリーム':<32} {legacy_tick:8.1f}")
+        flower = FlowerStats(
+            is_light_on=True, water_level=100.0, rng_streams=FlowerStreams.for_flower(0)
+        )
+        ns = _per_draw_ns("f.update(0.0)", COUNT // 10, f=flower)
+        print(f"{'花ごとのストリーム':<32} {ns:8.1f}  (x{legacy_tick / ns:.2f})")
+        print(f"乱数の割合（花ごとのストリーム）      {2 * pair_ns / ns:8.1%}")
+    finally:
+        config.game.weed_growth_chance = saved
+
+    # 同じシードからは同じ値（バッファの有無・まとめ引きによらない）
+    a, b = RandomManager(42), RandomManager(42)
+    assert list(a.random_array(3000)) == [b.random() for _ in range(3000)]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""セーブ1回あたりの時間（ファイルシステムのメタデータ操作を含む）
+
+実行: python -m benchmarks.bench_save [保存先ディレクトリ]（python benchmarks/bench_save.py でも可）
+（SDカードなど実機のストレージで計測する時はディレクトリを指定）
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# スクリプトとして直接実行した時もリポジトリのルートから src を読めるようにする
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.game.data.save_manager import SAVE_DATA_VERSION, SaveManager
+from src.game.entities.flower import FlowerStats
+from src.game.utils.rng_streams import FlowerStreams
+
+COUNT = 200
+
+
+def _legacy_save(path: Path, data, fsync: bool = False) -> None:
+    """比較用: 以前の SaveManager.save（リネーム → 書き込み → バックアップ削除）"""
+    backup = path.with_suffix(".backup")
+    if path.exists():
+        path.rename(backup)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"version": SAVE_DATA_VERSION, "timestamp": datetime.now().isoformat(), "data": data},
+            f,
+            ensure_ascii=False,
+            indent=2,
+        )
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    if backup.exists():
+        backup.unlink()
+
+
+def _per_save_ms(save, count: int = COUNT) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        save()
+    return (time.perf_counter() - start) / count * 1e3
+
+
+def main() -> None:
+    data = FlowerStats(rng_streams=FlowerStreams.for_flower(0)).to_dict()
+    with tempfile.TemporaryDirectory(dir=sys.argv[1] if len(sys.argv) > 1 else None) as tmp:
+        path = Path(tmp) / "state.sav"
+        rows = [
+            ("旧方式（メタデータ3回）", _per_save_ms(lambda: _legacy_save(path, data))),
+            ("旧方式 + fsync", _per_save_ms(lambda: _legacy_save(path, data, fsync=True))),
+        ]
+        for durability in ("none", "file", "dir"):
+            manager = SaveManager(str(path), durability)
+            rows.append(
+                (f"原子的セーブ durability={durability}", _per_save_ms(lambda: manager.save(data)))
+            )
+            # ジャーナルモード: 操作1件の追記（スナップショットの後に積む）
+            manager = SaveManager(str(path), durability, journal=True)
+            manager.save(data)
+            rows.append(
+                (
+                    f"ジャーナル追記 durability={durability}",
+                    _per_save_ms(lambda: manager.append_action("water", 0.0, 0.0)),
+                )
+            )
+
+        loads = []
+        for save_format in ("json", "binary"):
+            manager = SaveManager(str(path), "none", save_format)
+            manager.save(data)
+            manager.journal.delete()
+            loads.append(
+                (save_format, path.stat().st_size, _per_save_ms(manager.load, COUNT * 5))
+            )
+
+    print("--- セーブ1回あたり（ms）---")
+    for label, ms in rows:
+        print(f"{label:<36} {ms:8.3f}")
+    print("--- ロード1回あたり（ms）とファイルサイズ ---")
+    for save_format, size, ms in loads:
+        print(f"{save_format:<8} {size:6d} バイト {ms:8.3f}")
+
+
+if __name__ == "__main__":
+    main()
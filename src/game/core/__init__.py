@@ -1,8 +1,12 @@
 from .game_engine import GameEngine
-from .event_system import EventManager, EventType, Event, EventBus
+from .event_system import (
+    EventManager, EventType, Event, EventBus, TypedEvent, Signal, NavMoved, GrowthChanged,
+    make_event,
+)
 from .input_handler import InputHandler, InputAction, InputConfig
 
 __all__ = [
     'GameEngine', 'EventManager', 'EventType', 'Event', 'EventBus',
+    'TypedEvent', 'Signal', 'NavMoved', 'GrowthChanged', 'make_event',
     'InputHandler', 'InputAction', 'InputConfig'
 ]
@@ -0,0 +1,267 @@
+"""
+ローカル制御API（コンパニオンプロセス用）
+
+asyncio のサーバーを別スレッドで動かし、localhost のポートか Unix ソケットで
+1行1JSON（NDJSON）の要求を受け付ける。
+- {"op": "state"} → {"ok": true, "state": get_game_state() の内容}
+- {"op": "action", "type": "NAV_RIGHT", "data": {...}} → {"ok": true}
+  （type は CONTROL_ACTIONS の EventType 名。data は NAV_LEFT / NAV_RIGHT の count と
+  SEED_SELECTED の seed_type だけ）
+
+ゲームループ側は毎フレーム pump() を呼ぶだけで待たない。受け取ったアクションは
+deque でゲームスレッドに渡し、キー入力と同じ InputHandler.dispatch で処理する
+（SessionRecorder に記録され、再生で同じ結果になる）。状態は要求がある時だけ
+ゲームスレッドで作ってサーバー側へ返す。
+"""
+
+import asyncio
+import json
+import logging
+import os
+import stat
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+from .event_system import EventType
+from .input_handler import InputAction, SEED_ACTIONS
+
+logger = logging.getLogger(__name__)
+
+CONTROL_THREAD_NAME = "flower-control"
+
+# 外部から送れるイベント（入力に相当するものだけ）→ 同じ結果になる入力アクション
+CONTROL_ACTIONS: Dict[EventType, InputAction] = {
+    EventType.NAV_LEFT: InputAction.NAV_LEFT,
+    EventType.NAV_RIGHT: InputAction.NAV_RIGHT,
+    EventType.NAV_CONFIRM: InputAction.NAV_CONFIRM,
+    EventType.NAV_CANCEL: InputAction.NAV_CANCEL,
+    EventType.FLOWER_LIGHT_GIVEN: InputAction.LIGHT,
+    EventType.FERTILIZER_GIVEN: InputAction.FERTILIZER,
+    EventType.MENTAL_LIKE: InputAction.LIKE,
+    EventType.MENTAL_DISLIKE: InputAction.DISLIKE,
+    EventType.SEED_SELECTED: InputAction.SELECT_SEED,
+    EventType.GAME_RESET: InputAction.RESET,
+    EventType.TIME_TOGGLE_PAUSE: InputAction.TIME_TOGGLE_PAUSE,
+    EventType.TIME_SPEED_NORMAL: InputAction.TIME_SPEED_NORMAL,
+    EventType.TIME_SPEED_FAST: InputAction.TIME_SPEED_FAST,
+}
+
+# ゲームループが pump しない間（停止中など）に状態要求を待つ秒数
+STATE_TIMEOUT = 2.0
+# 1行の最大長（これを超える要求は切断）
+MAX_LINE_BYTES = 64 * 1024
+# 1回のアクションで動かせる回数（NAV_LEFT / NAV_RIGHT の count の上限）
+MAX_ACTION_COUNT = 16
+# ゲームスレッドに渡す前のアクションの上限（超えたら pump されるまで断る）
+MAX_PENDING_ACTIONS = 256
+
+
+def remove_stale_socket(path: str) -> None:
+    """前回の Unix ソケットの残りを消す（ソケット以外のファイルなら消さずに FileExistsError）"""
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(st.st_mode):
+        raise FileExistsError(f"制御ソケットのパスにソケット以外のファイルがあります: {path}")
+    os.unlink(path)
+
+
+class ControlServer:
+    """NDJSON の制御サーバー（asyncio、専用スレッドで動作）"""
+
+    def __init__(
+        self,
+        dispatch: Callable[[InputAction], bool],
+        state_provider: Callable[[], Dict[str, Any]],
+        host: str = "127.0.0.1",
+        port: int = 0,
+        path: Optional[str] = None,
+    ):
+        self.dispatch = dispatch  # InputHandler.dispatch
+        self.state_provider = state_provider
+        self.host = host
+        self.port = port
+        self.path = path  # 指定時は Unix ソケット
+        # サーバースレッド → ゲームスレッド（deque の append/popleft はスレッドセーフ）
+        # 要素は (入力アクション, 回数)
+        self._actions: Deque[Tuple[InputAction, int]] = deque()
+        self._state_requested = False
+        # 以下はサーバースレッド（イベントループ）だけが触る
+        self._state_waiters: List[asyncio.Future] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._error: Optional[BaseException] = None
+
+    @property
+    def address(self) -> Union[str, Tuple[str, int]]:
+        """待ち受けアドレス（Unix ソケットのパスか (host, port)）"""
+        return self.path if self.path else (self.host, self.port)
+
+    def start(self) -> None:
+        """サーバースレッドを起動し、待ち受けを開始するまで待つ"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name=CONTROL_THREAD_NAME, daemon=True
+        )
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            self._thread = None
+            raise self._error
+        logger.info(f"Control server listening on {self.address}")
+
+    def stop(self) -> None:
+        """サーバーを止める"""
+        if self._thread is None:
+            return
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def pump(self) -> int:
+        """ゲームスレッドで毎フレーム呼ぶ: アクションを処理し、状態要求に応える
+
+        処理した要求の数を返す。
+        """
+        posted = 0
+        actions = self._actions
+        while actions:
+            action, count = actions.popleft()
+            for _ in range(count):
+                self.dispatch(action)
+            posted += 1
+        if self._state_requested:
+            self._state_requested = False
+            state = self.state_provider()
+            loop = self._loop
+            if loop is not None and not loop.is_closed():
+                try:
+                    loop.call_soon_threadsafe(self._publish_state, state)
+                except RuntimeError:
+                    pass  # 停止処理中
+        return posted
+
+    # --- サーバースレッド ---
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+        try:
+            try:
+                self._server = loop.run_until_complete(self._listen())
+            except BaseException as e:
+                self._error = e
+                return
+            finally:
+                self._ready.set()
+            loop.run_forever()
+            self._server.close()
+            loop.run_until_complete(self._server.wait_closed())
+        finally:
+            for waiter in self._state_waiters:
+                waiter.cancel()
+            loop.close()
+            if self.path and self._server is not None:
+                try:
+                    remove_stale_socket(self.path)
+                except OSError as e:
+                    # 待ち受け中に別のファイルで置き換えられた（消さずに残す）
+                    logger.warning(f"Control socket not removed: {e}")
+
+    async def _listen(self) -> asyncio.AbstractServer:
+        if self.path:
+            remove_stale_socket(self.path)  # 前回の残り
+            return await asyncio.start_unix_server(
+                self._handle_client, path=self.path, limit=MAX_LINE_BYTES
+            )
+        server = await asyncio.start_server(
+            self._handle_client, self.host, self.port, limit=MAX_LINE_BYTES
+        )
+        self.port = server.sockets[0].getsockname()[1]
+        return server
+
+    def _publish_state(self, state: Dict[str, Any]) -> None:
+        waiters, self._state_waiters = self._state_waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(state)
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = await self._respond(line)
+                writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                await writer.drain()
+        except (ConnectionError, ValueError) as e:
+            # ValueError: 1行が MAX_LINE_BYTES を超えた
+            logger.debug(f"Control client disconnected: {e}")
+        finally:
+            writer.close()
+
+    async def _respond(self, line: bytes) -> Dict[str, Any]:
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return {"ok": False, "error": "invalid JSON"}
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "request must be an object"}
+
+        op = request.get("op")
+        if op == "state":
+            waiter = asyncio.get_running_loop().create_future()
+            self._state_waiters.append(waiter)
+            self._state_requested = True
+            try:
+                state = await asyncio.wait_for(waiter, STATE_TIMEOUT)
+            except asyncio.TimeoutError:
+                return {"ok": False, "error": "game loop is not running"}
+            return {"ok": True, "state": state}
+        if op == "action":
+            event_type = EventType.__members__.get(str(request.get("type")))
+            action = CONTROL_ACTIONS.get(event_type)
+            if action is None:
+                return {"ok": False, "error": f"unknown action: {request.get('type')}"}
+            data = request.get("data") or {}
+            if not isinstance(data, dict):
+                return {"ok": False, "error": "data must be an object"}
+            try:
+                action, count = self._parse_data(event_type, action, data)
+            except ValueError as e:
+                return {"ok": False, "error": f"invalid data: {e}"}
+            if len(self._actions) >= MAX_PENDING_ACTIONS:
+                return {"ok": False, "error": "too many pending actions"}
+            self._actions.append((action, count))
+            return {"ok": True}
+        return {"ok": False, "error": f"unknown op: {op}"}
+
+    @staticmethod
+    def _parse_data(
+        event_type: EventType, action: InputAction, data: Dict[str, Any]
+    ) -> Tuple[InputAction, int]:
+        """data を確かめ、(入力アクション, 回数) にする（不正なら ValueError）"""
+        data = dict(data)
+        count = 1
+        if event_type in (EventType.NAV_LEFT, EventType.NAV_RIGHT) and "count" in data:
+            count = data.pop("count")
+            if isinstance(count, bool) or not isinstance(count, int) or count < 1:
+                raise ValueError("count must be a positive integer")
+            count = min(count, MAX_ACTION_COUNT)
+        if event_type == EventType.SEED_SELECTED and data.get("seed_type") is not None:
+            seed_type = data.pop("seed_type")
+            if seed_type not in SEED_ACTIONS:
+                raise ValueError(f"unknown seed_type: {seed_type}")
+            action = SEED_ACTIONS[seed_type]
+        data.pop("seed_type", None)
+        if data:
+            raise ValueError(f"{event_type.name} takes no data: {sorted(data)}")
+        return action, count
@@ -1,8 +1,11 @@
-from typing import Dict, List, Callable, Any, Optional
+from typing import Dict, List, Callable, Any, Optional, Tuple
 from enum import Enum, auto
-from dataclasses import dataclass
+from functools import partial
+import logging
 from ..utils.helpers import Observable
 
+logger = logging.getLogger(__name__)
+
 class EventType(Enum):
     """イベントタイプの定義"""
     FLOWER_WATERED = auto()
@@ -30,38 +33,230 @@ class EventType(Enum):
     MENTAL_DISLIKE = auto()
     INVALID_ACTION = auto()
 
-@dataclass
+
 class Event:
-    """イベントデータクラス"""
-    type: EventType
-    data: Optional[Dict[str, Any]] = None
+    """イベントの基底クラス（型のないイベントは Event(type, data) で作る）
+
+    種類ごとの型付きイベント（GrowthChanged など）はサブクラスで、ペイロードを
+    __slots__ のフィールドに持つ。既存のハンドラー向けに data で辞書としても読める。
+    """
+
+    __slots__ = ("type", "_data")
+
+    def __init__(self, type: EventType, data: Optional[Dict[str, Any]] = None):
+        self.type = type
+        self._data = data
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        if self._data is None:
+            self._data = {}
+        return self._data
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, Event)
+            and self.type is other.type
+            and self.data == other.data
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.type.name}, {self.data})"
+
+
+class TypedEvent(Event):
+    """型付きイベントの基底
+
+    data は互換用で、None でないフィールドから毎回辞書を作る（新しいハンドラーは
+    フィールドを直接読む）。
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = cls._fields + tuple(cls.__dict__.get("__slots__", ()))
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        return {
+            name: value
+            for name in self._fields
+            if (value := getattr(self, name)) is not None
+        }
+
+
+class Signal(Event):
+    """ペイロードのないイベント（種類ごとに1つのインスタンスを共有）"""
+
+    __slots__ = ()
+    _instances: Dict[EventType, "Signal"] = {}
+
+    @classmethod
+    def of(cls, event_type: EventType) -> "Signal":
+        signal = cls._instances.get(event_type)
+        if signal is None:
+            signal = cls._instances[event_type] = cls(event_type)
+        return signal
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        return {}  # 共有インスタンスなので書き込みが残らないよう毎回新しい辞書
+
+
+class NavMoved(TypedEvent):
+    """NAV_LEFT / NAV_RIGHT（count: 合流した移動回数）"""
+
+    __slots__ = ("count",)
+
+    def __init__(self, type: EventType, count: int = 1):
+        self.type = type
+        self.count = count
+
+
+class GrowthChanged(TypedEvent):
+    """FLOWER_GROWTH_CHANGED（成長段階の値。offline: ロード時の留守中の成長）"""
+
+    __slots__ = ("old_stage", "new_stage", "offline")
+    type = EventType.FLOWER_GROWTH_CHANGED
+
+    def __init__(self, old_stage: str, new_stage: str, offline: bool = False):
+        self.old_stage = old_stage
+        self.new_stage = new_stage
+        self.offline = offline
+
+
+class SeedSelected(TypedEvent):
+    """SEED_SELECTED（seed_type: 種の値。None なら既定）"""
+
+    __slots__ = ("seed_type",)
+    type = EventType.SEED_SELECTED
+
+    def __init__(self, seed_type: Optional[str] = None):
+        self.seed_type = seed_type
+
+
+class InvalidAction(TypedEvent):
+    """INVALID_ACTION（表示するメッセージ）"""
+
+    __slots__ = ("message",)
+    type = EventType.INVALID_ACTION
+
+    def __init__(self, message: str = ""):
+        self.message = message
+
+
+class StatsChanged(TypedEvent):
+    """STATS_CHANGED（action: 変化の内容）"""
+
+    __slots__ = ("action",)
+    type = EventType.STATS_CHANGED
+
+    def __init__(self, action: Optional[str] = None):
+        self.action = action
+
+
+# 型付きイベントのクラス（ここにない種類はペイロードなしの Signal）
+EVENT_CLASSES: Dict[EventType, type] = {
+    EventType.NAV_LEFT: NavMoved,
+    EventType.NAV_RIGHT: NavMoved,
+    EventType.FLOWER_GROWTH_CHANGED: GrowthChanged,
+    EventType.SEED_SELECTED: SeedSelected,
+    EventType.INVALID_ACTION: InvalidAction,
+    EventType.STATS_CHANGED: StatsChanged,
+}
+
+
+# 配信のたびに引く表は EventType の値（_value_）をキーにする。Enum の __hash__ と
+# .value は Python で書かれていて、メンバーをそのままキーにすると辞書引きが約3倍遅い
+
+# 種類の値ごとのイベント生成関数（kwargs → イベント）
+_FACTORIES: Dict[int, Callable[..., Event]] = {
+    event_type._value_: partial(cls, event_type) if cls is NavMoved else cls
+    for event_type, cls in EVENT_CLASSES.items()
+}
+
+
+def make_event(event_type: EventType, **kwargs) -> Event:
+    """種類に対応する型付きイベントを作る
+
+    型付きイベントの未知のフィールドは TypeError。ペイロードのない種類に渡された
+    データは以前の Event(type, data) と同じく読まれないので、警告を出して捨て Signal を返す。
+    """
+    factory = _FACTORIES.get(event_type._value_)
+    if factory is not None:
+        return factory(**kwargs)
+    if kwargs:
+        logger.warning(f"{event_type.name} takes no data, ignored: {sorted(kwargs)}")
+    return Signal.of(event_type)
+
+
+# 合流ルール: (キュー末尾の同種イベント, 新しいイベント) → 合流後のイベント（None なら合流しない）
+CoalesceRule = Callable[[Event, Event], Optional[Event]]
+
+
+def coalesce_latest(pending: Event, event: Event) -> Event:
+    """新しい方だけを残す"""
+    return event
+
+
+def coalesce_count(pending: Event, event: Event) -> Event:
+    """1つにまとめ、回数（NavMoved.count）を足し込む"""
+    pending.count += event.count
+    return pending
 
-    def __post_init__(self):
-        if self.data is None:
-            self.data = {}
 
 class EventBus:
-    """イベントバスクラス"""
+    """イベントバスクラス
+
+    emit は常にその場で配信する。post はキューモード（queued=True）なら
+    キューに積み、drain で1フレームに1回まとめて配信する（キューモードでなければ
+    emit と同じ）。キューでは種類ごとに合流ルールと優先度を設定できる。
+    合流は直前に積まれたイベントが同じ種類の時だけ行うので、
+    別の種類のイベントをまたいで順序が入れ替わることはない。
+
+    emit_simple / post_simple は種類ごとの型付きイベントを作る。
+    """
     
-    def __init__(self):
+    def __init__(self, queued: bool = False):
         self._listeners: Dict[EventType, List[Callable[[Event], None]]] = {}
         self._global_listeners: List[Callable[[Event], None]] = []
+        # 配信用に種類ごとのリスナー（種類別→グローバルの順）を事前に組んだタプル
+        # 配信用の表は EventType の値がキー
+        self._dispatch_table: Dict[int, Tuple[Callable[[Event], None], ...]] = {}
+        self._global_dispatch: Tuple[Callable[[Event], None], ...] = ()
+        self.queued = queued
+        self._factories = _FACTORIES
+        self._queue: List[Event] = []
+        self._coalesce_rules: Dict[EventType, CoalesceRule] = {}
+        self._priorities: Dict[EventType, int] = {}
+
+    def _rebuild_dispatch_table(self) -> None:
+        self._global_dispatch = tuple(self._global_listeners)
+        self._dispatch_table = {
+            event_type._value_: tuple(listeners) + self._global_dispatch
+            for event_type, listeners in self._listeners.items()
+        }
     
     def subscribe(self, event_type: EventType, callback: Callable[[Event], None]) -> None:
         """特定のイベントタイプにサブスクライブ"""
         if event_type not in self._listeners:
             self._listeners[event_type] = []
         self._listeners[event_type].append(callback)
+        self._rebuild_dispatch_table()
     
     def subscribe_all(self, callback: Callable[[Event], None]) -> None:
         """すべてのイベントにサブスクライブ"""
         self._global_listeners.append(callback)
+        self._rebuild_dispatch_table()
     
     def unsubscribe(self, event_type: EventType, callback: Callable[[Event], None]) -> None:
         """サブスクリプションを解除"""
         if event_type in self._listeners:
             if callback in self._listeners[event_type]:
                 self._listeners[event_type].remove(callback)
+                self._rebuild_dispatch_table()
     
     def unsubscribe_all(self, callback: Callable[[Event], None]) -> None:
         """すべてのイベントからサブスクリプションを解除"""
@@ -70,38 +265,90 @@ class EventBus:
                 listeners.remove(callback)
         if callback in self._global_listeners:
             self._global_listeners.remove(callback)
+        self._rebuild_dispatch_table()
     
     def emit(self, event: Event) -> None:
-        """イベントを発行"""
-        # 特定のイベントタイプのリスナーに通知
-        if event.type in self._listeners:
-            for callback in self._listeners[event.type]:
-                try:
-                    callback(event)
-                except Exception as e:
-                    print(f"Event callback error in {event.type}: {e}")
-                    import traceback
-                    traceback.print_exc()
-        
-        # グローバルリスナーに通知
-        for callback in self._global_listeners:
+        """イベントを発行（その場で配信）"""
+        for callback in self._dispatch_table.get(event.type._value_, self._global_dispatch):
             try:
                 callback(event)
             except Exception as e:
-                print(f"Global event callback error: {e}")
+                print(f"Event callback error in {event.type}: {e}")
                 import traceback
                 traceback.print_exc()
     
     def emit_simple(self, event_type: EventType, **kwargs) -> None:
         """シンプルなイベント発行"""
-        event = Event(event_type, kwargs)
-        self.emit(event)
+        factory = self._factories.get(event_type._value_)
+        if factory is not None:
+            self.emit(factory(**kwargs))
+        else:
+            self.emit(make_event(event_type, **kwargs))
+
+    # --- キューモード ---
+    def set_coalescing(self, event_type: EventType, rule: Optional[CoalesceRule]) -> None:
+        """キュー内で連続した同種イベントの合流ルールを設定（None で解除）"""
+        if rule is None:
+            self._coalesce_rules.pop(event_type, None)
+        else:
+            self._coalesce_rules[event_type] = rule
+
+    def set_priority(self, event_type: EventType, priority: int) -> None:
+        """drain で配信する優先度（大きいほど先。同じ優先度は積んだ順）"""
+        if priority:
+            self._priorities[event_type] = priority
+        else:
+            self._priorities.pop(event_type, None)
+
+    def post(self, event: Event) -> None:
+        """キューモードならキューに積む（そうでなければ emit）"""
+        if not self.queued:
+            self.emit(event)
+            return
+        queue = self._queue
+        if queue and queue[-1].type is event.type:
+            rule = self._coalesce_rules.get(event.type)
+            if rule is not None:
+                pending = queue[-1]
+                merged = rule(pending, event)
+                if merged is not None:
+                    queue[-1] = merged
+                    return
+        queue.append(event)
+
+    def post_simple(self, event_type: EventType, **kwargs) -> None:
+        """シンプルなイベント投稿"""
+        factory = self._factories.get(event_type._value_)
+        if factory is not None:
+            self.post(factory(**kwargs))
+        else:
+            self.post(make_event(event_type, **kwargs))
+
+    @property
+    def pending_count(self) -> int:
+        """キューに積まれているイベント数"""
+        return len(self._queue)
+
+    def drain(self) -> int:
+        """キューのイベントを配信し、配信した数を返す
+
+        配信中に post されたイベントは次の drain で配信する（1フレームの処理量を一定にする）。
+        """
+        if not self._queue:
+            return 0
+        events, self._queue = self._queue, []
+        if self._priorities:
+            priorities = self._priorities
+            events.sort(key=lambda event: -priorities.get(event.type, 0))
+        for event in events:
+            self.emit(event)
+        return len(events)
 
 class EventManager:
     """イベントマネージャークラス"""
     
-    def __init__(self):
-        self.event_bus = EventBus()
+    def __init__(self, queued: bool = False):
+        self.event_bus = EventBus(queued=queued)
         self._observables: Dict[str, Observable] = {}
     
     def create_observable(self, name: str, initial_value: Any = None) -> Observable:
@@ -129,3 +376,15 @@ class EventManager:
     def emit_simple(self, event_type: EventType, **kwargs) -> None:
         """シンプルなイベント発行"""
         self.event_bus.emit_simple(event_type, **kwargs)
+
+    def post(self, event: Event) -> None:
+        """イベントを投稿（キューモードなら drain まで配信しない）"""
+        self.event_bus.post(event)
+
+    def post_simple(self, event_type: EventType, **kwargs) -> None:
+        """シンプルなイベント投稿（キューモードなら drain まで配信しない）"""
+        self.event_bus.post_simple(event_type, **kwargs)
+
+    def drain(self) -> int:
+        """キューに積まれたイベントを配信"""
+        return self.event_bus.drain()
@@ -1,44 +1,70 @@
+import time
 import pygame as pg
-from typing import Dict, Any, Optional
-from ..entities.flower import Flower
-from ..core.event_system import EventManager, EventType
-from ..core.input_handler import InputHandler
+from typing import Dict, Any, Iterable, Optional, Tuple
+from ..entities.flower import EVENT_GROWTH, WITHER_WATER_LEVEL, Flower, GrowthStage
+from ..entities.garden import Garden
+from ..core.event_system import EventManager, EventType, GrowthChanged, coalesce_count
+from ..core.control_server import ControlServer
+from ..core.input_handler import InputAction, InputHandler
+from ..core.save_scheduler import SaveScheduler
 from ..ui.display import DisplayManager
 from ..ui.renderer import RenderManager
 from ..data.config import config
+from ..simulation.forecast import Forecaster
 from ..utils.helpers import Timer
 from .screen_state import ScreenState
 from ..utils.random_manager import get_rng
 from ..ui.menu_system import MenuCursor, MenuItem
 
+# 時間スケールの循環順（_cycle_time_scale）
+TIME_SCALES = (1.0, 4.0, 16.0, 64.0, 1000.0, 0.25)
+
 
 class GameEngine:
     """ゲームエンジンクラス"""
 
-    def __init__(self):
+    def __init__(self, headless: bool = False):
         # システムの初期化
-        self.event_manager = EventManager()
-        self.input_handler = InputHandler(self.event_manager)
-        self.display_manager = DisplayManager()
+        # ヘッドレス: ウィンドウ・フォント・描画・フレーム制限なしで動かす
+        self.headless = headless
+        self.event_manager = EventManager(queued=config.game.queued_input_events)
+        self.input_handler = InputHandler(self.event_manager, headless=headless)
+        self.display_manager = None if headless else DisplayManager()
         self.render_manager = None  # 初期化時に作成
 
+        # ステータス画面の「もしも」予測
+        self.forecaster = Forecaster()
+
+        # ローカル制御API（start_control_server で起動）
+        self.control: Optional[ControlServer] = None
+
+        # セッション記録/再生（SessionRecorder / SessionReplayer）
+        self.session = None
+        self.tick_count = 0  # 実行したシミュレーションティック数
+
         # ゲーム状態
         self.flower = Flower()
+        self.garden: Optional[Garden] = None  # ガーデンモード（start_garden で作成）
         self.running = False
+        self._quit_done = False
         self.paused = False
         self.seed_selection_mode = True  # 互換用フラグ（今後廃止予定）
-        self.screen_state = ScreenState.TITLE
+        self._screen_state = ScreenState.TITLE
+        # 自動セーブ（間隔・成長/種の変化・終了時。種選択中はセーブしない）
+        self.save_scheduler = SaveScheduler(
+            self.flower, can_save=lambda: not self.seed_selection_mode
+        )
 
         # タイマー
         self.fps_timer = Timer(1.0 / config.display.fps, auto_reset=True)
-        self.auto_save_timer = Timer(config.data.auto_save_interval, auto_reset=True)
         self.time_scale = 1.0
         self.mode_return_timer = Timer(0.8, auto_reset=False)
         self.mode_active = False
         
-        # パフォーマンス最適化: 早送り時の描画更新抑制
-        self._render_skip_counter = 0
+        # 固定タイムステップ: 未消化のシミュレーション時間（次のフレームに持ち越す）
+        self._sim_accumulator = 0.0
         self._frame_time_history = []  # フレームタイム履歴（最大10フレーム）
+        self._last_render_key: Optional[Tuple[Any, ...]] = None  # 前回描画した内容
         self._max_frame_history = 10
 
         # 行為制約
@@ -60,6 +86,16 @@ class GameEngine:
         # イベントハンドラーの設定
         self._setup_event_handlers()
 
+    @property
+    def screen_state(self) -> ScreenState:
+        return self._screen_state
+
+    @screen_state.setter
+    def screen_state(self, value: ScreenState) -> None:
+        if value != self._screen_state and self.session:
+            self.session.on_screen(self.tick_count, value)
+        self._screen_state = value
+
     def _initialize_menu_cursors(self) -> None:
         """各画面のメニューカーソルを初期化"""
         from ..entities.flower import SeedType
@@ -223,10 +259,17 @@ class GameEngine:
         self.event_manager.subscribe(
             EventType.TIME_SPEED_FAST, self._on_time_speed_fast
         )
+        # キューモード: 連打したカーソル移動は1回の配信にまとめる
+        self.event_manager.event_bus.set_coalescing(EventType.NAV_LEFT, coalesce_count)
+        self.event_manager.event_bus.set_coalescing(EventType.NAV_RIGHT, coalesce_count)
 
     def initialize(self) -> bool:
         """ゲームエンジンを初期化"""
         try:
+            if self.headless:
+                get_rng().set_seed(config.data.random_seed)
+                self.running = True
+                return True
             pg.init()
             # フォントシステムを初期化
             pg.font.init()
@@ -243,38 +286,30 @@ class GameEngine:
             return False
 
     def run(self) -> None:
-        """ゲームループを実行"""
+        """ゲームループを実行（ESC やウィンドウを閉じて抜けたら quit で後始末する）"""
+        try:
+            self._run_loop()
+        finally:
+            self.quit()
+
+    def _run_loop(self) -> None:
         clock = pg.time.Clock()
 
         while self.running:
             frame_start_time = pg.time.get_ticks()
             dt = clock.tick(config.display.fps) / 1000.0
-            dt *= self.time_scale
 
             # イベント処理（カーソルシステムでは種選択も通常ナビゲーション）
             if not self.input_handler.handle_events(False):
                 self.running = False
                 break
+            if self.control:
+                self.control.pump()
+            self.event_manager.drain()
 
-            if not self.paused:
-                # ゲーム状態の更新
-                self.update(dt)
+            self.step_frame(dt)
+            self.render()
 
-            # パフォーマンス最適化: 早送り時の描画更新抑制
-            should_render = True
-            if self.time_scale > 1.0:
-                # 早送り時は描画更新頻度を下げる（time_scaleに応じて）
-                render_interval = max(1, int(self.time_scale))
-                self._render_skip_counter += 1
-                if self._render_skip_counter < render_interval:
-                    should_render = False
-                else:
-                    self._render_skip_counter = 0
-            
-            # レンダリング（早送り時はスキップする場合がある）
-            if should_render:
-                self.render()
-            
             # フレームタイム計測（早送り時のみ）
             if self.time_scale > 1.0:
                 frame_time = pg.time.get_ticks() - frame_start_time
@@ -282,10 +317,79 @@ class GameEngine:
                 if len(self._frame_time_history) > self._max_frame_history:
                     self._frame_time_history.pop(0)
 
+    def run_headless(
+        self,
+        ticks: int,
+        script: Iterable[Tuple[int, InputAction]] = (),
+    ) -> Dict[str, float]:
+        """ヘッドレスで最大速度で実行し、実行結果（ティック数・ティック/秒）を返す
+
+        1ループ = 1シミュレーションティック（config.game.sim_tick秒）。
+        script は (ティック, アクション) の列で、そのティックの先頭で入力される。
+        """
+        tick = config.game.sim_tick
+        pending = sorted(script, key=lambda entry: entry[0])
+        next_index = 0
+        executed = 0
+        start = time.perf_counter()
+
+        while self.running and executed < ticks:
+            while next_index < len(pending) and pending[next_index][0] <= executed:
+                self.input_handler.queue_action(pending[next_index][1])
+                next_index += 1
+            if not self.input_handler.handle_events(False):
+                self.running = False
+                break
+            if self.control:
+                self.control.pump()
+            self.event_manager.drain()
+            self.update(tick)
+            executed += 1
+
+        elapsed = time.perf_counter() - start
+        return {
+            "ticks": executed,
+            "sim_seconds": executed * tick,
+            "elapsed": elapsed,
+            "ticks_per_second": executed / elapsed if elapsed > 0 else float("inf"),
+        }
+
+    def step_frame(self, real_dt: float) -> int:
+        """1フレーム分進める（実時間dtを固定ティックに分割）。実行したティック数を返す"""
+        # 長い停止（ウィンドウ移動など）で一度に大量に進まないよう実時間を制限
+        real_dt = min(max(0.0, real_dt), config.game.max_frame_dt)
+        tick = config.game.sim_tick
+        ticks = 0
+
+        if not self.paused:
+            self._sim_accumulator += real_dt * self.time_scale
+            # 浮動小数の誤差でティック境界を取りこぼさないよう僅かに丸める
+            pending = int(self._sim_accumulator / tick + 1e-9)
+            # 上限を超えた分は閉形式で一括進行（フレーム時間が倍率に比例しない）
+            excess = pending - config.game.max_substeps_per_frame
+            if excess > 0:
+                self._fast_forward(excess * tick)
+                self._sim_accumulator -= excess * tick
+                pending -= excess
+            for _ in range(pending):
+                self._update_simulation(tick)
+                self._sim_accumulator -= tick
+                ticks += 1
+
+        self._update_interface(real_dt)
+        # このフレームの状態変更をまとめて通知（描画・セーブの要否判定に使う）
+        self.flower.tracker.commit()
+        return ticks
+
     def update(self, dt: float) -> None:
         """ゲーム状態を更新"""
-        # ゲームプレイ中は花を更新（メイン画面とモード画面の両方）
-        should_update_flower = (
+        self._update_simulation(dt)
+        self._update_interface(dt)
+        self.flower.tracker.commit()
+
+    def _is_flower_active(self) -> bool:
+        """ゲームプレイ中か（メイン画面とモード画面の両方）"""
+        return (
             self.screen_state in (
                 ScreenState.MAIN,
                 ScreenState.MODE_WATER,
@@ -294,42 +398,134 @@ class GameEngine:
             ) 
             and not self.paused
         )
-        
-        if should_update_flower:
+
+    def _update_simulation(self, dt: float) -> None:
+        """シミュレーション時間で進む状態を更新"""
+        if self._is_flower_active():
             # 成長段階の変化を検知するため、更新前の段階を保持
             previous_stage = self.flower.stats.growth_stage
             # 早送り/一時停止に応じた更新
             self.flower.update(dt)
             # 成長段階の変更イベントを発行
             if previous_stage != self.flower.stats.growth_stage:
-                self.event_manager.emit_simple(
-                    EventType.FLOWER_GROWTH_CHANGED,
-                    old_stage=previous_stage.value,
-                    new_stage=self.flower.stats.growth_stage.value,
+                self.event_manager.emit(
+                    GrowthChanged(previous_stage.value, self.flower.stats.growth_stage.value)
                 )
             # 枯死判定→自動遷移
             if not self.flower.is_alive:
                 self.event_manager.emit_simple(EventType.FLOWER_WITHERED)
 
+        if self.garden is not None and not self.paused:
+            self._update_garden(dt)
+
+        self._update_action_hour()
+        self.tick_count += 1
+
+    def _fast_forward(self, seconds: float) -> None:
+        """FlowerStats.advance で一括進行し、途中の成長/枯死をイベント通知"""
+        if self.session:
+            self.session.on_advance(self.tick_count, seconds)
+        # 成長のたびに止めて通知し、画面が変わったら（開花など）ティック進行と同じく以降は進めない
+        remaining = seconds
+        while remaining > 0 and self._is_flower_active():
+            events = self.flower.stats.advance(
+                remaining, stop_on_wither=True, stop_on_growth=True
+            )
+            last = events[-1] if events else None
+            if last is not None and last.kind == EVENT_GROWTH:
+                self.event_manager.emit(
+                    GrowthChanged(last.old_stage.value, last.new_stage.value)
+                )
+                remaining -= last.at
+                continue
+            if not self.flower.is_alive:
+                self.event_manager.emit_simple(EventType.FLOWER_WITHERED)
+            break
+        if self.garden is not None and not self.paused:
+            self._update_garden(seconds)
+
+        self._update_action_hour()
+
+    def _update_garden(self, dt: float) -> None:
+        """花壇をまとめて進め、開花/枯死を知らせる（イベントのない区画は触らない）"""
+        for index, event in self.garden.update(dt):
+            if event.kind == EVENT_GROWTH:
+                if event.new_stage == GrowthStage.FLOWER:
+                    self._emit_info(f"{index + 1}番の花が咲きました！")
+            else:
+                self._emit_info(f"{index + 1}番の花が枯れてしまった…")
+
+    def start_garden(self, size: int) -> None:
+        """ガーデンモードを開始（size 区画の花壇の一覧画面へ）"""
+        self.garden = Garden.with_size(size, seed=config.data.random_seed)
+        self._cursors[ScreenState.GARDEN] = MenuCursor(
+            [
+                MenuItem(f"plot{i}", f"{i + 1}", lambda i=i: self._tend_plot(i))
+                for i in range(size)
+            ]
+            + [MenuItem("back", "戻る", self._leave_garden)]
+        )
+        self.screen_state = ScreenState.GARDEN
+
+    def _leave_garden(self) -> None:
+        """花壇の一覧画面から戻る（種を選ぶ前ならタイトルへ）"""
+        self.screen_state = (
+            ScreenState.TITLE if self.seed_selection_mode else ScreenState.MAIN
+        )
+
+    def start_control_server(
+        self, port: Optional[int] = None, path: Optional[str] = None
+    ) -> ControlServer:
+        """ローカル制御API（localhost のポートか Unix ソケット）を起動"""
+        self.control = ControlServer(
+            self.input_handler.dispatch, self.get_game_state, port=port or 0, path=path
+        )
+        self.control.start()
+        return self.control
+
+    def _tend_plot(self, index: int) -> None:
+        """選択中の区画のお世話（枯れていれば植え直し→光ON→水やりの順）"""
+        stats = self.garden.sync(index)
+        if stats.water_level <= WITHER_WATER_LEVEL:
+            self.garden.replant(index)
+            self._emit_info(f"{index + 1}番に新しい種を植えました")
+        elif not stats.is_light_on:
+            self.garden.apply(index, lambda s: s.turn_light_on())
+            self._emit_info(f"{index + 1}番の光をONにしました")
+        elif stats.water_level < 90:
+            self.garden.apply(index, lambda s: s.water())
+            self._emit_info(f"{index + 1}番に水をあげました！")
+        else:
+            self._emit_info(f"{index + 1}番は元気です")
+
+    def _update_action_hour(self) -> None:
+        """行為制約: ゲーム内時間（時）を更新し、同一時内のカウンタ初期化"""
+        current_hour = int(self.flower.stats.age_seconds // 3600)
+        if current_hour != self._last_action_hour:
+            self._last_action_hour = current_hour
+            self._nutrition_actions_in_current_hour = 0
+            self._nutrition_remaining_cached = self._nutrition_action_limit
+
+    def _return_from_mode(self) -> None:
+        """モード画面からメイン画面へ自動復帰"""
+        if self.session:
+            self.session.on_mode_return(self.tick_count)
+        self.screen_state = ScreenState.MAIN
+        self.mode_active = False
+
+    def _update_interface(self, dt: float) -> None:
+        """実時間で進む状態（演出・メッセージ・自動セーブ）を更新"""
         # レンダラーを更新
         if self.render_manager:
             self.render_manager.update(dt)
 
         # 自動セーブ
-        if self.auto_save_timer.update(dt) and not self.seed_selection_mode:
-            self.flower.save()
+        self.save_scheduler.update(dt)
 
         # モード画面からの自動復帰
         if self.mode_active and self.mode_return_timer.update(dt):
-            self.screen_state = ScreenState.MAIN
-            self.mode_active = False
+            self._return_from_mode()
 
-        # 行為制約: ゲーム内時間（時）を更新し、同一時内のカウンタ初期化
-        current_hour = int(self.flower.stats.age_seconds // 3600)
-        if current_hour != self._last_action_hour:
-            self._last_action_hour = current_hour
-            self._nutrition_actions_in_current_hour = 0
-            self._nutrition_remaining_cached = self._nutrition_action_limit
         # 無効操作メッセージの寿命
         if self._invalid_message_timer > 0.0:
             self._invalid_message_timer = max(0.0, self._invalid_message_timer - dt)
@@ -344,12 +540,26 @@ class GameEngine:
         """ゲームをレンダリング"""
         # 論理サーフェスを取得
         if self.render_manager:
+            # 表示に関わる値が前回の描画から変わっていなければ描き直さない
+            render_key = self._render_key()
+            if render_key is not None and render_key == self._last_render_key:
+                return
+            self._last_render_key = render_key
             logical_surface = self.display_manager.get_logical_surface()
 
             # ゲーム状態を準備
             cursor = self.get_current_cursor()
             # get_game_state()を使用（ステータス画面用の辞書データ含む）
             game_state_dict = self.get_game_state()
+            # ステータス画面では「もしも」予測をバックグラウンドで計算（待たない）
+            forecasts = None
+            if self.screen_state == ScreenState.STATUS:
+                self.forecaster.submit(self.flower.stats)
+                forecasts = self.forecaster.latest(self.flower.stats)
+            # 花壇の一覧は表示する時だけ現在時刻の状態を求める
+            garden = None
+            if self.screen_state == ScreenState.GARDEN and self.garden is not None:
+                garden = [self.garden.view(i) for i in range(len(self.garden))]
             # レンダリング用のゲーム状態（FlowerStatsオブジェクトも含む）
             game_state = {
                 "flower_stats": self.flower.stats,  # FlowerStatsオブジェクト（game_play用）
@@ -363,6 +573,8 @@ class GameEngine:
                 "invalid_message": game_state_dict["invalid_message"],
                 "screen_state": self.screen_state.name,
                 "time_scale": self.time_scale,
+                "forecasts": forecasts,
+                "garden": garden,
                 "nutrition_remaining": self._nutrition_remaining_cached,
                 "nutrition_limit": self._nutrition_action_limit,
                 "cursor": cursor,
@@ -376,6 +588,25 @@ class GameEngine:
             # ディスプレイに表示
             self.display_manager.render()
 
+    def _render_key(self) -> Optional[Tuple[Any, ...]]:
+        """描画内容を決める値の組（毎フレーム描き直す画面ではNone）"""
+        if self.screen_state in (ScreenState.STATUS, ScreenState.GARDEN):
+            return None  # 予測・花壇はフレームごとに変わる
+        if self.render_manager.is_animated(self.screen_state.name, self.flower.stats):
+            return None
+        cursor = self.get_current_cursor()
+        return (
+            self.screen_state,
+            self.flower.tracker.group_version("visible"),
+            cursor.index if cursor else 0,
+            tuple((item.label, item.enabled) for item in cursor.items) if cursor else (),
+            self._info_message,
+            self._invalid_message,
+            self.paused,
+            self.time_scale,
+            self._nutrition_remaining_cached,
+        )
+
     def pause(self) -> None:
         """ゲームを一時停止"""
         self.paused = True
@@ -385,11 +616,19 @@ class GameEngine:
         self.paused = False
 
     def quit(self) -> None:
-        """ゲームを終了"""
+        """ゲームを終了（2回目以降は何もしない）"""
         self.running = False
-        if not self.seed_selection_mode:
-            self.flower.save()
-        pg.quit()
+        if self._quit_done:
+            return
+        self._quit_done = True
+        self.forecaster.stop()
+        if self.control:
+            self.control.stop()
+        self.save_scheduler.request("quit")
+        # 書き込み待ちのセーブを書き終えてから終了する
+        self.flower.close()
+        if not self.headless:
+            pg.quit()
 
     def reset_game(self) -> None:
         """ゲームをリセット"""
@@ -450,17 +689,17 @@ class GameEngine:
             self._emit_invalid("栄養行為は同一時間内で3回まで")
             return
         if self.screen_state in (ScreenState.MAIN, ScreenState.MODE_WATER):
-            self.flower.stats.fertilize()
+            self.flower.fertilize()
             self.screen_state = ScreenState.MODE_WATER
             self.mode_return_timer.reset()
             self.mode_active = True
             self._on_nutrition_action()
 
     def _on_mental_like(self, event) -> None:
-        self.flower.stats.adjust_mental(+5)
+        self.flower.adjust_mental(+5)
 
     def _on_mental_dislike(self, event) -> None:
-        self.flower.stats.adjust_mental(-5)
+        self.flower.adjust_mental(-5)
 
     def _on_invalid_action(self, event) -> None:
         msg = event.data.get("message", "") if event and event.data else ""
@@ -536,16 +775,18 @@ class GameEngine:
 
     # --- 画面ナビゲーション ---
     def _on_nav_left(self, event) -> None:
-        """ナビゲーション左ボタン（カーソルを前へ移動）"""
+        """ナビゲーション左ボタン（カーソルを前へ移動。合流した分だけ動かす）"""
         cursor = self._cursors.get(self.screen_state)
         if cursor:
-            cursor.move_prev()
+            for _ in range(getattr(event, "count", 1)):
+                cursor.move_prev()
 
     def _on_nav_right(self, event) -> None:
-        """ナビゲーション右ボタン（カーソルを次へ移動）"""
+        """ナビゲーション右ボタン（カーソルを次へ移動。合流した分だけ動かす）"""
         cursor = self._cursors.get(self.screen_state)
         if cursor:
-            cursor.move_next()
+            for _ in range(getattr(event, "count", 1)):
+                cursor.move_next()
 
     def _on_nav_confirm(self, event) -> None:
         """ナビゲーション決定ボタン（カーソルで選択中の項目を実行）"""
@@ -593,6 +834,9 @@ class GameEngine:
         self.screen_state = ScreenState.MAIN
 
     def _on_nav_cancel(self, event) -> None:
+        if self.screen_state == ScreenState.GARDEN:
+            self._leave_garden()
+            return
         if self.screen_state in (
             ScreenState.SEED_SELECTION,
             ScreenState.TIME_SETTING,
@@ -629,11 +873,10 @@ class GameEngine:
 
     def _cycle_time_scale(self) -> None:
         """時間スケールを循環変更"""
-        if self.time_scale == 1.0:
-            self.time_scale = 4.0
-        elif self.time_scale == 4.0:
-            self.time_scale = 0.25
-        else:
+        try:
+            index = TIME_SCALES.index(self.time_scale)
+            self.time_scale = TIME_SCALES[(index + 1) % len(TIME_SCALES)]
+        except ValueError:
             self.time_scale = 1.0
         self._emit_info(f"時間スケール: x{self.time_scale:g}")
 
@@ -658,6 +901,8 @@ class GameEngine:
         
         # セーブデータをロード（Flower._load_state()を使用）
         self.flower._load_state()
+        if self.session:
+            self.session.on_load(self.tick_count, self.flower.stats)
         
         # ロードが成功したかチェック（statsが初期値でないことを確認）
         if self.flower.stats.age_seconds > 0 or self.flower.stats.growth_stage.value != "種":
@@ -665,13 +910,29 @@ class GameEngine:
             self.screen_state = ScreenState.MAIN
             self.seed_selection_mode = False
             print("セーブデータからゲームを開始しました。")
+            self._report_offline_progress()
         else:
             self._emit_info("セーブデータの読み込みに失敗しました", duration=2.0)
         # 画面遷移時にカーソルをリセット
-        cursor = self._cursors.get(target_screen)
+        cursor = self._cursors.get(self.screen_state)
         if cursor:
             cursor.reset()
 
+    def _report_offline_progress(self) -> None:
+        """オフライン進行中のイベントを通常の成長/枯死イベントとして通知"""
+        report = self.flower.offline_report
+        if report is None:
+            return
+        for growth in report.growth_events:
+            self.event_manager.emit(
+                GrowthChanged(growth.old_stage.value, growth.new_stage.value, offline=True)
+            )
+        if report.withered or not self.flower.is_alive:
+            self.event_manager.emit_simple(EventType.FLOWER_WITHERED)
+        elif report.elapsed_seconds >= 60:
+            hours, rem = divmod(int(report.elapsed_seconds), 3600)
+            self._emit_info(f"留守中に{hours}時間{rem // 60}分経過しました", duration=3.0)
+
     def _reset_game_confirm(self) -> None:
         """ゲームリセットを実行"""
         self.event_manager.emit_simple(EventType.GAME_RESET)
@@ -702,7 +963,7 @@ class GameEngine:
         if self.flower.stats.water_level >= 90:
             self._emit_info("もう十分栄養があります")
         else:
-            self.flower.stats.fertilize()
+            self.flower.fertilize()
             self._on_nutrition_action()
             self._emit_info("肥料をあげました！")
 
@@ -733,7 +994,7 @@ class GameEngine:
     def _select_flower_language_like(self) -> None:
         """花言葉選択：好き"""
         self.event_manager.emit_simple(EventType.MENTAL_LIKE)
-        self.flower.stats.adjust_mental(5.0)
+        self.flower.adjust_mental(5.0)
         self.screen_state = ScreenState.MAIN
         # エンディングテキストを表示
         self._show_ending_text()
@@ -741,7 +1002,7 @@ class GameEngine:
     def _select_flower_language_dislike(self) -> None:
         """花言葉選択：嫌い"""
         self.event_manager.emit_simple(EventType.MENTAL_DISLIKE)
-        self.flower.stats.adjust_mental(-5.0)
+        self.flower.adjust_mental(-5.0)
         self.screen_state = ScreenState.MAIN
         # エンディングテキストを表示
         self._show_ending_text()
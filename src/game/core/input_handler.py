@@ -1,5 +1,6 @@
 import pygame as pg
-from typing import Dict, Callable, Optional
+from collections import deque
+from typing import Deque, Dict, Callable, List, Optional, Tuple
 from enum import Enum, auto
 from ..core.event_system import EventManager, EventType
 from ..core.button_config import (
@@ -32,13 +33,27 @@ class InputAction(Enum):
     FERTILIZER = auto()
     LIKE = auto()
     DISLIKE = auto()
+    SELECT_SEED_YIN = auto()
+    SELECT_SEED_YANG = auto()
+
+
+# 種を指定して選ぶアクション（SeedType の値 → アクション）
+SEED_ACTIONS: Dict[str, "InputAction"] = {
+    "陰": InputAction.SELECT_SEED_YIN,
+    "陽": InputAction.SELECT_SEED_YANG,
+}
 
 
 class InputHandler:
     """入力処理クラス"""
 
-    def __init__(self, event_manager: EventManager):
+    def __init__(self, event_manager: EventManager, headless: bool = False):
         self.event_manager = event_manager
+        # ヘッドレス時はpygameのイベントを読まず、キューに積まれたアクションのみ処理
+        self.headless = headless
+        self._scripted_actions: Deque[InputAction] = deque()
+        # 処理する直前に呼ばれるフック（セッション記録用）
+        self.action_listener: Optional[Callable[[InputAction], None]] = None
         self.key_bindings: Dict[int, InputAction] = {
             pg.K_ESCAPE: InputAction.QUIT,
             PRIMARY_BUTTONS.left: InputAction.NAV_LEFT,
@@ -91,6 +106,8 @@ class InputHandler:
             InputAction.FERTILIZER: self._handle_fertilizer,
             InputAction.LIKE: self._handle_like,
             InputAction.DISLIKE: self._handle_dislike,
+            InputAction.SELECT_SEED_YIN: lambda: self._handle_select_seed("陰"),
+            InputAction.SELECT_SEED_YANG: lambda: self._handle_select_seed("陽"),
         }
 
     def set_key_binding(self, key: int, action: InputAction) -> None:
@@ -101,8 +118,33 @@ class InputHandler:
         """アクションハンドラーを設定"""
         self.action_handlers[action] = handler
 
+    def queue_action(self, action: InputAction) -> None:
+        """スクリプト入力: 次の handle_events で処理するアクションを積む"""
+        self._scripted_actions.append(action)
+
+    def _handle_scripted_actions(self) -> bool:
+        """積まれたアクションを順に処理"""
+        while self._scripted_actions:
+            if not self.dispatch(self._scripted_actions.popleft()):
+                return False
+        return True
+
+    def dispatch(self, action: InputAction) -> bool:
+        """アクションを実行し、ゲームを続行するかどうかを返す"""
+        handler = self.action_handlers.get(action)
+        if handler is None:
+            return True
+        if self.action_listener:
+            self.action_listener(action)
+        return handler()
+
     def handle_events(self, seed_selection_mode: bool = False) -> bool:
         """イベントを処理し、ゲームを続行するかどうかを返す"""
+        if not self._handle_scripted_actions():
+            return False
+        if self.headless:
+            return True
+
         for event in pg.event.get():
             if event.type == pg.QUIT:
                 return False
@@ -120,10 +162,7 @@ class InputHandler:
     def _handle_keydown(self, key: int) -> bool:
         """キー押下イベントを処理"""
         if key in self.key_bindings:
-            action = self.key_bindings[key]
-            if action in self.action_handlers:
-                handler = self.action_handlers[action]
-                return handler()
+            return self.dispatch(self.key_bindings[key])
         return True
 
     def _handle_seed_selection(self, key: int) -> bool:
@@ -132,58 +171,59 @@ class InputHandler:
             return False
         elif key in self.seed_selection_bindings:
             seed_type = self.seed_selection_bindings[key]
-            self.event_manager.emit_simple(EventType.SEED_SELECTED, seed_type=seed_type)
+            self.event_manager.post_simple(EventType.SEED_SELECTED, seed_type=seed_type)
             return True
         return True
 
     def _handle_quit(self) -> bool:
         """終了処理"""
+        # ループを抜けるので drain を待たずに配信
         self.event_manager.emit_simple(EventType.STATS_CHANGED, action="quit")
         return False
 
     def _handle_water(self) -> bool:
         """水を与える"""
-        self.event_manager.emit_simple(EventType.FLOWER_WATERED)
+        self.event_manager.post_simple(EventType.FLOWER_WATERED)
         return True
 
     def _handle_light(self) -> bool:
         """光を与える"""
-        self.event_manager.emit_simple(EventType.FLOWER_LIGHT_GIVEN)
+        self.event_manager.post_simple(EventType.FLOWER_LIGHT_GIVEN)
         return True
 
     def _handle_remove_weeds(self) -> bool:
         """雑草を除去する"""
-        self.event_manager.emit_simple(EventType.FLOWER_WEEDS_REMOVED)
+        self.event_manager.post_simple(EventType.FLOWER_WEEDS_REMOVED)
         return True
 
     def _handle_remove_pests(self) -> bool:
         """害虫を駆除する"""
-        self.event_manager.emit_simple(EventType.FLOWER_PESTS_REMOVED)
+        self.event_manager.post_simple(EventType.FLOWER_PESTS_REMOVED)
         return True
 
     def _handle_fertilizer(self) -> bool:
         """肥料を与える"""
-        self.event_manager.emit_simple(EventType.FERTILIZER_GIVEN)
+        self.event_manager.post_simple(EventType.FERTILIZER_GIVEN)
         return True
 
     def _handle_like(self) -> bool:
         """好きを入力"""
-        self.event_manager.emit_simple(EventType.MENTAL_LIKE)
+        self.event_manager.post_simple(EventType.MENTAL_LIKE)
         return True
 
     def _handle_dislike(self) -> bool:
         """きらいを入力"""
-        self.event_manager.emit_simple(EventType.MENTAL_DISLIKE)
+        self.event_manager.post_simple(EventType.MENTAL_DISLIKE)
         return True
 
-    def _handle_select_seed(self) -> bool:
-        """種を選択する"""
-        self.event_manager.emit_simple(EventType.SEED_SELECTED)
+    def _handle_select_seed(self, seed_type: Optional[str] = None) -> bool:
+        """種を選択する（seed_type: SeedType の値。None なら既定）"""
+        self.event_manager.post_simple(EventType.SEED_SELECTED, seed_type=seed_type)
         return True
 
     def _handle_reset(self) -> bool:
         """ゲームをリセットする"""
-        self.event_manager.emit_simple(EventType.GAME_RESET)
+        self.event_manager.post_simple(EventType.GAME_RESET)
         return True
 
     def _handle_pause(self) -> bool:
@@ -198,34 +238,34 @@ class InputHandler:
 
     def _handle_nav_left(self) -> bool:
         """ナビゲーション: 左"""
-        self.event_manager.emit_simple(EventType.NAV_LEFT)
+        self.event_manager.post_simple(EventType.NAV_LEFT)
         return True
 
     def _handle_nav_right(self) -> bool:
         """ナビゲーション: 右"""
-        self.event_manager.emit_simple(EventType.NAV_RIGHT)
+        self.event_manager.post_simple(EventType.NAV_RIGHT)
         return True
 
     def _handle_nav_confirm(self) -> bool:
         """ナビゲーション: 決定"""
-        self.event_manager.emit_simple(EventType.NAV_CONFIRM)
+        self.event_manager.post_simple(EventType.NAV_CONFIRM)
         return True
 
     def _handle_nav_cancel(self) -> bool:
         """ナビゲーション: キャンセル"""
-        self.event_manager.emit_simple(EventType.NAV_CANCEL)
+        self.event_manager.post_simple(EventType.NAV_CANCEL)
         return True
 
     def _handle_time_toggle_pause(self) -> bool:
-        self.event_manager.emit_simple(EventType.TIME_TOGGLE_PAUSE)
+        self.event_manager.post_simple(EventType.TIME_TOGGLE_PAUSE)
         return True
 
     def _handle_time_speed_normal(self) -> bool:
-        self.event_manager.emit_simple(EventType.TIME_SPEED_NORMAL)
+        self.event_manager.post_simple(EventType.TIME_SPEED_NORMAL)
         return True
 
     def _handle_time_speed_fast(self) -> bool:
-        self.event_manager.emit_simple(EventType.TIME_SPEED_FAST)
+        self.event_manager.post_simple(EventType.TIME_SPEED_FAST)
         return True
 
     def _register_alternative_navigation_keys(self) -> None:
@@ -237,6 +277,26 @@ class InputHandler:
             self.key_bindings[key] = InputAction.NAV_RIGHT
 
 
+def parse_input_script(text: str) -> List[Tuple[int, InputAction]]:
+    """入力スクリプトを解析する
+
+    1行に「<ティック> <アクション名>」（例: ``10 NAV_CONFIRM``）。
+    ``#`` 以降はコメント。ティック順に並べて返す。
+    """
+    entries: List[Tuple[int, InputAction]] = []
+    for line_no, raw in enumerate(text.splitlines(), start=1):
+        line = raw.split("#", 1)[0].strip()
+        if not line:
+            continue
+        try:
+            tick_str, action_name = line.split()
+            entries.append((int(tick_str), InputAction[action_name.upper()]))
+        except (ValueError, KeyError):
+            raise ValueError(f"入力スクリプト {line_no}行目が不正です: {raw!r}")
+    entries.sort(key=lambda entry: entry[0])
+    return entries
+
+
 class InputConfig:
     """入力設定クラス"""
 
@@ -288,5 +348,7 @@ class InputConfig:
             InputAction.TIME_TOGGLE_PAUSE: "時間: 一時停止切替",
             InputAction.TIME_SPEED_NORMAL: "時間: 通常",
             InputAction.TIME_SPEED_FAST: "時間: 早送り",
+            InputAction.SELECT_SEED_YIN: "陰の種を選択する",
+            InputAction.SELECT_SEED_YANG: "陽の種を選択する",
         }
         return descriptions.get(action, "不明")
@@ -0,0 +1,125 @@
+"""
+自動セーブのスケジューラ（GameEngine が1つだけ持つ）
+
+セーブのきっかけ:
+- 一定間隔（config.data.auto_save_interval 秒のフレーム時間ごと）
+- 大きな変化（成長段階・種の変化。StatsTracker の通知を受けて次の update で書く）
+- 終了時（GameEngine.quit から request("quit")）
+- 古さの上限（最後にセーブ内容とディスクが一致してから
+  config.data.save_max_staleness 秒の実時間が過ぎたら。フレーム時間が
+  max_frame_dt で切り詰められて間隔のタイマーが遅れても、これより古くはならない）
+
+セーブ内容（StatsTracker の "persisted" グループ）が前回のセーブから
+変わっていなければ書かずにスキップとして数える。
+
+ジャーナルモード（config.data.save_journal）では、操作は Flower がその場で
+ジャーナルに追記するので、上のきっかけでは経過時間だけを追記し（Flower.checkpoint）、
+スナップショットは config.data.journal_snapshot_interval 秒（実時間）ごとと終了時だけ書く。
+"""
+
+import logging
+import time
+from typing import Callable, Optional
+
+from ..data.config import config
+from ..entities.flower import Flower
+from ..utils.helpers import Timer
+
+logger = logging.getLogger(__name__)
+
+# 変わったらすぐセーブするキー
+SIGNIFICANT_KEYS = ("growth_stage", "seed_type")
+
+
+class SaveScheduler:
+    """自動セーブのきっかけをまとめ、変化がなければ書かない"""
+
+    def __init__(
+        self,
+        flower: Flower,
+        can_save: Callable[[], bool] = lambda: True,
+        interval: Optional[float] = None,
+        max_staleness: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        snapshot_interval: Optional[float] = None,
+    ):
+        self.flower = flower
+        self.can_save = can_save  # False の間（種選択中など）はセーブしない
+        self.interval_timer = Timer(
+            config.data.auto_save_interval if interval is None else interval,
+            auto_reset=True,
+        )
+        self.max_staleness = (
+            config.data.save_max_staleness if max_staleness is None else max_staleness
+        )
+        self.snapshot_interval = (
+            config.data.journal_snapshot_interval
+            if snapshot_interval is None
+            else snapshot_interval
+        )
+        self._clock = clock
+        self._clean_at = clock()  # 最後にセーブ内容とディスクが一致した時刻
+        self._snapshot_at = clock()  # 最後にスナップショットを書いた時刻
+        self._significant: Optional[str] = None  # 次の update で書く理由
+
+        # 統計
+        self.saves_written = 0
+        self.saves_skipped = 0
+        self.saves_failed = 0
+        self.last_reason: Optional[str] = None
+
+        flower.tracker.subscribe(SIGNIFICANT_KEYS, self._on_significant_change)
+
+    def _on_significant_change(self, changed) -> None:
+        # commit の途中で書かないよう、次の update まで遅らせる
+        self._significant = "growth" if "growth_stage" in changed else "seed"
+
+    def update(self, dt: float) -> bool:
+        """フレームごとに呼ぶ。セーブを書いたら True"""
+        if self._significant is not None:
+            reason, self._significant = self._significant, None
+            return self.request(reason)
+        if self.interval_timer.update(dt):
+            return self.request("interval")
+        if self._clock() - self._clean_at >= self.max_staleness:
+            return self.request("staleness")
+        return False
+
+    def request(self, reason: str, force: bool = False) -> bool:
+        """今すぐセーブする（変化がなければスキップ）。書いたら True"""
+        self.interval_timer.reset()
+        if not self.can_save():
+            return False
+        if not force and not self.flower.has_unsaved_changes():
+            self.saves_skipped += 1
+            self._clean_at = self._clock()
+            return False
+        if self._use_journal(reason, force):
+            ok = self.flower.checkpoint()
+        else:
+            ok = self.flower.save(force=force)
+            if ok:
+                self._snapshot_at = self._clock()
+        if not ok:
+            self.saves_failed += 1
+            logger.warning(f"Auto save failed ({reason})")
+            return False
+        self.saves_written += 1
+        self.last_reason = reason
+        self._clean_at = self._clock()
+        return True
+
+    def _use_journal(self, reason: str, force: bool) -> bool:
+        """スナップショットの代わりにジャーナルへの追記で済ませるか"""
+        if not config.data.save_journal or force or reason == "quit":
+            return False
+        return self._clock() - self._snapshot_at < self.snapshot_interval
+
+    @property
+    def counters(self) -> dict:
+        """セーブの回数（書いた/スキップ/失敗）"""
+        return {
+            "written": self.saves_written,
+            "skipped": self.saves_skipped,
+            "failed": self.saves_failed,
+        }
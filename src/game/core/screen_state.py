@@ -13,5 +13,6 @@ class ScreenState(Enum):
     MODE_LIGHT = auto()
     FLOWER_LANGUAGE = auto()
     DEATH = auto()
+    GARDEN = auto()
 
 
@@ -0,0 +1,328 @@
+"""入力セッションの記録と高速再生
+
+記録ファイルは1行1レコードのJSON（JSON Lines）。
+- header: 乱数シード・シミュレーションの設定（SIM_SETTINGS）・開始時の FlowerStats
+- action: そのティックの先頭で処理された入力アクション
+- advance: 閉形式での一括進行（早送りの上限超過分）
+- mode_return: モード画面からの自動復帰
+- load: セーブデータのロード結果（ロード後の FlowerStats と乱数状態）
+- end: 終了時の FlowerStats と画面遷移の履歴
+
+再生時はレコードをファイル順にティックへ割り当て、描画なしで最大速度で実行する。
+シミュレーションは固定ティックで進むため、同じ入力列からは同じ結果になる。
+再生中だけ記録時の設定を config に適用し（今の設定と違えば警告）、終わったら元に戻す。
+"""
+
+import json
+import logging
+import time
+from dataclasses import fields
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from ..data.config import GameConfig, config
+from ..entities.flower import FlowerStats
+from ..utils.random_manager import get_rng
+from .input_handler import InputAction
+from .screen_state import ScreenState
+
+logger = logging.getLogger(__name__)
+
+# 2: 乱数状態を (エントロピー, 消費数) で記録 / 3: シミュレーションの設定を記録
+SESSION_FORMAT_VERSION = 3
+SUPPORTED_VERSIONS = (2, 3)
+
+# 再生結果に影響する config.game の設定
+# （入力キューの有無は配信のタイミングが変わるので含め、再生時にエンジンのイベントバスへ反映する）
+SIM_SETTINGS = tuple(field.name for field in fields(GameConfig))
+
+
+def _encode_rng_state(state: Tuple[int, int]) -> List:
+    entropy, draws = state
+    return [entropy, draws]
+
+
+def _decode_rng_state(data: List) -> Tuple[int, int]:
+    entropy, draws = data
+    return (int(entropy), int(draws))
+
+
+class SessionRecorder:
+    """エンジンの入力と非ティック進行をファイルへ記録する"""
+
+    def __init__(self, engine, stream: TextIO):
+        self.engine = engine
+        self.stream = stream
+        self.screens: List[Tuple[int, str]] = [(engine.tick_count, engine.screen_state.name)]
+        self._closed = False
+        self._write({
+            "type": "header",
+            "version": SESSION_FORMAT_VERSION,
+            "seed": get_rng().get_seed(),
+            "settings": {name: getattr(config.game, name) for name in SIM_SETTINGS},
+            "stats": engine.flower.stats.to_dict(),
+            "screen": engine.screen_state.name,
+            "time_scale": engine.time_scale,
+            "paused": engine.paused,
+        })
+        engine.session = self
+        engine.input_handler.action_listener = self.on_action
+
+    @classmethod
+    def open(cls, engine, path: str) -> "SessionRecorder":
+        """記録ファイルを開いて記録を開始"""
+        return cls(engine, open(path, "w", encoding="utf-8"))
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    # --- エンジンからの通知 ---
+    def on_action(self, action: InputAction) -> None:
+        self._write({"type": "action", "tick": self.engine.tick_count, "action": action.name})
+
+    def on_advance(self, tick: int, seconds: float) -> None:
+        self._write({"type": "advance", "tick": tick, "seconds": seconds})
+
+    def on_mode_return(self, tick: int) -> None:
+        self._write({"type": "mode_return", "tick": tick})
+
+    def on_load(self, tick: int, stats: FlowerStats) -> None:
+        self._write({
+            "type": "load",
+            "tick": tick,
+            "stats": stats.to_dict(),
+            "rng_state": _encode_rng_state(get_rng().get_state()),
+        })
+
+    def on_screen(self, tick: int, state) -> None:
+        self.screens.append((tick, state.name))
+
+    def close(self) -> None:
+        """終了レコードを書いて記録を終える"""
+        if self._closed:
+            return
+        self._closed = True
+        self._write({
+            "type": "end",
+            "tick": self.engine.tick_count,
+            "stats": self.engine.flower.stats.to_dict(),
+            "screens": [list(entry) for entry in self.screens],
+        })
+        self.stream.close()
+        if self.engine.session is self:
+            self.engine.session = None
+            self.engine.input_handler.action_listener = None
+
+
+class _ReplaySaveManager:
+    """再生用のセーブ管理（記録済みのロード結果を返し、ファイルには書かない）"""
+
+    def __init__(self):
+        self.pending: Optional[Dict[str, Any]] = None
+        self.last_saved_at = None
+
+    def begin_snapshot(self) -> None:
+        return None
+
+    def save(self, data: Dict[str, Any], timestamp=None) -> bool:
+        return True
+
+    def append_action(
+        self, action: str, value: float, age_seconds: float, sync: bool = True
+    ) -> bool:
+        return True
+
+    def sync_journal(self) -> bool:
+        return True
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        record, self.pending = self.pending, None
+        if record is None:
+            return None
+        get_rng().set_state(_decode_rng_state(record["rng_state"]))
+        return {"data": record["stats"]}
+
+    def has_save(self) -> bool:
+        return self.pending is not None
+
+    def delete_save(self) -> bool:
+        return True
+
+
+class ReplayResult:
+    """再生結果（記録時の終了状態との比較）"""
+
+    def __init__(self, ticks: int, elapsed: float, stats: FlowerStats,
+                 expected_stats: Optional[FlowerStats],
+                 screens: List[Tuple[int, str]],
+                 expected_screens: Optional[List[Tuple[int, str]]]):
+        self.ticks = ticks
+        self.elapsed = elapsed
+        self.stats = stats
+        self.expected_stats = expected_stats
+        self.screens = screens
+        self.expected_screens = expected_screens
+
+    @property
+    def stats_match(self) -> bool:
+        return self.expected_stats is not None and self.stats == self.expected_stats
+
+    @property
+    def screens_match(self) -> bool:
+        return self.expected_screens is not None and self.screens == self.expected_screens
+
+    @property
+    def matched(self) -> bool:
+        return self.stats_match and self.screens_match
+
+    @property
+    def ticks_per_second(self) -> float:
+        return self.ticks / self.elapsed if self.elapsed > 0 else float("inf")
+
+
+class SessionReplayer:
+    """記録ファイルをヘッドレスエンジンで再生する"""
+
+    def __init__(self, records: List[Dict[str, Any]]):
+        if not records or records[0].get("type") != "header":
+            raise ValueError("Session file has no header")
+        self.header = records[0]
+        if self.header.get("version") not in SUPPORTED_VERSIONS:
+            raise ValueError(f"Unsupported session version: {self.header.get('version')}")
+        self.footer = records[-1] if records[-1].get("type") == "end" else None
+        end = len(records) - 1 if self.footer else len(records)
+        self.events = records[1:end]
+        self.screens: List[Tuple[int, str]] = []
+
+    @classmethod
+    def load(cls, path: str) -> "SessionReplayer":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(list(_read_records(f)))
+
+    # --- エンジンからの通知（再生中は画面遷移のみ記録） ---
+    def on_screen(self, tick: int, state) -> None:
+        self.screens.append((tick, state.name))
+
+    def on_advance(self, tick: int, seconds: float) -> None:
+        pass
+
+    def on_mode_return(self, tick: int) -> None:
+        pass
+
+    def on_load(self, tick: int, stats: FlowerStats) -> None:
+        pass
+
+    def _apply_settings(self) -> Dict[str, Any]:
+        """記録時の設定を config に適用し、元に戻すための今の値を返す"""
+        recorded = self.header.get("settings")
+        if recorded is None:
+            # バージョン2の記録はティック幅だけ
+            recorded = {"sim_tick": self.header["sim_tick"]}
+        unknown = sorted(name for name in recorded if not hasattr(config.game, name))
+        if unknown:
+            logger.warning(f"Session settings not in this version, ignored: {unknown}")
+        recorded = {name: value for name, value in recorded.items() if name not in unknown}
+        previous = {name: getattr(config.game, name) for name in recorded}
+        changed = sorted(name for name, value in recorded.items() if previous[name] != value)
+        if changed:
+            logger.warning(
+                "Replaying with recorded settings that differ from the current config: "
+                + ", ".join(f"{name}={recorded[name]} (now {previous[name]})" for name in changed)
+            )
+        for name, value in recorded.items():
+            setattr(config.game, name, value)
+        return previous
+
+    def _prepare(self, engine) -> None:
+        """記録開始時の状態を再現"""
+        header = self.header
+        get_rng().set_seed(header["seed"])
+        engine.flower.save_manager = _ReplaySaveManager()
+        engine.flower.stats = FlowerStats.from_dict(header["stats"])
+        engine.time_scale = header["time_scale"]
+        engine.paused = header["paused"]
+        engine.screen_state = ScreenState[header["screen"]]
+        # キューモードはエンジン作成時の config で決まるため、記録時の設定にそろえる
+        engine.event_manager.event_bus.queued = config.game.queued_input_events
+        engine.session = self
+        self.screens = [(engine.tick_count, engine.screen_state.name)]
+
+    def _apply(self, engine, record: Dict[str, Any]) -> bool:
+        """1レコードを適用し、続行するかどうかを返す"""
+        kind = record["type"]
+        if kind == "action":
+            return engine.input_handler.dispatch(InputAction[record["action"]])
+        if kind == "advance":
+            engine._fast_forward(record["seconds"])
+        elif kind == "mode_return":
+            engine._return_from_mode()
+        elif kind != "load":
+            logger.warning("Unknown session record: %s", kind)
+        return True
+
+    def run(self, engine) -> ReplayResult:
+        """ヘッドレスエンジンで最大速度で再生（記録時の設定は再生中だけ適用する）"""
+        previous = self._apply_settings()
+        # 壁時計に依存する処理（オフライン進行）は記録済みのロード結果で代替
+        offline_catch_up = config.data.offline_catch_up
+        config.data.offline_catch_up = False
+        try:
+            return self._run(engine)
+        finally:
+            for name, value in previous.items():
+                setattr(config.game, name, value)
+            config.data.offline_catch_up = offline_catch_up
+
+    def _run(self, engine) -> ReplayResult:
+        self._prepare(engine)
+        tick = config.game.sim_tick
+        end_tick = self.footer["tick"] if self.footer else (
+            self.events[-1]["tick"] if self.events else 0
+        )
+        index = 0
+        start = time.perf_counter()
+        while engine.running:
+            while index < len(self.events) and self.events[index]["tick"] <= engine.tick_count:
+                record = self.events[index]
+                index += 1
+                # ロード結果はアクションの後に記録されるため、アクション処理前にセーブ管理へ渡す
+                if (
+                    record["type"] == "action"
+                    and index < len(self.events)
+                    and self.events[index]["type"] == "load"
+                ):
+                    engine.flower.save_manager.pending = self.events[index]
+                if not self._apply(engine, record):
+                    engine.running = False
+                    break
+            # run_headless と同じく、そのティックの入力をシミュレーションの前に配信
+            engine.event_manager.drain()
+            if not engine.running or engine.tick_count >= end_tick:
+                break
+            engine._update_simulation(tick)
+        elapsed = time.perf_counter() - start
+        engine.session = None
+
+        expected_stats = None
+        expected_screens = None
+        if self.footer:
+            expected_stats = FlowerStats.from_dict(self.footer["stats"])
+            expected_screens = [tuple(entry) for entry in self.footer["screens"]]
+        return ReplayResult(
+            ticks=engine.tick_count,
+            elapsed=elapsed,
+            stats=engine.flower.stats,
+            expected_stats=expected_stats,
+            screens=self.screens,
+            expected_screens=expected_screens,
+        )
+
+
+def _read_records(stream: TextIO) -> Iterator[Dict[str, Any]]:
+    for line_no, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid session record at line {line_no}: {e}") from e
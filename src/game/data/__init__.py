@@ -1,4 +1,8 @@
 from .config import config, DisplayConfig, GameConfig, DataConfig, Config
 from .save_manager import SaveManager
+from .growth_tables import GrowthTables, get_growth_tables
 
-__all__ = ['config', 'DisplayConfig', 'GameConfig', 'DataConfig', 'Config', 'SaveManager']
+__all__ = [
+    'config', 'DisplayConfig', 'GameConfig', 'DataConfig', 'Config', 'SaveManager',
+    'GrowthTables', 'get_growth_tables'
+]
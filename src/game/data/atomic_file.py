@@ -0,0 +1,98 @@
+"""
+クラッシュに強いファイル書き込み（一時ファイル → fsync → os.replace）
+
+書き込み途中で落ちても、置き換え先は「前の内容」か「新しい内容」のどちらかで
+必ず読める（os.replace は同じディレクトリ内なら原子的）。
+
+耐久性レベル（config.data.save_durability）:
+- "none": fsync しない（プロセスのクラッシュには強いが、電源断では直前の数秒を失い得る）
+- "file": 置き換え前にファイルを fsync（電源断でも中途半端な内容にはならない）
+- "dir": さらにディレクトリを fsync（置き換え自体も電源断後に残る）
+"""
+
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DURABILITY_LEVELS = ("none", "file", "dir")
+
+# 書き込み中の一時ファイルの接尾辞（残っていても次の書き込みで上書きされる）
+TEMP_SUFFIX = ".tmp"
+
+
+def temp_path_for(path: Path) -> Path:
+    """path を置き換えるための一時ファイルのパス（同じディレクトリ）"""
+    return path.with_name(path.name + TEMP_SUFFIX)
+
+
+def atomic_write(
+    path: Union[str, Path],
+    payload: bytes,
+    durability: str = "file",
+    backup: Optional[Union[str, Path]] = None,
+) -> None:
+    """payload で path を原子的に置き換える（失敗時は OSError、path は元のまま）
+
+    backup を指定すると、置き換える前の path をそこにハードリンクする（1世代前を残す）。
+    path 自体は動かさないので、どの時点で落ちても path は必ず存在する。
+    """
+    if durability not in DURABILITY_LEVELS:
+        raise ValueError(f"未知の耐久性レベルです: {durability}")
+    path = Path(path)
+    temp = temp_path_for(path)
+    fd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        try:
+            view = memoryview(payload)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+            if durability != "none":
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        if backup is not None and os.path.exists(path):
+            _link_backup(path, Path(backup))
+        os.replace(temp, path)
+    except BaseException:
+        try:
+            os.unlink(temp)
+        except OSError:
+            pass
+        raise
+    if durability == "dir":
+        fsync_directory(path.parent)
+
+
+def _link_backup(path: Path, backup: Path) -> None:
+    """path の今の内容を backup として残す（ハードリンク。使えなければコピー）"""
+    try:
+        os.unlink(backup)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(path, backup)
+    except OSError as e:
+        # FAT の SD カードなどハードリンクの無いファイルシステム
+        logger.debug(f"Hard link unavailable, copying backup: {e}")
+        shutil.copyfile(path, backup)
+
+
+def fsync_directory(directory: Union[str, Path]) -> None:
+    """ディレクトリのエントリ変更（作成・置き換え）をディスクに反映する"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError as e:
+        # Windows などディレクトリを開けない環境では何もしない
+        logger.debug(f"Directory fsync skipped: {e}")
+        return
+    try:
+        os.fsync(fd)
+    except OSError as e:
+        logger.debug(f"Directory fsync skipped: {e}")
+    finally:
+        os.close(fd)
@@ -34,15 +34,34 @@ class GameConfig:
     fertilizer_amount: float = 20.0
     # 成長/分岐用
     growth_age_threshold_flower: float = 60.0
+    # 固定タイムステップ（シミュレーション1ティックの秒数とフレームあたりの上限）
+    sim_tick: float = 0.1
+    max_substeps_per_frame: int = 8
+    max_frame_dt: float = 0.25  # 実時間でこれ以上のフレーム間隔は切り詰める
+    # 入力イベントをキューに積み、1フレームに1回まとめて配信する（連打のカーソル移動は合流）
+    queued_input_events: bool = False
     # テスト用オプション
     nutrition_limit_disabled: bool = True  # Trueにすると1時間3回制限を無効化
 
 @dataclass
 class DataConfig:
     """データ関連の設定"""
-    save_path: str = "save/state.json"
+    save_path: str = "save/state.sav"  # 以前の save/state.json は無い時だけ読む
+    save_format: str = "binary"  # "binary"（CRC付き）/ "json"（デバッグ用）
+    save_backup: bool = True  # 1世代前のセーブを .backup に残す（壊れたセーブはここから読む。セーブごとにリンク操作が2回増える）
     auto_save_interval: float = 30.0  # 30秒ごとに自動セーブ
+    save_max_staleness: float = 120.0  # 未保存の変更をこれ以上（実時間の秒）残さない
+    # セーブの耐久性: "none"（fsyncなし）/ "file"（ファイルをfsync）/ "dir"（ディレクトリも）
+    save_durability: str = "file"
+    # セーブの変換・書き込みを別スレッドで行う（ゲームループを止めない）
+    async_save: bool = True
+    # 操作をジャーナルに追記し、スナップショットは journal_snapshot_interval 秒（実時間）ごと
+    save_journal: bool = False
+    journal_snapshot_interval: float = 600.0
     random_seed: Optional[int] = None
+    # オフライン進行: ロード時にセーブ時刻からの経過時間だけ花を進める（オプトイン）
+    offline_catch_up: bool = False
+    offline_catch_up_max_seconds: float = 30 * 24 * 3600.0  # 最大30日分まで
 
 @dataclass
 class Config:
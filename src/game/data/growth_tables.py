@@ -0,0 +1,179 @@
+"""成長分岐テーブル（growth_tables.json）のコンパイル済みキャッシュ
+
+JSON を分岐判定のたびに読み直さないよう、一度だけ読み込んで検索しやすい形に変換する。
+ファイルの更新時刻（mtime）が変わった場合のみ再読み込みする。
+"""
+
+import json
+import logging
+import os
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+GROWTH_TABLES_PATH = Path(__file__).parent / "growth_tables.json"
+
+# JSONが読めない場合のフォールバック
+DEFAULT_GROWTH_TABLES: Dict[str, Any] = {
+    "phase2_branch": {
+        "score_ranges": [
+            {"min": 50, "max": 100, "result": "しなる"},
+            {"min": 0, "max": 49, "result": "つる"}
+        ],
+        "default": "ふつう",
+        "seed_biases": {"陽": 5, "陰": 0},
+        "mental_bonus": {"threshold": 70, "bonus": 5}
+    },
+    "phase3_shape": {
+        "seed_base_values": {"陽": 10, "陰": 5},
+        "phase2_branch_values": {"しなる": 5, "つる": 0, "ふつう": 0},
+        "light_tendency_values": {"陽": 5, "陰": -5},
+        "shape_candidates": [
+            {"name": "大輪", "min_base": 20},
+            {"name": "まるまる", "min_base": 15},
+            {"name": "ひらひら", "min_base": 10},
+            {"name": "ちいさめ", "min_base": 5},
+            {"name": "とがり", "min_base": -999}
+        ],
+        "default": "ふつう"
+    },
+    "light_requirements": {
+        "sprout": 20.0,
+        "stem": 40.0,
+        "bud": 60.0,
+        "flower": 80.0
+    }
+}
+
+
+class GrowthTables:
+    """成長分岐テーブルを検索用に変換したもの"""
+
+    def __init__(self, raw: Dict[str, Any]):
+        self.raw = raw
+        phase2 = raw.get("phase2_branch", {})
+        phase3 = raw.get("phase3_shape", {})
+
+        # --- フェーズ2: スコア帯（min昇順に並べ、bisectで検索） ---
+        self.branch_default: str = phase2.get("default", "ふつう")
+        self.seed_biases: Dict[str, float] = dict(phase2.get("seed_biases", {}))
+        mental_bonus = phase2.get("mental_bonus", {})
+        self.mental_threshold: float = mental_bonus.get("threshold", 70)
+        self.mental_bonus: float = mental_bonus.get("bonus", 5)
+
+        # JSONでの並び順（重なりがある場合は先頭が優先）
+        self.ranges_in_order: List[Tuple[float, float, str]] = [
+            (r["min"], r["max"], r["result"]) for r in phase2.get("score_ranges", [])
+        ]
+        self.score_ranges: List[Tuple[float, float, str]] = sorted(
+            self.ranges_in_order, key=lambda r: r[0]
+        )
+        self._range_mins = [r[0] for r in self.score_ranges]
+        self.warnings = self._validate_score_ranges()
+        self.has_overlaps = any("重なり" in w for w in self.warnings)
+
+        # --- フェーズ3: ベース値と形候補 ---
+        self.shape_default: str = phase3.get("default", "ふつう")
+        self.seed_base_values: Dict[str, float] = dict(phase3.get("seed_base_values", {}))
+        self.phase2_branch_values: Dict[str, float] = dict(
+            phase3.get("phase2_branch_values", {})
+        )
+        self.light_tendency_values: Dict[str, float] = dict(
+            phase3.get("light_tendency_values", {})
+        )
+        candidates = [
+            (c["name"], c.get("min_base", -999)) for c in phase3.get("shape_candidates", [])
+        ]
+        self.shape_candidates: List[Tuple[str, float]] = candidates
+        # しきい値を昇順に並べ、「しきい値以下の候補がk個」のときの有効候補を
+        # JSONの並び順のまま前計算する（乱択の結果を従来と一致させるため）
+        order = sorted(range(len(candidates)), key=lambda i: candidates[i][1])
+        self._shape_thresholds = [candidates[i][1] for i in order]
+        self._valid_shapes: List[Tuple[str, ...]] = [
+            tuple(candidates[i][0] for i in sorted(order[:k]))
+            for k in range(len(order) + 1)
+        ]
+
+    # --- 検証 ---
+    def _validate_score_ranges(self) -> List[str]:
+        """スコア帯の隙間・重なりを検出する
+
+        min 昇順に見ながら、それまでで一番上まで届くスコア帯と比べる
+        （隣どうしだけを比べると、広い帯に含まれる帯の重なりや偽の隙間を見誤る）。
+        """
+        warnings = []
+        if not self.score_ranges:
+            return warnings
+        covering = self.score_ranges[0]
+        for current in self.score_ranges[1:]:
+            lo1, hi1, res1 = covering
+            lo2, hi2, res2 = current
+            if lo2 > hi1:
+                warnings.append(
+                    f"スコア帯の隙間: ({hi1}, {lo2}) は {res1}/{res2} のどちらにも入らず"
+                    f" default={self.branch_default} になります"
+                )
+            else:
+                warnings.append(
+                    f"スコア帯の重なり: [{lo1}, {hi1}]={res1} と [{lo2}, {hi2}]={res2}"
+                )
+            if hi2 > hi1:
+                covering = current
+        return warnings
+
+    # --- 検索 ---
+    def match_score_range(self, score: float) -> Optional[Tuple[float, float, str]]:
+        """スコアが入るスコア帯（なければNone）"""
+        if self.has_overlaps:
+            # 重なりがある場合はJSONの並び順で先に一致したものを優先
+            for range_config in self.ranges_in_order:
+                if range_config[0] <= score <= range_config[1]:
+                    return range_config
+            return None
+        index = bisect_right(self._range_mins, score) - 1
+        if index >= 0 and score <= self.score_ranges[index][1]:
+            return self.score_ranges[index]
+        return None
+
+    def phase2_branch(self, score: float) -> str:
+        """スコアからフェーズ2分岐を決定"""
+        matched = self.match_score_range(score)
+        return matched[2] if matched else self.branch_default
+
+    def phase3_candidates(self, base: float) -> Tuple[str, ...]:
+        """ベース値で有効な形候補（JSONの並び順）"""
+        return self._valid_shapes[bisect_right(self._shape_thresholds, base)]
+
+
+_cache: Dict[Path, Tuple[Optional[int], GrowthTables]] = {}
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def get_growth_tables(path: Optional[Path] = None) -> GrowthTables:
+    """コンパイル済みの成長分岐テーブルを取得（mtimeが変わったときのみ再読み込み）"""
+    path = Path(path) if path is not None else GROWTH_TABLES_PATH
+    mtime = _mtime_ns(path)
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            raw = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        logger.warning(f"Failed to load growth_tables.json: {e}. Using default values.")
+        raw = DEFAULT_GROWTH_TABLES
+
+    tables = GrowthTables(raw)
+    for warning in tables.warnings:
+        logger.warning(f"[成長分岐テーブル] {warning}")
+    _cache[path] = (mtime, tables)
+    return tables
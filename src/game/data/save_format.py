@@ -0,0 +1,149 @@
+"""
+セーブファイルのバイナリ形式
+
+[ヘッダ 25バイト][ペイロード]
+- ヘッダ: マジック b"FLWS", 形式バージョン(u16), データバージョン(u8×3),
+  保存時刻(f64, UNIX秒), ペイロード長(u32), CRC32(u32)
+- CRC32 はヘッダ（CRC の手前まで）とペイロードにかける。読み込み時は
+  ペイロードを解釈する前に長さと CRC を確かめる
+- ペイロード: FlowerStats.tobytes() の固定レイアウト
+  ＋乱数ストリームの状態（エントロピーのバイト数（0 ならストリームなし）, エントロピー,
+  花ID, 世代, 各ストリームの引いた回数）
+- 形式バージョン2でエントロピーのバイト数を u8 から u16 にした（1 も読める）
+
+デバッグ用に JSON（従来の {"version", "timestamp", "data"}）との相互変換もここで行う。
+"""
+
+import json
+import struct
+import zlib
+from datetime import datetime
+from typing import Any, Dict
+
+from ..utils.rng_streams import STREAM_NAMES
+
+MAGIC = b"FLWS"
+FORMAT_VERSION = 2
+
+_HEADER = struct.Struct("<4sH3BdI")
+_CRC = struct.Struct("<I")
+HEADER_SIZE = _HEADER.size + _CRC.size
+
+# エントロピーのバイト数（形式バージョンごと）
+_ENTROPY_LENGTH = {1: struct.Struct("<B"), 2: struct.Struct("<H")}
+_STREAM_STATE = struct.Struct("<II3Q")  # 花ID, 世代, weeds/pests/phase3 の引いた回数
+
+
+class SaveFormatError(ValueError):
+    """セーブファイルが壊れている、または未対応の形式"""
+
+
+def is_binary(raw: bytes) -> bool:
+    """バイナリ形式のセーブか（先頭のマジックで判定）"""
+    return raw[: len(MAGIC)] == MAGIC
+
+
+def _parse_version(version: str) -> tuple:
+    try:
+        parts = tuple(int(part) for part in version.split("."))
+    except ValueError:
+        raise SaveFormatError(f"バージョンを数値にできません: {version}")
+    if len(parts) != 3 or not all(0 <= part < 256 for part in parts):
+        raise SaveFormatError(f"バージョンは x.y.z（各0〜255）です: {version}")
+    return parts
+
+
+_flower_stats = None  # (FlowerStats, 固定レイアウトのバイト数)
+
+
+def _stats_layout() -> tuple:
+    # flower.py がデータ層を読み込むので、初回に遅れて import してキャッシュする
+    global _flower_stats
+    if _flower_stats is None:
+        from ..entities.flower import FlowerStats
+
+        _flower_stats = (FlowerStats, len(FlowerStats().tobytes()))
+    return _flower_stats
+
+
+def encode(save_data: Dict[str, Any]) -> bytes:
+    """{"version", "timestamp", "data"} をバイナリにする"""
+    FlowerStats, _ = _stats_layout()
+    data = dict(save_data["data"])
+    # 乱数ストリームは状態（辞書）のまま書く（ジェネレータを作らない）
+    streams = data.pop("rng_streams", None)
+    payload = bytearray(FlowerStats.from_dict(data).tobytes())
+    if streams is None:
+        payload += _ENTROPY_LENGTH[FORMAT_VERSION].pack(0)
+    else:
+        entropy = int(streams["entropy"])
+        entropy_bytes = entropy.to_bytes(max(1, (entropy.bit_length() + 7) // 8), "little")
+        length_field = _ENTROPY_LENGTH[FORMAT_VERSION]
+        if len(entropy_bytes) >= 1 << (8 * length_field.size):
+            raise SaveFormatError(
+                f"乱数ストリームのエントロピーが長すぎます: {len(entropy_bytes)} バイト"
+            )
+        draws = streams.get("draws", {})
+        payload += length_field.pack(len(entropy_bytes))
+        payload += entropy_bytes
+        payload += _STREAM_STATE.pack(
+            int(streams["flower_id"]),
+            int(streams["generation"]),
+            *(int(draws.get(name, 0)) for name in STREAM_NAMES),
+        )
+
+    timestamp = datetime.fromisoformat(save_data["timestamp"]).timestamp()
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, *_parse_version(save_data["version"]), timestamp, len(payload)
+    )
+    crc = zlib.crc32(payload, zlib.crc32(header))
+    return header + _CRC.pack(crc) + payload
+
+
+def decode(raw: bytes) -> Dict[str, Any]:
+    """バイナリを {"version", "timestamp", "data"} に戻す（CRC を先に確かめる）"""
+    if len(raw) < HEADER_SIZE or not is_binary(raw):
+        raise SaveFormatError("バイナリ形式のセーブではありません")
+    header = raw[: _HEADER.size]
+    magic, format_version, major, minor, patch, timestamp, length = _HEADER.unpack(header)
+    (crc,) = _CRC.unpack_from(raw, _HEADER.size)
+    payload = raw[HEADER_SIZE:]
+    if len(payload) != length:
+        raise SaveFormatError(f"ペイロード長が一致しません: {len(payload)} != {length}")
+    if zlib.crc32(payload, zlib.crc32(header)) != crc:
+        raise SaveFormatError("CRC32 が一致しません（セーブファイルが壊れています）")
+    length_field = _ENTROPY_LENGTH.get(format_version)
+    if length_field is None:
+        raise SaveFormatError(f"未対応の形式バージョンです: {format_version}")
+
+    try:
+        FlowerStats, offset = _stats_layout()
+        data = FlowerStats.frombytes(payload[:offset]).to_dict()
+        (entropy_length,) = length_field.unpack_from(payload, offset)
+        offset += length_field.size
+        if entropy_length:
+            entropy = int.from_bytes(payload[offset : offset + entropy_length], "little")
+            offset += entropy_length
+            flower_id, generation, *draws = _STREAM_STATE.unpack_from(payload, offset)
+            offset += _STREAM_STATE.size
+            data["rng_streams"] = {
+                "entropy": entropy,
+                "flower_id": flower_id,
+                "generation": generation,
+                "draws": dict(zip(STREAM_NAMES, draws)),
+            }
+    except (struct.error, ValueError, IndexError) as e:
+        raise SaveFormatError(f"ペイロードを解釈できません: {e}")
+    if offset != len(payload):
+        raise SaveFormatError("ペイロードの末尾に余分なデータがあります")
+
+    return {
+        "version": f"{major}.{minor}.{patch}",
+        "timestamp": datetime.fromtimestamp(timestamp).isoformat(),
+        "data": data,
+    }
+
+
+def to_json(save_data: Dict[str, Any]) -> str:
+    """デバッグ用の JSON（従来のセーブファイルと同じ形）"""
+    return json.dumps(save_data, ensure_ascii=False, indent=2)
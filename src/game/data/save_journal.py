@@ -0,0 +1,216 @@
+"""
+プレイヤーの操作を追記するセーブの差分ジャーナル
+
+スナップショット（SaveManager のセーブファイル）は数分ごとにしか書かず、その間の
+操作（水・肥料・光ON/OFF・好き/嫌い・種の選択など）は1件33バイトのレコードとして
+ジャーナルファイルの末尾に追記する。
+
+レコード: [土台のスナップショットID(i64), 実時刻(f64), 花の年齢(f64), 値(f32), 操作(u8)][CRC32(u32)]
+- 土台のスナップショットID は、そのレコードを積み上げるスナップショットの保存時刻
+  （マイクロ秒）。スナップショットを作った時点（ゲームスレッド）で切り替わる
+- 読み込み時は CRC の合わないレコード以降を捨てる（書き込み途中で落ちても失うのは最後の1件）
+- スナップショットを書いたら、それより古い土台のレコードを捨てて詰める
+
+ロード時はスナップショットの後に、年齢まで FlowerStats.advance() で進めてから
+操作を適用することを繰り返す（オフライン進行と同じ閉形式の進め方）。
+"""
+
+import logging
+import os
+import struct
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Union
+
+from .atomic_file import atomic_write, fsync_directory
+
+logger = logging.getLogger(__name__)
+
+# 操作の種類（レコードには 1 始まりの番号で書く。末尾にだけ追加すること）
+ACTIONS = (
+    "water",
+    "fertilize",
+    "light_on",
+    "light_off",
+    "mental",  # 値 = メンタルの増減（好き +5 / 嫌い -5）
+    "seed",  # 値 = SeedType の順番
+    "remove_weeds",
+    "remove_pests",
+    "give_light",  # 値 = 光の量
+    "checkpoint",  # 操作なし（時間の経過だけを残す）
+)
+_ACTION_CODES = {name: code for code, name in enumerate(ACTIONS, start=1)}
+
+_RECORD = struct.Struct("<qddfB")
+_CRC = struct.Struct("<I")
+RECORD_SIZE = _RECORD.size + _CRC.size
+
+
+def snapshot_id(timestamp: datetime) -> int:
+    """スナップショットの保存時刻からID（マイクロ秒）を作る"""
+    return round(timestamp.timestamp() * 1_000_000)
+
+
+@dataclass(frozen=True)
+class JournalRecord:
+    """ジャーナルの1件"""
+
+    base: int  # 土台のスナップショットID
+    wall_time: float  # 追記した実時刻（UNIX秒）
+    age_seconds: float  # 操作した時の花の年齢
+    value: float
+    action: str
+
+    def pack(self) -> bytes:
+        body = _RECORD.pack(
+            self.base, self.wall_time, self.age_seconds, self.value, _ACTION_CODES[self.action]
+        )
+        return body + _CRC.pack(zlib.crc32(body))
+
+
+class SaveJournal:
+    """ジャーナルファイルへの追記・読み込み・詰め直し"""
+
+    def __init__(self, path: Union[str, Path], durability: str = "file"):
+        self.path = Path(path)
+        self.durability = durability
+        # sync=False で追記し、まだ fsync していない（ファイル / 作ったディレクトリのエントリ）
+        self._file_unsynced = False
+        self._dir_unsynced = False
+
+    def append(
+        self, base: int, action: str, value: float, age_seconds: float, sync: bool = True
+    ) -> JournalRecord:
+        """1件追記する（失敗時は OSError）
+
+        sync=False なら fsync せずに戻る（後で sync() を呼ぶ。SD カードで fsync は重いので、
+        ゲームスレッドからは書き込みスレッドに任せる）。
+        """
+        if action not in _ACTION_CODES:
+            raise ValueError(f"未知の操作です: {action}")
+        record = JournalRecord(base, time.time(), age_seconds, value, action)
+        created = not self.path.exists()
+        if created:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(
+            self.path,
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0),
+            0o644,
+        )
+        try:
+            # 1件は小さいので1回の write で書ける（O_APPEND で末尾に付く）
+            os.write(fd, record.pack())
+            if self.durability != "none":
+                if sync:
+                    os.fsync(fd)
+                else:
+                    self._file_unsynced = True
+        finally:
+            os.close(fd)
+        if created and self.durability == "dir":
+            if sync:
+                fsync_directory(self.path.parent)
+            else:
+                self._dir_unsynced = True
+        return record
+
+    def sync(self) -> None:
+        """sync=False で追記した分をディスクに反映する（失敗時は OSError）"""
+        if self._file_unsynced:
+            try:
+                fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | getattr(os, "O_BINARY", 0))
+            except FileNotFoundError:
+                fd = None  # 詰め直しで消えた
+            if fd is not None:
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            self._file_unsynced = False
+        if self._dir_unsynced:
+            fsync_directory(self.path.parent)
+            self._dir_unsynced = False
+
+    def read(self, base: int) -> List[JournalRecord]:
+        """土台が base 以降のレコードを追記順に返す
+
+        途中で壊れたレコード（書き込み途中のクラッシュ）があればそこで切り詰め、
+        次の追記が壊れた部分の後ろに付かないようにする。
+        """
+        try:
+            raw = self.path.read_bytes()
+        except FileNotFoundError:
+            return []
+        records = []
+        offset = 0
+        while offset + RECORD_SIZE <= len(raw):
+            body = raw[offset : offset + _RECORD.size]
+            (crc,) = _CRC.unpack_from(raw, offset + _RECORD.size)
+            if zlib.crc32(body) != crc:
+                break
+            record_base, wall_time, age_seconds, value, code = _RECORD.unpack(body)
+            if not 1 <= code <= len(ACTIONS):
+                break
+            records.append(
+                JournalRecord(record_base, wall_time, age_seconds, value, ACTIONS[code - 1])
+            )
+            offset += RECORD_SIZE
+        if offset != len(raw):
+            logger.warning(
+                f"Journal truncated at record {len(records)} "
+                f"({len(raw) - offset} bytes discarded): {self.path}"
+            )
+            os.truncate(self.path, offset)
+        return [record for record in records if record.base >= base]
+
+    def compact(self, base: int) -> int:
+        """土台が base より古いレコードを捨てる（残した件数を返す）"""
+        records = self.read(base)
+        if not records:
+            self.delete()
+            return 0
+        payload = b"".join(record.pack() for record in records)
+        atomic_write(self.path, payload, self.durability)
+        self._file_unsynced = self._dir_unsynced = False  # 書き直したファイルは fsync 済み
+        return len(records)
+
+    def delete(self) -> None:
+        self._file_unsynced = self._dir_unsynced = False
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def replay(data: Dict[str, Any], records: Sequence[JournalRecord]) -> Dict[str, Any]:
+    """スナップショットの data にレコードを順に適用した data を返す"""
+    # flower.py がデータ層を読み込むので遅れて import する
+    from ..entities.flower import FlowerStats, SeedType
+
+    stats = FlowerStats.from_dict(data)
+    seeds = tuple(SeedType)
+    for record in records:
+        stats.advance(max(0.0, record.age_seconds - stats.age_seconds))
+        action = record.action
+        if action == "water":
+            stats.water()
+        elif action == "fertilize":
+            stats.fertilize()
+        elif action == "light_on":
+            stats.turn_light_on()
+        elif action == "light_off":
+            stats.turn_light_off()
+        elif action == "mental":
+            stats.adjust_mental(record.value)
+        elif action == "seed":
+            stats.seed_type = seeds[int(record.value)]
+        elif action == "remove_weeds":
+            stats.remove_weeds()
+        elif action == "remove_pests":
+            stats.remove_pests()
+        elif action == "give_light":
+            stats.give_light(record.value)
+    return stats.to_dict()
@@ -1,10 +1,14 @@
 import json
 import os
 import logging
+import threading
 from typing import Any, Dict, Optional
 from pathlib import Path
 from datetime import datetime
 from ..data.config import config
+from . import save_format
+from .atomic_file import atomic_write, temp_path_for
+from .save_journal import SaveJournal, replay, snapshot_id
 
 logger = logging.getLogger(__name__)
 
@@ -14,116 +18,284 @@ SAVE_DATA_VERSION = "1.0.0"
 class SaveManager:
     """セーブ/ロード機能を管理するクラス"""
     
-    def __init__(self, save_path: Optional[str] = None):
+    def __init__(
+        self,
+        save_path: Optional[str] = None,
+        durability: Optional[str] = None,
+        save_format: Optional[str] = None,
+        journal: Optional[bool] = None,
+    ):
         self.save_path = Path(save_path or config.data.save_path)
+        # 1世代前のセーブ（セーブのたびに置き換える前の内容を移す）
         self.backup_path = self.save_path.with_suffix('.backup')
+        # 以前のバージョンの JSON セーブ（新しいセーブが無い時だけ読む）
+        self.legacy_path = self.save_path.with_suffix('.json')
+        # 書き込みの耐久性レベル（atomic_file.DURABILITY_LEVELS）
+        self.durability = durability or config.data.save_durability
+        # 書き込む形式: "binary"（save_format.py）/ "json"。読み込みは両方に対応
+        self.save_format = save_format or config.data.save_format
+        # 直近にロードしたセーブデータの保存時刻（オフライン進行の計算用）
+        self.last_saved_at: Optional[datetime] = None
+        # 操作を追記するジャーナル（save_journal.py）。読み込みは常に、追記は journal 有効時
+        self.journal_enabled = config.data.save_journal if journal is None else journal
+        self.journal = SaveJournal(self.save_path.with_suffix('.journal'), self.durability)
+        # 追記するレコードの土台（直近に作ったスナップショットのID。無ければ追記しない）
+        self._journal_base: Optional[int] = None
+        # 追記（ゲームスレッド）と詰め直し（書き込みスレッド）を排他する
+        self._journal_lock = threading.Lock()
     
-    def save(self, data: Dict[str, Any]) -> bool:
-        """データをセーブする（バージョンメタデータ付き）"""
+    def begin_snapshot(self) -> datetime:
+        """スナップショットの保存時刻を決める（セーブ内容を作るのと同じスレッドで呼ぶ）
+
+        以降に追記する操作はこのスナップショットの上に積む。
+        """
+        timestamp = datetime.now()
+        with self._journal_lock:
+            self._journal_base = snapshot_id(timestamp)
+        return timestamp
+    
+    def save(self, data: Dict[str, Any], timestamp: Optional[datetime] = None) -> bool:
+        """データをセーブする（バージョンメタデータ付き）
+
+        一時ファイルに書いて os.replace で置き換えるので、途中で落ちても
+        セーブファイルには前回か今回の内容が残る。
+        timestamp は begin_snapshot() の戻り値（省略時はここで決める）。
+        """
         try:
-            # ディレクトリを作成
-            self.save_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # 既存のファイルをバックアップ
-            if self.save_path.exists():
-                self.save_path.rename(self.backup_path)
-            
+            if timestamp is None:
+                timestamp = self.begin_snapshot()
             # メタデータを追加
             save_data = {
                 "version": SAVE_DATA_VERSION,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp.isoformat(),
                 "data": data
             }
-            
-            # 新しいファイルに書き込み
-            with open(self.save_path, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, ensure_ascii=False, indent=2)
-            
-            # バックアップを削除
-            if self.backup_path.exists():
-                self.backup_path.unlink()
+            self._write(save_data)
             
             logger.info(
                 f"Save successful: {self.save_path} "
-                f"(version={SAVE_DATA_VERSION})"
+                f"(version={SAVE_DATA_VERSION}, format={self.save_format})"
             )
-            return True
-            
         except Exception as e:
             logger.error(f"Save failed: {e}")
-            # バックアップから復元を試行
-            self._restore_backup()
             return False
+        
+        # スナップショットに含まれた操作をジャーナルから捨てる
+        try:
+            with self._journal_lock:
+                kept = self.journal.compact(snapshot_id(timestamp))
+            if kept:
+                logger.debug(f"Journal compacted: {kept} records kept")
+        except OSError as e:
+            # 古いレコードは読み込み時に土台のIDで読み飛ばされる
+            logger.warning(f"Journal compaction failed: {e}")
+        return True
+    
+    def append_action(
+        self, action: str, value: float, age_seconds: float, sync: bool = True
+    ) -> bool:
+        """操作をジャーナルに追記する（土台のスナップショットが無い・失敗したら False）
+
+        sync=False なら fsync は後で sync_journal() を呼んだ時に行う。
+        """
+        if not self.journal_enabled:
+            return False
+        with self._journal_lock:
+            base = self._journal_base
+            if base is None:
+                return False
+            try:
+                self.journal.append(base, action, value, age_seconds, sync)
+            except OSError as e:
+                logger.error(f"Journal append failed: {e}")
+                return False
+        return True
+
+    def sync_journal(self) -> bool:
+        """sync=False で追記した操作をディスクに反映する（書き込みスレッドから呼ぶ）"""
+        with self._journal_lock:
+            try:
+                self.journal.sync()
+            except OSError as e:
+                logger.error(f"Journal sync failed: {e}")
+                return False
+        return True
+    
+    def _write(self, save_data: Dict[str, Any]) -> None:
+        if self.save_format == "binary":
+            payload = save_format.encode(save_data)
+        elif self.save_format == "json":
+            payload = save_format.to_json(save_data).encode('utf-8')
+        else:
+            raise ValueError(f"未知のセーブ形式です: {self.save_format}")
+        # ディレクトリを作成
+        self.save_path.parent.mkdir(parents=True, exist_ok=True)
+        backup = self.backup_path if config.data.save_backup else None
+        atomic_write(self.save_path, payload, self.durability, backup)
     
     def load(self) -> Optional[Dict[str, Any]]:
-        """データをロードする（バージョンチェック付き）"""
+        """データをロードする（CRC・バージョンチェック付き。壊れていれば .backup から）
+
+        スナップショットの後に追記された操作はジャーナルから再生する。
+        """
+        data = self._load_snapshot()
+        with self._journal_lock:
+            self._journal_base = None
+            if data is None or self.last_saved_at is None:
+                return data
+            base = snapshot_id(self.last_saved_at)
+            self._journal_base = base
+            try:
+                records = self.journal.read(base)
+            except OSError as e:
+                logger.error(f"Journal read failed: {e}")
+                return data
+        if not records:
+            return data
         try:
-            if not self.save_path.exists():
-                logger.info("No save file found, creating new game")
-                return None
-            
-            with open(self.save_path, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
-            
-            # バージョン情報をチェック
-            if isinstance(save_data, dict) and "version" in save_data:
-                version = save_data.get("version")
-                data = save_data.get("data", save_data)
-                logger.info(
-                    f"Load successful: {self.save_path} "
-                    f"(version={version}, current={SAVE_DATA_VERSION})"
-                )
-                
-                # バージョン互換性チェック
-                if version != SAVE_DATA_VERSION:
-                    logger.warning(
-                        f"Save data version mismatch: "
-                        f"loaded={version}, current={SAVE_DATA_VERSION}. "
-                        f"Attempting migration..."
-                    )
-                    data = self._migrate_data(data, version)
-            else:
-                # 古い形式（バージョン情報なし）の互換性処理
-                logger.warning(
-                    f"Legacy save file format detected. "
-                    f"Attempting migration..."
-                )
-                data = self._migrate_legacy_data(save_data)
-            
+            data = replay(data, records)
+        except Exception as e:
+            logger.error(f"Journal replay failed: {e}")
             return data
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid save file format: {e}")
-            return self._load_backup()
+        logger.info(f"Replayed {len(records)} journal records")
+        # オフライン進行は最後の追記から
+        self.last_saved_at = datetime.fromtimestamp(records[-1].wall_time)
+        return data
+    
+    def _load_snapshot(self) -> Optional[Dict[str, Any]]:
+        if not self.save_path.exists():
+            if self.backup_path.exists():
+                # 以前の方式（リネームしてから書く）のセーブが途中で中断された
+                return self._load_backup()
+            if self.legacy_path != self.save_path and self.legacy_path.exists():
+                logger.info(f"Loading legacy JSON save: {self.legacy_path}")
+                return self._load_file(self.legacy_path, "legacy file")
+            logger.info("No save file found, creating new game")
+            return None
+        try:
+            return self._read(self.save_path, "save file")
         except Exception as e:
             logger.error(f"Load failed: {e}")
-            return self._load_backup()
+        # 壊れたセーブは次のセーブで上書きしない（.backup に移されて1世代前を消すこともない）
+        self._set_aside_corrupt()
+        data = self._load_backup()
+        if data is None:
+            logger.error("No usable backup, starting a new game")
+        return data
+
+    def _set_aside_corrupt(self) -> Optional[Path]:
+        """読めなかったセーブを <名前>.corrupt-<日時> に移して残す"""
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        corrupt_path = self.save_path.with_name(f"{self.save_path.name}.corrupt-{stamp}")
+        try:
+            os.replace(self.save_path, corrupt_path)
+        except OSError as e:
+            logger.error(f"Could not set aside corrupt save: {e}")
+            return None
+        logger.error(f"Corrupt save kept at {corrupt_path}")
+        return corrupt_path
     
     def _load_backup(self) -> Optional[Dict[str, Any]]:
         """バックアップファイルからロードを試行（バージョンチェック付き）"""
+        if self.backup_path.exists():
+            return self._load_file(self.backup_path, "backup file")
+        return None
+    
+    def _load_file(self, path: Path, source: str) -> Optional[Dict[str, Any]]:
         try:
-            if self.backup_path.exists():
-                with open(self.backup_path, 'r', encoding='utf-8') as f:
-                    save_data = json.load(f)
-                
-                # バージョン情報をチェック
-                if isinstance(save_data, dict) and "version" in save_data:
-                    version = save_data.get("version")
-                    data = save_data.get("data", save_data)
-                    logger.info(
-                        f"Loaded from backup file "
-                        f"(version={version}, current={SAVE_DATA_VERSION})"
-                    )
-                    if version != SAVE_DATA_VERSION:
-                        data = self._migrate_data(data, version)
-                else:
-                    data = self._migrate_legacy_data(save_data)
-                
-                return data
+            return self._read(path, source)
         except Exception as e:
-            logger.error(f"Backup load failed: {e}")
+            logger.error(f"Load from {source} failed: {e}")
+            return None
+    
+    def _read(self, path: Path, source: str) -> Dict[str, Any]:
+        """ファイルを読み、形式（先頭のマジック）に応じて解釈する"""
+        raw = path.read_bytes()
+        if save_format.is_binary(raw):
+            # CRC を確かめてから解釈する（壊れていれば SaveFormatError）
+            save_data = save_format.decode(raw)
+        else:
+            save_data = json.loads(raw.decode('utf-8'))
+        return self._unpack(save_data, source)
+    
+    def _unpack(self, save_data: Any, source: str) -> Dict[str, Any]:
+        """保存時刻を記録し、バージョンに応じてマイグレーションしたデータを返す"""
+        self.last_saved_at = self._parse_timestamp(save_data)
         
-        return None
+        # バージョン情報をチェック
+        if isinstance(save_data, dict) and "version" in save_data:
+            version = save_data.get("version")
+            data = save_data.get("data", save_data)
+            logger.info(
+                f"Loaded from {source} "
+                f"(version={version}, current={SAVE_DATA_VERSION})"
+            )
+            
+            # バージョン互換性チェック
+            if version != SAVE_DATA_VERSION:
+                logger.warning(
+                    f"Save data version mismatch: "
+                    f"loaded={version}, current={SAVE_DATA_VERSION}. "
+                    f"Attempting migration..."
+                )
+                data = self._migrate_data(data, version)
+        else:
+            # 古い形式（バージョン情報なし）の互換性処理
+            logger.warning(
+                f"Legacy save file format detected. "
+                f"Attempting migration..."
+            )
+            data = self._migrate_legacy_data(save_data)
+        
+        return data
+    
+    def export_json(self, path: str) -> bool:
+        """現在のセーブを JSON に書き出す（デバッグ用）"""
+        data = self.load()
+        if data is None:
+            logger.error("No save data to export")
+            return False
+        timestamp = self.last_saved_at or datetime.now()
+        save_data = {
+            "version": SAVE_DATA_VERSION,
+            "timestamp": timestamp.isoformat(),
+            "data": data,
+        }
+        try:
+            atomic_write(Path(path), save_format.to_json(save_data).encode('utf-8'), self.durability)
+        except OSError as e:
+            logger.error(f"Export failed: {e}")
+            return False
+        logger.info(f"Exported save to {path}")
+        return True
+    
+    def import_json(self, path: str) -> bool:
+        """JSON（export_json の出力や以前のセーブ）を読み込んでセーブにする（デバッグ用）"""
+        try:
+            data = self._read(Path(path), "import file")
+            timestamp = self.last_saved_at or datetime.now()
+            self._write(
+                {
+                    "version": SAVE_DATA_VERSION,
+                    "timestamp": timestamp.isoformat(),
+                    "data": data,
+                }
+            )
+        except Exception as e:
+            logger.error(f"Import failed: {e}")
+            return False
+        logger.info(f"Imported {path} into {self.save_path}")
+        return True
+    
+    @staticmethod
+    def _parse_timestamp(save_data: Any) -> Optional[datetime]:
+        """セーブデータの保存時刻を取得（無い/不正な場合はNone）"""
+        if not isinstance(save_data, dict):
+            return None
+        try:
+            return datetime.fromisoformat(save_data["timestamp"])
+        except (KeyError, TypeError, ValueError):
+            return None
     
     def _migrate_data(self, data: Dict[str, Any], from_version: str) -> Dict[str, Any]:
         """
@@ -156,15 +328,6 @@ class SaveManager:
         logger.info("Migrating legacy save data format")
         return data
     
-    def _restore_backup(self):
-        """バックアップファイルを復元"""
-        try:
-            if self.backup_path.exists():
-                self.backup_path.rename(self.save_path)
-                logger.info("Restored from backup")
-        except Exception as e:
-            logger.error(f"Backup restore failed: {e}")
-    
     def delete_save(self) -> bool:
         """セーブファイルを削除"""
         try:
@@ -172,6 +335,14 @@ class SaveManager:
                 self.save_path.unlink()
             if self.backup_path.exists():
                 self.backup_path.unlink()
+            if self.legacy_path.exists():
+                self.legacy_path.unlink()
+            with self._journal_lock:
+                self.journal.delete()
+                self._journal_base = None
+            temp_path = temp_path_for(self.save_path)
+            if temp_path.exists():
+                temp_path.unlink()
             logger.info("Save file deleted")
             return True
         except Exception as e:
@@ -180,4 +351,6 @@ class SaveManager:
     
     def has_save(self) -> bool:
         """セーブファイルが存在するかチェック"""
-        return self.save_path.exists() or self.backup_path.exists()
+        return any(
+            path.exists() for path in (self.save_path, self.backup_path, self.legacy_path)
+        )
@@ -0,0 +1,206 @@
+"""
+バックグラウンドのセーブ書き込み
+
+ゲームスレッドはセーブ内容のスナップショット（その場で作った辞書など）を submit するだけで、
+JSON への変換とファイルへの書き込みは書き込みスレッドが行う。
+待ち行列は1枠で、書き込み中に次のスナップショットが来たら新しい方で上書きする
+（最新だけを書けばよいので、古いスナップショットは捨てる）。
+
+ジャーナルの追記のように書き込み自体はゲームスレッドで済ませるものは、fsync だけを
+request_sync() で頼める（何回頼まれても次の1回にまとめる）。
+
+終了時は flush() / close() で未書き込みのスナップショットを書き終えてから止める。
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+SAVE_THREAD_NAME = "flower-save"
+
+SaveFunction = Callable[[Any], bool]
+SyncFunction = Callable[[], Any]
+DoneCallback = Callable[[bool], None]
+
+
+@dataclass(slots=True)
+class SaveWriterMetrics:
+    """書き込みの統計（秒）"""
+
+    submitted: int = 0  # submit された数
+    written: int = 0  # 書き込みに成功した数
+    failed: int = 0  # 書き込みに失敗した数
+    coalesced: int = 0  # 書く前に新しいスナップショットで上書きされた数
+    synced: int = 0  # request_sync() で行った fsync の回数
+    last_queue_latency: float = 0.0  # submit から書き込み開始まで
+    max_queue_latency: float = 0.0
+    last_write_duration: float = 0.0  # 変換と書き込みにかかった時間
+    max_write_duration: float = 0.0
+    total_write_duration: float = 0.0
+
+
+class AsyncSaveWriter:
+    """1枠・最新優先の待ち行列を持つセーブ書き込みスレッド"""
+
+    def __init__(self, save: SaveFunction, sync: Optional[SyncFunction] = None):
+        self._save = save
+        self._sync = sync
+        self._condition = threading.Condition()
+        # 待ち行列（1枠）: (スナップショット, submit時刻, 完了時のコールバック)
+        self._pending: Optional[tuple] = None
+        self._sync_requested = False
+        self._writing = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._metrics = SaveWriterMetrics()
+
+    @property
+    def metrics(self) -> SaveWriterMetrics:
+        """統計のコピー"""
+        with self._condition:
+            return replace(self._metrics)
+
+    @property
+    def busy(self) -> bool:
+        """書き込み中か、書き込み待ちがあるか"""
+        with self._condition:
+            return self._writing or self._pending is not None
+
+    def submit(self, snapshot: Any, on_done: Optional[DoneCallback] = None) -> None:
+        """スナップショットを書き込み待ちにする（待ちがあれば置き換える）
+
+        snapshot は渡した後に変更しないこと（書き込みスレッドが読む）。
+        on_done(成功したか) は書き込みスレッドから呼ばれる。
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("セーブ書き込みスレッドは停止しています")
+            if self._pending is not None:
+                self._metrics.coalesced += 1
+            self._pending = (snapshot, time.perf_counter(), on_done)
+            self._metrics.submitted += 1
+            self._wake()
+
+    def request_sync(self) -> None:
+        """書き込みスレッドで sync を呼ぶよう頼む（停止後は何もしない）"""
+        if self._sync is None:
+            return
+        with self._condition:
+            if self._closed:
+                return
+            self._sync_requested = True
+            self._wake()
+
+    def _wake(self) -> None:
+        """書き込みスレッドを（無ければ起動して）起こす（_condition を持って呼ぶ）"""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name=SAVE_THREAD_NAME, daemon=True
+            )
+            self._thread.start()
+        self._condition.notify_all()
+
+    def discard(self) -> None:
+        """書き込み待ちを捨て、書き込み中のものが終わるまで待つ"""
+        with self._condition:
+            self._pending = None
+            while self._writing:
+                self._condition.wait()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """書き込み待ちがなくなるまで待つ（timeout 内に終わらなければ False）"""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._writing
+                and self._pending is None
+                and not self._sync_requested,
+                timeout,
+            )
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """書き込み待ちを書き終えてからスレッドを止める"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+            if thread.is_alive():
+                logger.warning("Save writer did not finish before timeout")
+                return False
+        metrics = self.metrics
+        if metrics.submitted:
+            logger.info(
+                f"Save writer closed: written={metrics.written} failed={metrics.failed} "
+                f"coalesced={metrics.coalesced} "
+                f"max_write={metrics.max_write_duration * 1e3:.1f}ms "
+                f"max_latency={metrics.max_queue_latency * 1e3:.1f}ms"
+            )
+        return True
+
+    # --- 書き込みスレッド ---
+    def _run(self) -> None:
+        condition = self._condition
+        while True:
+            with condition:
+                while (
+                    self._pending is None and not self._sync_requested and not self._closed
+                ):
+                    condition.wait()
+                # スナップショットを先に書き、待ちが無くなってから sync する
+                sync_only = self._pending is None
+                if sync_only:
+                    if not self._sync_requested:
+                        return  # 停止要求があり、書き込み待ちもない
+                    self._sync_requested = False
+                else:
+                    snapshot, submitted_at, on_done = self._pending
+                    self._pending = None
+                self._writing = True
+            if sync_only:
+                self._run_sync()
+                continue
+
+            started = time.perf_counter()
+            try:
+                ok = bool(self._save(snapshot))
+            except Exception as e:
+                logger.error(f"Background save failed: {e}")
+                ok = False
+            finished = time.perf_counter()
+            # flush() が戻る前にコールバックまで済ませる
+            if on_done is not None:
+                try:
+                    on_done(ok)
+                except Exception as e:
+                    logger.error(f"Save callback error: {e}")
+
+            with condition:
+                metrics = self._metrics
+                latency = started - submitted_at
+                duration = finished - started
+                metrics.last_queue_latency = latency
+                metrics.max_queue_latency = max(metrics.max_queue_latency, latency)
+                metrics.last_write_duration = duration
+                metrics.max_write_duration = max(metrics.max_write_duration, duration)
+                metrics.total_write_duration += duration
+                if ok:
+                    metrics.written += 1
+                else:
+                    metrics.failed += 1
+                self._writing = False
+                condition.notify_all()
+
+    def _run_sync(self) -> None:
+        try:
+            self._sync()
+        except Exception as e:
+            logger.error(f"Background sync failed: {e}")
+        with self._condition:
+            self._metrics.synced += 1
+            self._writing = False
+            self._condition.notify_all()
@@ -1,3 +1,5 @@
 from .flower import Flower, FlowerStats, SeedType, GrowthStage
+from .flower_batch import FlowerBatch
+from .garden import Garden
 
-__all__ = ['Flower', 'FlowerStats', 'SeedType', 'GrowthStage']
+__all__ = ['Flower', 'FlowerStats', 'SeedType', 'GrowthStage', 'FlowerBatch', 'Garden']
@@ -1,51 +1,29 @@
-from dataclasses import dataclass, asdict
-from typing import Optional, Dict, Any
+import copy
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 from enum import Enum
 import json
+import logging
 import os
+import struct
+from datetime import datetime
 from pathlib import Path
 from ..data.save_manager import SaveManager
-from ..utils.helpers import Observable, Timer
+from ..data.save_writer import AsyncSaveWriter
 from ..data.config import config
+from ..data.growth_tables import get_growth_tables
+from ..utils.helpers import format_time_compact, format_time_digital
 from ..utils.random_manager import get_rng
+from ..utils.rng_streams import FlowerStreams
+from .stats_tracker import StatsTracker
+
+logger = logging.getLogger(__name__)
 
 
 def _load_growth_tables() -> Dict[str, Any]:
-    """成長分岐テーブルをJSONから読み込む"""
-    try:
-        # プロジェクトルートからの相対パス
-        json_path = Path(__file__).parent.parent / "data" / "growth_tables.json"
-        with open(json_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        # フォールバック: デフォルト値を返す
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.warning(f"Failed to load growth_tables.json: {e}. Using default values.")
-        return {
-            "phase2_branch": {
-                "score_ranges": [
-                    {"min": 50, "max": 100, "result": "しなる"},
-                    {"min": 0, "max": 49, "result": "つる"}
-                ],
-                "default": "ふつう",
-                "seed_biases": {"陽": 5, "陰": 0},
-                "mental_bonus": {"threshold": 70, "bonus": 5}
-            },
-            "phase3_shape": {
-                "seed_base_values": {"陽": 10, "陰": 5},
-                "phase2_branch_values": {"しなる": 5, "つる": 0, "ふつう": 0},
-                "light_tendency_values": {"陽": 5, "陰": -5},
-                "shape_candidates": [
-                    {"name": "大輪", "min_base": 20},
-                    {"name": "まるまる", "min_base": 15},
-                    {"name": "ひらひら", "min_base": 10},
-                    {"name": "ちいさめ", "min_base": 5},
-                    {"name": "とがり", "min_base": -999}
-                ],
-                "default": "ふつう"
-            }
-        }
+    """成長分岐テーブル（JSONの内容）を取得"""
+    return get_growth_tables().raw
 
 
 class SeedType(Enum):
@@ -65,9 +43,98 @@ class GrowthStage(Enum):
     FLOWER = "花"
 
 
-@dataclass
+# 種段階〜蕾のキャラクター名
+_SEED_CHARACTER_NAMES = {
+    SeedType.YIN: "陰っち",
+    SeedType.YANG: "陽っち",
+}
+
+# 花段階: 種ごとのフェーズ3形状 → 最終進化名
+_FLOWER_SHAPE_NAMES = {
+    SeedType.YANG: {
+        "大輪": "ひまわり",
+        "まるまる": "たんぽぽ",
+        "ひらひら": "こすも",
+        "ちいさめ": "なでしこ",
+        "とがり": "ばら",
+        "ふつう": "ふつう",
+    },
+    SeedType.YIN: {
+        "大輪": "あじさい",
+        "まるまる": "ふじ",
+        "ひらひら": "さくら",
+        "ちいさめ": "すみれ",
+        "とがり": "ねも",
+        "ふつう": "かれはな",
+    },
+}
+
+# (種, フェーズ2分岐, フェーズ3形状) → 最終進化名
+FLOWER_NAME_TABLE: Dict[Tuple[SeedType, str, str], str] = {
+    (seed_type, branch, shape): name
+    for branch in ("しなる", "つる", "ふつう")
+    for seed_type, shape_map in _FLOWER_SHAPE_NAMES.items()
+    for shape, name in shape_map.items()
+}
+
+
+# 表示用文字列のメモ化（元の値が変わらない限り再フォーマットしない）
+@lru_cache(maxsize=256)
+def _age_compact_text(total_minutes: int) -> str:
+    return format_time_compact(total_minutes * 60.0)
+
+
+@lru_cache(maxsize=256)
+def _age_digital_text(total_minutes: int) -> str:
+    return format_time_digital(total_minutes * 60.0)
+
+
+@lru_cache(maxsize=None)
+def _character_label_text(stage: GrowthStage, seed_type: SeedType) -> str:
+    return f"{stage.value}（{seed_type.value}）"
+
+
+# 枯死ライン（水分がこの値以下になると枯れる）
+WITHER_WATER_LEVEL = 5.0
+
+# advance() が報告するイベント種別
+EVENT_GROWTH = "growth"
+EVENT_WITHERED = "withered"
+EVENT_LIGHT_FULL = "light_full"
+EVENT_WEED = "weed"
+EVENT_PEST = "pest"
+
+
+@dataclass(frozen=True)
+class AdvanceEvent:
+    """FlowerStats.advance() 中に発生したイベント"""
+
+    kind: str
+    at: float  # advance() 開始からの経過秒
+    old_stage: Optional[GrowthStage] = None
+    new_stage: Optional[GrowthStage] = None
+
+
+@dataclass(frozen=True)
+class OfflineReport:
+    """ロード時のオフライン進行の結果"""
+
+    elapsed_seconds: float  # 実際に進めた秒数
+    skipped_seconds: float  # 上限や枯死で進めなかった秒数
+    events: Tuple[AdvanceEvent, ...] = ()
+
+    @property
+    def growth_events(self) -> List[AdvanceEvent]:
+        return [e for e in self.events if e.kind == EVENT_GROWTH]
+
+    @property
+    def withered(self) -> bool:
+        return any(e.kind == EVENT_WITHERED for e in self.events)
+
+
+@dataclass(slots=True)
 class FlowerStats:
-    """花の基本統計情報"""
+    """花の基本統計情報（__slots__ で1インスタンスあたりのメモリを抑える）"""
 
     # 基本情報
     seed_type: SeedType = SeedType.YANG
@@ -92,6 +159,14 @@ class FlowerStats:
     light_required_for_bud: float = 60.0
     light_required_for_flower: float = 80.0
 
+    # 花ごとの乱数ストリーム（未設定なら共有の RandomManager を使う）
+    rng_streams: Optional[FlowerStreams] = field(default=None, compare=False, repr=False)
+
+    def _stream(self, name: str):
+        """用途 name（weeds/pests/phase3）の乱数ストリーム"""
+        streams = self.rng_streams
+        return get_rng() if streams is None else getattr(streams, name)
+
     def update(self, dt: float) -> None:
         """統計情報を更新"""
         self.age_seconds += dt
@@ -108,25 +183,173 @@ class FlowerStats:
             self.light_level += config.game.light_amount * dt
             self.light_level = min(100, self.light_level)
 
-        # 雑草の自然発生（低確率）
-        if (
-            config.game.weed_growth_chance > 0
-            and self.weed_count < config.game.max_weeds
-        ):
-            if get_rng().random() < config.game.weed_growth_chance * dt:
-                self.weed_count += 1
-
-        # 害虫の自然発生（低確率）
-        if (
-            config.game.pest_growth_chance > 0
-            and self.pest_count < config.game.max_pests
-        ):
-            if get_rng().random() < config.game.pest_growth_chance * dt:
-                self.pest_count += 1
+        # 雑草/害虫の自然発生（低確率）
+        game = config.game
+        weeds = game.weed_growth_chance > 0 and self.weed_count < game.max_weeds
+        pests = game.pest_growth_chance > 0 and self.pest_count < game.max_pests
+        streams = self.rng_streams
+        if weeds and pests and streams is not None:
+            # 花ごとのストリームからは2個を1回の呼び出しで引く（値は1個ずつ引くのと同じ）
+            weed_draw, pest_draw = streams.draw_pair()
+        else:
+            weed_draw = self._stream("weeds").random() if weeds else 1.0
+            pest_draw = self._stream("pests").random() if pests else 1.0
+        if weeds and weed_draw < game.weed_growth_chance * dt:
+            self.weed_count += 1
+        if pests and pest_draw < game.pest_growth_chance * dt:
+            self.pest_count += 1
 
         # 成長判定
         self._check_growth()
 
+    def advance(
+        self,
+        total_dt: float,
+        stop_on_wither: bool = False,
+        stop_on_growth: bool = False,
+    ) -> List[AdvanceEvent]:
+        """total_dt 秒をイベント駆動で進める
+
+        水の減少と光の蓄積は線形なので、成長しきい値・枯死ライン・光の上限に
+        到達する時刻を解析的に求め、次のイベントまで一気に進めて適用する。
+        雑草/害虫の発生は指数分布の到着間隔でサンプリングする。
+
+        Args:
+            total_dt: 進める秒数
+            stop_on_wither: Trueなら枯死した時点で停止する
+            stop_on_growth: Trueなら成長段階が変わった時点で停止する
+
+        Returns:
+            発生したイベントのリスト（時刻順）
+        """
+        game = config.game
+        events: List[AdvanceEvent] = []
+        elapsed = 0.0
+        next_weed = self._sample_spawn(
+            "weeds", game.weed_growth_chance, self.weed_count, game.max_weeds
+        )
+        next_pest = self._sample_spawn(
+            "pests", game.pest_growth_chance, self.pest_count, game.max_pests
+        )
+
+        while True:
+            t_growth, growth_cause = self._time_to_growth()
+            t_wither = self._time_to_wither()
+            t_full = self._time_to_light_full()
+            t_weed = next_weed - elapsed
+            t_pest = next_pest - elapsed
+            step = min(t_growth, t_wither, t_full, t_weed, t_pest)
+            remaining = total_dt - elapsed
+            if step > remaining:
+                self._integrate(remaining)
+                break
+
+            self._integrate(step)
+            elapsed += step
+
+            if step == t_full:
+                self.light_level = 100
+                events.append(AdvanceEvent(EVENT_LIGHT_FULL, elapsed))
+            elif step == t_growth:
+                old_stage = self.growth_stage
+                # 浮動小数点誤差で取りこぼさないよう到達値にそろえる
+                if growth_cause == "age":
+                    self.age_seconds = max(
+                        self.age_seconds, game.growth_age_threshold_flower
+                    )
+                else:
+                    self.light_level = max(self.light_level, self._light_required())
+                self._check_growth()
+                events.append(
+                    AdvanceEvent(EVENT_GROWTH, elapsed, old_stage, self.growth_stage)
+                )
+                if stop_on_growth:
+                    break
+            elif step == t_wither:
+                self.water_level = WITHER_WATER_LEVEL
+                events.append(AdvanceEvent(EVENT_WITHERED, elapsed))
+                if stop_on_wither:
+                    break
+            elif step == t_weed:
+                self.weed_count += 1
+                events.append(AdvanceEvent(EVENT_WEED, elapsed))
+                next_weed = elapsed + self._sample_spawn(
+                    "weeds", game.weed_growth_chance, self.weed_count, game.max_weeds
+                )
+            else:
+                self.pest_count += 1
+                events.append(AdvanceEvent(EVENT_PEST, elapsed))
+                next_pest = elapsed + self._sample_spawn(
+                    "pests", game.pest_growth_chance, self.pest_count, game.max_pests
+                )
+
+        return events
+
+    def _integrate(self, dt: float) -> None:
+        """イベントの起きない区間 dt を解析的に進める"""
+        if dt <= 0:
+            return
+        self.age_seconds += dt
+        self.water_level = max(0, self.water_level - config.game.water_decay_rate * dt)
+        self.environment_level = max(
+            0, self.environment_level - config.game.environment_decay_rate * dt
+        )
+        if self.is_light_on:
+            self.light_level = min(100, self.light_level + config.game.light_amount * dt)
+
+    def _light_required(self) -> float:
+        """現在の成長段階から次に進むのに必要な光の蓄積量"""
+        return {
+            GrowthStage.SEED: self.light_required_for_sprout,
+            GrowthStage.SPROUT: self.light_required_for_stem,
+            GrowthStage.STEM: self.light_required_for_bud,
+            GrowthStage.BUD: self.light_required_for_flower,
+        }.get(self.growth_stage, float("inf"))
+
+    def _time_to_growth(self) -> Tuple[float, str]:
+        """次の成長段階に進むまでの秒数とその要因（"light" / "age"）"""
+        if self.growth_stage == GrowthStage.FLOWER:
+            return float("inf"), "light"
+        required = self._light_required()
+        if self.light_level >= required:
+            return 0.0, "light"
+
+        t_light = float("inf")
+        rate = config.game.light_amount
+        if self.is_light_on and rate > 0 and required <= 100:
+            t_light = (required - self.light_level) / rate
+        if self.growth_stage == GrowthStage.BUD:
+            t_age = max(0.0, config.game.growth_age_threshold_flower - self.age_seconds)
+            if t_age < t_light:
+                return t_age, "age"
+        return t_light, "light"
+
+    def _time_to_wither(self) -> float:
+        """水分が枯死ラインに達するまでの秒数"""
+        rate = config.game.water_decay_rate
+        if self.water_level <= WITHER_WATER_LEVEL or rate <= 0:
+            return float("inf")
+        return (self.water_level - WITHER_WATER_LEVEL) / rate
+
+    def _time_to_light_full(self) -> float:
+        """光蓄積量が上限100に達するまでの秒数"""
+        rate = config.game.light_amount
+        if not self.is_light_on or rate <= 0 or self.light_level >= 100:
+            return float("inf")
+        return (100 - self.light_level) / rate
+
+    def time_to_next_event(self) -> float:
+        """次の決定的イベント（成長・枯死・光の上限）までの秒数"""
+        return min(
+            self._time_to_growth()[0], self._time_to_wither(), self._time_to_light_full()
+        )
+
+    def _sample_spawn(self, stream: str, chance: float, count: int, max_count: int) -> float:
+        """次の発生までの秒数を指数分布からサンプリング"""
+        if chance <= 0 or count >= max_count:
+            return float("inf")
+        return self._stream(stream).expovariate(chance)
+
     def _check_growth(self) -> None:
         """成長段階と分岐の判定"""
         import logging
@@ -235,16 +458,12 @@ class FlowerStats:
     @property
     def age_formatted(self) -> str:
         """年齢をフォーマットされた文字列で取得"""
-        from ..utils.helpers import format_time_compact
-
-        return format_time_compact(self.age_seconds)
+        return _age_compact_text(int(self.age_seconds // 60))
 
     @property
     def age_digital(self) -> str:
         """年齢をデジタル時計形式で取得"""
-        from ..utils.helpers import format_time_digital
-
-        return format_time_digital(self.age_seconds)
+        return _age_digital_text(int(self.age_seconds // 60))
 
     @property
     def growth_stage_display(self) -> str:
@@ -254,57 +473,26 @@ class FlowerStats:
     @property
     def character_name(self) -> str:
         """キャラクター名を取得"""
-        # 種タイプに基づく基本キャラクター名マッピング
-        seed_name_map = {
-            SeedType.YIN: "陰っち",
-            SeedType.YANG: "陽っち",
-        }
-        
         # 花段階の場合は、成長分岐の結果に基づいて最終進化名を返す
         if self.growth_stage == GrowthStage.FLOWER:
-            shape_map_by_seed = {
-                SeedType.YANG: {
-                    "大輪": "ひまわり",
-                    "まるまる": "たんぽぽ",
-                    "ひらひら": "こすも",
-                    "ちいさめ": "なでしこ",
-                    "とがり": "ばら",
-                    "ふつう": "ふつう",
-                },
-                SeedType.YIN: {
-                    "大輪": "あじさい",
-                    "まるまる": "ふじ",
-                    "ひらひら": "さくら",
-                    "ちいさめ": "すみれ",
-                    "とがり": "ねも",
-                    "ふつう": "かれはな",
-                },
-            }
-            flower_name_map = {}
-            for branch in ("しなる", "つる", "ふつう"):
-                for seed_type, shape_map in shape_map_by_seed.items():
-                    for shape, name in shape_map.items():
-                        flower_name_map[(seed_type, branch, shape)] = name
-            
-            # 分岐結果の組み合わせで検索
-            key = (self.seed_type, self.phase2_branch, self.phase3_shape)
-            if key in flower_name_map:
-                return flower_name_map[key]
-            
-            # デフォルト: 種タイプに基づく基本名
-            base_name = seed_name_map.get(self.seed_type, "ふらわっち")
-            # "っち"を削除して花名に変換
+            name = FLOWER_NAME_TABLE.get(
+                (self.seed_type, self.phase2_branch, self.phase3_shape)
+            )
+            if name is not None:
+                return name
+            # デフォルト: 種タイプに基づく基本名から"っち"を削除して花名に変換
+            base_name = _SEED_CHARACTER_NAMES.get(self.seed_type, "ふらわっち")
             if base_name.endswith("っち"):
                 return base_name[:-2]
             return base_name
         
         # 種段階以降は基本名を返す
-        return seed_name_map.get(self.seed_type, "ふらわっち")
+        return _SEED_CHARACTER_NAMES.get(self.seed_type, "ふらわっち")
 
     @property
     def character_label(self) -> str:
         """UI表示用のラベル（成長段階と種タイプ）"""
-        return f"{self.growth_stage.value}（{self.seed_type.value}）"
+        return _character_label_text(self.growth_stage, self.seed_type)
 
     @property
     def needs_water(self) -> bool:
@@ -331,21 +519,111 @@ class FlowerStats:
         """完全に成長したかどうか"""
         return self.growth_stage == GrowthStage.FLOWER
 
+    def preview(self, dt: float) -> "FlowerStats":
+        """表示用: dt 秒後の水分・光・環境だけを進めたコピー（乱数ストリームは持たない）
+
+        dt が次の決定的イベント（time_to_next_event）より前の間に限って正しい。
+        """
+        clone = copy.copy(self)
+        clone.rng_streams = None
+        clone._integrate(dt)
+        return clone
+
+    def copy(self) -> "FlowerStats":
+        """スナップショットを作成（乱数ストリームも複製し、元の花の乱数列は進めない）"""
+        clone = copy.copy(self)
+        if self.rng_streams is not None:
+            clone.rng_streams = self.rng_streams.copy()
+        return clone
+
     def to_dict(self) -> dict:
-        """辞書形式に変換"""
-        data = asdict(self)
-        # Enumを文字列に変換
-        data["seed_type"] = self.seed_type.value
-        data["growth_stage"] = self.growth_stage.value
+        """辞書形式に変換（Enumは文字列。乱数ストリームがあればその状態も含む）"""
+        data = {
+            "seed_type": self.seed_type.value,
+            "growth_stage": self.growth_stage.value,
+            "age_seconds": self.age_seconds,
+            "water_level": self.water_level,
+            "light_level": self.light_level,
+            "is_light_on": self.is_light_on,
+            "weed_count": self.weed_count,
+            "pest_count": self.pest_count,
+            "environment_level": self.environment_level,
+            "mental_level": self.mental_level,
+            "light_tendency_yin": self.light_tendency_yin,
+            "phase2_branch": self.phase2_branch,
+            "phase3_shape": self.phase3_shape,
+            "light_required_for_sprout": self.light_required_for_sprout,
+            "light_required_for_stem": self.light_required_for_stem,
+            "light_required_for_bud": self.light_required_for_bud,
+            "light_required_for_flower": self.light_required_for_flower,
+        }
+        if self.rng_streams is not None:
+            data["rng_streams"] = self.rng_streams.to_state()
         return data
 
+    def tobytes(self) -> bytes:
+        """固定長のバイナリ表現に変換（frombytes で復元。乱数ストリームは含まない）"""
+        flags = (1 if self.is_light_on else 0) | (2 if self.light_tendency_yin else 0)
+        return _STATS_STRUCT.pack(
+            STATS_BINARY_VERSION,
+            _SEED_CODES[self.seed_type],
+            _STAGE_CODES[self.growth_stage],
+            flags,
+            self.weed_count,
+            self.pest_count,
+            self.age_seconds,
+            self.water_level,
+            self.light_level,
+            self.environment_level,
+            self.mental_level,
+            self.light_required_for_sprout,
+            self.light_required_for_stem,
+            self.light_required_for_bud,
+            self.light_required_for_flower,
+            _encode_name(self.phase2_branch),
+            _encode_name(self.phase3_shape),
+        )
+
+    @classmethod
+    def frombytes(cls, data: bytes) -> "FlowerStats":
+        """tobytes() のバイナリ表現から作成"""
+        if len(data) != _STATS_STRUCT.size:
+            raise ValueError(
+                f"FlowerStats のバイナリ長が不正です: {len(data)} != {_STATS_STRUCT.size}"
+            )
+        (
+            version, seed_code, stage_code, flags, weed_count, pest_count,
+            age_seconds, water_level, light_level, environment_level, mental_level,
+            sprout, stem, bud, flower, branch, shape,
+        ) = _STATS_STRUCT.unpack(data)
+        if version != STATS_BINARY_VERSION:
+            raise ValueError(f"未対応のバイナリバージョンです: {version}")
+        return cls(
+            seed_type=_SEED_ORDER[seed_code],
+            growth_stage=_STAGE_ORDER[stage_code],
+            age_seconds=age_seconds,
+            water_level=water_level,
+            light_level=light_level,
+            is_light_on=bool(flags & 1),
+            weed_count=weed_count,
+            pest_count=pest_count,
+            environment_level=environment_level,
+            mental_level=mental_level,
+            light_tendency_yin=bool(flags & 2),
+            phase2_branch=_decode_name(branch),
+            phase3_shape=_decode_name(shape),
+            light_required_for_sprout=sprout,
+            light_required_for_stem=stem,
+            light_required_for_bud=bud,
+            light_required_for_flower=flower,
+        )
+
     def _compute_phase2_branch(self) -> str:
         """フェーズ2分岐（JSONテーブルから読み込む）"""
         import logging
         logger = logging.getLogger(__name__)
         
-        tables = _load_growth_tables()
-        phase2_config = tables.get("phase2_branch", {})
+        tables = get_growth_tables()
         
         # 総合スコア: 栄養/光/メンタル + 種バイアス（環境整備機能削除によりenvironment_levelは使用停止）
         base_score = 0.0
@@ -360,9 +638,8 @@ class FlowerStats:
             f"メンタル={mental_contrib:.1f} → 平均={base_score:.2f}"
         )
         
-        # 種バイアス（JSONから読み込む）
-        seed_biases = phase2_config.get("seed_biases", {})
-        seed_bias = seed_biases.get(self.seed_type.value, 0)
+        # 種バイアス
+        seed_bias = tables.seed_biases.get(self.seed_type.value, 0)
         score = base_score + seed_bias
         
         logger.info(
@@ -370,99 +647,107 @@ class FlowerStats:
             f"→ スコア={score:.2f}"
         )
         
-        # メンタル高値バイアス（JSONから読み込む）
-        mental_bonus = phase2_config.get("mental_bonus", {})
-        mental_bonus_value = 0
-        if self.mental_level >= mental_bonus.get("threshold", 70):
-            mental_bonus_value = mental_bonus.get("bonus", 5)
+        # メンタル高値バイアス
+        if self.mental_level >= tables.mental_threshold:
+            mental_bonus_value = tables.mental_bonus
             score += mental_bonus_value
             logger.info(
                 f"[フェーズ2分岐] メンタル高値バイアス: "
-                f"メンタル={self.mental_level:.1f}>=70 → +{mental_bonus_value} "
-                f"→ スコア={score:.2f}"
+                f"メンタル={self.mental_level:.1f}>={tables.mental_threshold} "
+                f"→ +{mental_bonus_value} → スコア={score:.2f}"
             )
         
-        # スコア範囲から結果を決定（JSONから読み込む）
-        score_ranges = phase2_config.get("score_ranges", [])
-        result = None
-        for range_config in score_ranges:
-            if range_config["min"] <= score <= range_config["max"]:
-                result = range_config["result"]
-                logger.info(
-                    f"[フェーズ2分岐] 結果決定: スコア={score:.2f} "
-                    f"→ 範囲[{range_config['min']}-{range_config['max']}] "
-                    f"→ {result}"
-                )
-                return result
+        # スコア範囲から結果を決定
+        matched = tables.match_score_range(score)
+        if matched is not None:
+            low, high, result = matched
+            logger.info(
+                f"[フェーズ2分岐] 結果決定: スコア={score:.2f} "
+                f"→ 範囲[{low}-{high}] → {result}"
+            )
+            return result
         
-        result = phase2_config.get("default", "ふつう")
+        result = tables.branch_default
         logger.info(
             f"[フェーズ2分岐] 結果決定: スコア={score:.2f} "
             f"→ デフォルト → {result}"
         )
         return result
 
+    def phase2_score(self, light_level: Optional[float] = None) -> float:
+        """フェーズ2分岐の総合スコア（light_level を指定するとその光量で計算）"""
+        tables = get_growth_tables()
+        light = self.light_level if light_level is None else light_level
+        score = (
+            min(100, self.water_level) + min(100, light) + min(100, self.mental_level)
+        ) / 3.0 + tables.seed_biases.get(self.seed_type.value, 0)
+        if self.mental_level >= tables.mental_threshold:
+            score += tables.mental_bonus
+        return score
+
+    def phase3_candidates(self) -> Tuple[str, ...]:
+        """現在の種・フェーズ2分岐・光傾向で有効な形候補（フェーズ3でこの中から乱択）"""
+        tables = get_growth_tables()
+        base = (
+            tables.seed_base_values.get(self.seed_type.value, 5)
+            + tables.phase2_branch_values.get(self.phase2_branch, 0)
+            + tables.light_tendency_values.get(
+                "陰" if self.light_tendency_yin else "陽", 0
+            )
+        )
+        return tables.phase3_candidates(base) or (tables.shape_default,)
+
     def _compute_phase3_shape(self) -> str:
         """フェーズ3形状（JSONテーブルから読み込む）"""
         import logging
         logger = logging.getLogger(__name__)
         
-        tables = _load_growth_tables()
-        phase3_config = tables.get("phase3_shape", {})
+        tables = get_growth_tables()
         
         base = 0
         
-        # 種ベース値（JSONから読み込む）
-        seed_base_values = phase3_config.get("seed_base_values", {})
-        seed_base = seed_base_values.get(self.seed_type.value, 5)
+        # 種ベース値
+        seed_base = tables.seed_base_values.get(self.seed_type.value, 5)
         base += seed_base
         logger.info(
             f"[フェーズ3分岐] 種ベース値: {self.seed_type.value}=+{seed_base} "
             f"→ ベース={base}"
         )
         
-        # フェーズ2分岐値（JSONから読み込む）
-        phase2_branch_values = phase3_config.get("phase2_branch_values", {})
-        phase2_value = phase2_branch_values.get(self.phase2_branch, 0)
+        # フェーズ2分岐値
+        phase2_value = tables.phase2_branch_values.get(self.phase2_branch, 0)
         base += phase2_value
         logger.info(
             f"[フェーズ3分岐] フェーズ2分岐値: {self.phase2_branch}=+{phase2_value} "
             f"→ ベース={base}"
         )
         
-        # 光傾向値（JSONから読み込む）
-        light_tendency_values = phase3_config.get("light_tendency_values", {})
+        # 光傾向値
         light_tendency_key = "陰" if self.light_tendency_yin else "陽"
-        light_tendency_value = light_tendency_values.get(light_tendency_key, 0)
+        light_tendency_value = tables.light_tendency_values.get(light_tendency_key, 0)
         base += light_tendency_value
         logger.info(
             f"[フェーズ3分岐] 光傾向値: {light_tendency_key}=+{light_tendency_value} "
             f"→ ベース={base}"
         )
         
-        # 形候補（JSONから読み込む）
-        shape_candidates = phase3_config.get("shape_candidates", [])
-        valid = [
-            candidate["name"]
-            for candidate in shape_candidates
-            if base >= candidate.get("min_base", -999)
-        ]
+        # 形候補（しきい値で前計算済み、JSONの並び順）
+        valid = tables.phase3_candidates(base)
         
         logger.info(
-            f"[フェーズ3分岐] 有効候補: ベース={base} → {valid}"
+            f"[フェーズ3分岐] 有効候補: ベース={base} → {list(valid)}"
         )
         
         if not valid:
-            result = phase3_config.get("default", "ふつう")
+            result = tables.shape_default
             logger.info(
                 f"[フェーズ3分岐] 結果決定: 有効候補なし → デフォルト={result}"
             )
             return result
         
-        from ..utils.random_manager import get_rng
-        result = get_rng().choice(valid)
+        result = self._stream("phase3").choice(valid)
         logger.info(
-            f"[フェーズ3分岐] 結果決定: ベース={base}, 候補={valid} "
+            f"[フェーズ3分岐] 結果決定: ベース={base}, 候補={list(valid)} "
             f"→ ランダム選択 → {result}"
         )
         return result
@@ -470,48 +755,103 @@ class FlowerStats:
     @classmethod
     def from_dict(cls, data: dict) -> "FlowerStats":
         """辞書から作成"""
-        # デバッグ: 受信したデータを確認
-        print(f"DEBUG: from_dict received data: {data}")
+        logger.debug("from_dict received data: %s", data)
 
         # 古い形式のデータを新しい形式に変換
         if "hunger" in data:
-            print("DEBUG: Converting old format to new format")
-            # 古い形式から新しい形式への変換
-            new_data = {
-                "seed_type": SeedType.YANG,  # デフォルト値
-                "growth_stage": GrowthStage.SEED,  # デフォルト値
-                "age_seconds": data.get("age_seconds", 0.0),
-                "water_level": 50.0,  # 古いhungerを水レベルに変換
-                "light_level": 0.0,  # デフォルト値（光は手動で与える）
-                "is_light_on": False,  # デフォルト値（光はOFF）
-                "weed_count": 0,
-                "pest_count": 0,
-                "environment_level": 0.0,
-                "mental_level": 0.0,
-                "light_tendency_yin": False,
-                "phase2_branch": "ふつう",
-                "phase3_shape": "ふつう",
-                "light_required_for_sprout": 20.0,
-                "light_required_for_stem": 40.0,
-                "light_required_for_bud": 60.0,
-                "light_required_for_flower": 80.0,
-            }
-            data = new_data
+            logger.debug("Converting old format to new format")
+            # 古い形式から新しい形式への変換（水分50、その他はデフォルト値）
+            return cls(age_seconds=data.get("age_seconds", 0.0), water_level=50.0)
 
+        kwargs = dict(data)
         # 文字列をEnumに変換
-        if "seed_type" in data and isinstance(data["seed_type"], str):
-            legacy_seed_map = {
-                "太陽": "陽",
-                "風": "陽",
-                "月": "陰",
-                "雨": "陰",
-            }
-            seed_value = legacy_seed_map.get(data["seed_type"], data["seed_type"])
-            data["seed_type"] = SeedType(seed_value)
-        if "growth_stage" in data and isinstance(data["growth_stage"], str):
-            data["growth_stage"] = GrowthStage(data["growth_stage"])
-
-        return cls(**data)
+        seed_type = kwargs.get("seed_type")
+        if isinstance(seed_type, str):
+            kwargs["seed_type"] = SeedType(_LEGACY_SEED_VALUES.get(seed_type, seed_type))
+        growth_stage = kwargs.get("growth_stage")
+        if isinstance(growth_stage, str):
+            kwargs["growth_stage"] = GrowthStage(growth_stage)
+        rng_streams = kwargs.get("rng_streams")
+        if isinstance(rng_streams, dict):
+            kwargs["rng_streams"] = FlowerStreams.from_state(rng_streams)
+
+        return cls(**kwargs)
+
+
+# 旧バージョンの種名 → 現行の陰/陽
+_LEGACY_SEED_VALUES = {
+    "太陽": "陽",
+    "風": "陽",
+    "月": "陰",
+    "雨": "陰",
+}
+
+# tobytes()/frombytes() の固定レイアウト
+# version, 種, 段階, フラグ(光ON/陰傾向), 雑草, 害虫, 実数9個, 分岐名, 形状名
+STATS_BINARY_VERSION = 1
+_NAME_BYTES = 24  # UTF-8 で全角8文字まで
+_STATS_STRUCT = struct.Struct(f"<BBBBHH9d{_NAME_BYTES}s{_NAME_BYTES}s")
+_SEED_ORDER = tuple(SeedType)
+_STAGE_ORDER = tuple(GrowthStage)
+_SEED_CODES = {seed: code for code, seed in enumerate(_SEED_ORDER)}
+_STAGE_CODES = {stage: code for code, stage in enumerate(_STAGE_ORDER)}
+
+
+def _encode_name(name: str) -> bytes:
+    encoded = name.encode("utf-8")
+    if len(encoded) > _NAME_BYTES:
+        raise ValueError(f"名前が長すぎます（{_NAME_BYTES}バイトまで）: {name}")
+    return encoded
+
+
+def _decode_name(raw: bytes) -> str:
+    return raw.rstrip(b"\0").decode("utf-8")
+
+
+def _rng_draws(stats: FlowerStats) -> Optional[Tuple[int, ...]]:
+    streams = stats.rng_streams
+    if streams is None:
+        return None
+    return (streams.generation, streams.weeds.draws, streams.pests.draws, streams.phase3.draws)
+
+
+def _field_getter(name: str):
+    return lambda stats: getattr(stats, name)
+
+
+# StatsTracker で追跡するキー（フィールド＋表示に合わせて丸めた派生値）
+STATS_KEYS: Dict[str, Any] = {
+    **{f.name: _field_getter(f.name) for f in fields(FlowerStats) if f.name != "rng_streams"},
+    "rng_draws": _rng_draws,
+    "age_minutes": lambda stats: int(stats.age_seconds // 60),
+    "water_display": lambda stats: int(stats.water_level * 2),
+    "light_display": lambda stats: int(stats.light_level * 2),
+    "mental_display": lambda stats: int(stats.mental_level * 2),
+}
+
+STATS_GROUPS: Dict[str, frozenset] = {
+    # セーブ内容（変わっていなければセーブを書かない）
+    "persisted": frozenset(
+        [f.name for f in fields(FlowerStats) if f.name != "rng_streams"] + ["rng_draws"]
+    ),
+    # メイン画面の表示に使う値（変わっていなければ再描画しない）
+    "visible": frozenset(
+        (
+            "seed_type",
+            "growth_stage",
+            "is_light_on",
+            "light_tendency_yin",
+            "phase2_branch",
+            "phase3_shape",
+            "weed_count",
+            "pest_count",
+            "age_minutes",
+            "water_display",
+            "light_display",
+            "mental_display",
+        )
+    ),
+}
 
 
 class Flower:
@@ -519,79 +859,181 @@ class Flower:
 
     def __init__(self, save_manager: Optional[SaveManager] = None):
         self.save_manager = save_manager or SaveManager()
-        self.stats = FlowerStats()
-        self.auto_save_timer = Timer(config.data.auto_save_interval, auto_reset=True)
-
-        # 状態変更の監視
-        self.stats_observable = Observable(self.stats)
+        # 状態変更の監視（フィールド単位の版番号。commit() でまとめて通知）
+        self.tracker = StatsTracker(
+            FlowerStats(rng_streams=FlowerStreams.for_flower(config.data.random_seed)),
+            STATS_KEYS,
+            STATS_GROUPS,
+        )
+        self._stage_before = self.stats.growth_stage
         self._setup_observers()
+        # 直近ロード時のオフライン進行結果（無効/未実施ならNone）
+        self.offline_report: Optional[OfflineReport] = None
+        # 最後に書いた（または読んだ）セーブ内容の版（Noneなら未保存）
+        self._saved_version: Optional[int] = None
+        # バックグラウンドのセーブ書き込み（config.data.async_save）
+        self.save_writer: Optional[AsyncSaveWriter] = (
+            AsyncSaveWriter(self._write_save, self._sync_journal)
+            if config.data.async_save
+            else None
+        )
 
         # 初期ロード
         self._load_state()
 
+    @property
+    def stats(self) -> FlowerStats:
+        return self.tracker.stats
+
+    @stats.setter
+    def stats(self, stats: FlowerStats) -> None:
+        self.tracker.attach(stats)
+
     def _setup_observers(self):
         """状態変更の監視を設定"""
-        self.stats_observable.add_observer(self._on_stats_changed)
-
-    def _on_stats_changed(self, old_stats: FlowerStats, new_stats: FlowerStats):
-        """統計情報が変更された時の処理"""
-        # 成長段階の変更を通知
-        if old_stats.growth_stage != new_stats.growth_stage:
-            print(
-                f"花が成長しました: {old_stats.growth_stage.value} → {new_stats.growth_stage.value}"
-            )
+        self.tracker.subscribe(("growth_stage",), self._on_stage_changed)
+
+    def _on_stage_changed(self, changed) -> None:
+        """成長段階が変更された時の処理"""
+        old_stage, self._stage_before = self._stage_before, self.stats.growth_stage
+        print(f"花が成長しました: {old_stage.value} → {self.stats.growth_stage.value}")
 
     def select_seed(self, seed_type: SeedType) -> None:
         """種を選択する"""
         self.stats.seed_type = seed_type
-        self.stats_observable.value = self.stats
+        self.tracker.commit()
+        self._record("seed", _SEED_CODES[seed_type])
 
     def update(self, dt: float) -> None:
         """花を更新"""
-        # 統計情報を更新
+        # 統計情報を更新（自動セーブは GameEngine の SaveScheduler が行う）
         self.stats.update(dt)
 
-        # 自動セーブタイマーを更新
-        if self.auto_save_timer.update(dt):
-            self.save()
-
     def water(self) -> None:
         """水を与える"""
         self.stats.water()
-        self.stats_observable.value = self.stats
+        self.tracker.commit()
+        self._record("water")
+
+    def fertilize(self) -> None:
+        """肥料を与える"""
+        self.stats.fertilize()
+        self.tracker.commit()
+        self._record("fertilize")
 
     def give_light(self, amount: float = None) -> None:
         """光を与える（非推奨: 光ON/OFFで蓄積する仕様に変更）"""
         if amount is None:
             amount = config.game.light_amount
         self.stats.give_light(amount)
-        self.stats_observable.value = self.stats
+        self.tracker.commit()
+        self._record("give_light", amount)
     
     def turn_light_on(self) -> None:
         """光をONにする（光蓄積量が増加する）"""
         self.stats.turn_light_on()
-        self.stats_observable.value = self.stats
+        self.tracker.commit()
+        self._record("light_on")
     
     def turn_light_off(self) -> None:
         """光をOFFにする（光蓄積量は維持される）"""
         self.stats.turn_light_off()
-        self.stats_observable.value = self.stats
+        self.tracker.commit()
+        self._record("light_off")
 
     def remove_weeds(self) -> None:
         """雑草を除去する"""
         self.stats.remove_weeds()
-        self.stats_observable.value = self.stats
+        self.tracker.commit()
+        self._record("remove_weeds")
 
     def remove_pests(self) -> None:
         """害虫を駆除する"""
         self.stats.remove_pests()
-        self.stats_observable.value = self.stats
+        self.tracker.commit()
+        self._record("remove_pests")
+
+    def adjust_mental(self, delta: float) -> None:
+        """メンタル（言葉）を調整（好き/嫌い）"""
+        self.stats.adjust_mental(delta)
+        self.tracker.commit()
+        self._record("mental", delta)
+
+    def _record(self, action: str, value: float = 0.0) -> bool:
+        """操作をセーブのジャーナルに追記する（config.data.save_journal）
+
+        fsync は書き込みスレッドに任せる。追記できなければ（新規ゲームで最初の
+        スナップショットがまだ無い時など）この操作を含めたスナップショットを書き、
+        以降の追記の土台にする。
+        """
+        if not self.save_manager or not config.data.save_journal:
+            return False
+        deferred = self.save_writer is not None
+        if self.save_manager.append_action(
+            action, value, self.stats.age_seconds, sync=not deferred
+        ):
+            if deferred:
+                self.save_writer.request_sync()
+            return True
+        return self.save(force=True)
 
-    def save(self) -> bool:
-        """状態をセーブ"""
+    def _sync_journal(self) -> None:
+        """書き込みスレッドから呼ばれる（追記したジャーナルの fsync）"""
         if self.save_manager:
-            return self.save_manager.save(self.stats.to_dict())
-        return False
+            self.save_manager.sync_journal()
+
+    def checkpoint(self) -> bool:
+        """ジャーナルに経過時間だけを追記する（追記できなければスナップショットを書く）"""
+        if not self.has_unsaved_changes():
+            return True
+        version = self.tracker.group_version("persisted")
+        if not self._record("checkpoint"):
+            return False
+        self._saved_version = version
+        return True
+
+    def save(self, force: bool = False) -> bool:
+        """状態をセーブ（前回のセーブからセーブ内容が変わっていなければ書かない）"""
+        if not self.save_manager:
+            return False
+        if not force and not self.has_unsaved_changes():
+            return True
+        version = self.tracker.group_version("persisted")
+        # 保存時刻はここで決める（以降のジャーナルの操作はこのセーブの上に積む）
+        snapshot = (self.stats.to_dict(), self.save_manager.begin_snapshot())
+        if self.save_writer is not None:
+            # 変換と書き込みは書き込みスレッドで（失敗したら次回また書く）
+            self._saved_version = version
+            self.save_writer.submit(snapshot, self._on_background_save)
+            return True
+        if not self._write_save(snapshot):
+            return False
+        self._saved_version = version
+        return True
+
+    def has_unsaved_changes(self) -> bool:
+        """セーブ内容が前回のセーブ（またはロード）から変わったか"""
+        self.tracker.commit()
+        return self.tracker.group_version("persisted") != self._saved_version
+
+    def _write_save(self, snapshot: Tuple[Dict[str, Any], Any]) -> bool:
+        """書き込みスレッドから呼ばれる（snapshot = (セーブ内容, 保存時刻)）"""
+        data, timestamp = snapshot
+        return self.save_manager.save(data, timestamp) if self.save_manager else False
+
+    def _on_background_save(self, ok: bool) -> None:
+        if not ok:
+            self._saved_version = None
+
+    def flush_saves(self, timeout: Optional[float] = None) -> bool:
+        """書き込み待ちのセーブを書き終えるまで待つ"""
+        return self.save_writer.flush(timeout) if self.save_writer else True
+
+    def close(self) -> None:
+        """書き込み待ちのセーブを書き終えてから書き込みスレッドを止める（以降は同期セーブ）"""
+        if self.save_writer is not None:
+            self.save_writer.close()
+            self.save_writer = None
 
     def _load_state(self) -> None:
         """状態をロード"""
@@ -605,20 +1047,63 @@ class Flower:
                     # 古い形式（直接データ）の場合はそのまま使用
                     data = save_data
                 
-                self.stats = FlowerStats.from_dict(data)
-                self.stats_observable.value = self.stats
+                stats = FlowerStats.from_dict(data)
+                if stats.rng_streams is None:
+                    # 乱数ストリームのない古いセーブ
+                    stats.rng_streams = FlowerStreams.for_flower(config.data.random_seed)
+                self.stats = stats
+                self._saved_version = self.tracker.group_version("persisted")
+                self.offline_report = self._catch_up_offline()
+                self.tracker.commit()
+
+    def _catch_up_offline(self, now: Optional[datetime] = None) -> Optional[OfflineReport]:
+        """セーブ時刻からの経過時間だけ状態を進める（config.data.offline_catch_up）"""
+        if not config.data.offline_catch_up:
+            return None
+        saved_at = getattr(self.save_manager, "last_saved_at", None)
+        if saved_at is None:
+            return None
+        now = now or datetime.now()
+        elapsed = max(0.0, (now - saved_at).total_seconds())
+        if elapsed <= 0.0:
+            return None
+        # 既に枯れている花は進めない
+        if self.stats.water_level <= WITHER_WATER_LEVEL:
+            return OfflineReport(elapsed_seconds=0.0, skipped_seconds=elapsed)
+
+        budget = min(elapsed, max(0.0, config.data.offline_catch_up_max_seconds))
+        start_age = self.stats.age_seconds
+        events = self.stats.advance(budget, stop_on_wither=True)
+        advanced = self.stats.age_seconds - start_age
+        logger.info(
+            "オフライン進行: %.0f秒 (イベント%d件)", advanced, len(events)
+        )
+        return OfflineReport(
+            elapsed_seconds=advanced,
+            skipped_seconds=elapsed - advanced,
+            events=tuple(events),
+        )
 
     def reset(self) -> None:
-        """状態をリセット"""
-        self.stats = FlowerStats()
-        self.stats_observable.value = self.stats
+        """状態をリセット（乱数ストリームは次の世代へ）"""
+        streams = self.stats.rng_streams
+        self.stats = FlowerStats(
+            rng_streams=streams.next_generation()
+            if streams is not None
+            else FlowerStreams.for_flower(config.data.random_seed)
+        )
+        self.offline_report = None
+        self._saved_version = None
+        if self.save_writer is not None:
+            # 書き込み待ちの古いセーブが削除後に書かれないように
+            self.save_writer.discard()
         if self.save_manager:
             self.save_manager.delete_save()
 
     @property
     def is_alive(self) -> bool:
         """生きているかどうか（水分が極端に低くなったら枯れる）"""
-        return self.stats.water_level > 5.0
+        return self.stats.water_level > WITHER_WATER_LEVEL
 
     @property
     def needs_attention(self) -> bool:
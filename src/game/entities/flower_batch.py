@@ -0,0 +1,335 @@
+"""FlowerStats を構造体配列（SoA）で一括更新するバッチシミュレータ
+
+バランス検証や大量の仮想ペット運用向けに、N 本の花の統計情報を NumPy 配列で保持し、
+1 回のベクトル化呼び出しで全ての花を進める。更新規則は FlowerStats.update /
+FlowerStats._check_growth と同一（パリティテストで保証）。
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from ..data.config import config
+from ..data.growth_tables import GrowthTables, get_growth_tables
+from ..utils.random_manager import get_rng
+from .flower import FlowerStats, GrowthStage, SeedType
+
+# 配列上のコード ↔ Enum の対応（インデックスがコード値）
+SEED_TYPES = (SeedType.YIN, SeedType.YANG)
+GROWTH_STAGES = tuple(GrowthStage)
+
+_SEED_CODE = {seed: code for code, seed in enumerate(SEED_TYPES)}
+_STAGE_CODE = {stage: code for code, stage in enumerate(GROWTH_STAGES)}
+
+STAGE_SEED = _STAGE_CODE[GrowthStage.SEED]
+STAGE_SPROUT = _STAGE_CODE[GrowthStage.SPROUT]
+STAGE_STEM = _STAGE_CODE[GrowthStage.STEM]
+STAGE_BUD = _STAGE_CODE[GrowthStage.BUD]
+STAGE_FLOWER = _STAGE_CODE[GrowthStage.FLOWER]
+
+
+class FlowerBatch:
+    """N 本の花を NumPy 配列で一括シミュレーションするクラス"""
+
+    def __init__(
+        self,
+        size: int,
+        seed_type: SeedType = SeedType.YANG,
+        rng: Optional[np.random.Generator] = None,
+        tables: Optional[Union[GrowthTables, Dict[str, Any]]] = None,
+    ):
+        """
+        Args:
+            size: 花の本数
+            seed_type: 全ての花に設定する種タイプ
+            rng: 雑草/害虫/フェーズ3に使う乱数生成器（省略時は RandomManager のシード）
+            tables: 成長分岐テーブル（省略時は growth_tables.json）
+        """
+        defaults = FlowerStats()
+        self.size = size
+        self.rng = rng if rng is not None else np.random.default_rng(get_rng().get_seed())
+
+        # 基本情報
+        self.seed_type = np.full(size, _SEED_CODE[seed_type], dtype=np.int8)
+        self.growth_stage = np.full(size, STAGE_SEED, dtype=np.int8)
+        self.age_seconds = np.zeros(size, dtype=np.float64)
+
+        # 育成要素
+        self.water_level = np.full(size, defaults.water_level, dtype=np.float64)
+        self.light_level = np.full(size, defaults.light_level, dtype=np.float64)
+        self.is_light_on = np.zeros(size, dtype=bool)
+        self.weed_count = np.zeros(size, dtype=np.int32)
+        self.pest_count = np.zeros(size, dtype=np.int32)
+        self.environment_level = np.full(size, defaults.environment_level, dtype=np.float64)
+        self.mental_level = np.full(size, defaults.mental_level, dtype=np.float64)
+        self.light_tendency_yin = np.zeros(size, dtype=bool)
+
+        # 成長に必要な光の蓄積量
+        self.light_required_for_sprout = np.full(size, defaults.light_required_for_sprout)
+        self.light_required_for_stem = np.full(size, defaults.light_required_for_stem)
+        self.light_required_for_bud = np.full(size, defaults.light_required_for_bud)
+        self.light_required_for_flower = np.full(size, defaults.light_required_for_flower)
+
+        # 分岐結果（名前テーブルへのインデックス）
+        self._compile_tables(tables if tables is not None else get_growth_tables())
+        self.phase2_branch = np.full(
+            size, self._branch_code(defaults.phase2_branch), dtype=np.int16
+        )
+        self.phase3_shape = np.full(
+            size, self._shape_code(defaults.phase3_shape), dtype=np.int16
+        )
+
+    # --- 変換 ---
+    @classmethod
+    def from_stats(
+        cls,
+        stats_list: Sequence[FlowerStats],
+        rng: Optional[np.random.Generator] = None,
+        tables: Optional[Union[GrowthTables, Dict[str, Any]]] = None,
+    ) -> "FlowerBatch":
+        """FlowerStats のリストからバッチを作成"""
+        batch = cls(len(stats_list), rng=rng, tables=tables)
+        for i, stats in enumerate(stats_list):
+            batch.set_stats(i, stats)
+        return batch
+
+    def set_stats(self, index: int, stats: FlowerStats) -> None:
+        """指定インデックスに FlowerStats の値を書き込む"""
+        self.seed_type[index] = _SEED_CODE[stats.seed_type]
+        self.growth_stage[index] = _STAGE_CODE[stats.growth_stage]
+        self.age_seconds[index] = stats.age_seconds
+        self.water_level[index] = stats.water_level
+        self.light_level[index] = stats.light_level
+        self.is_light_on[index] = stats.is_light_on
+        self.weed_count[index] = stats.weed_count
+        self.pest_count[index] = stats.pest_count
+        self.environment_level[index] = stats.environment_level
+        self.mental_level[index] = stats.mental_level
+        self.light_tendency_yin[index] = stats.light_tendency_yin
+        self.phase2_branch[index] = self._branch_code(stats.phase2_branch)
+        self.phase3_shape[index] = self._shape_code(stats.phase3_shape)
+        self.light_required_for_sprout[index] = stats.light_required_for_sprout
+        self.light_required_for_stem[index] = stats.light_required_for_stem
+        self.light_required_for_bud[index] = stats.light_required_for_bud
+        self.light_required_for_flower[index] = stats.light_required_for_flower
+
+    def to_stats(self, index: int) -> FlowerStats:
+        """指定インデックスの花を FlowerStats として取り出す"""
+        return FlowerStats(
+            seed_type=SEED_TYPES[self.seed_type[index]],
+            growth_stage=GROWTH_STAGES[self.growth_stage[index]],
+            age_seconds=float(self.age_seconds[index]),
+            water_level=float(self.water_level[index]),
+            light_level=float(self.light_level[index]),
+            is_light_on=bool(self.is_light_on[index]),
+            weed_count=int(self.weed_count[index]),
+            pest_count=int(self.pest_count[index]),
+            environment_level=float(self.environment_level[index]),
+            mental_level=float(self.mental_level[index]),
+            light_tendency_yin=bool(self.light_tendency_yin[index]),
+            phase2_branch=self._branch_names[self.phase2_branch[index]],
+            phase3_shape=self._shape_names[self.phase3_shape[index]],
+            light_required_for_sprout=float(self.light_required_for_sprout[index]),
+            light_required_for_stem=float(self.light_required_for_stem[index]),
+            light_required_for_bud=float(self.light_required_for_bud[index]),
+            light_required_for_flower=float(self.light_required_for_flower[index]),
+        )
+
+    def __len__(self) -> int:
+        return self.size
+
+    # --- 更新 ---
+    def update(self, dt: float) -> np.ndarray:
+        """全ての花を dt 秒進める（FlowerStats.update と同一規則）
+
+        Returns:
+            このティックで成長段階が変化した花のマスク
+        """
+        game = config.game
+        self.age_seconds += dt
+
+        # 水・環境の自然減少
+        np.maximum(self.water_level - game.water_decay_rate * dt, 0, out=self.water_level)
+        np.maximum(
+            self.environment_level - game.environment_decay_rate * dt,
+            0,
+            out=self.environment_level,
+        )
+
+        # 光ON状態の花は光蓄積量が増加
+        on = self.is_light_on
+        if on.any():
+            self.light_level[on] = np.minimum(
+                self.light_level[on] + game.light_amount * dt, 100
+            )
+
+        # 雑草・害虫の自然発生（低確率）
+        if game.weed_growth_chance > 0:
+            self._spawn(self.weed_count, game.max_weeds, game.weed_growth_chance * dt)
+        if game.pest_growth_chance > 0:
+            self._spawn(self.pest_count, game.max_pests, game.pest_growth_chance * dt)
+
+        return self._check_growth()
+
+    def _spawn(self, counts: np.ndarray, limit: int, chance: float) -> None:
+        """上限未満の花だけ乱数を引いて増やす（FlowerStats.update と同じく上限の花は引かない）"""
+        below = np.flatnonzero(counts < limit)
+        if below.size:
+            counts[below] += self.rng.random(below.size) < chance
+
+    def _check_growth(self) -> np.ndarray:
+        """成長段階と分岐の判定（FlowerStats._check_growth のベクトル版）"""
+        stage = self.growth_stage
+        light = self.light_level
+
+        to_sprout = (stage == STAGE_SEED) & (light >= self.light_required_for_sprout)
+        to_stem = (stage == STAGE_SPROUT) & (light >= self.light_required_for_stem)
+        to_bud = (stage == STAGE_STEM) & (light >= self.light_required_for_bud)
+        to_flower = (stage == STAGE_BUD) & (
+            (light >= self.light_required_for_flower)
+            | (self.age_seconds >= config.game.growth_age_threshold_flower)
+        )
+        grown = to_sprout | to_stem | to_bud | to_flower
+        if not grown.any():
+            return grown
+
+        # フェーズ1（種→芽）：決定前の光蓄積で陰/陽傾向を決める（境界49/50）
+        self.light_tendency_yin[to_sprout] = light[to_sprout] < 50
+
+        # 段階を進め、光をリセットしてOFFにする
+        stage[grown] += 1
+        light[grown] = 0
+        self.is_light_on[grown] = False
+
+        # フェーズ2/3 はリセット後の値で判定する（スカラー版と同じ順序）
+        if to_stem.any():
+            self.phase2_branch[to_stem] = self._compute_phase2_branch(to_stem)
+        if to_bud.any():
+            self.phase3_shape[to_bud] = self._compute_phase3_shape(to_bud)
+        return grown
+
+    def _compute_phase2_branch(self, mask: np.ndarray) -> np.ndarray:
+        """フェーズ2分岐（総合スコア帯）"""
+        water = np.minimum(100, self.water_level[mask])
+        light = np.minimum(100, self.light_level[mask])
+        mental_level = self.mental_level[mask]
+        score = (water + light + np.minimum(100, mental_level)) / 3.0
+        score = score + self._seed_bias[self.seed_type[mask]]
+        score = score + np.where(
+            mental_level >= self._mental_threshold, self._mental_bonus, 0
+        )
+
+        result = np.full(score.shape, self._branch_default, dtype=np.int16)
+        if not self._score_ranges:
+            return result
+        if self._score_ranges_overlap:
+            # 重なりがある場合は並び順で先に一致したものを優先
+            unresolved = np.ones(score.shape, dtype=bool)
+            for low, high, code in self._score_ranges:
+                hit = unresolved & (low <= score) & (score <= high)
+                result[hit] = code
+                unresolved &= ~hit
+            return result
+        index = np.searchsorted(self._range_min, score, side="right") - 1
+        clipped = np.maximum(index, 0)
+        hit = (index >= 0) & (score <= self._range_max[clipped])
+        result[hit] = self._range_code[clipped[hit]]
+        return result
+
+    def _compute_phase3_shape(self, mask: np.ndarray) -> np.ndarray:
+        """フェーズ3形状（有効候補から一様に選択）"""
+        base = (
+            self._seed_base[self.seed_type[mask]]
+            + self._branch_value[self.phase2_branch[mask]]
+            + self._tendency_value[self.light_tendency_yin[mask].astype(np.int8)]
+        )
+        valid = base[:, None] >= self._candidate_min_base[None, :]
+        counts = valid.sum(axis=1)
+
+        result = np.full(base.shape, self._shape_default, dtype=np.int16)
+        has_valid = counts > 0
+        if has_valid.any():
+            valid = valid[has_valid]
+            pick = (self.rng.random(valid.shape[0]) * counts[has_valid]).astype(np.int64)
+            # pick 番目（0始まり）の有効候補の列を求める
+            column = np.argmax(np.cumsum(valid, axis=1) > pick[:, None], axis=1)
+            result[has_valid] = self._candidate_codes[column]
+        return result
+
+    # --- 分岐テーブル ---
+    def _compile_tables(self, tables: Union[GrowthTables, Dict[str, Any]]) -> None:
+        """成長分岐テーブルを配列ルックアップに変換"""
+        if not isinstance(tables, GrowthTables):
+            tables = GrowthTables(tables)
+
+        self._branch_names: List[str] = []
+        self._shape_names: List[str] = []
+        self._branch_values_table: Dict[str, Any] = {}
+
+        self._seed_bias = np.array(
+            [tables.seed_biases.get(seed.value, 0) for seed in SEED_TYPES],
+            dtype=np.float64,
+        )
+        self._mental_threshold = tables.mental_threshold
+        self._mental_bonus = tables.mental_bonus
+        # 重なりがなければ min 昇順の配列を searchsorted で引く
+        self._score_ranges_overlap = tables.has_overlaps
+        ranges = tables.ranges_in_order if tables.has_overlaps else tables.score_ranges
+        self._score_ranges = [
+            (low, high, self._branch_code(result)) for low, high, result in ranges
+        ]
+        self._range_min = np.array([r[0] for r in self._score_ranges], dtype=np.float64)
+        self._range_max = np.array([r[1] for r in self._score_ranges], dtype=np.float64)
+        self._range_code = np.array([r[2] for r in self._score_ranges], dtype=np.int16)
+        self._branch_default = self._branch_code(tables.branch_default)
+
+        self._seed_base = np.array(
+            [tables.seed_base_values.get(seed.value, 5) for seed in SEED_TYPES],
+            dtype=np.float64,
+        )
+        self._branch_values_table = tables.phase2_branch_values
+        for name in self._branch_values_table:
+            self._branch_code(name)
+        self._rebuild_branch_values()
+        # インデックス0=陽（light_tendency_yin=False）、1=陰
+        self._tendency_value = np.array(
+            [
+                tables.light_tendency_values.get("陽", 0),
+                tables.light_tendency_values.get("陰", 0),
+            ],
+            dtype=np.float64,
+        )
+        self._candidate_min_base = np.array(
+            [min_base for _, min_base in tables.shape_candidates], dtype=np.float64
+        )
+        self._candidate_codes = np.array(
+            [self._shape_code(name) for name, _ in tables.shape_candidates],
+            dtype=np.int16,
+        )
+        self._shape_default = self._shape_code(tables.shape_default)
+
+    def _branch_code(self, name: str) -> int:
+        """フェーズ2分岐名をコードに変換（未知の名前は追加）"""
+        if name not in self._branch_names:
+            self._branch_names.append(name)
+            self._rebuild_branch_values()
+        return self._branch_names.index(name)
+
+    def _rebuild_branch_values(self) -> None:
+        """分岐コード → フェーズ3加算値の配列を作り直す"""
+        self._branch_value = np.array(
+            [self._branch_values_table.get(n, 0) for n in self._branch_names],
+            dtype=np.float64,
+        )
+
+    def _shape_code(self, name: str) -> int:
+        """フェーズ3形状名をコードに変換（未知の名前は追加）"""
+        if name not in self._shape_names:
+            self._shape_names.append(name)
+        return self._shape_names.index(name)
+
+    # --- 集計 ---
+    def stage_counts(self) -> Dict[GrowthStage, int]:
+        """成長段階ごとの本数"""
+        counts = np.bincount(self.growth_stage, minlength=len(GROWTH_STAGES))
+        return {stage: int(counts[code]) for code, stage in enumerate(GROWTH_STAGES)}
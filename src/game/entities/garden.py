@@ -0,0 +1,198 @@
+"""複数の花をまとめて育てる花壇（ガーデンモード）
+
+各区画の FlowerStats は、次の決定的イベント（成長・枯死・光の上限）の時刻を
+共有のスケジューラ（ヒープ）に登録しておき、その時刻が来た区画だけを
+FlowerStats.advance で一括進行する。水分・光は時間に対して線形なので、
+イベントのない区画は触らずに済み、1フレームの処理量はイベントの起きた
+区画数にしか比例しない（大半が待機中なら本数によらずほぼ一定）。
+
+お世話の前には sync() で現在時刻まで進める。表示には元の区画を進めない
+view() を使う（進める回数で雑草/害虫の乱数の消費が変わらないように）。
+view() は乱数を使わず、線形に変わる水分・光・環境だけを現在時刻まで積分する。
+各区画は花ごとの乱数ストリーム（FlowerStreams）を持ち、他の区画の
+更新順に結果が左右されない。
+"""
+
+import heapq
+import itertools
+import logging
+
+import numpy as np
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .flower import (
+    EVENT_GROWTH,
+    EVENT_WITHERED,
+    WITHER_WATER_LEVEL,
+    AdvanceEvent,
+    FlowerStats,
+    GrowthStage,
+    SeedType,
+)
+from ..utils.rng_streams import FlowerStreams
+
+logger = logging.getLogger(__name__)
+
+# 1つの花壇に植えられる区画数の上限
+MAX_PLOTS = 64
+
+
+class GardenPlot:
+    """花壇の1区画"""
+
+    __slots__ = ("stats", "synced_at", "due", "version")
+
+    def __init__(self, stats: FlowerStats, synced_at: float):
+        self.stats = stats
+        self.synced_at = synced_at  # stats が表すガーデン時刻
+        self.due = float("inf")  # 次のイベントのガーデン時刻
+        self.version = 0  # スケジュール更新のたびに増やす（古いヒープ項目の判定）
+
+    @property
+    def is_alive(self) -> bool:
+        return self.stats.water_level > WITHER_WATER_LEVEL
+
+
+class Garden:
+    """複数の花と、それらを更新する共有スケジューラ"""
+
+    def __init__(self, seed_types: Sequence[SeedType] = (), seed: Optional[int] = None):
+        self.entropy = np.random.SeedSequence(seed).entropy  # 区画の乱数ストリームの元
+        self.now = 0.0  # ガーデン時刻（シミュレーション秒）
+        self.plots: List[GardenPlot] = []
+        self._heap: List[Tuple[float, int, int, int]] = []
+        self._sequence = itertools.count()
+        self.advanced_count = 0  # advance した区画の延べ数（負荷の目安）
+        for seed_type in seed_types:
+            self.plant(FlowerStats(seed_type=seed_type))
+
+    @classmethod
+    def with_size(cls, size: int, seed: Optional[int] = None) -> "Garden":
+        """陰/陽を交互に植えた size 区画の花壇"""
+        if not 0 < size <= MAX_PLOTS:
+            raise ValueError(f"区画数は1〜{MAX_PLOTS}です: {size}")
+        seed_types = (SeedType.YIN, SeedType.YANG)
+        return cls([seed_types[i % 2] for i in range(size)], seed=seed)
+
+    def __len__(self) -> int:
+        return len(self.plots)
+
+    def __iter__(self) -> Iterator[GardenPlot]:
+        return iter(self.plots)
+
+    def plant(self, stats: FlowerStats) -> int:
+        """区画を追加し、そのインデックスを返す"""
+        if len(self.plots) >= MAX_PLOTS:
+            raise ValueError(f"区画数は{MAX_PLOTS}までです")
+        if stats.rng_streams is None:
+            stats.rng_streams = FlowerStreams.for_flower(self.entropy, len(self.plots))
+        self.plots.append(GardenPlot(stats, self.now))
+        index = len(self.plots) - 1
+        self._schedule(index)
+        return index
+
+    def replant(self, index: int, seed_type: Optional[SeedType] = None) -> None:
+        """区画を新しい種で植え直す"""
+        plot = self.plots[index]
+        plot.stats = FlowerStats(
+            seed_type=seed_type or plot.stats.seed_type,
+            rng_streams=plot.stats.rng_streams.next_generation(),
+        )
+        plot.synced_at = self.now
+        self._schedule(index)
+
+    def update(self, dt: float) -> List[Tuple[int, AdvanceEvent]]:
+        """dt 秒進め、期限の来た区画だけを進める
+
+        Returns:
+            (区画インデックス, イベント) のリスト（成長・枯死のみ、時刻順）
+        """
+        self.now += dt
+        heap = self._heap
+        due: List[int] = []
+        while heap and heap[0][0] <= self.now:
+            _, _, index, version = heapq.heappop(heap)
+            if self.plots[index].version == version:
+                due.append(index)
+
+        events: List[Tuple[float, int, AdvanceEvent]] = []
+        for index in due:
+            start = self.plots[index].synced_at
+            for event in self._advance(index):
+                if event.kind in (EVENT_GROWTH, EVENT_WITHERED):
+                    events.append((start + event.at, index, event))
+            self._schedule(index)
+        events.sort(key=lambda entry: (entry[0], entry[1]))
+        return [(index, event) for _, index, event in events]
+
+    def sync(self, index: int) -> FlowerStats:
+        """区画を現在時刻まで進めた FlowerStats（表示・お世話の前に呼ぶ）"""
+        plot = self.plots[index]
+        if plot.synced_at < self.now:
+            self._advance(index)
+        return plot.stats
+
+    def view(self, index: int) -> FlowerStats:
+        """表示用: 現在時刻の状態のコピー（区画そのものは進めない）
+
+        期限の来た区画は update で進めてあるので、同期後は線形に変わる値だけを積分すればよい
+        （乱数ストリームを複製しないので毎フレーム全区画を表示しても軽い）。
+        雑草/害虫の発生は次に区画を進めた時に反映される。
+        """
+        plot = self.plots[index]
+        elapsed = self.now - plot.synced_at
+        if elapsed <= 0 or not plot.is_alive:
+            return plot.stats
+        return plot.stats.preview(elapsed)
+
+    def sync_all(self) -> List[FlowerStats]:
+        """全区画を現在時刻まで進める"""
+        return [self.sync(index) for index in range(len(self.plots))]
+
+    def apply(self, index: int, action: Callable[[FlowerStats], None]) -> None:
+        """区画にお世話を行い、次のイベント時刻を登録し直す"""
+        action(self.sync(index))
+        self._schedule(index)
+
+    @property
+    def pending_count(self) -> int:
+        """イベント待ちの区画数"""
+        return sum(1 for plot in self.plots if plot.due != float("inf"))
+
+    @property
+    def alive_count(self) -> int:
+        """枯れていない区画数（枯死はイベントなので未同期でも正しい）"""
+        return sum(1 for plot in self.plots if plot.is_alive)
+
+    def stage_counts(self) -> Dict[GrowthStage, int]:
+        """成長段階ごとの本数"""
+        counts = {stage: 0 for stage in GrowthStage}
+        for plot in self.plots:
+            counts[plot.stats.growth_stage] += 1
+        return counts
+
+    def _advance(self, index: int) -> List[AdvanceEvent]:
+        plot = self.plots[index]
+        elapsed = self.now - plot.synced_at
+        plot.synced_at = self.now
+        if elapsed <= 0 or not plot.is_alive:
+            return []
+        self.advanced_count += 1
+        return plot.stats.advance(elapsed, stop_on_wither=True)
+
+    def _schedule(self, index: int) -> None:
+        """区画の次のイベント時刻をヒープに登録（古い項目は version で無効化）"""
+        plot = self.plots[index]
+        plot.version += 1
+        wait = plot.stats.time_to_next_event() if plot.is_alive else float("inf")
+        plot.due = plot.synced_at + wait
+        if plot.due != float("inf"):
+            heapq.heappush(
+                self._heap, (plot.due, next(self._sequence), index, plot.version)
+            )
+        # お世話の繰り返しで古い項目がたまったら作り直す
+        if len(self._heap) > 4 * len(self.plots) + 16:
+            self._heap = [
+                entry for entry in self._heap if self.plots[entry[2]].version == entry[3]
+            ]
+            heapq.heapify(self._heap)
@@ -0,0 +1,114 @@
+"""
+FlowerStats のフィールド単位の変更追跡
+
+FlowerStats は毎ティック更新される（__slots__ のデータクラス）ので、代入ごとに
+フックを挟むと更新処理が遅くなる。StatsTracker は追跡対象には手を入れず、
+commit() の時点で前回のスナップショットと比べて変わったキーの版番号を進め、
+購読者へまとめて通知する（1フレームに1回 commit すれば、その間の変更は1回の通知）。
+
+キーは値を取り出す関数（フィールドそのものや、表示に合わせて丸めた派生値）。
+グループはキーの集まりで、どれかが変わるとグループの版が進む。
+花で使うキーとグループは flower.py の STATS_KEYS / STATS_GROUPS。
+"""
+
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Tuple
+
+StatsKey = Callable[[Any], Any]
+ChangeCallback = Callable[[FrozenSet[str]], None]
+
+
+class StatsTracker:
+    """キーごとの版番号と、キー単位の変更通知"""
+
+    def __init__(
+        self,
+        stats: Any,
+        keys: Dict[str, StatsKey],
+        groups: Dict[str, FrozenSet[str]],
+    ):
+        self._names: Tuple[str, ...] = tuple(keys)
+        self._getters: Tuple[StatsKey, ...] = tuple(keys.values())
+        self._versions: Dict[str, int] = {name: 0 for name in self._names}
+        self._group_versions: Dict[str, int] = {group: 0 for group in groups}
+        # キー → そのキーを含むグループ
+        self._key_groups: Dict[str, Tuple[str, ...]] = {
+            name: tuple(group for group, members in groups.items() if name in members)
+            for name in self._names
+        }
+        self._subscribers: List[Tuple[FrozenSet[str], ChangeCallback]] = []
+        self._depth = 0
+        self.version = 0  # どれかのキーが変わるたびに進む
+        self._stats = stats
+        self._snapshot = self._take()
+
+    @property
+    def stats(self) -> Any:
+        return self._stats
+
+    def attach(self, stats: Any) -> FrozenSet[str]:
+        """追跡対象を差し替える（値の違うキーは変更として通知）"""
+        self._stats = stats
+        return self.commit()
+
+    def _take(self) -> Tuple[Any, ...]:
+        stats = self._stats
+        return tuple(getter(stats) for getter in self._getters)
+
+    def version_of(self, key: str) -> int:
+        """キーの版番号"""
+        return self._versions[key]
+
+    def group_version(self, group: str) -> int:
+        """グループの版番号（含まれるキーのどれかが変わると進む）"""
+        return self._group_versions[group]
+
+    def subscribe(self, keys: Iterable[str], callback: ChangeCallback) -> None:
+        """keys のどれかが変わった commit で callback(変わったキーの集合) を呼ぶ"""
+        keys = frozenset(keys)
+        unknown = keys.difference(self._names)
+        if unknown:
+            raise KeyError(f"追跡していないキーです: {sorted(unknown)}")
+        self._subscribers.append((keys, callback))
+
+    def unsubscribe(self, callback: ChangeCallback) -> None:
+        self._subscribers = [(k, c) for k, c in self._subscribers if c != callback]
+
+    @contextmanager
+    def transaction(self) -> Iterator["StatsTracker"]:
+        """ブロック内の変更を抜けた時の1回の commit にまとめる"""
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+        if self._depth == 0:
+            self.commit()
+
+    def commit(self) -> FrozenSet[str]:
+        """前回からの変更を版番号に反映して通知し、変わったキーを返す"""
+        if self._depth:
+            return frozenset()
+        current = self._take()
+        previous = self._snapshot
+        if current == previous:
+            return frozenset()
+        self._snapshot = current
+        changed = frozenset(
+            name
+            for name, old, new in zip(self._names, previous, current)
+            if old != new
+        )
+        self.version += 1
+        for name in changed:
+            self._versions[name] += 1
+        for group in {group for name in changed for group in self._key_groups[name]}:
+            self._group_versions[group] += 1
+        for keys, callback in self._subscribers:
+            hit = keys & changed
+            if hit:
+                try:
+                    callback(hit)
+                except Exception as e:
+                    print(f"Stats change callback error: {e}")
+        return changed
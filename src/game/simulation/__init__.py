@@ -0,0 +1,12 @@
+from .care_optimizer import CareAction, CareOptimizer, PolicyTable, optimize
+from .forecast import Forecast, Forecaster, Snapshot, compute_forecasts
+from .outcome_explorer import (
+    CARE_POLICIES, ExplorationReport, RunResult, exact_outcomes, explore, simulate_one,
+)
+from .outcome_model import OutcomeModel, get_outcome_model
+
+__all__ = [
+    'CARE_POLICIES', 'CareAction', 'CareOptimizer', 'ExplorationReport', 'Forecast',
+    'Forecaster', 'OutcomeModel', 'PolicyTable', 'RunResult', 'Snapshot', 'compute_forecasts',
+    'exact_outcomes', 'explore', 'get_outcome_model', 'optimize', 'simulate_one',
+]
@@ -0,0 +1,554 @@
+"""
+お世話スケジュールの最適化（動的計画法）
+
+FlowerStats を離散化した状態空間で、判断間隔ごとのお世話
+（光ON/OFF・水やり・肥料）を選ぶマルコフ決定過程として解く。
+- 遷移は成長ルール（FlowerStats.advance）で計算してメモ化する
+- フェーズ3の形は候補から等確率の乱択として分岐させる
+- 栄養行為（水やり・肥料）は同一ゲーム内時間（時）で3回まで
+  （GameEngine._can_perform_nutrition_action と同じ制限）
+
+価値反復で最適方針を求め、自動操縦用のコンパクトな参照表として出力する。
+
+例:
+  python -m src.game.simulation.care_optimizer --target あじさい --objective reliable \\
+      --out autopilot.json
+  python -m src.game.simulation.care_optimizer --list
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from ..entities.flower import (
+    FLOWER_NAME_TABLE,
+    FlowerStats,
+    GrowthStage,
+    SeedType,
+    WITHER_WATER_LEVEL,
+)
+from ..utils.random_manager import RandomManager, use_rng
+
+logger = logging.getLogger(__name__)
+
+OBJECTIVE_RELIABLE = "reliable"  # 目標の花になる確率を最大化
+OBJECTIVE_FASTEST = "fastest"  # 目標の花になるまでの期待時間を最小化
+OBJECTIVES = (OBJECTIVE_RELIABLE, OBJECTIVE_FASTEST)
+
+# GameEngine._nutrition_action_limit と同じ（同一時間内の栄養行為の上限）
+NUTRITION_ACTION_LIMIT = 3
+# 水分がこの値以上なら水やり・肥料はできない（GameEngine._perform_water と同じ）
+NUTRITION_WATER_CAP = 90
+
+NUTRITION_WATER = "water"
+NUTRITION_FERTILIZE = "fertilize"
+
+_STAGE_ORDER = tuple(GrowthStage)
+_STAGE_CODES = {stage: code for code, stage in enumerate(_STAGE_ORDER)}
+
+
+class CareAction(NamedTuple):
+    """1回の判断で行うお世話（光の設定と、任意で栄養行為1回）"""
+
+    light_on: bool
+    nutrition: Optional[str] = None
+
+    @property
+    def label(self) -> str:
+        light = "光ON" if self.light_on else "光OFF"
+        if self.nutrition == NUTRITION_WATER:
+            return f"{light}+水やり"
+        if self.nutrition == NUTRITION_FERTILIZE:
+            return f"{light}+肥料"
+        return light
+
+
+CARE_ACTIONS: Tuple[CareAction, ...] = tuple(
+    CareAction(light_on, nutrition)
+    for light_on in (True, False)
+    for nutrition in (None, NUTRITION_WATER, NUTRITION_FERTILIZE)
+)
+
+
+class CareState(NamedTuple):
+    """離散化した状態（判断時点）"""
+
+    epoch: int  # 判断回数（年齢 = epoch × 判断間隔）
+    stage: GrowthStage
+    water: float
+    light: float
+    light_on: bool
+    nutrition_used: int  # 現在の時（ゲーム内時間）で使った栄養行為の回数
+    tendency_yin: bool
+    branch: str
+    shape: str
+
+
+@dataclass
+class PolicyTable:
+    """最適方針の参照表（自動操縦用）"""
+
+    target: str
+    seed_type: SeedType
+    objective: str
+    decision_interval: float
+    water_step: float
+    mental_level: float
+    actions: Dict[CareState, CareAction] = field(default_factory=dict)
+    success_probability: float = 0.0
+    expected_seconds: Optional[float] = None  # 終了（開花/枯死/時間切れ）までの期待時間
+    # 初期状態から最も起こりやすい経路をたどったお世話の予定（秒, 内容）
+    schedule: List[Tuple[float, str]] = field(default_factory=list)
+
+    def key_for(self, stats: FlowerStats, nutrition_used: int) -> CareState:
+        """現在の状態に対応する表のキー"""
+        return _make_state(
+            stats,
+            int(round(stats.age_seconds / self.decision_interval)),
+            nutrition_used,
+            self.water_step,
+        )
+
+    def action_for(
+        self, stats: FlowerStats, nutrition_used: int = 0
+    ) -> Optional[CareAction]:
+        """現在の状態で行うお世話（表にない状態ならNone）"""
+        return self.actions.get(self.key_for(stats, nutrition_used))
+
+    def to_json(self, path: Optional[str] = None) -> Dict[str, object]:
+        """コンパクトな表形式（1状態1行）に変換し、pathがあれば保存"""
+        action_index = {action: i for i, action in enumerate(CARE_ACTIONS)}
+        data: Dict[str, object] = {
+            "target": self.target,
+            "seed_type": self.seed_type.value,
+            "objective": self.objective,
+            "decision_interval": self.decision_interval,
+            "water_step": self.water_step,
+            "mental_level": self.mental_level,
+            "success_probability": self.success_probability,
+            "expected_seconds": self.expected_seconds,
+            "actions": [[a.light_on, a.nutrition] for a in CARE_ACTIONS],
+            "columns": [
+                "epoch", "stage", "water", "light", "light_on", "nutrition_used",
+                "tendency_yin", "branch", "shape", "action",
+            ],
+            "rows": [
+                [
+                    s.epoch, _STAGE_CODES[s.stage], s.water, s.light, int(s.light_on),
+                    s.nutrition_used, int(s.tendency_yin), s.branch, s.shape,
+                    action_index[a],
+                ]
+                for s, a in sorted(self.actions.items(), key=lambda item: item[0].epoch)
+            ],
+        }
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        return data
+
+    @classmethod
+    def from_json(cls, data: Dict[str, object]) -> "PolicyTable":
+        actions = [CareAction(bool(on), nutrition) for on, nutrition in data["actions"]]
+        table = cls(
+            target=data["target"],
+            seed_type=SeedType(data["seed_type"]),
+            objective=data["objective"],
+            decision_interval=data["decision_interval"],
+            water_step=data["water_step"],
+            mental_level=data["mental_level"],
+            success_probability=data["success_probability"],
+            expected_seconds=data["expected_seconds"],
+        )
+        for epoch, stage, water, light, on, used, yin, branch, shape, index in data["rows"]:
+            state = CareState(
+                epoch, _STAGE_ORDER[stage], water, light, bool(on), used, bool(yin),
+                branch, shape,
+            )
+            table.actions[state] = actions[index]
+        return table
+
+    @classmethod
+    def load(cls, path: str) -> "PolicyTable":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_json(json.load(f))
+
+
+def apply_action(stats: FlowerStats, action: CareAction) -> bool:
+    """お世話を適用し、栄養行為を行ったかどうかを返す（回数制限の判定は呼び出し側）"""
+    if action.light_on:
+        stats.turn_light_on()
+    else:
+        stats.turn_light_off()
+    if action.nutrition == NUTRITION_WATER:
+        stats.water()
+        return True
+    if action.nutrition == NUTRITION_FERTILIZE:
+        stats.fertilize()
+        return True
+    return False
+
+
+def _quantize(value: float, step: float) -> float:
+    return round(round(value / step) * step, 6)
+
+
+def _make_state(
+    stats: FlowerStats, epoch: int, nutrition_used: int, water_step: float
+) -> CareState:
+    return CareState(
+        epoch=epoch,
+        stage=stats.growth_stage,
+        water=_quantize(stats.water_level, water_step),
+        light=round(stats.light_level, 6),
+        light_on=stats.is_light_on,
+        nutrition_used=nutrition_used,
+        tendency_yin=stats.light_tendency_yin,
+        branch=stats.phase2_branch,
+        shape=stats.phase3_shape,
+    )
+
+
+class CareOptimizer:
+    """離散化した状態空間で最適なお世話方針を求める"""
+
+    def __init__(
+        self,
+        seed_type: SeedType,
+        decision_interval: float = 10.0,
+        max_seconds: float = 3600.0,
+        water_step: float = 1.0,
+        mental_level: float = 0.0,
+        nutrition_limit: Optional[int] = NUTRITION_ACTION_LIMIT,
+    ):
+        self.seed_type = seed_type
+        self.decision_interval = decision_interval
+        self.max_epochs = int(max_seconds // decision_interval)
+        self.water_step = water_step
+        self.mental_level = mental_level
+        self.nutrition_limit = nutrition_limit
+        # (状態, お世話) → ((確率, 次の状態), ...) のメモ
+        self._transitions: Dict[
+            Tuple[CareState, CareAction], Tuple[Tuple[float, CareState], ...]
+        ] = {}
+        self._states: Optional[List[CareState]] = None
+        # 雑草/害虫の発生用（成長に影響しないので固定シードの1つを使い回す）
+        self._rng = RandomManager(0)
+
+    # --- 状態と遷移 ---
+    def initial_state(self) -> CareState:
+        stats = FlowerStats(seed_type=self.seed_type, mental_level=self.mental_level)
+        return _make_state(stats, 0, 0, self.water_step)
+
+    def _to_stats(self, state: CareState) -> FlowerStats:
+        return FlowerStats(
+            seed_type=self.seed_type,
+            growth_stage=state.stage,
+            age_seconds=state.epoch * self.decision_interval,
+            water_level=state.water,
+            light_level=state.light,
+            is_light_on=state.light_on,
+            mental_level=self.mental_level,
+            light_tendency_yin=state.tendency_yin,
+            phase2_branch=state.branch,
+            phase3_shape=state.shape,
+        )
+
+    def is_terminal(self, state: CareState) -> bool:
+        return (
+            state.stage == GrowthStage.FLOWER
+            or state.water <= WITHER_WATER_LEVEL
+            or state.epoch >= self.max_epochs
+        )
+
+    def outcome(self, state: CareState) -> Optional[str]:
+        """終端状態の結果（開花した花の名前。枯死・時間切れはNone）"""
+        if state.stage != GrowthStage.FLOWER:
+            return None
+        return self._to_stats(state).character_name
+
+    def transitions(
+        self, state: CareState, action: CareAction
+    ) -> Tuple[Tuple[float, CareState], ...]:
+        """お世話を行い判断間隔だけ進めた遷移先（行えないお世話なら空）"""
+        key = (state, action)
+        cached = self._transitions.get(key)
+        if cached is not None:
+            return cached
+
+        stats = self._to_stats(state)
+        used = state.nutrition_used
+        result: Tuple[Tuple[float, CareState], ...] = ()
+        if action.nutrition is None or self._nutrition_allowed(stats, used):
+            if apply_action(stats, action):
+                used += 1
+
+            # 茎→蕾で乱択される形の候補（種・分岐・光傾向は茎の時点で確定済み）
+            shapes = stats.phase3_candidates() if stats.growth_stage == GrowthStage.STEM else ()
+            hour = int(stats.age_seconds // 3600)
+            # 雑草/害虫の発生は成長に影響しないので固定の乱数で進める
+            with use_rng(self._rng):
+                stats.advance(self.decision_interval, stop_on_wither=True)
+            if int(stats.age_seconds // 3600) != hour:
+                used = 0
+            next_state = _make_state(stats, state.epoch + 1, used, self.water_step)
+
+            if shapes and next_state.stage in (GrowthStage.BUD, GrowthStage.FLOWER):
+                p = 1.0 / len(shapes)
+                result = tuple((p, next_state._replace(shape=shape)) for shape in shapes)
+            else:
+                result = ((1.0, next_state),)
+
+        self._transitions[key] = result
+        return result
+
+    def _nutrition_allowed(self, stats: FlowerStats, used: int) -> bool:
+        if stats.water_level >= NUTRITION_WATER_CAP:
+            return False
+        return self.nutrition_limit is None or used < self.nutrition_limit
+
+    def reachable_states(self) -> List[CareState]:
+        """初期状態から到達可能な状態（判断回数の昇順）"""
+        if self._states is None:
+            start = self.initial_state()
+            seen = {start}
+            frontier = [start]
+            while frontier:
+                next_frontier = []
+                for state in frontier:
+                    if self.is_terminal(state):
+                        continue
+                    for action in CARE_ACTIONS:
+                        for _, successor in self.transitions(state, action):
+                            if successor not in seen:
+                                seen.add(successor)
+                                next_frontier.append(successor)
+                frontier = next_frontier
+            self._states = sorted(seen, key=lambda s: s.epoch)
+        return self._states
+
+    # --- 価値反復 ---
+    def solve(
+        self,
+        target: str,
+        objective: str = OBJECTIVE_RELIABLE,
+        tolerance: float = 1e-9,
+        max_sweeps: int = 100,
+        prune: bool = True,
+    ) -> PolicyTable:
+        """目標の花に対する最適方針を価値反復で求める
+
+        reliable: 価値 = 目標の花になる確率（最大化）
+        fastest: 費用 = 判断間隔ごとの経過時間 + 失敗時のペナルティ（最小化）
+        prune: 方針に従って到達しうる状態だけを参照表に残す
+        """
+        if objective not in OBJECTIVES:
+            raise ValueError(f"未知の目的: {objective}")
+        states = self.reachable_states()
+        # 時間は進む一方なので、判断回数の降順に更新すれば1巡でほぼ収束する
+        order = [s for s in reversed(states) if not self.is_terminal(s)]
+        maximize = objective == OBJECTIVE_RELIABLE
+        failure_cost = 2.0 * self.max_epochs * self.decision_interval
+
+        def terminal_value(state: CareState) -> float:
+            hit = self.outcome(state) == target
+            if maximize:
+                return 1.0 if hit else 0.0
+            return 0.0 if hit else failure_cost
+
+        values = {s: terminal_value(s) for s in states if self.is_terminal(s)}
+        for s in order:
+            values[s] = 0.0 if maximize else failure_cost
+        policy: Dict[CareState, CareAction] = {}
+
+        for sweep in range(max_sweeps):
+            delta = 0.0
+            for state in order:
+                best_value = None
+                best_action = None
+                for action in CARE_ACTIONS:
+                    successors = self.transitions(state, action)
+                    if not successors:
+                        continue
+                    value = sum(p * values[s] for p, s in successors)
+                    if not maximize:
+                        value += self.decision_interval
+                    if best_value is None or (
+                        value > best_value + 1e-12 if maximize else value < best_value - 1e-12
+                    ):
+                        best_value, best_action = value, action
+                delta = max(delta, abs(best_value - values[state]))
+                values[state] = best_value
+                policy[state] = best_action
+            if delta < tolerance:
+                logger.debug("value iteration converged after %d sweeps", sweep + 1)
+                break
+
+        probability, expected = self._evaluate(policy, target, order)
+        start = self.initial_state()
+        schedule = []
+        state = start
+        while state in policy:
+            action = policy[state]
+            schedule.append((state.epoch * self.decision_interval, action.label))
+            # 分岐（フェーズ3の形）では目標に届く確率が最も高い先へ
+            state = max(
+                self.transitions(state, action), key=lambda t: (t[0], probability[t[1]])
+            )[1]
+        if prune:
+            policy = self._on_policy(policy, start)
+        return PolicyTable(
+            target=target,
+            seed_type=self.seed_type,
+            objective=objective,
+            decision_interval=self.decision_interval,
+            water_step=self.water_step,
+            mental_level=self.mental_level,
+            actions=policy,
+            success_probability=probability.get(start, 0.0),
+            expected_seconds=expected.get(start),
+            schedule=schedule,
+        )
+
+    def _on_policy(
+        self, policy: Dict[CareState, CareAction], start: CareState
+    ) -> Dict[CareState, CareAction]:
+        """方針に従った場合に到達しうる状態だけの方針"""
+        pruned: Dict[CareState, CareAction] = {}
+        frontier = [start]
+        while frontier:
+            state = frontier.pop()
+            if state in pruned or state not in policy:
+                continue
+            pruned[state] = policy[state]
+            frontier.extend(s for _, s in self.transitions(state, policy[state]))
+        return pruned
+
+    def _evaluate(
+        self,
+        policy: Dict[CareState, CareAction],
+        target: str,
+        order: Sequence[CareState],
+    ) -> Tuple[Dict[CareState, float], Dict[CareState, float]]:
+        """方針に従った場合の成功確率と終了までの期待時間"""
+        probability: Dict[CareState, float] = {}
+        expected: Dict[CareState, float] = {}
+        for state in self.reachable_states():
+            if self.is_terminal(state):
+                probability[state] = 1.0 if self.outcome(state) == target else 0.0
+                expected[state] = 0.0
+        for state in order:
+            successors = self.transitions(state, policy[state])
+            probability[state] = sum(p * probability[s] for p, s in successors)
+            expected[state] = self.decision_interval + sum(
+                p * expected[s] for p, s in successors
+            )
+        return probability, expected
+
+
+def _target_seed_types(target: str) -> List[SeedType]:
+    seeds = sorted(
+        {seed for (seed, _, _), name in FLOWER_NAME_TABLE.items() if name == target},
+        key=lambda s: s.value,
+    )
+    if not seeds:
+        raise ValueError(f"未知の花の名前: {target}")
+    return seeds
+
+
+@contextlib.contextmanager
+def _quiet():
+    """成長時のprint/ログを抑止（大量の遷移計算で出力がボトルネックになるため）"""
+    flower_logger = logging.getLogger(FlowerStats.__module__)
+    level = flower_logger.level
+    flower_logger.setLevel(logging.WARNING)
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            yield
+    finally:
+        flower_logger.setLevel(level)
+
+
+def optimize(
+    target: str,
+    objective: str = OBJECTIVE_RELIABLE,
+    decision_interval: float = 10.0,
+    max_seconds: float = 3600.0,
+    nutrition_limit: Optional[int] = NUTRITION_ACTION_LIMIT,
+    optimizers: Optional[Dict[SeedType, CareOptimizer]] = None,
+) -> PolicyTable:
+    """目標の花になりうる種すべてで解き、最も良い方針を返す
+
+    optimizers を渡すと種ごとの状態空間・遷移のメモを複数の目標で使い回す。
+    """
+    optimizers = {} if optimizers is None else optimizers
+    best: Optional[PolicyTable] = None
+    with _quiet():
+        for seed_type in _target_seed_types(target):
+            optimizer = optimizers.get(seed_type)
+            if optimizer is None:
+                optimizer = optimizers[seed_type] = CareOptimizer(
+                    seed_type,
+                    decision_interval=decision_interval,
+                    max_seconds=max_seconds,
+                    nutrition_limit=nutrition_limit,
+                )
+            table = optimizer.solve(target, objective)
+            if best is None or _better(table, best):
+                best = table
+    return best
+
+
+def _better(a: PolicyTable, b: PolicyTable) -> bool:
+    if a.objective == OBJECTIVE_FASTEST and a.success_probability > 0 and b.success_probability > 0:
+        return (a.expected_seconds or 0.0) < (b.expected_seconds or 0.0)
+    return a.success_probability > b.success_probability
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="目標の花に向けたお世話方針を求める")
+    parser.add_argument("--target", default=None, help="目標の花の名前")
+    parser.add_argument("--objective", choices=OBJECTIVES, default=OBJECTIVE_RELIABLE)
+    parser.add_argument("--interval", type=float, default=10.0, help="お世話の判断間隔（秒）")
+    parser.add_argument("--max-seconds", type=float, default=3600.0, help="上限時間")
+    parser.add_argument(
+        "--no-nutrition-limit", action="store_true", help="1時間3回の栄養行為制限を外す"
+    )
+    parser.add_argument("--out", default=None, help="参照表（JSON）の出力先")
+    parser.add_argument("--list", action="store_true", help="すべての花の到達確率を表示")
+    args = parser.parse_args(argv)
+    limit = None if args.no_nutrition_limit else NUTRITION_ACTION_LIMIT
+
+    if args.list:
+        optimizers: Dict[SeedType, CareOptimizer] = {}
+        for name in sorted(set(FLOWER_NAME_TABLE.values())):
+            table = optimize(
+                name, args.objective, args.interval, args.max_seconds, limit, optimizers
+            )
+            print(
+                f"{name:<8} {table.seed_type.value} {table.success_probability:6.1%}"
+                f" ({len(table.actions)} states)"
+            )
+        return 0
+    if not args.target:
+        parser.error("--target か --list を指定してください")
+
+    table = optimize(args.target, args.objective, args.interval, args.max_seconds, limit)
+    print(
+        f"{table.target} ({table.seed_type.value}, {table.objective}): "
+        f"成功確率 {table.success_probability:.1%}, "
+        f"終了までの期待時間 {table.expected_seconds or 0.0:.0f}秒"
+    )
+    for seconds, label in table.schedule:
+        print(f"  {seconds:6.0f}s  {label}")
+    if args.out:
+        table.to_json(args.out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+"""
+お世話の「もしも」予測（ステータス画面用）
+
+現在の FlowerStats と乱数状態のスナップショットを取り、候補のお世話を
+それぞれ適用した結果をバックグラウンドスレッドで早送りして予測する。
+- 次の成長段階とそこまでの時間（そのまま放置した場合）
+- 丁寧にお世話を続けた場合のフェーズ2分岐と最終的な花の確率（OutcomeModel）
+
+ゲームループ側は submit()/latest() を呼ぶだけで待たない。状態が変わると
+（時間経過による水分・光の線形変化は除く）実行中の予測は打ち切られる。
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence, Tuple
+
+from ..data.config import config
+from ..entities.flower import FlowerStats, GrowthStage, WITHER_WATER_LEVEL
+from ..utils.random_manager import RandomManager, get_rng, use_rng
+from .outcome_model import get_outcome_model
+
+logger = logging.getLogger(__name__)
+
+FORECAST_THREAD_NAME = "flower-forecast"
+
+# 予測する候補のお世話（表示名, 直ちに行う操作）
+FORECAST_ACTIONS: Tuple[Tuple[str, Optional[Callable[[FlowerStats], None]]], ...] = (
+    ("そのまま", None),
+    ("光ON", FlowerStats.turn_light_on),
+    ("水やり", FlowerStats.water),
+)
+
+_STAGE_ORDER = tuple(GrowthStage)
+
+
+def _next_stage(stage: GrowthStage) -> Optional[GrowthStage]:
+    index = _STAGE_ORDER.index(stage)
+    return _STAGE_ORDER[index + 1] if index + 1 < len(_STAGE_ORDER) else None
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """予測の起点（状態と乱数のコピー。元の状態とは独立）"""
+
+    stats: FlowerStats
+    rng: RandomManager
+
+    @classmethod
+    def take(cls, stats: FlowerStats) -> "Snapshot":
+        return cls(stats.copy(), get_rng().fork())
+
+
+@dataclass(frozen=True)
+class Forecast:
+    """1候補の予測結果"""
+
+    label: str
+    next_stage: Optional[GrowthStage] = None
+    eta: Optional[float] = None  # 次の段階までのゲーム内秒数
+    withers_in: Optional[float] = None  # 先に枯れる場合の秒数
+    phase2_branch: Optional[str] = None
+    # 最終的な花の名前と確率（確率の高い順）
+    outcomes: Tuple[Tuple[str, float], ...] = ()
+
+
+def forecast_key(stats: FlowerStats) -> tuple:
+    """予測が有効な間は変わらない値
+
+    時間経過だけなら水分・光は年齢に対して線形に変化するので、年齢分を
+    打ち消した値を使う（お世話や成長で初めて変わる）。雑草/害虫は分岐に
+    影響しないため含めない。
+    """
+    game = config.game
+    water = (
+        "withered"
+        if stats.water_level <= 0
+        else round(stats.water_level + game.water_decay_rate * stats.age_seconds, 4)
+    )
+    if stats.light_level >= 100:
+        light = "full"
+    elif stats.is_light_on:
+        light = round(stats.light_level - game.light_amount * stats.age_seconds, 4)
+    else:
+        light = round(stats.light_level, 4)
+    return (
+        stats.seed_type,
+        stats.growth_stage,
+        stats.is_light_on,
+        stats.light_tendency_yin,
+        stats.mental_level,
+        stats.phase2_branch,
+        stats.phase3_shape,
+        water,
+        light,
+    )
+
+
+def _care(stats: FlowerStats) -> None:
+    """予測で続けるお世話（光はつけっぱなし、水は60未満で補充）"""
+    if not stats.is_light_on:
+        stats.turn_light_on()
+    if stats.water_level < 60:
+        stats.water()
+
+
+def forecast_one(
+    snapshot: Snapshot,
+    label: str,
+    action: Optional[Callable[[FlowerStats], None]],
+    horizon: float = 7 * 86_400.0,
+    decision_interval: float = 10.0,
+    cancelled: Callable[[], bool] = lambda: False,
+) -> Optional[Forecast]:
+    """1候補を予測する（打ち切られた場合は None）"""
+    stats = snapshot.stats.copy()
+    if action is not None:
+        action(stats)
+
+    # 次の段階まで（追加のお世話なし）: 水分・光は線形なので解析的に求まる
+    t_growth = stats._time_to_growth()[0]
+    t_wither = stats._time_to_wither()
+    next_stage = eta = withers_in = None
+    if t_growth < t_wither and t_growth <= horizon:
+        next_stage, eta = _next_stage(stats.growth_stage), t_growth
+    elif t_wither <= horizon:
+        withers_in = t_wither
+
+    # 分岐の見込み: 茎（フェーズ2確定）までお世話を続けて早送り
+    # 茎以降の花の確率は OutcomeModel で厳密に求まる
+    start = stats.age_seconds
+    while (
+        _STAGE_ORDER.index(stats.growth_stage) < _STAGE_ORDER.index(GrowthStage.STEM)
+        and stats.water_level > WITHER_WATER_LEVEL
+        and stats.age_seconds - start < horizon
+    ):
+        if cancelled():
+            return None
+        _care(stats)
+        stats.advance(
+            min(decision_interval, horizon - (stats.age_seconds - start)),
+            stop_on_wither=True,
+        )
+
+    phase2_branch = None
+    outcomes: Tuple[Tuple[str, float], ...] = ()
+    if _STAGE_ORDER.index(stats.growth_stage) >= _STAGE_ORDER.index(GrowthStage.STEM):
+        phase2_branch = stats.phase2_branch
+        distribution = get_outcome_model().distribution(stats)
+        outcomes = tuple(sorted(distribution.items(), key=lambda item: -item[1]))
+
+    return Forecast(
+        label=label,
+        next_stage=next_stage,
+        eta=eta,
+        withers_in=withers_in,
+        phase2_branch=phase2_branch,
+        outcomes=outcomes,
+    )
+
+
+def compute_forecasts(
+    snapshot: Snapshot,
+    actions: Sequence[Tuple[str, Optional[Callable[[FlowerStats], None]]]] = FORECAST_ACTIONS,
+    cancelled: Callable[[], bool] = lambda: False,
+    **kwargs,
+) -> Optional[Tuple[Forecast, ...]]:
+    """すべての候補を予測する（打ち切られた場合は None）
+
+    雑草/害虫の発生で乱数を使うため、スナップショットの乱数の複製に差し替えて
+    実行する（ゲーム本体の乱数列は進めない）。
+    """
+    results = []
+    with use_rng(snapshot.rng.fork()):
+        for label, action in actions:
+            if cancelled():
+                return None
+            forecast = forecast_one(snapshot, label, action, cancelled=cancelled, **kwargs)
+            if forecast is None:
+                return None
+            results.append(forecast)
+    return tuple(results)
+
+
+class _ForecastThreadFilter(logging.Filter):
+    """予測スレッドでの分岐ログを本体のログに混ぜない"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.threadName != FORECAST_THREAD_NAME
+
+
+class Forecaster:
+    """バックグラウンドで予測を計算し、最新の結果を保持する"""
+
+    def __init__(self, actions=FORECAST_ACTIONS):
+        self.actions = actions
+        self._condition = threading.Condition()
+        self._generation = 0
+        self._job: Optional[Tuple[int, tuple, Snapshot]] = None
+        self._job_key: Optional[tuple] = None
+        self._result: Optional[Tuple[tuple, Tuple[Forecast, ...]]] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def submit(self, stats: FlowerStats) -> None:
+        """状態が変わっていれば予測を依頼する（すぐ戻る）"""
+        key = forecast_key(stats)
+        with self._condition:
+            if key == self._job_key or self._stopped:
+                return
+            self._generation += 1
+            self._job = (self._generation, key, Snapshot.take(stats))
+            self._job_key = key
+            self._condition.notify()
+        self._ensure_thread()
+
+    def latest(self, stats: FlowerStats) -> Optional[Tuple[Forecast, ...]]:
+        """現在の状態に対応する予測（未計算・古い場合は None）"""
+        result = self._result
+        if result is None or result[0] != forecast_key(stats):
+            return None
+        return result[1]
+
+    def stop(self) -> None:
+        """スレッドを止める"""
+        with self._condition:
+            self._stopped = True
+            self._generation += 1
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        flower_logger = logging.getLogger(FlowerStats.__module__)
+        if not any(isinstance(f, _ForecastThreadFilter) for f in flower_logger.filters):
+            flower_logger.addFilter(_ForecastThreadFilter())
+        self._thread = threading.Thread(
+            target=self._run, name=FORECAST_THREAD_NAME, daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._job is None and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                generation, key, snapshot = self._job
+                self._job = None
+
+            def cancelled() -> bool:
+                return self._generation != generation
+
+            try:
+                forecasts = compute_forecasts(snapshot, self.actions, cancelled=cancelled)
+            except Exception as e:
+                logger.warning(f"Forecast failed: {e}")
+                continue
+            if forecasts is not None and not cancelled():
+                self._result = (key, forecasts)
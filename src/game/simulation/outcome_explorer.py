@@ -0,0 +1,355 @@
+"""
+結果分布エクスプローラ（モンテカルロ）
+
+乱数シードの範囲を ProcessPoolExecutor でシャード分割し、お世話方針ごとに
+花を最後まで育てて、最終キャラクター名の分布と開花までの時間を集計する。
+
+相対 import を使うので、リポジトリのルートから python -m で実行する。
+
+例:
+  python -m src.game.simulation.outcome_explorer --seeds 0:10000 \\
+      --policy attentive --policy minimal --csv out.csv --json out.json
+  python -m src.game.simulation.outcome_explorer --exact --policy attentive
+"""
+
+import argparse
+import contextlib
+import csv
+import json
+import logging
+import os
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..entities.flower import FlowerStats, GrowthStage, SeedType, WITHER_WATER_LEVEL
+from ..utils.random_manager import get_rng
+from .outcome_model import get_outcome_model
+
+logger = logging.getLogger(__name__)
+
+# 開花しなかった場合の結果名
+OUTCOME_WITHERED = "枯死"
+OUTCOME_UNFINISHED = "未完"
+
+# 開花までの時間のパーセンタイル
+PERCENTILES = (50, 90, 99)
+
+
+# --- お世話方針 -----------------------------------------------------------
+# 方針は判断間隔ごとに呼ばれ、FlowerStats を直接操作する
+
+
+def _policy_neglect(stats: FlowerStats) -> None:
+    """何もしない"""
+
+
+def _policy_minimal(stats: FlowerStats) -> None:
+    """光はつけっぱなし、水は必要になってから"""
+    if not stats.is_light_on:
+        stats.turn_light_on()
+    if stats.needs_water:
+        stats.water()
+
+
+def _policy_attentive(stats: FlowerStats) -> None:
+    """光はつけっぱなし、水は60未満で補充"""
+    if not stats.is_light_on:
+        stats.turn_light_on()
+    if stats.water_level < 60:
+        stats.water()
+
+
+def _policy_affectionate(stats: FlowerStats) -> None:
+    """丁寧なお世話に加えて毎回「好き」を伝える"""
+    _policy_attentive(stats)
+    stats.adjust_mental(+5)
+
+
+CARE_POLICIES: Dict[str, Callable[[FlowerStats], None]] = {
+    "neglect": _policy_neglect,
+    "minimal": _policy_minimal,
+    "attentive": _policy_attentive,
+    "affectionate": _policy_affectionate,
+}
+
+
+@dataclass(frozen=True)
+class RunResult:
+    """1シード・1方針の実行結果"""
+
+    seed: int
+    policy: str
+    seed_type: str
+    outcome: str
+    time_to_flower: Optional[float] = None
+
+
+def _grow(
+    care: Callable[[FlowerStats], None],
+    seed_type: SeedType,
+    decision_interval: float,
+    max_seconds: float,
+) -> FlowerStats:
+    """開花/枯死/時間切れまで育てた最終状態"""
+    stats = FlowerStats(seed_type=seed_type)
+    while stats.age_seconds < max_seconds:
+        care(stats)
+        step = min(decision_interval, max_seconds - stats.age_seconds)
+        stats.advance(step, stop_on_wither=True)
+        if stats.growth_stage == GrowthStage.FLOWER or stats.water_level <= WITHER_WATER_LEVEL:
+            break
+    return stats
+
+
+def simulate_one(
+    seed: int,
+    policy: str,
+    seed_type: SeedType = SeedType.YANG,
+    decision_interval: float = 10.0,
+    max_seconds: float = 86_400.0,
+) -> RunResult:
+    """1本の花を開花/枯死/時間切れまで育てる（シードごとに決定的）"""
+    get_rng().set_seed(seed)
+    stats = _grow(CARE_POLICIES[policy], seed_type, decision_interval, max_seconds)
+    if stats.growth_stage == GrowthStage.FLOWER:
+        return RunResult(
+            seed, policy, seed_type.value, stats.character_name, stats.age_seconds
+        )
+    if stats.water_level <= WITHER_WATER_LEVEL:
+        return RunResult(seed, policy, seed_type.value, OUTCOME_WITHERED)
+    return RunResult(seed, policy, seed_type.value, OUTCOME_UNFINISHED)
+
+
+def exact_outcomes(
+    policy: str,
+    seed_type: SeedType = SeedType.YANG,
+    decision_interval: float = 10.0,
+    max_seconds: float = 86_400.0,
+) -> Dict[str, float]:
+    """方針どおりに育てた場合の結果の厳密な分布（モンテカルロ不要）
+
+    乱数はフェーズ3の形の乱択と雑草/害虫（成長に影響しない）にしか使われないため、
+    1回育てれば経路は決まり、形の分布は OutcomeModel から求まる。
+    """
+    get_rng().set_seed(0)
+    stats = _grow(CARE_POLICIES[policy], seed_type, decision_interval, max_seconds)
+    if stats.growth_stage == GrowthStage.FLOWER:
+        # 形の乱択前（茎）の状態として確率表を引く
+        stem = stats.copy()
+        stem.growth_stage = GrowthStage.STEM
+        return dict(get_outcome_model().distribution(stem))
+    if stats.water_level <= WITHER_WATER_LEVEL:
+        return {OUTCOME_WITHERED: 1.0}
+    return {OUTCOME_UNFINISHED: 1.0}
+
+
+def _run_shard(
+    seeds: Sequence[int],
+    policies: Sequence[str],
+    seed_types: Sequence[SeedType],
+    decision_interval: float,
+    max_seconds: float,
+) -> List[RunResult]:
+    """シャード（シードの一部）を実行する（ワーカープロセスで呼ばれる）"""
+    # 成長時のprint/ログを抑止（大量実行で出力がボトルネックになるため）
+    logging.getLogger("src.game.entities.flower").setLevel(logging.WARNING)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        return [
+            simulate_one(seed, policy, seed_type, decision_interval, max_seconds)
+            for policy in policies
+            for seed_type in seed_types
+            for seed in seeds
+        ]
+
+
+@dataclass
+class ExplorationReport:
+    """集計結果"""
+
+    results: List[RunResult] = field(default_factory=list)
+
+    def _groups(self) -> Dict[Tuple[str, str], List[RunResult]]:
+        groups: Dict[Tuple[str, str], List[RunResult]] = defaultdict(list)
+        for result in self.results:
+            groups[(result.policy, result.seed_type)].append(result)
+        return groups
+
+    def histogram(self) -> Dict[Tuple[str, str], Counter]:
+        """(方針, 種) ごとの結果名の出現数"""
+        return {
+            key: Counter(r.outcome for r in runs) for key, runs in self._groups().items()
+        }
+
+    def time_to_flower_percentiles(
+        self, runs: Optional[Iterable[RunResult]] = None
+    ) -> Dict[str, Optional[float]]:
+        """開花までの時間のパーセンタイル（秒）"""
+        runs = self.results if runs is None else runs
+        times = [r.time_to_flower for r in runs if r.time_to_flower is not None]
+        if not times:
+            return {f"p{p}": None for p in PERCENTILES}
+        values = np.percentile(np.asarray(times), PERCENTILES)
+        return {f"p{p}": float(v) for p, v in zip(PERCENTILES, values)}
+
+    def summary_rows(self) -> List[Dict[str, object]]:
+        """CSV出力用の行（方針×種×結果名）"""
+        rows = []
+        for (policy, seed_type), runs in sorted(self._groups().items()):
+            by_outcome: Dict[str, List[RunResult]] = defaultdict(list)
+            for r in runs:
+                by_outcome[r.outcome].append(r)
+            for outcome, outcome_runs in sorted(
+                by_outcome.items(), key=lambda item: -len(item[1])
+            ):
+                row: Dict[str, object] = {
+                    "policy": policy,
+                    "seed_type": seed_type,
+                    "outcome": outcome,
+                    "count": len(outcome_runs),
+                    "share": len(outcome_runs) / len(runs),
+                }
+                for key, value in self.time_to_flower_percentiles(outcome_runs).items():
+                    row[f"ttf_{key}"] = value
+                rows.append(row)
+        return rows
+
+    def to_csv(self, path: str) -> None:
+        rows = self.summary_rows()
+        fieldnames = ["policy", "seed_type", "outcome", "count", "share"] + [
+            f"ttf_p{p}" for p in PERCENTILES
+        ]
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+
+    def to_json(self, path: str, include_runs: bool = False) -> None:
+        data: Dict[str, object] = {
+            "runs": len(self.results),
+            "groups": [
+                {
+                    "policy": policy,
+                    "seed_type": seed_type,
+                    "histogram": dict(self.histogram()[(policy, seed_type)]),
+                    "time_to_flower": self.time_to_flower_percentiles(runs),
+                }
+                for (policy, seed_type), runs in sorted(self._groups().items())
+            ],
+        }
+        if include_runs:
+            data["results"] = [asdict(r) for r in self.results]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def explore(
+    seeds: Sequence[int],
+    policies: Sequence[str] = ("attentive",),
+    seed_types: Sequence[SeedType] = (SeedType.YIN, SeedType.YANG),
+    workers: Optional[int] = None,
+    shard_size: int = 250,
+    decision_interval: float = 10.0,
+    max_seconds: float = 86_400.0,
+) -> ExplorationReport:
+    """シード範囲をシャード分割して並列実行し、集計する
+
+    結果はシードごとに決定的で、ワーカー数に依存しない（シャードの順序で連結）。
+    """
+    unknown = [p for p in policies if p not in CARE_POLICIES]
+    if unknown:
+        raise ValueError(f"未知のお世話方針: {', '.join(unknown)}")
+
+    seeds = list(seeds)
+    shards = [seeds[i : i + shard_size] for i in range(0, len(seeds), shard_size)]
+    args = (policies, seed_types, decision_interval, max_seconds)
+    workers = workers or os.cpu_count() or 1
+
+    report = ExplorationReport()
+    if workers == 1 or len(shards) <= 1:
+        for shard in shards:
+            report.results.extend(_run_shard(shard, *args))
+        return report
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_run_shard, shard, *args) for shard in shards]
+        for future in futures:
+            report.results.extend(future.result())
+    return report
+
+
+def _parse_seed_range(text: str) -> range:
+    """'start:stop' または件数 'N'（0..N-1）"""
+    if ":" in text:
+        start, stop = text.split(":", 1)
+        return range(int(start), int(stop))
+    return range(int(text))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="お世話方針ごとの結果分布を調べる")
+    parser.add_argument("--seeds", default="1000", help="シード範囲 'start:stop' または件数")
+    parser.add_argument(
+        "--policy",
+        action="append",
+        choices=sorted(CARE_POLICIES),
+        help="お世話方針（複数指定可、デフォルト: attentive）",
+    )
+    parser.add_argument(
+        "--seed-type",
+        action="append",
+        choices=[s.value for s in SeedType],
+        help="種（複数指定可、デフォルト: 全種）",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="ワーカープロセス数")
+    parser.add_argument("--interval", type=float, default=10.0, help="お世話の判断間隔（秒）")
+    parser.add_argument("--max-seconds", type=float, default=86_400.0, help="1本あたりの上限時間")
+    parser.add_argument("--csv", default=None, help="集計CSVの出力先")
+    parser.add_argument("--json", default=None, help="集計JSONの出力先")
+    parser.add_argument(
+        "--exact", action="store_true", help="乱択せず確率モデルで厳密な分布を表示"
+    )
+    args = parser.parse_args(argv)
+
+    if args.exact:
+        seed_types = [SeedType(s) for s in args.seed_type] if args.seed_type else list(SeedType)
+        logging.getLogger(FlowerStats.__module__).setLevel(logging.WARNING)
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            rows = [
+                (policy, seed_type, exact_outcomes(
+                    policy, seed_type, args.interval, args.max_seconds
+                ))
+                for policy in args.policy or ["attentive"]
+                for seed_type in seed_types
+            ]
+        for policy, seed_type, distribution in rows:
+            for outcome, share in sorted(distribution.items(), key=lambda item: -item[1]):
+                print(f"{policy:>12} {seed_type.value} {outcome:<8} ({share:.1%})")
+        return 0
+
+    report = explore(
+        _parse_seed_range(args.seeds),
+        policies=args.policy or ["attentive"],
+        seed_types=[SeedType(s) for s in args.seed_type] if args.seed_type else list(SeedType),
+        workers=args.workers,
+        decision_interval=args.interval,
+        max_seconds=args.max_seconds,
+    )
+    if args.csv:
+        report.to_csv(args.csv)
+    if args.json:
+        report.to_json(args.json)
+    for row in report.summary_rows():
+        print(
+            f"{row['policy']:>12} {row['seed_type']} {row['outcome']:<8} "
+            f"{row['count']:>6} ({row['share']:.1%})"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
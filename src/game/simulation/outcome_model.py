@@ -0,0 +1,119 @@
+"""
+最終的な花の確率モデル（厳密計算）
+
+フェーズ1（陰/陽傾向）とフェーズ2（茎の分岐）は状態から決定的に決まり、
+フェーズ3（形）だけが有効候補からの等確率の乱択（_compute_phase3_shape）。
+そのため現在の状態から最終キャラクター名の分布は厳密に求まる。
+
+(種, 光傾向, フェーズ2分岐) ごとの分布を前計算しておき、段階に応じて
+- 蕾・花: 形まで確定済み
+- 茎: 分岐が確定済み
+- 芽: 茎になる時点（光量は0にリセット済み）のスコアを分岐の帯に量子化
+  （水分・心情は現在の値が保たれるものとする）
+- 種: さらに芽になる時点の光量で陰/陽傾向を見込む
+としてキーを作り、辞書引きで答える。growth_tables.json が更新されると
+（get_growth_tables() が新しいテーブルを返すと）自動的に作り直す。
+"""
+
+import threading
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from ..data.growth_tables import GrowthTables, get_growth_tables
+from ..entities.flower import FlowerStats, GrowthStage, SeedType
+
+# 蕾・花の段階のキー（形まで確定済み）
+_FIXED = "fixed"
+
+OutcomeKey = Tuple[SeedType, bool, str]
+
+
+class OutcomeModel:
+    """最終キャラクター名の確率表（GrowthTables 1つ分）"""
+
+    def __init__(self, tables: GrowthTables):
+        self.tables = tables
+        branches = {r[2] for r in tables.score_ranges} | {tables.branch_default}
+        self._table: Dict[OutcomeKey, Dict[str, float]] = {}
+        for seed_type in SeedType:
+            for tendency_yin in (False, True):
+                for branch in sorted(branches):
+                    self._table[(seed_type, tendency_yin, branch)] = self._branch_distribution(
+                        seed_type, tendency_yin, branch
+                    )
+
+    def _branch_distribution(
+        self, seed_type: SeedType, tendency_yin: bool, branch: str
+    ) -> Dict[str, float]:
+        """分岐まで確定した状態からの分布（形は有効候補から等確率）"""
+        tables = self.tables
+        base = (
+            tables.seed_base_values.get(seed_type.value, 5)
+            + tables.phase2_branch_values.get(branch, 0)
+            + tables.light_tendency_values.get("陰" if tendency_yin else "陽", 0)
+        )
+        shapes = tables.phase3_candidates(base) or (tables.shape_default,)
+        distribution: Dict[str, float] = {}
+        for shape in shapes:
+            name = _flower_name(seed_type, branch, shape)
+            distribution[name] = distribution.get(name, 0.0) + 1.0 / len(shapes)
+        return distribution
+
+    def key(self, stats: FlowerStats) -> Tuple:
+        """分布を引くキー（種, 光傾向, 分岐）。蕾・花は（種, "fixed", 分岐, 形）
+
+        芽・種の段階では見込みスコアを分岐の帯に量子化したものが分岐になる。
+        """
+        stage = stats.growth_stage
+        if stage in (GrowthStage.BUD, GrowthStage.FLOWER):
+            return (stats.seed_type, _FIXED, stats.phase2_branch, stats.phase3_shape)
+        if stage == GrowthStage.SEED:
+            # 光の蓄積が必要量に達した時点の光量で陰/陽傾向が決まる
+            light = max(stats.light_level, stats.light_required_for_sprout)
+            tendency_yin = light < 50
+        else:
+            tendency_yin = stats.light_tendency_yin
+        if stage == GrowthStage.STEM:
+            branch = stats.phase2_branch
+        else:
+            # 茎になる時点で光量は0にリセットされてからスコアが計算される
+            branch = self.tables.phase2_branch(stats.phase2_score(0))
+        return (stats.seed_type, tendency_yin, branch)
+
+    def distribution(self, stats: FlowerStats) -> Dict[str, float]:
+        """現在の状態からの最終キャラクター名の分布（このまま成長した場合）"""
+        key = self.key(stats)
+        if key[1] == _FIXED:
+            return {_flower_name(key[0], key[2], key[3]): 1.0}
+        return self._table[key]
+
+    def probability(self, stats: FlowerStats, name: str) -> float:
+        """P(name | 現在の状態)"""
+        return self.distribution(stats).get(name, 0.0)
+
+
+@lru_cache(maxsize=None)
+def _flower_name(seed_type: SeedType, branch: str, shape: str) -> str:
+    return FlowerStats(
+        seed_type=seed_type,
+        growth_stage=GrowthStage.FLOWER,
+        phase2_branch=branch,
+        phase3_shape=shape,
+    ).character_name
+
+
+_lock = threading.Lock()
+_model: Optional[OutcomeModel] = None
+
+
+def get_outcome_model() -> OutcomeModel:
+    """現在の成長分岐テーブルに対応する確率モデル（テーブル更新時に作り直す）"""
+    global _model
+    tables = get_growth_tables()
+    model = _model
+    if model is not None and model.tables is tables:
+        return model
+    with _lock:
+        if _model is None or _model.tables is not tables:
+            _model = OutcomeModel(tables)
+        return _model
@@ -26,6 +26,7 @@ class CharacterSpriteManager:
         ).resolve()
         self._image_cache: Dict[Path, pg.Surface] = {}
         self._animation_cache: Dict[Path, AnimationFrames] = {}
+        self._thumbnail_cache: Dict[Tuple[Path, Tuple[int, int]], pg.Surface] = {}
         self._analyzer = CharacterImageAnalyzer()
 
     def get_character_surface(
@@ -34,17 +35,7 @@ class CharacterSpriteManager:
         base_path = self._get_sprite_path(stats)
         if not base_path:
             return None
-        if not base_path.exists():
-            fallback_name = (
-                "normal_normal.png"
-                if stats.growth_stage in (GrowthStage.BUD, GrowthStage.FLOWER)
-                else "normal.png"
-            )
-            fallback_path = base_path.parent / fallback_name
-            if fallback_path.exists():
-                base_path = fallback_path
-
-        frames = self._get_animation_frames(base_path)
+        frames = self._get_animation_frames(self._resolve_fallback(base_path, stats))
         if not frames:
             return None
 
@@ -55,9 +46,50 @@ class CharacterSpriteManager:
         effect_surface = self._apply_effects(frame, stats)
         return self._scale_image(effect_surface, target_size)
 
+    def get_thumbnail(
+        self, stats: FlowerStats, target_size: Tuple[int, int]
+    ) -> Optional[pg.Surface]:
+        """一覧表示用の小さな静止画（演出なし。画像とサイズごとにキャッシュ）"""
+        base_path = self._get_sprite_path(stats)
+        if not base_path:
+            return None
+        key = (base_path, target_size)
+        if key in self._thumbnail_cache:
+            return self._thumbnail_cache[key]
+        frames = self._get_animation_frames(self._resolve_fallback(base_path, stats))
+        thumbnail = (
+            self._scale_image(frames.frames[0], target_size)
+            if frames and frames.frames
+            else None
+        )
+        self._thumbnail_cache[key] = thumbnail
+        return thumbnail
+
+    def is_animated(self, stats: FlowerStats) -> bool:
+        """時間で見た目が変わるか（コマ送りのアニメーションや演出がある）"""
+        if stats.water_level >= 60 or stats.mental_level >= 60:
+            return True
+        base_path = self._get_sprite_path(stats)
+        if not base_path:
+            return False
+        frames = self._get_animation_frames(self._resolve_fallback(base_path, stats))
+        return bool(frames) and frames.fps > 0 and len(frames.frames) > 1
+
     def analyze_image(self, path: Path):
         return self._analyzer.analyze_image(path)
 
+    def _resolve_fallback(self, base_path: Path, stats: FlowerStats) -> Path:
+        """状態別の画像がなければ標準の画像を使う"""
+        if base_path.exists():
+            return base_path
+        fallback_name = (
+            "normal_normal.png"
+            if stats.growth_stage in (GrowthStage.BUD, GrowthStage.FLOWER)
+            else "normal.png"
+        )
+        fallback_path = base_path.parent / fallback_name
+        return fallback_path if fallback_path.exists() else base_path
+
     def _get_sprite_path(self, stats: FlowerStats) -> Optional[Path]:
         state_key = self._get_state_string(stats)
         if stats.growth_stage == GrowthStage.SEED:
@@ -193,3 +225,14 @@ class CharacterSpriteManager:
 
     def _scale_image(self, image: pg.Surface, target_size: Tuple[int, int]) -> pg.Surface:
         return pg.transform.smoothscale(image, target_size)
+
+
+_sprite_manager: Optional[CharacterSpriteManager] = None
+
+
+def get_sprite_manager() -> CharacterSpriteManager:
+    """共有のキャラクタースプライトマネージャーを取得（画像キャッシュを全体で共有）"""
+    global _sprite_manager
+    if _sprite_manager is None:
+        _sprite_manager = CharacterSpriteManager()
+    return _sprite_manager
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from ..data.config import config
 from .font_manager import get_font_manager
 from ..utils.helpers import DigitalNumberRenderer
-from .character_sprite_manager import CharacterSpriteManager
+from .character_sprite_manager import get_sprite_manager
 import os
 
 # カラーパレット（ピクセルアート風）
@@ -102,7 +102,7 @@ class Icon(UIComponent):
         self.icon_type = icon_type
         # 擬人化キャラクター用の状態情報
         self.character_state = None  # FlowerStatsオブジェクトを保持
-        self._sprite_manager = CharacterSpriteManager()
+        self._sprite_manager = get_sprite_manager()
     
     def set_icon(self, icon_type: str) -> None:
         """アイコンタイプを設定"""
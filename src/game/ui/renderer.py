@@ -1,9 +1,11 @@
+import math
 import pygame as pg
 from typing import List, Dict, Any, Optional
 from .components import UIComponent, Icon, Text, Colors, Rect
-from ..entities.flower import FlowerStats, SeedType, GrowthStage
+from ..entities.flower import FlowerStats, SeedType, GrowthStage, WITHER_WATER_LEVEL
 from .font_manager import get_font_manager
-from ..utils.helpers import format_time_digital
+from .character_sprite_manager import get_sprite_manager
+from ..utils.helpers import format_time_compact, format_time_digital
 from .menu_system import MenuCursor, MenuItem
 
 # 定数定義
@@ -32,6 +34,13 @@ class UIRenderer:
             Rect(40, 24, 160, 26), "種を選択してください", 16
         )
 
+        # メイン画面上部（時間・キャラ名・時間倍率）: 文字列が変わった時だけ更新する
+        self.header_clock = Text(Rect(6, 8, 60, 16), "", 8)
+        self.header_name = Text(Rect(66, 8, 108, 16), "", 8, center=True)
+        self.header_name.color = Colors.BLACK
+        self.header_scale = Text(Rect(176, 8, 58, 16), "", 8, center=True)
+        self._header_scale_key = None
+
         # コンポーネントリストに追加
         self.components.extend(
             [
@@ -68,6 +77,8 @@ class UIRenderer:
             self._render_flower_language(surface, game_state)
         elif screen_state == "DEATH":
             self._render_death(surface)
+        elif screen_state == "GARDEN":
+            self._render_garden(surface, game_state)
         else:
             self._render_game_play(surface, game_state)
 
@@ -195,17 +206,49 @@ class UIRenderer:
         mental_level = flower_stats.get('mental_level', 0)
         
         self._render_modern_stat(surface, 8, y, "水分", water_level, (100, 180, 255))
-        y += 28
+        y += 24
         self._render_modern_stat(surface, 8, y, "光量", light_level, (255, 220, 100))
-        y += 28
+        y += 24
         self._render_modern_stat(surface, 8, y, "心情", mental_level, (255, 150, 200))
-        y += 35
+        y += 22
+        
+        # 「もしも」予測（バックグラウンドで計算済みのものだけ表示）
+        forecasts = game_state.get("forecasts")
+        if forecasts:
+            for forecast in forecasts:
+                line = Text(Rect(12, y, 220, 13), self._forecast_text(forecast), 12)
+                line.color = (200, 220, 210)
+                line.render(surface)
+                y += 13
+        else:
+            line = Text(Rect(12, y, 220, 13), "予測中…", 12)
+            line.color = (140, 160, 150)
+            line.render(surface)
         
         # メニュー（「戻る」選択肢）
         menu_items = game_state.get("menu_items", [])
         cursor_index = game_state.get("cursor_index", 0)
         if menu_items:
-            self._render_menu_items(surface, menu_items, cursor_index, start_y=200, item_height=18)
+            self._render_menu_items(surface, menu_items, cursor_index, start_y=220, item_height=18)
+
+    @staticmethod
+    def _forecast_text(forecast) -> str:
+        """予測1件の表示文字列（例: 光ON 芽まで20秒 つる→ばら50%）"""
+        def duration(seconds: float) -> str:
+            return f"{int(seconds)}秒" if seconds < 60 else format_time_compact(seconds)
+
+        if forecast.next_stage is not None:
+            text = f"{forecast.label} {forecast.next_stage.value}まで{duration(forecast.eta)}"
+        elif forecast.withers_in is not None:
+            text = f"{forecast.label} {duration(forecast.withers_in)}で枯れる"
+        else:
+            text = f"{forecast.label} 変化なし"
+        if forecast.phase2_branch:
+            text += f" {forecast.phase2_branch}"
+            if forecast.outcomes:
+                name, probability = forecast.outcomes[0]
+                text += f"→{name}{probability:.0%}"
+        return text
     
     def _render_modern_stat(self, surface: pg.Surface, x: int, y: int, label: str, value: float, color: tuple) -> None:
         """モダンなステータス表示"""
@@ -293,6 +336,57 @@ class UIRenderer:
         title = Text(Rect(50, 100, 140, 22), "枯れてしまった…", 12)
         title.render(surface)
 
+    def _render_garden(self, surface: pg.Surface, game_state: Dict[str, Any]) -> None:
+        """花壇の一覧画面（区画をマス目に並べ、選択中の区画を枠で示す）"""
+        plots = game_state.get("garden") or []
+        selected = game_state.get("cursor_index", 0)
+        alive = sum(1 for stats in plots if stats.water_level > WITHER_WATER_LEVEL)
+        header = Text(Rect(0, 4, 240, 16), f"おにわ {alive}/{len(plots)}", 12, center=True)
+        header.render(surface)
+        if not plots:
+            return
+
+        # グリッド配置（y=24〜208 に収める）
+        cols = math.ceil(math.sqrt(len(plots)))
+        rows = math.ceil(len(plots) / cols)
+        cell = min(232 // cols, 184 // rows)
+        left = (240 - cell * cols) // 2
+        sprites = get_sprite_manager()
+        for index, stats in enumerate(plots):
+            x = left + (index % cols) * cell
+            y = 24 + (index // cols) * cell
+            alive = stats.water_level > WITHER_WATER_LEVEL
+            background = (
+                Colors.LIGHT_GRAY if not alive
+                else (255, 255, 240) if stats.is_light_on
+                else (225, 225, 225)
+            )
+            surface.fill(background, pg.Rect(x + 1, y + 1, cell - 2, cell - 2))
+            size = max(1, cell - 6)
+            thumbnail = sprites.get_thumbnail(stats, (size, size)) if alive else None
+            if thumbnail:
+                surface.blit(thumbnail, (x + 3, y + 2))
+            elif not alive:
+                pg.draw.line(surface, Colors.DARK_GRAY, (x + 4, y + 4), (x + cell - 5, y + cell - 5))
+                pg.draw.line(surface, Colors.DARK_GRAY, (x + cell - 5, y + 4), (x + 4, y + cell - 5))
+            # 水分バー（区画の下端）
+            water_width = int((cell - 4) * min(100.0, stats.water_level) / 100.0)
+            surface.fill(Colors.BLUE, pg.Rect(x + 2, y + cell - 3, water_width, 2))
+            if index == selected:
+                pg.draw.rect(surface, Colors.BLACK, (x, y, cell, cell), 1)
+
+        # 選択中の区画の情報・メッセージ
+        if 0 <= selected < len(plots):
+            stats = plots[selected]
+            detail = f"{selected + 1}: {stats.character_label} 水{stats.water_level:.0f}"
+            Text(Rect(4, 210, 232, 14), detail, 8).render(surface)
+        elif selected == len(plots):
+            # 区画の後ろの「戻る」
+            Text(Rect(4, 210, 232, 14), "▶ 戻る", 8).render(surface)
+        message = game_state.get("info_message", "") or game_state.get("invalid_message", "")
+        if message:
+            Text(Rect(4, 224, 232, 14), message, 8).render(surface)
+
     def _render_game_play(
         self, surface: pg.Surface, game_state: Dict[str, Any]
     ) -> None:
@@ -317,19 +411,16 @@ class UIRenderer:
         scale = game_state.get("time_scale", 1.0)
         flower_stats = game_state.get("flower_stats")
         if flower_stats:
-            clock_text = flower_stats.age_digital
-            character_label = flower_stats.character_label
-            scale_text = "PAUSE" if paused else f"x{int(scale)}"
-
-            clock_display = Text(Rect(6, 8, 60, 16), clock_text, 8)
-            clock_display.render(surface)
-
-            name_text = Text(Rect(66, 8, 108, 16), character_label, 8, center=True)
-            name_text.color = Colors.BLACK
-            name_text.render(surface)
+            self._set_text_if_changed(self.header_clock, flower_stats.age_digital)
+            self._set_text_if_changed(self.header_name, flower_stats.character_label)
+            scale_key = (paused, scale)
+            if scale_key != self._header_scale_key:
+                self._header_scale_key = scale_key
+                self.header_scale.set_text("PAUSE" if paused else f"x{int(scale)}")
 
-            time_text = Text(Rect(176, 8, 58, 16), scale_text, 8, center=True)
-            time_text.render(surface)
+            self.header_clock.render(surface)
+            self.header_name.render(surface)
+            self.header_scale.render(surface)
 
         # 操作メッセージ表示
         info = game_state.get("info_message", "")
@@ -359,6 +450,12 @@ class UIRenderer:
             if component != self.seed_selection_title:
                 component.render(surface)
 
+    @staticmethod
+    def _set_text_if_changed(text: Text, value: str) -> None:
+        """文字列が変わった時だけ set_text する（フォントサイズ再計算を避ける）"""
+        if text.text != value:
+            text.set_text(value)
+
     def _update_flower_sprite(self, stats: FlowerStats) -> None:
         """花のスプライトを更新（擬人化キャラクター）"""
         # 成長段階に応じてスプライト名を設定
@@ -437,6 +534,10 @@ class UIRenderer:
                 cursor = Text(Rect(cursor_x, cursor_y, 15, 15), "→", 8)
                 cursor.render(surface)
 
+    def is_animated(self, screen_state: str, stats: FlowerStats) -> bool:
+        """状態が同じでも時間で描画内容が変わるか（メイン画面のキャラクター）"""
+        return screen_state == "MAIN" and get_sprite_manager().is_animated(stats)
+
     def update(self, dt: float) -> None:
         """レンダラーの更新"""
         # 必要に応じてアニメーションなどを更新
@@ -453,6 +554,10 @@ class RenderManager:
         """ゲーム状態をレンダリング"""
         self.ui_renderer.render(surface, game_state)
 
+    def is_animated(self, screen_state: str, stats: FlowerStats) -> bool:
+        """状態が同じでも時間で描画内容が変わるか"""
+        return self.ui_renderer.is_animated(screen_state, stats)
+
     def update(self, dt: float) -> None:
         """レンダラーの更新"""
         self.ui_renderer.update(dt)
@@ -1,17 +1,100 @@
 from __future__ import annotations
 
-import random
-from typing import Optional
+import math
+import threading
+from contextlib import contextmanager
+from itertools import chain, islice
+from operator import length_hint
+from typing import Callable, Iterator, Optional, Sequence, Tuple
 
+import numpy as np
 
-class RandomManager:
-    """Centralized RNG with optional fixed seed for reproducibility."""
+# 1回の補充で生成する一様乱数の数
+BUFFER_SIZE = 1024
+_FIRST_BUFFER_SIZE = 32
+
+
+class BufferedUniforms:
+    """NumPy の Generator からまとめて生成した一様乱数を1個ずつ返す
+
+    値は generator.random() を1個ずつ呼んだ場合と同じ並びになる
+    （バッファは生成順に消費し、random_array も残りのバッファから使う）。
+    random は連結したバッファのイテレータの __next__ そのもので、1個あたり
+    Python の関数呼び出しを挟まない。補充はバッファが尽きた時だけ行う。
+    サブクラスは _reset_buffer(generator, draws) で初期化する。
+    """
+
+    __slots__ = ("_generator", "_filled", "_current", "_values", "random")
+
+    def _reset_buffer(self, generator: np.random.Generator, draws: int = 0) -> None:
+        self._generator = generator
+        self._filled = draws  # generator から取り出した総数
+        self._current: Iterator[float] = iter(())  # 消費中のバッファ
+        self._values = chain.from_iterable(self._chunks())
+        # random(): [0, 1) の一様乱数
+        self.random = self._values.__next__
+
+    def _chunks(self) -> Iterator[Iterator[float]]:
+        """補充のたびにバッファを生成（最初は小さく、倍にして上限まで）"""
+        chunk = _FIRST_BUFFER_SIZE
+        while True:
+            values = self._generator.random(chunk).tolist()
+            self._filled += chunk
+            self._current = iter(values)
+            yield self._current
+            chunk = min(chunk * 2, BUFFER_SIZE)
+
+    @property
+    def draws(self) -> int:
+        """これまでに消費した一様乱数の数"""
+        return self._filled - length_hint(self._current)
+
+    def paired_with(self, other: "BufferedUniforms") -> Callable[[], Tuple[float, float]]:
+        """self と other から1個ずつ引いて組で返す関数
+
+        1回の呼び出しで2個引ける（self.random() と other.random() を続けて呼んだのと同じ値）。
+        """
+        return zip(self._values, other._values).__next__
+
+    def random_array(self, n: int) -> np.ndarray:
+        """[0, 1) の一様乱数 n 個（random() を n 回呼んだのと同じ値）"""
+        out = np.empty(n)
+        buffered = min(n, length_hint(self._current))
+        if buffered:
+            out[:buffered] = list(islice(self._current, buffered))
+        if n > buffered:
+            out[buffered:] = self._generator.random(n - buffered)
+            self._filled += n - buffered
+        return out
+
+    def randint(self, a: int, b: int) -> int:
+        """a 以上 b 以下の整数"""
+        return a + min(int(self.random() * (b - a + 1)), b - a)
+
+    def choice(self, seq: Sequence):
+        """seq から等確率に1つ選ぶ"""
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence")
+        return seq[min(int(self.random() * len(seq)), len(seq) - 1)]
+
+    def expovariate(self, lambd: float) -> float:
+        """指数分布（逆関数法。一様乱数1個を消費）"""
+        return -math.log1p(-self.random()) / lambd
+
+
+class RandomManager(BufferedUniforms):
+    """Centralized RNG with optional fixed seed for reproducibility.
+
+    PCG64 からバッファ単位でまとめて生成する。状態は (エントロピー, 消費数) で、
+    復元は PCG64.advance で行う。
+    """
+
+    __slots__ = ("_seed", "_entropy")
 
     _instance: Optional["RandomManager"] = None
 
     def __init__(self, seed: Optional[int] = None):
-        self._seed = seed
-        self._rng = random.Random(seed)
+        self.set_seed(seed)
 
     @classmethod
     def get_instance(cls) -> "RandomManager":
@@ -21,22 +104,60 @@ class RandomManager:
 
     def set_seed(self, seed: Optional[int]) -> None:
         self._seed = seed
-        self._rng = random.Random(seed)
+        self._entropy = np.random.SeedSequence(seed).entropy
+        self._restore(0)
 
     def get_seed(self) -> Optional[int]:
         return self._seed
 
-    def random(self) -> float:
-        return self._rng.random()
+    def get_state(self) -> Tuple[int, int]:
+        return (self._entropy, self.draws)
+
+    def set_state(self, state) -> None:
+        entropy, draws = state
+        self._entropy = int(entropy)
+        self._restore(int(draws))
+
+    def _restore(self, draws: int) -> None:
+        bit_generator = np.random.PCG64(np.random.SeedSequence(self._entropy))
+        bit_generator.advance(draws)
+        self._reset_buffer(np.random.Generator(bit_generator), draws)
+
+    def fork(self) -> "RandomManager":
+        """同じ状態から始まる独立したコピーを作成"""
+        forked = RandomManager(self._seed)
+        forked.set_state(self.get_state())
+        return forked
+
+
+class _Local(threading.local):
+    rng: Optional[RandomManager] = None
 
-    def randint(self, a: int, b: int) -> int:
-        return self._rng.randint(a, b)
 
-    def choice(self, seq):
-        return self._rng.choice(seq)
+_local = _Local()
+_override_count = 0  # use_rng 中のスレッド数（0ならスレッドローカルを見ない）
+_override_lock = threading.Lock()
 
 
 def get_rng() -> RandomManager:
-    return RandomManager.get_instance()
+    if _override_count:
+        override = _local.rng
+        if override is not None:
+            return override
+    return RandomManager._instance or RandomManager.get_instance()
 
 
+@contextmanager
+def use_rng(manager: RandomManager) -> Iterator[RandomManager]:
+    """このスレッドの get_rng() を一時的に差し替える（バックグラウンド計算用）"""
+    global _override_count
+    previous = _local.rng
+    _local.rng = manager
+    with _override_lock:
+        _override_count += 1
+    try:
+        yield manager
+    finally:
+        _local.rng = previous
+        with _override_lock:
+            _override_count -= 1
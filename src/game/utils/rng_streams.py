@@ -0,0 +1,131 @@
+"""花ごと・用途ごとのカウンタベース乱数ストリーム
+
+共有の RandomManager は引く順番で結果が変わるため、花や処理の実行順に
+依存してしまう。ここでは NumPy の SeedSequence から
+(エントロピー, 花ID, 世代, 用途) ごとに独立した Philox（カウンタベース）の
+ストリームを作り、他の花や用途がいつ何回引いても結果が変わらないようにする。
+
+各ストリームは一様乱数だけを1回1値で消費するので、状態は
+(エントロピー, spawn_key, 引いた回数) で表せる。復元時は Philox.advance で
+カウンタを進めるだけなので、引いた回数によらず一定時間で戻せる。
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from .random_manager import BufferedUniforms
+
+# 1本の花が持つストリーム（spawn_key の末尾の番号はこの並び順）
+STREAM_NAMES = ("weeds", "pests", "phase3")
+
+# Philox4x64 はカウンタ1つで64bit値を4つ生成する
+_DRAWS_PER_COUNTER = 4
+
+
+class RngStream(BufferedUniforms):
+    """1用途分の乱数ストリーム（Philox。状態は引いた回数で表す）
+
+    random()/random_array() などは BufferedUniforms のバッファから供給する。
+    """
+
+    __slots__ = ("entropy", "spawn_key")
+
+    def __init__(self, entropy: int, spawn_key: Tuple[int, ...] = (), draws: int = 0):
+        self.entropy = entropy
+        self.spawn_key = tuple(spawn_key)
+        bit_generator = np.random.Philox(
+            np.random.SeedSequence(entropy, spawn_key=self.spawn_key)
+        )
+        bit_generator.advance(draws // _DRAWS_PER_COUNTER)
+        generator = np.random.Generator(bit_generator)
+        if draws % _DRAWS_PER_COUNTER:
+            generator.random(draws % _DRAWS_PER_COUNTER)
+        self._reset_buffer(generator, draws)
+
+    def copy(self) -> "RngStream":
+        """同じ位置から始まる独立したコピー"""
+        return RngStream(self.entropy, self.spawn_key, self.draws)
+
+    def to_state(self) -> Dict[str, Any]:
+        """JSON にそのまま書ける状態"""
+        return {
+            "entropy": self.entropy,
+            "spawn_key": list(self.spawn_key),
+            "draws": self.draws,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "RngStream":
+        return cls(int(state["entropy"]), tuple(state["spawn_key"]), int(state["draws"]))
+
+
+class FlowerStreams:
+    """1本の花の乱数ストリーム一式（雑草・害虫・フェーズ3の形）"""
+
+    __slots__ = STREAM_NAMES + ("draw_pair",)
+
+    def __init__(self, weeds: RngStream, pests: RngStream, phase3: RngStream):
+        self.weeds = weeds
+        self.pests = pests
+        self.phase3 = phase3
+        # draw_pair(): (雑草, 害虫) を1回の呼び出しで引く（ティック処理用）
+        self.draw_pair = weeds.paired_with(pests)
+
+    @classmethod
+    def for_flower(
+        cls, seed: Optional[int] = None, flower_id: int = 0, generation: int = 0
+    ) -> "FlowerStreams":
+        """シードと花IDから作る（seed=None なら新しいエントロピー）"""
+        entropy = np.random.SeedSequence(seed).entropy
+        key = (flower_id, generation)
+        return cls(*(RngStream(entropy, key + (i,)) for i in range(len(STREAM_NAMES))))
+
+    @property
+    def entropy(self) -> int:
+        return self.weeds.entropy
+
+    @property
+    def flower_id(self) -> int:
+        return self.weeds.spawn_key[0]
+
+    @property
+    def generation(self) -> int:
+        return self.weeds.spawn_key[1]
+
+    def next_generation(self) -> "FlowerStreams":
+        """植え直し用: 同じエントロピー・花IDで次の世代のストリーム"""
+        key = (self.flower_id, self.generation + 1)
+        return FlowerStreams(
+            *(RngStream(self.entropy, key + (i,)) for i in range(len(STREAM_NAMES)))
+        )
+
+    def copy(self) -> "FlowerStreams":
+        return FlowerStreams(self.weeds.copy(), self.pests.copy(), self.phase3.copy())
+
+    def to_state(self) -> Dict[str, Any]:
+        """セーブ用の状態（エントロピーと各ストリームの引いた回数）"""
+        return {
+            "entropy": self.entropy,
+            "flower_id": self.flower_id,
+            "generation": self.generation,
+            "draws": {name: getattr(self, name).draws for name in STREAM_NAMES},
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "FlowerStreams":
+        entropy = int(state["entropy"])
+        key = (int(state["flower_id"]), int(state["generation"]))
+        draws = state.get("draws", {})
+        return cls(
+            *(
+                RngStream(entropy, key + (i,), int(draws.get(name, 0)))
+                for i, name in enumerate(STREAM_NAMES)
+            )
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FlowerStreams) and self.to_state() == other.to_state()
+
+    def __repr__(self) -> str:
+        return f"FlowerStreams({self.to_state()})"
@@ -6,8 +6,16 @@
 import sys
 import argparse
 import logging
+import random
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
 from .game.core.game_engine import GameEngine
+from .game.core.input_handler import parse_input_script
+from .game.core.session_recorder import SessionRecorder, SessionReplayer
 from .game.data.config import config
+from .game.data.save_manager import SaveManager
 
 def setup_logging():
     """ログ設定を初期化"""
@@ -20,6 +28,120 @@ def setup_logging():
         ]
     )
 
+def run_headless(
+    ticks: int,
+    script_path: Optional[str] = None,
+    record_path: Optional[str] = None,
+    garden_size: Optional[int] = None,
+    control: Optional[dict] = None,
+    use_save: bool = False,
+) -> int:
+    """ヘッドレスで実行し、ティック/秒を報告
+
+    use_save が False なら一時ディレクトリのセーブを使い、プレイヤーのセーブ
+    （config.data.save_path）は読みも書きもしない。
+    """
+    if use_save:
+        return _run_headless(ticks, script_path, record_path, garden_size, control)
+    with _temporary_save_path():
+        return _run_headless(ticks, script_path, record_path, garden_size, control)
+
+@contextmanager
+def _temporary_save_path() -> Iterator[None]:
+    """セーブ先を一時ディレクトリに切り替える（プレイヤーのセーブは読みも書きもしない）"""
+    saved_path = config.data.save_path
+    with tempfile.TemporaryDirectory(prefix="flower-headless-") as tmp:
+        config.data.save_path = str(Path(tmp) / Path(saved_path).name)
+        try:
+            yield
+        finally:
+            config.data.save_path = saved_path
+
+def _run_headless(
+    ticks: int,
+    script_path: Optional[str],
+    record_path: Optional[str],
+    garden_size: Optional[int],
+    control: Optional[dict],
+) -> int:
+    logger = logging.getLogger(__name__)
+    script = []
+    if script_path:
+        with open(script_path, 'r', encoding='utf-8') as f:
+            script = parse_input_script(f.read())
+
+    engine = GameEngine(headless=True)
+    if not engine.initialize():
+        logger.error("Failed to initialize headless engine")
+        return 1
+    if garden_size:
+        engine.start_garden(garden_size)
+    if control:
+        engine.start_control_server(**control)
+
+    recorder = SessionRecorder.open(engine, record_path) if record_path else None
+    try:
+        result = engine.run_headless(ticks, script)
+    finally:
+        if recorder:
+            recorder.close()
+    engine.quit()
+    logger.info(
+        f"Headless run: {result['ticks']} ticks "
+        f"({result['sim_seconds']:.0f}s sim) in {result['elapsed']:.3f}s "
+        f"= {result['ticks_per_second']:.0f} ticks/s, "
+        f"screen={engine.screen_state.name}"
+    )
+    if engine.garden is not None:
+        logger.info(
+            f"Garden: {engine.garden.alive_count}/{len(engine.garden)} alive, "
+            f"{engine.garden.advanced_count} plot updates"
+        )
+    return 0
+
+def run_replay(replay_path: str) -> int:
+    """記録したセッションをヘッドレスで再生し、記録時の結果と一致するか確認
+
+    エンジン作成時のロードでプレイヤーのセーブに触れないよう、一時ディレクトリのセーブを使う。
+    """
+    replayer = SessionReplayer.load(replay_path)
+    with _temporary_save_path():
+        return _run_replay(replayer)
+
+def _run_replay(replayer: SessionReplayer) -> int:
+    logger = logging.getLogger(__name__)
+    engine = GameEngine(headless=True)
+    if not engine.initialize():
+        logger.error("Failed to initialize headless engine")
+        return 1
+
+    result = replayer.run(engine)
+    engine.quit()
+    logger.info(
+        f"Replay: {result.ticks} ticks in {result.elapsed:.3f}s "
+        f"= {result.ticks_per_second:.0f} ticks/s, "
+        f"stats={'OK' if result.stats_match else 'MISMATCH'}, "
+        f"screens={'OK' if result.screens_match else 'MISMATCH'}"
+    )
+    if not result.matched:
+        if not result.stats_match:
+            logger.error(f"Expected stats: {result.expected_stats}")
+            logger.error(f"Replayed stats: {result.stats}")
+        if not result.screens_match:
+            logger.error(f"Expected screens: {result.expected_screens}")
+            logger.error(f"Replayed screens: {result.screens}")
+        return 1
+    return 0
+
+def run_save_tool(export_path: Optional[str], import_path: Optional[str]) -> int:
+    """セーブの JSON 書き出し/読み込み（デバッグ用。ゲームは起動しない）"""
+    manager = SaveManager()
+    if import_path and not manager.import_json(import_path):
+        return 1
+    if export_path and not manager.export_json(export_path):
+        return 1
+    return 0
+
 def main():
     """メイン関数"""
     # コマンドライン引数の解析
@@ -31,6 +153,22 @@ def main():
   python -m src.main              # デフォルト設定で実行
   python -m src.main --seed 42     # シード42で実行（再現性確保）
   python -m src.main --seed 12345 # シード12345で実行
+  python -m src.main --headless --ticks 100000 --seed 42
+                                   # 画面なしで最大速度実行（ティック/秒を表示）
+  python -m src.main --headless --script inputs.txt
+                                   # 入力スクリプト（各行「<ティック> <アクション>」）を再生
+                                   # （ヘッドレスは一時ファイルにセーブ。--use-save で実際のセーブを使う）
+  python -m src.main --record session.rec
+                                   # 入力を記録しながらプレイ
+  python -m src.main --replay session.rec --headless
+                                   # 記録を最大速度で再生し、結果が一致するか確認
+  python -m src.main --garden 16   # 16本の花壇を一覧画面で育てる（最大64）
+  python -m src.main --control-port 8765
+                                   # localhost:8765 で制御API（NDJSON）を受け付ける
+  python -m src.main --export-json save.json
+                                   # セーブ（バイナリ）を JSON に書き出す（デバッグ用）
+  python -m src.main --import-json save.json
+                                   # JSON を読み込んでセーブにする（デバッグ用）
         """
     )
     parser.add_argument(
@@ -39,18 +177,104 @@ def main():
         default=None,
         help='乱数シードを指定（再現性確保のため）'
     )
+    parser.add_argument(
+        '--headless',
+        action='store_true',
+        help='画面・フォント・フレーム制限なしで実行'
+    )
+    parser.add_argument(
+        '--ticks',
+        type=int,
+        default=36000,
+        help='ヘッドレス実行時のティック数（デフォルト: 36000）'
+    )
+    parser.add_argument(
+        '--script',
+        type=str,
+        default=None,
+        help='ヘッドレス実行時の入力スクリプトファイル'
+    )
+    parser.add_argument(
+        '--record',
+        type=str,
+        default=None,
+        help='入力セッションを記録するファイル'
+    )
+    parser.add_argument(
+        '--replay',
+        type=str,
+        default=None,
+        help='記録したセッションを画面なしで再生するファイル'
+    )
+    parser.add_argument(
+        '--garden',
+        type=int,
+        default=None,
+        help='ガーデンモード: 指定した本数（1〜64）の花壇で開始'
+    )
+    parser.add_argument(
+        '--control-port',
+        type=int,
+        default=None,
+        help='制御API（NDJSON）を待ち受ける localhost のポート'
+    )
+    parser.add_argument(
+        '--control-socket',
+        type=str,
+        default=None,
+        help='制御API（NDJSON）を待ち受ける Unix ソケットのパス'
+    )
+    parser.add_argument(
+        '--use-save',
+        action='store_true',
+        help='ヘッドレス実行でもプレイヤーのセーブを読み書きする（既定は一時ファイル）'
+    )
+    parser.add_argument(
+        '--export-json',
+        type=str,
+        default=None,
+        help='セーブを JSON ファイルに書き出して終了（デバッグ用）'
+    )
+    parser.add_argument(
+        '--import-json',
+        type=str,
+        default=None,
+        help='JSON ファイルを読み込んでセーブにして終了（デバッグ用）'
+    )
     
     args = parser.parse_args()
     
+    # ログ設定（先に logging.info を呼ぶと basicConfig が無効になるため最初に行う）
+    setup_logging()
+    logger = logging.getLogger(__name__)
+    
     # シードが指定された場合は設定に反映
     if args.seed is not None:
         config.data.random_seed = args.seed
-        logging.info(f"Random seed set to: {args.seed}")
-    
-    # ログ設定
-    setup_logging()
-    logger = logging.getLogger(__name__)
+        logger.info(f"Random seed set to: {args.seed}")
     
+    if args.export_json or args.import_json:
+        return run_save_tool(args.export_json, args.import_json)
+
+    if args.replay:
+        return run_replay(args.replay)
+
+    # 記録時はシードを必ず固定（再生で同じ乱数列にするため）
+    if args.record and config.data.random_seed is None:
+        config.data.random_seed = random.SystemRandom().randrange(2**32)
+        logger.info(f"Random seed for recording: {config.data.random_seed}")
+
+    control = None
+    if args.control_port is not None or args.control_socket:
+        control = {"port": args.control_port, "path": args.control_socket}
+
+    if args.headless:
+        return run_headless(
+            args.ticks, args.script, args.record, args.garden, control, args.use_save
+        )
+
+    recorder = None
+    engine = None
     try:
         # ゲームエンジンを作成
         engine = GameEngine()
@@ -59,10 +283,16 @@ def main():
         if not engine.initialize():
             logger.error("Failed to initialize game engine")
             return 1
+        if args.garden:
+            engine.start_garden(args.garden)
+        if control:
+            engine.start_control_server(**control)
         
         logger.info("Game engine initialized successfully")
         if config.data.random_seed is not None:
             logger.info(f"Using random seed: {config.data.random_seed}")
+        if args.record:
+            recorder = SessionRecorder.open(engine, args.record)
         
         # ゲームループを実行
         engine.run()
@@ -76,6 +306,12 @@ def main():
     except Exception as e:
         logger.error(f"Unexpected error: {e}", exc_info=True)
         return 1
+    finally:
+        if recorder:
+            recorder.close()
+        # 初期化の途中で失敗した時も、書き込み待ちのセーブと制御サーバーを片付ける
+        if engine is not None:
+            engine.quit()
 
 if __name__ == "__main__":
     sys.exit(main())
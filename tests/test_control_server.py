@@ -0,0 +1,208 @@
+"""
+ローカル制御API のテスト
+
+仕様書参照:
+- src/game/core/control_server.py: NDJSON の state / action
+- src/main.py --control-port / --control-socket
+"""
+
+import json
+import os
+import socket
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock
+
+from src.game.core.control_server import MAX_ACTION_COUNT, MAX_PENDING_ACTIONS, ControlServer
+from src.game.core.game_engine import GameEngine
+from src.game.core.input_handler import InputAction
+from src.game.core.session_recorder import SessionRecorder, SessionReplayer
+from src.game.entities.flower import SeedType
+from src.game.core.screen_state import ScreenState
+
+
+class _Client:
+    """テスト用の NDJSON クライアント"""
+
+    def __init__(self, sock: socket.socket):
+        sock.settimeout(5.0)
+        self._file = sock.makefile("rwb")
+        self._sock = sock
+
+    def request(self, **payload) -> dict:
+        self._file.write(json.dumps(payload).encode("utf-8") + b"\n")
+        self._file.flush()
+        return json.loads(self._file.readline())
+
+    def close(self) -> None:
+        self._file.close()
+        self._sock.close()
+
+
+class TestControlServer(unittest.TestCase):
+    """ControlServer のテストクラス"""
+
+    def setUp(self):
+        self.engine = GameEngine(headless=True)
+        self.engine.flower.save = Mock(return_value=True)
+        self.engine.initialize()
+
+    def tearDown(self):
+        self.engine.quit()
+
+    def _run_client(self, connect, requests):
+        """クライアントを別スレッドで動かし、その間ゲームループを回す"""
+        responses = []
+
+        def client():
+            c = _Client(connect())
+            try:
+                for payload in requests:
+                    responses.append(c.request(**payload))
+            finally:
+                c.close()
+
+        thread = threading.Thread(target=client)
+        thread.start()
+        while thread.is_alive():
+            self.engine.run_headless(1)
+        thread.join()
+        return responses
+
+    def test_state_and_actions_over_tcp(self):
+        """
+        仕様: 状態を読み出し、アクションをイベントとして投稿できる
+        テスト: NAV_CONFIRM で種選択画面へ進む
+        """
+        server = self.engine.start_control_server()
+        host, port = server.address
+        responses = self._run_client(
+            lambda: socket.create_connection((host, port)),
+            [
+                {"op": "state"},
+                {"op": "action", "type": "NAV_CONFIRM"},
+                {"op": "state"},
+            ],
+        )
+        self.assertTrue(all(r["ok"] for r in responses))
+        self.assertIn("flower_stats", responses[0]["state"])
+        self.assertTrue(responses[2]["state"]["seed_selection_mode"])
+        self.assertEqual(self.engine.screen_state, ScreenState.SEED_SELECTION)
+
+    def test_rejects_unknown_requests(self):
+        """
+        テスト: 入力以外のイベントや壊れた要求はエラーを返し、何も投稿しない
+        """
+        server = self.engine.start_control_server()
+        responses = self._run_client(
+            lambda: socket.create_connection(server.address),
+            [
+                {"op": "action", "type": "FLOWER_WITHERED"},
+                {"op": "action", "type": "NAV_LEFT", "data": [1]},
+                {"op": "reboot"},
+            ],
+        )
+        self.assertEqual([r["ok"] for r in responses], [False, False, False])
+        self.assertEqual(server.pump(), 0)
+        self.assertEqual(self.engine.screen_state, ScreenState.TITLE)
+
+    def test_actions_are_recorded_and_replayed(self):
+        """
+        仕様: 制御APIのアクションもキー入力と同じ経路で処理され、セッションに記録される
+        テスト: 制御APIで陰の種を選んだ記録を再生すると同じ結果になる
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "session.rec")
+            recorder = SessionRecorder.open(self.engine, path)
+            server = self.engine.start_control_server()
+            responses = self._run_client(
+                lambda: socket.create_connection(server.address),
+                [
+                    {"op": "action", "type": "NAV_CONFIRM"},
+                    {"op": "action", "type": "SEED_SELECTED", "data": {"seed_type": "陰"}},
+                    {"op": "action", "type": "NAV_RIGHT", "data": {"count": 2}},
+                ],
+            )
+            self.assertTrue(all(r["ok"] for r in responses))
+            self.engine.run_headless(2)
+            recorder.close()
+            self.assertEqual(self.engine.flower.stats.seed_type, SeedType.YIN)
+            self.assertEqual(self.engine.screen_state, ScreenState.TIME_SETTING)
+
+            replayed = GameEngine(headless=True)
+            replayed.flower.save = Mock(return_value=True)
+            replayed.initialize()
+            result = SessionReplayer.load(path).run(replayed)
+            replayed.quit()
+        self.assertTrue(result.matched)
+        self.assertEqual(replayed.flower.stats.seed_type, SeedType.YIN)
+
+    def test_action_count_and_queue_are_bounded(self):
+        """
+        仕様: count は MAX_ACTION_COUNT までに切り詰め、渡す前のアクションは
+        MAX_PENDING_ACTIONS まで（巨大な count でゲームループが止まらない）
+        """
+        server = ControlServer(self.engine.input_handler.dispatch, dict)
+        server.start()
+        try:
+            with socket.create_connection(server.address) as sock:
+                client = _Client(sock)
+                big = {"op": "action", "type": "NAV_LEFT", "data": {"count": 10**9}}
+                self.assertTrue(client.request(**big)["ok"])
+                self.assertFalse(
+                    client.request(op="action", type="NAV_LEFT", data={"count": "9"})["ok"]
+                )
+                for _ in range(MAX_PENDING_ACTIONS - 1):
+                    self.assertTrue(client.request(op="action", type="NAV_CONFIRM")["ok"])
+                self.assertFalse(client.request(op="action", type="NAV_CONFIRM")["ok"])
+                client.close()
+            self.assertEqual(server._actions[0], (InputAction.NAV_LEFT, MAX_ACTION_COUNT))
+        finally:
+            server.stop()
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix ソケットのみ")
+    def test_unix_socket(self):
+        """
+        テスト: Unix ソケットでも同じ要求を受け付け、停止時にソケットを消す
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "control.sock")
+            self.engine.start_control_server(path=path)
+
+            def connect():
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                sock.connect(path)
+                return sock
+
+            responses = self._run_client(connect, [{"op": "state"}])
+            self.assertTrue(responses[0]["ok"])
+            self.engine.control.stop()
+            self.assertFalse(os.path.exists(path))
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix ソケットのみ")
+    def test_unix_socket_path_keeps_regular_files(self):
+        """
+        仕様: 前回のソケットの残りだけを消し、ソケット以外のファイル（セーブなど）は消さない
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "state.sav")
+            with open(path, "wb") as f:
+                f.write(b"save")
+            with self.assertRaises(FileExistsError):
+                ControlServer(Mock(), dict, path=path).start()
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), b"save")
+
+            stale = os.path.join(tmp, "control.sock")
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.bind(stale)
+            sock.close()
+            server = ControlServer(Mock(), dict, path=stale)
+            server.start()
+            server.stop()
+            self.assertFalse(os.path.exists(stale))
+
+
+if __name__ == "__main__":
+    unittest.main()
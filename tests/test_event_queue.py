@@ -0,0 +1,202 @@
+"""
+イベントキュー（EventBus のキューモード）のテスト
+
+仕様書参照:
+- src/game/core/event_system.py: post / drain / 合流ルール / 優先度
+"""
+
+import unittest
+from unittest.mock import Mock
+
+from src.game.core.event_system import (
+    Event,
+    EventBus,
+    EventType,
+    GrowthChanged,
+    Signal,
+    coalesce_count,
+    coalesce_latest,
+    make_event,
+)
+from src.game.core.game_engine import GameEngine
+from src.game.core.input_handler import parse_input_script
+from src.game.core.screen_state import ScreenState
+from src.game.data.config import config
+from src.game.entities.flower import SeedType
+
+
+class TestEventQueue(unittest.TestCase):
+    """EventBus のキューモードのテストクラス"""
+
+    def _record(self, bus: EventBus):
+        received = []
+        bus.subscribe_all(lambda event: received.append((event.type, dict(event.data))))
+        return received
+
+    def test_post_waits_for_drain(self):
+        """
+        仕様: キューモードでは post したイベントは drain まで配信しない
+        """
+        bus = EventBus(queued=True)
+        received = self._record(bus)
+        bus.post_simple(EventType.NAV_LEFT)
+        bus.post_simple(EventType.NAV_CONFIRM)
+        self.assertEqual(received, [])
+        self.assertEqual(bus.pending_count, 2)
+        self.assertEqual(bus.drain(), 2)
+        self.assertEqual([t for t, _ in received], [EventType.NAV_LEFT, EventType.NAV_CONFIRM])
+        self.assertEqual(bus.pending_count, 0)
+
+    def test_post_without_queue_emits(self):
+        """
+        テスト: キューモードでなければ post はその場で配信する
+        """
+        bus = EventBus()
+        received = self._record(bus)
+        bus.post_simple(EventType.NAV_LEFT)
+        self.assertEqual(len(received), 1)
+        self.assertEqual(bus.drain(), 0)
+
+    def test_coalescing_only_adjacent(self):
+        """
+        仕様: 合流は直前に積まれた同種イベントとだけ行う
+        テスト: 別の種類をまたいだ NAV_RIGHT は合流しない
+        """
+        bus = EventBus(queued=True)
+        bus.set_coalescing(EventType.NAV_RIGHT, coalesce_count)
+        bus.set_coalescing(EventType.INVALID_ACTION, coalesce_latest)
+        received = self._record(bus)
+        for _ in range(5):
+            bus.post_simple(EventType.NAV_RIGHT)
+        bus.post_simple(EventType.NAV_CONFIRM)
+        bus.post_simple(EventType.NAV_RIGHT)
+        bus.post_simple(EventType.INVALID_ACTION, message="a")
+        bus.post_simple(EventType.INVALID_ACTION, message="b")
+        bus.drain()
+        self.assertEqual(
+            received,
+            [
+                (EventType.NAV_RIGHT, {"count": 5}),
+                (EventType.NAV_CONFIRM, {}),
+                (EventType.NAV_RIGHT, {"count": 1}),
+                (EventType.INVALID_ACTION, {"message": "b"}),
+            ],
+        )
+
+    def test_priority_order(self):
+        """
+        仕様: 優先度の高い種類から配信し、同じ優先度は積んだ順
+        """
+        bus = EventBus(queued=True)
+        bus.set_priority(EventType.NAV_CANCEL, 10)
+        received = self._record(bus)
+        bus.post_simple(EventType.NAV_LEFT)
+        bus.post_simple(EventType.NAV_RIGHT)
+        bus.post_simple(EventType.NAV_CANCEL)
+        bus.drain()
+        self.assertEqual(
+            [t for t, _ in received],
+            [EventType.NAV_CANCEL, EventType.NAV_LEFT, EventType.NAV_RIGHT],
+        )
+
+    def test_events_posted_during_drain_wait(self):
+        """
+        仕様: 配信中に post されたイベントは次の drain で配信する
+        """
+        bus = EventBus(queued=True)
+        received = self._record(bus)
+        bus.subscribe(EventType.NAV_CONFIRM, lambda event: bus.post_simple(EventType.NAV_LEFT))
+        bus.post_simple(EventType.NAV_CONFIRM)
+        self.assertEqual(bus.drain(), 1)
+        self.assertEqual(bus.pending_count, 1)
+        bus.drain()
+        self.assertEqual([t for t, _ in received], [EventType.NAV_CONFIRM, EventType.NAV_LEFT])
+
+    def test_unsubscribe_updates_dispatch(self):
+        """
+        テスト: 解除したリスナーには配信しない（事前に組んだタプルも更新される）
+        """
+        bus = EventBus()
+        callback = Mock()
+        bus.subscribe(EventType.NAV_LEFT, callback)
+        bus.emit(Event(EventType.NAV_LEFT))
+        bus.unsubscribe(EventType.NAV_LEFT, callback)
+        bus.emit(Event(EventType.NAV_LEFT))
+        self.assertEqual(callback.call_count, 1)
+
+
+class TestTypedEvents(unittest.TestCase):
+    """型付きイベントとプールのテストクラス"""
+
+    def test_data_shim(self):
+        """
+        仕様: 型付きイベントも data で辞書として読める（None のフィールドは含まない）
+        """
+        event = make_event(EventType.FLOWER_GROWTH_CHANGED, old_stage="種", new_stage="芽")
+        self.assertIsInstance(event, GrowthChanged)
+        self.assertEqual(event.data.get("new_stage"), "芽")
+        self.assertEqual(make_event(EventType.SEED_SELECTED).data.get("seed_type", "陽"), "陽")
+        self.assertEqual(event, Event(EventType.FLOWER_GROWTH_CHANGED, dict(event.data)))
+
+    def test_signal_is_shared(self):
+        """
+        仕様: ペイロードのないイベントは種類ごとに1つのインスタンスを使い回す
+        """
+        signal = make_event(EventType.NAV_CONFIRM)
+        self.assertIs(signal, Signal.of(EventType.NAV_CONFIRM))
+        signal.data["x"] = 1
+        self.assertEqual(signal.data, {})
+        # ペイロードのない種類に渡されたデータは警告を出して捨てる（以前の Event と同じく読まれない）
+        with self.assertLogs("src.game.core.event_system", "WARNING"):
+            self.assertIs(make_event(EventType.NAV_CONFIRM, x=1), signal)
+        with self.assertRaises(TypeError):
+            make_event(EventType.FLOWER_GROWTH_CHANGED, unknown=1)
+
+
+class TestQueuedInput(unittest.TestCase):
+    """GameEngine のキューモード入力のテストクラス"""
+
+    def setUp(self):
+        self._saved = config.game.queued_input_events
+
+    def tearDown(self):
+        config.game.queued_input_events = self._saved
+
+    def _run(self, queued: bool, nav_right: Mock) -> GameEngine:
+        config.game.queued_input_events = queued
+        engine = GameEngine(headless=True)
+        engine.flower.save = Mock(return_value=True)
+        engine.event_manager.subscribe(EventType.NAV_RIGHT, nav_right)
+        engine.initialize()
+        script = parse_input_script(
+            """
+            0 NAV_CONFIRM
+            1 NAV_CONFIRM
+            2 NAV_RIGHT
+            2 NAV_RIGHT
+            2 NAV_RIGHT
+            2 NAV_LEFT
+            3 NAV_CONFIRM
+            """
+        )
+        engine.run_headless(20, script)
+        return engine
+
+    def test_same_result_as_immediate(self):
+        """
+        仕様: キューモードでも同じ入力列なら同じ結果になる
+        テスト: 連打した NAV_RIGHT は1回の配信（count=3）にまとまる
+        """
+        immediate_nav, queued_nav = Mock(), Mock()
+        immediate = self._run(False, immediate_nav)
+        queued = self._run(True, queued_nav)
+        self.assertEqual(immediate_nav.call_count, 3)
+        self.assertEqual(queued_nav.call_count, 1)
+        self.assertEqual(queued_nav.call_args[0][0].data["count"], 3)
+        for engine in (immediate, queued):
+            self.assertEqual(engine.screen_state, ScreenState.MAIN)
+            self.assertEqual(engine.flower.stats.seed_type, SeedType.YIN)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+"""
+固定タイムステップのゲームループのテスト
+
+仕様書参照:
+- config.py - GameConfig.sim_tick / max_substeps_per_frame / max_frame_dt
+- 時間設定画面: 時間スケールの循環
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+
+from src.game.core.game_engine import GameEngine, TIME_SCALES
+from src.game.core.screen_state import ScreenState
+from src.game.data.config import config
+from src.game.entities.flower import FlowerStats, GrowthStage, SeedType
+from src.game.utils.random_manager import get_rng
+
+
+class TestFixedTimestep(unittest.TestCase):
+    """GameEngine.step_frame のテストクラス"""
+
+    def setUp(self):
+        """テスト前の準備"""
+        self._saved_chances = (
+            config.game.weed_growth_chance,
+            config.game.pest_growth_chance,
+        )
+        config.game.weed_growth_chance = 0.0
+        config.game.pest_growth_chance = 0.0
+        self.engine = self._make_engine()
+
+    def tearDown(self):
+        (
+            config.game.weed_growth_chance,
+            config.game.pest_growth_chance,
+        ) = self._saved_chances
+
+    def _make_engine(self) -> GameEngine:
+        with patch('pygame.init'), \
+             patch('pygame.font.init'), \
+             patch('src.game.ui.display.DisplayManager.initialize'), \
+             patch('src.game.ui.renderer.RenderManager'):
+            engine = GameEngine()
+            engine.running = True
+            engine.render_manager = Mock()
+        get_rng().set_seed(3)
+        engine.flower.save = Mock(return_value=True)
+        engine.flower.stats = FlowerStats(seed_type=SeedType.YANG, water_level=100.0)
+        engine.screen_state = ScreenState.MAIN
+        engine.seed_selection_mode = False
+        return engine
+
+    def test_ticks_are_independent_of_frame_rate(self):
+        """
+        仕様: シミュレーションは固定ティックで進む
+        テスト: フレーム分割が違っても同じティック数・同じ状態になる
+        """
+        for _ in range(30):
+            self.engine.step_frame(1.0 / 30)
+        age_30fps = self.engine.flower.stats.age_seconds
+
+        self.engine = self._make_engine()
+        for _ in range(60):
+            self.engine.step_frame(1.0 / 60)
+        self.assertAlmostEqual(self.engine.flower.stats.age_seconds, age_30fps, places=9)
+        self.assertAlmostEqual(age_30fps, 10 * config.game.sim_tick, places=9)
+
+    def test_leftover_time_carries_over(self):
+        """
+        テスト: ティックに満たない時間は次のフレームに持ち越される
+        """
+        tick = config.game.sim_tick
+        self.assertEqual(self.engine.step_frame(tick * 1.5), 1)
+        self.assertAlmostEqual(self.engine._sim_accumulator, tick * 0.5, places=6)
+        self.assertEqual(self.engine.step_frame(tick * 0.5), 1)
+        self.assertAlmostEqual(self.engine.flower.stats.age_seconds, tick * 2, places=6)
+
+    def test_high_scale_is_bounded(self):
+        """
+        仕様: フレームあたりのティック数には上限がある（spiral of death 対策）
+        テスト: x1000 でもティック数は上限以下、経過時間は全て反映される
+        """
+        self.engine.time_scale = 1000.0
+        with patch.object(
+            self.engine, "_update_simulation", wraps=self.engine._update_simulation
+        ) as tick_spy:
+            self.engine.step_frame(1.0 / 30)
+        self.assertLessEqual(tick_spy.call_count, config.game.max_substeps_per_frame)
+        expected = 1000.0 / 30
+        self.assertAlmostEqual(
+            self.engine.flower.stats.age_seconds
+            + self.engine._sim_accumulator,
+            expected,
+            places=6,
+        )
+
+    def test_fast_forward_stops_at_bloom(self):
+        """
+        仕様: 一括進行でも開花で画面が変わったら以降は進めない
+        テスト: 開花直前の蕾は x1 でも x1000 でも花言葉画面で終わる
+        """
+        end_screens = []
+        for scale in (1.0, 1000.0):
+            self.engine = self._make_engine()
+            self.engine.flower.stats = FlowerStats(
+                seed_type=SeedType.YANG,
+                growth_stage=GrowthStage.BUD,
+                age_seconds=config.game.growth_age_threshold_flower - 5.0,
+                water_level=20.0,
+                is_light_on=True,
+            )
+            self.engine.time_scale = scale
+            for _ in range(int(40 / scale) + 4):
+                self.engine.step_frame(0.25)
+            end_screens.append(self.engine.screen_state)
+            self.assertGreater(self.engine.flower.stats.water_level, 5.0)
+        self.assertEqual(
+            end_screens, [ScreenState.FLOWER_LANGUAGE, ScreenState.FLOWER_LANGUAGE]
+        )
+
+    def test_long_frame_is_clamped(self):
+        """
+        テスト: 実時間の長い中断は max_frame_dt に切り詰められる
+        """
+        self.engine.step_frame(10.0)
+        self.assertLessEqual(
+            self.engine.flower.stats.age_seconds, config.game.max_frame_dt
+        )
+
+    def test_paused_does_not_advance(self):
+        """
+        テスト: 一時停止中はシミュレーション時間が進まない
+        """
+        self.engine.paused = True
+        self.assertEqual(self.engine.step_frame(0.1), 0)
+        self.assertEqual(self.engine.flower.stats.age_seconds, 0.0)
+
+    def test_messages_use_real_time(self):
+        """
+        テスト: 情報メッセージの寿命は時間スケールに依存しない
+        """
+        self.engine.time_scale = 1000.0
+        self.engine._emit_info("テスト", duration=1.0)
+        self.engine.step_frame(0.1)
+        self.assertEqual(self.engine._info_message, "テスト")
+
+    def test_cycle_time_scale(self):
+        """
+        仕様: 時間スケールは x1→x4→x16→x64→x1000→x0.25→x1 の順に循環
+        """
+        seen = []
+        for _ in range(len(TIME_SCALES)):
+            self.engine._cycle_time_scale()
+            seen.append(self.engine.time_scale)
+        self.assertEqual(seen, [4.0, 16.0, 64.0, 1000.0, 0.25, 1.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
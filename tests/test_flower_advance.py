@@ -0,0 +1,150 @@
+"""
+FlowerStats.advance（イベント駆動の時間早送り）のテスト
+
+仕様書参照:
+- docs/specifications/05_成長分岐表.md: 成長条件（光の蓄積量・年齢）
+- docs/specifications/02_状態パラメータ.md: 水分の自然減少と枯死
+"""
+
+import unittest
+from unittest.mock import patch
+
+from src.game.data.config import config
+from src.game.entities.flower import (
+    EVENT_GROWTH,
+    EVENT_LIGHT_FULL,
+    EVENT_WEED,
+    EVENT_WITHERED,
+    FlowerStats,
+    GrowthStage,
+    WITHER_WATER_LEVEL,
+)
+from src.game.utils.random_manager import get_rng
+
+
+class TestFlowerAdvance(unittest.TestCase):
+    """advance() のテストクラス"""
+
+    def setUp(self):
+        self._saved_chances = (
+            config.game.weed_growth_chance,
+            config.game.pest_growth_chance,
+        )
+        get_rng().set_seed(11)
+
+    def tearDown(self):
+        (
+            config.game.weed_growth_chance,
+            config.game.pest_growth_chance,
+        ) = self._saved_chances
+
+    def test_matches_small_step_update(self):
+        """
+        仕様: advance(T) は update(dt) を細かく繰り返した結果と一致する
+        テスト: 成長を2段階またぐ区間で比較（差は1ティック分以内）
+        """
+        config.game.weed_growth_chance = 0.0
+        config.game.pest_growth_chance = 0.0
+        stepped = FlowerStats(water_level=100.0, is_light_on=True)
+        jumped = FlowerStats(water_level=100.0, is_light_on=True)
+
+        dt = 0.001
+        for _ in range(int(round(30.0 / dt))):
+            stepped.update(dt)
+        events = jumped.advance(30.0)
+
+        self.assertEqual(jumped.growth_stage, stepped.growth_stage)
+        self.assertEqual(jumped.growth_stage, GrowthStage.SPROUT)
+        self.assertAlmostEqual(jumped.age_seconds, stepped.age_seconds, places=6)
+        self.assertAlmostEqual(jumped.water_level, stepped.water_level, places=6)
+        self.assertEqual(jumped.light_tendency_yin, stepped.light_tendency_yin)
+        self.assertEqual([e.kind for e in events], [EVENT_GROWTH])
+        self.assertAlmostEqual(events[0].at, 20.0, places=9)
+
+    def test_growth_turns_light_off(self):
+        """
+        仕様: 成長フェーズ変更時に光はOFFになり、以降は光が蓄積しない
+        テスト: 長時間進めても芽のまま止まる
+        """
+        config.game.weed_growth_chance = 0.0
+        config.game.pest_growth_chance = 0.0
+        stats = FlowerStats(water_level=100.0, is_light_on=True)
+        stats.advance(10_000.0)
+        self.assertEqual(stats.growth_stage, GrowthStage.SPROUT)
+        self.assertFalse(stats.is_light_on)
+        self.assertEqual(stats.light_level, 0)
+
+    def test_bud_blooms_by_age(self):
+        """
+        仕様: 05_成長分岐表.md - フェーズ4: 年齢到達で花になる
+        テスト: 光OFFの蕾が年齢しきい値で花になる
+        """
+        config.game.weed_growth_chance = 0.0
+        config.game.pest_growth_chance = 0.0
+        stats = FlowerStats(growth_stage=GrowthStage.BUD, water_level=100.0)
+        events = stats.advance(120.0)
+        self.assertEqual(stats.growth_stage, GrowthStage.FLOWER)
+        growth = [e for e in events if e.kind == EVENT_GROWTH]
+        self.assertAlmostEqual(growth[0].at, config.game.growth_age_threshold_flower)
+
+    def test_wither_event_and_stop(self):
+        """
+        仕様: 水分が枯死ライン以下で枯れる
+        テスト: 枯死時刻を正確に報告し、stop_on_wither で停止する
+        """
+        config.game.weed_growth_chance = 0.0
+        config.game.pest_growth_chance = 0.0
+        stats = FlowerStats(water_level=25.0)
+        events = stats.advance(86_400.0, stop_on_wither=True)
+        expected_at = (25.0 - WITHER_WATER_LEVEL) / config.game.water_decay_rate
+        self.assertEqual(events[-1].kind, EVENT_WITHERED)
+        self.assertAlmostEqual(events[-1].at, expected_at)
+        self.assertAlmostEqual(stats.age_seconds, expected_at)
+        self.assertEqual(stats.water_level, WITHER_WATER_LEVEL)
+
+    def test_light_full_event(self):
+        """
+        テスト: 花段階で光ONのままなら上限100で止まりイベントが出る
+        """
+        config.game.weed_growth_chance = 0.0
+        config.game.pest_growth_chance = 0.0
+        stats = FlowerStats(growth_stage=GrowthStage.FLOWER, is_light_on=True)
+        events = stats.advance(500.0)
+        self.assertEqual(stats.light_level, 100)
+        self.assertIn(EVENT_LIGHT_FULL, [e.kind for e in events])
+
+    def test_spawns_reach_max_over_long_gap(self):
+        """
+        仕様: config.py - 雑草/害虫は上限まで発生
+        テスト: 長時間の早送りでも上限で止まる
+        """
+        stats = FlowerStats(water_level=100.0)
+        events = stats.advance(30 * 86_400.0)
+        self.assertEqual(stats.weed_count, config.game.max_weeds)
+        self.assertEqual(stats.pest_count, config.game.max_pests)
+        self.assertEqual(
+            sum(1 for e in events if e.kind == EVENT_WEED), config.game.max_weeds
+        )
+
+    def test_one_day_is_cheap(self):
+        """
+        仕様: advance はティックを積まず、イベント（成長・光・雑草/害虫・枯死）ごとに1回だけ進む
+        テスト: 1日分でも update は呼ばれず、ループはイベント数+1回（所要時間は
+        benchmarks/bench_advance.py）
+        """
+        stats = FlowerStats(water_level=100.0, is_light_on=True)
+        with patch.object(
+            FlowerStats, "_time_to_growth", autospec=True,
+            side_effect=FlowerStats._time_to_growth,
+        ) as steps, patch.object(FlowerStats, "update", autospec=True) as update:
+            events = stats.advance(86_400.0)
+        update.assert_not_called()
+        self.assertEqual(steps.call_count, len(events) + 1)
+        self.assertLessEqual(
+            len(events), len(GrowthStage) + 2 + config.game.max_weeds + config.game.max_pests
+        )
+        self.assertAlmostEqual(stats.age_seconds, 86_400.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
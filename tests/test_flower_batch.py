@@ -0,0 +1,161 @@
+"""
+FlowerBatch（ベクトル化バッチシミュレータ）のテスト
+
+仕様書参照:
+- docs/specifications/05_成長分岐表.md: 成長分岐表（集約）
+- FlowerStats.update / FlowerStats._check_growth とのパリティ
+"""
+
+import unittest
+
+import numpy as np
+
+from src.game.data.config import config
+from src.game.entities.flower import FlowerStats, GrowthStage, SeedType
+from src.game.entities.flower_batch import FlowerBatch
+from src.game.utils.random_manager import get_rng
+
+
+def _make_initial_stats():
+    """境界値を含む多様な初期状態を用意"""
+    stats_list = []
+    for i in range(60):
+        stats = FlowerStats(
+            seed_type=SeedType.YIN if i % 2 else SeedType.YANG,
+            water_level=float(5 + (i * 7) % 96),
+            mental_level=float((i * 13) % 101),
+            is_light_on=i % 3 != 0,
+        )
+        stage = GrowthStage.SEED
+        if i % 5 == 1:
+            stage = GrowthStage.SPROUT
+        elif i % 5 == 2:
+            stage = GrowthStage.STEM
+            stats.phase2_branch = ("しなる", "つる", "ふつう")[i % 3]
+            stats.light_tendency_yin = bool(i % 4)
+        elif i % 5 == 3:
+            stage = GrowthStage.BUD
+        stats.growth_stage = stage
+        # フェーズ1の49/50境界をまたぐ光レベル
+        stats.light_level = float(45 + i % 10) if stage == GrowthStage.SEED else float(i % 30)
+        stats_list.append(stats)
+    return stats_list
+
+
+class TestFlowerBatch(unittest.TestCase):
+    """FlowerBatch のテストクラス"""
+
+    def setUp(self):
+        # 雑草/害虫の乱数はスカラー版と系列が異なるためパリティ検証では無効化
+        self._saved_chances = (
+            config.game.weed_growth_chance,
+            config.game.pest_growth_chance,
+        )
+        config.game.weed_growth_chance = 0.0
+        config.game.pest_growth_chance = 0.0
+        get_rng().set_seed(7)
+
+    def tearDown(self):
+        (
+            config.game.weed_growth_chance,
+            config.game.pest_growth_chance,
+        ) = self._saved_chances
+
+    def test_parity_with_scalar_update(self):
+        """
+        仕様: FlowerBatch.update は FlowerStats.update と同じ結果になる
+        テスト: 多様な初期状態から同じ dt で進めて全フィールドを比較
+        """
+        scalar = _make_initial_stats()
+        batch = FlowerBatch.from_stats(_make_initial_stats(), rng=np.random.default_rng(1))
+
+        for _ in range(900):
+            for stats in scalar:
+                stats.update(0.1)
+            batch.update(0.1)
+
+        for i, expected in enumerate(scalar):
+            actual = batch.to_stats(i)
+            with self.subTest(index=i):
+                self.assertEqual(actual.growth_stage, expected.growth_stage)
+                self.assertAlmostEqual(actual.age_seconds, expected.age_seconds, places=9)
+                self.assertAlmostEqual(actual.water_level, expected.water_level, places=9)
+                self.assertAlmostEqual(actual.light_level, expected.light_level, places=9)
+                self.assertEqual(actual.is_light_on, expected.is_light_on)
+                self.assertEqual(actual.light_tendency_yin, expected.light_tendency_yin)
+                self.assertEqual(actual.phase2_branch, expected.phase2_branch)
+                if expected.phase3_shape == FlowerStats().phase3_shape:
+                    self.assertEqual(actual.phase3_shape, expected.phase3_shape)
+                else:
+                    # フェーズ3は乱択のため、候補集合に含まれることを確認
+                    self.assertIn(
+                        actual.phase3_shape, self._phase3_candidates(expected)
+                    )
+
+    def _phase3_candidates(self, stats: FlowerStats):
+        from src.game.entities.flower import _load_growth_tables
+
+        phase3 = _load_growth_tables()["phase3_shape"]
+        base = (
+            phase3["seed_base_values"].get(stats.seed_type.value, 5)
+            + phase3["phase2_branch_values"].get(stats.phase2_branch, 0)
+            + phase3["light_tendency_values"].get(
+                "陰" if stats.light_tendency_yin else "陽", 0
+            )
+        )
+        return [
+            c["name"] for c in phase3["shape_candidates"] if base >= c["min_base"]
+        ] or [phase3["default"]]
+
+    def test_phase1_threshold_boundary(self):
+        """
+        仕様: 05_成長分岐表.md - フェーズ1: 光<50で陰、>=50で陽
+        テスト: バッチでも49/50境界で傾向が切り替わる
+        """
+        batch = FlowerBatch(2)
+        batch.light_level[:] = [49.0, 50.0]
+        batch._check_growth()
+        self.assertTrue(batch.light_tendency_yin[0])
+        self.assertFalse(batch.light_tendency_yin[1])
+        self.assertTrue((batch.light_level == 0).all())
+
+    def test_spawn_respects_max_counts(self):
+        """
+        仕様: config.py - 雑草/害虫は上限まで
+        テスト: 発生確率1でも上限を超えない
+        """
+        config.game.weed_growth_chance = 10.0
+        config.game.pest_growth_chance = 10.0
+        batch = FlowerBatch(100, rng=np.random.default_rng(3))
+        for _ in range(20):
+            batch.update(1.0)
+        self.assertTrue((batch.weed_count == config.game.max_weeds).all())
+        self.assertTrue((batch.pest_count == config.game.max_pests).all())
+
+    def test_spawn_draws_only_below_cap(self):
+        """
+        仕様: FlowerStats.update と同じく、上限に達した花は乱数を引かない
+        テスト: 上限の花を除いた本数だけ乱数を消費する
+        """
+        config.game.weed_growth_chance = 0.5
+        batch = FlowerBatch(10, rng=np.random.default_rng(5))
+        batch.weed_count[:7] = config.game.max_weeds
+        batch.update(1.0)
+        reference = np.random.default_rng(5)
+        reference.random(3)
+        self.assertEqual(batch.rng.random(), reference.random())
+        self.assertTrue((batch.weed_count[:7] == config.game.max_weeds).all())
+
+    def test_stage_counts(self):
+        """
+        テスト: 段階ごとの本数集計
+        """
+        batch = FlowerBatch(10)
+        batch.growth_stage[:3] = 4
+        counts = batch.stage_counts()
+        self.assertEqual(counts[GrowthStage.FLOWER], 3)
+        self.assertEqual(counts[GrowthStage.SEED], 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+FlowerStats のシリアライズ（to_dict/from_dict, tobytes/frombytes）のテスト
+
+仕様書参照:
+- src/game/data/save_manager.py: セーブデータ形式
+"""
+
+import dataclasses
+import unittest
+
+from src.game.entities.flower import FlowerStats, GrowthStage, SeedType
+
+
+def _sample_stats() -> FlowerStats:
+    return FlowerStats(
+        seed_type=SeedType.YIN,
+        growth_stage=GrowthStage.BUD,
+        age_seconds=1234.5,
+        water_level=42.25,
+        light_level=17.0,
+        is_light_on=True,
+        weed_count=3,
+        pest_count=1,
+        environment_level=5.5,
+        mental_level=70.0,
+        light_tendency_yin=True,
+        phase2_branch="しなる",
+        phase3_shape="まるまる",
+        light_required_for_bud=65.0,
+    )
+
+
+class TestFlowerStatsSerialization(unittest.TestCase):
+    """シリアライズのテストクラス"""
+
+    def test_slots(self):
+        """
+        仕様: インスタンスごとの __dict__ を持たない
+        """
+        self.assertFalse(hasattr(FlowerStats(), "__dict__"))
+
+    def test_to_dict_matches_asdict(self):
+        """
+        仕様: セーブデータ形式は従来（asdict + Enum文字列化）と同じ
+        """
+        stats = _sample_stats()
+        expected = dataclasses.asdict(stats)
+        expected["seed_type"] = stats.seed_type.value
+        expected["growth_stage"] = stats.growth_stage.value
+        # 乱数ストリームは設定されている場合だけ書き出す
+        self.assertIsNone(expected.pop("rng_streams"))
+        self.assertEqual(stats.to_dict(), expected)
+
+    def test_dict_round_trip(self):
+        """
+        テスト: to_dict → from_dict で元に戻り、入力の辞書は変更されない
+        """
+        stats = _sample_stats()
+        data = stats.to_dict()
+        snapshot = dict(data)
+        self.assertEqual(FlowerStats.from_dict(data), stats)
+        self.assertEqual(data, snapshot)
+
+    def test_from_dict_legacy_formats(self):
+        """
+        テスト: 旧形式（hunger）と旧種名を読み込める
+        """
+        legacy = FlowerStats.from_dict({"hunger": 10, "age_seconds": 30.0})
+        self.assertEqual(legacy, FlowerStats(age_seconds=30.0, water_level=50.0))
+        old_seed = FlowerStats.from_dict({"seed_type": "月", "growth_stage": "芽"})
+        self.assertEqual(old_seed.seed_type, SeedType.YIN)
+        self.assertEqual(old_seed.growth_stage, GrowthStage.SPROUT)
+
+    def test_bytes_round_trip(self):
+        """
+        テスト: tobytes → frombytes で元に戻り、長さは固定
+        """
+        stats = _sample_stats()
+        raw = stats.tobytes()
+        self.assertEqual(len(raw), len(FlowerStats().tobytes()))
+        self.assertEqual(FlowerStats.frombytes(raw), stats)
+
+    def test_bytes_rejects_bad_input(self):
+        """
+        テスト: 長すぎる名前や壊れたデータはエラー
+        """
+        with self.assertRaises(ValueError):
+            FlowerStats(phase3_shape="とてもながいかたちのなまえ").tobytes()
+        with self.assertRaises(ValueError):
+            FlowerStats.frombytes(b"\x01\x02")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+FlowerStats の表示用プロパティ（キャラクター名・年齢表示）のテスト
+
+仕様書参照:
+- docs/specifications/05_成長分岐表.md: 最終進化名
+- src/game/utils/helpers.py: 年齢表示フォーマット
+"""
+
+import unittest
+
+from src.game.entities.flower import (
+    FLOWER_NAME_TABLE,
+    FlowerStats,
+    GrowthStage,
+    SeedType,
+)
+from src.game.utils.helpers import format_time_compact, format_time_digital
+
+
+class TestFlowerViews(unittest.TestCase):
+    """表示用プロパティのテストクラス"""
+
+    def test_flower_name_table(self):
+        """
+        仕様: 05_成長分岐表.md - 種×茎×形で最終進化名が決まる
+        テスト: 2種×3分岐×6形の36通りが引ける
+        """
+        self.assertEqual(len(FLOWER_NAME_TABLE), 36)
+        stats = FlowerStats(
+            seed_type=SeedType.YIN,
+            growth_stage=GrowthStage.FLOWER,
+            phase2_branch="しなる",
+            phase3_shape="大輪",
+        )
+        self.assertEqual(stats.character_name, "あじさい")
+        stats.seed_type = SeedType.YANG
+        self.assertEqual(stats.character_name, "ひまわり")
+
+    def test_character_name_fallbacks(self):
+        """
+        テスト: 花段階以外は基本名、未知の組み合わせは「っち」を外した名前
+        """
+        stats = FlowerStats(seed_type=SeedType.YIN)
+        self.assertEqual(stats.character_name, "陰っち")
+        stats.growth_stage = GrowthStage.FLOWER
+        stats.phase3_shape = "未知"
+        self.assertEqual(stats.character_name, "陰")
+
+    def test_age_text_matches_helpers(self):
+        """
+        テスト: メモ化した年齢表示がヘルパー関数と同じ文字列になる
+        """
+        for seconds in (0.0, 59.9, 60.0, 3599.0, 3600.0, 86_399.0, 90_061.5):
+            stats = FlowerStats(age_seconds=seconds)
+            with self.subTest(seconds=seconds):
+                self.assertEqual(stats.age_formatted, format_time_compact(seconds))
+                self.assertEqual(stats.age_digital, format_time_digital(seconds))
+
+    def test_derived_text_is_memoized(self):
+        """
+        仕様: 元の値が変わらない限り文字列を作り直さない
+        テスト: 同じ分内なら同一オブジェクト、分が変われば更新される
+        """
+        stats = FlowerStats(age_seconds=600.0)
+        clock = stats.age_digital
+        label = stats.character_label
+        stats.age_seconds = 630.0
+        self.assertIs(stats.age_digital, clock)
+        self.assertIs(stats.character_label, label)
+        stats.age_seconds = 660.0
+        self.assertEqual(stats.age_digital, format_time_digital(660.0))
+        stats.growth_stage = GrowthStage.SPROUT
+        self.assertEqual(stats.character_label, "芽（陽）")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+ステータス画面の「もしも」予測のテスト
+
+仕様書参照:
+- docs/specifications/05_成長分岐表.md: フェーズ2/フェーズ3の分岐
+- src/game/simulation/forecast.py
+"""
+
+import time
+import unittest
+
+from src.game.data.config import config
+from src.game.entities.flower import FlowerStats, GrowthStage
+from src.game.simulation.forecast import (
+    Forecaster,
+    Snapshot,
+    compute_forecasts,
+    forecast_key,
+)
+from src.game.utils.random_manager import get_rng
+
+
+class TestForecast(unittest.TestCase):
+    """予測のテストクラス"""
+
+    def setUp(self):
+        get_rng().set_seed(7)
+
+    def test_snapshot_is_independent(self):
+        """
+        仕様: スナップショットは元の状態・乱数と独立
+        テスト: 予測しても元の FlowerStats と本体の乱数列は変わらない
+        """
+        stats = FlowerStats(is_light_on=True, water_level=80.0)
+        original = stats.copy()
+        state = get_rng().get_state()
+        compute_forecasts(Snapshot.take(stats))
+        self.assertEqual(stats, original)
+        self.assertEqual(get_rng().get_state(), state)
+
+    def test_light_on_forecast(self):
+        """
+        仕様: 光ONで種→芽（光20蓄積）、放置なら水切れで枯れる
+        テスト: 次の段階と所要時間、枯れるまでの時間を予測
+        """
+        forecasts = {f.label: f for f in compute_forecasts(Snapshot.take(FlowerStats()))}
+        light_on = forecasts["光ON"]
+        self.assertEqual(light_on.next_stage, GrowthStage.SPROUT)
+        self.assertAlmostEqual(light_on.eta, 20.0 / config.game.light_amount)
+        keep = forecasts["そのまま"]
+        self.assertIsNone(keep.next_stage)
+        self.assertAlmostEqual(keep.withers_in, (50.0 - 5.0) / config.game.water_decay_rate)
+        # お世話を続けた場合の分岐の見込み
+        self.assertIsNotNone(light_on.phase2_branch)
+        self.assertAlmostEqual(sum(p for _, p in light_on.outcomes), 1.0)
+
+    def test_fixed_branches_are_reported(self):
+        """
+        テスト: 蕾以降は確定済みの分岐をそのまま返す
+        """
+        stats = FlowerStats(
+            growth_stage=GrowthStage.BUD, phase2_branch="しなる", phase3_shape="大輪"
+        )
+        for forecast in compute_forecasts(Snapshot.take(stats)):
+            self.assertEqual(forecast.phase2_branch, "しなる")
+            self.assertEqual(forecast.outcomes, (("ひまわり", 1.0),))
+
+    def test_key_ignores_time_passing(self):
+        """
+        仕様: 時間経過だけでは予測は古くならず、お世話で古くなる
+        """
+        saved = (config.game.weed_growth_chance, config.game.pest_growth_chance)
+        config.game.weed_growth_chance = config.game.pest_growth_chance = 0.0
+        try:
+            stats = FlowerStats(is_light_on=True, water_level=80.0)
+            key = forecast_key(stats)
+            for _ in range(50):
+                stats.update(0.1)
+            self.assertEqual(forecast_key(stats), key)
+            stats.water()
+            self.assertNotEqual(forecast_key(stats), key)
+        finally:
+            config.game.weed_growth_chance, config.game.pest_growth_chance = saved
+
+    def test_cancelled_forecast_returns_none(self):
+        """
+        テスト: 打ち切り指示があれば結果を返さない
+        """
+        self.assertIsNone(
+            compute_forecasts(Snapshot.take(FlowerStats()), cancelled=lambda: True)
+        )
+
+    def test_forecaster_runs_in_background(self):
+        """
+        仕様: submit はすぐ戻り、結果は後から latest で取得する
+        テスト: 状態が変わると古い予測は返さない
+        """
+        forecaster = Forecaster()
+        stats = FlowerStats(is_light_on=True)
+        try:
+            forecaster.submit(stats)
+            deadline = time.monotonic() + 5.0
+            while forecaster.latest(stats) is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertIsNotNone(forecaster.latest(stats))
+            stats.turn_light_off()
+            self.assertIsNone(forecaster.latest(stats))
+        finally:
+            forecaster.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
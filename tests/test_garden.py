@@ -0,0 +1,175 @@
+"""
+花壇（ガーデンモード）のテスト
+
+仕様書参照:
+- src/game/entities/garden.py: 共有スケジューラ
+- src/main.py --garden N
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+
+from src.game.core.game_engine import GameEngine
+from src.game.core.input_handler import InputAction
+from src.game.core.screen_state import ScreenState
+from src.game.data.config import config
+from src.game.entities.flower import EVENT_GROWTH, EVENT_WITHERED, FlowerStats, GrowthStage
+from src.game.entities.garden import MAX_PLOTS, Garden
+from src.game.utils.rng_streams import FlowerStreams
+
+
+class TestGarden(unittest.TestCase):
+    """Garden のテストクラス"""
+
+    def setUp(self):
+        # 雑草/害虫の乱数を使わず、個別に進めた結果と比較できるようにする
+        self._saved = (config.game.weed_growth_chance, config.game.pest_growth_chance)
+        config.game.weed_growth_chance = config.game.pest_growth_chance = 0.0
+
+    def tearDown(self):
+        config.game.weed_growth_chance, config.game.pest_growth_chance = self._saved
+
+    def test_matches_individual_flowers(self):
+        """
+        仕様: 花壇で進めた花は1本ずつ進めた花と同じ状態になる
+        """
+        garden = Garden.with_size(8)
+        for index in range(0, 8, 2):
+            garden.apply(index, FlowerStats.turn_light_on)
+        expected = [plot.stats.copy() for plot in garden]
+
+        for _ in range(1500):
+            garden.update(0.1)
+        for stats in expected:
+            stats.advance(150.0, stop_on_wither=True)
+        for index, stats in enumerate(garden.sync_all()):
+            self.assertEqual(stats.growth_stage, expected[index].growth_stage)
+            self.assertAlmostEqual(stats.water_level, expected[index].water_level)
+            self.assertAlmostEqual(stats.light_level, expected[index].light_level)
+
+    def test_idle_flowers_are_skipped(self):
+        """
+        仕様: イベントのない区画は更新しない（1フレームの負荷が本数に比例しない）
+        テスト: 64本を1000ティック進めても advance は成長時の分だけ
+        """
+        garden = Garden.with_size(MAX_PLOTS)
+        garden.apply(0, FlowerStats.turn_light_on)
+        for _ in range(1000):
+            garden.update(0.1)
+        # 光ONの1本が種→芽（20秒）で1回進められるだけ
+        self.assertEqual(garden.advanced_count, 1)
+        self.assertEqual(garden.plots[0].stats.growth_stage, GrowthStage.SPROUT)
+        self.assertEqual(garden.plots[1].stats.age_seconds, 0.0)
+        self.assertAlmostEqual(garden.sync(1).age_seconds, 100.0)
+
+    def test_view_does_not_copy_rng_streams(self):
+        """
+        仕様: 表示用の view は毎フレーム呼ばれるので乱数ストリームを複製しない
+        テスト: 待機中の区画の view は sync と同じ値で、区画は進まない
+        """
+        garden = Garden.with_size(MAX_PLOTS)
+        garden.apply(0, FlowerStats.turn_light_on)
+        garden.update(12.5)
+        with patch.object(FlowerStreams, "copy") as copy_streams:
+            views = [garden.view(i) for i in range(len(garden))]
+        copy_streams.assert_not_called()
+        self.assertEqual(garden.plots[1].stats.age_seconds, 0.0)
+        for index, view in enumerate(views):
+            self.assertIsNone(view.rng_streams)
+            stats = garden.sync(index)
+            self.assertAlmostEqual(view.age_seconds, stats.age_seconds)
+            self.assertAlmostEqual(view.water_level, stats.water_level)
+            self.assertAlmostEqual(view.light_level, stats.light_level)
+
+    def test_reports_growth_and_wither_in_order(self):
+        """
+        テスト: 成長と枯死のイベントを区画インデックス付きで時刻順に返す
+        """
+        garden = Garden.with_size(2)
+        garden.apply(1, FlowerStats.turn_light_on)
+        events = []
+        for _ in range(300):
+            events.extend(garden.update(1.0))
+        self.assertEqual(
+            [(index, event.kind) for index, event in events],
+            [(1, EVENT_GROWTH), (0, EVENT_WITHERED), (1, EVENT_WITHERED)],
+        )
+        self.assertEqual(garden.alive_count, 0)
+        self.assertEqual(garden.pending_count, 0)
+
+    def test_care_reschedules(self):
+        """
+        仕様: お世話をすると次のイベント時刻を登録し直す
+        テスト: 水やりで枯死が先に延び、植え直した区画は種から育つ
+        """
+        garden = Garden.with_size(1)
+        garden.update(200.0)
+        garden.apply(0, FlowerStats.water)
+        self.assertEqual(garden.update(20.0), [])
+        self.assertTrue(garden.plots[0].is_alive)
+
+        garden.update(1000.0)
+        self.assertEqual(garden.alive_count, 0)
+        garden.replant(0)
+        self.assertEqual(garden.alive_count, 1)
+        self.assertEqual(garden.sync(0).age_seconds, 0.0)
+
+    def test_size_limit(self):
+        """
+        テスト: 区画数は1〜64
+        """
+        with self.assertRaises(ValueError):
+            Garden.with_size(MAX_PLOTS + 1)
+        with self.assertRaises(ValueError):
+            Garden.with_size(0)
+
+
+class TestGardenMode(unittest.TestCase):
+    """GameEngine のガーデンモードのテストクラス"""
+
+    def test_tend_selected_plot(self):
+        """
+        仕様: 一覧画面で区画を選んで決定するとお世話（光ON→水やり）
+        """
+        engine = GameEngine(headless=True)
+        engine.flower.save = Mock(return_value=True)
+        engine.initialize()
+        engine.start_garden(4)
+        self.assertEqual(engine.screen_state, ScreenState.GARDEN)
+
+        engine.run_headless(
+            300,
+            [
+                (0, InputAction.NAV_RIGHT),
+                (0, InputAction.NAV_CONFIRM),
+                (100, InputAction.NAV_CONFIRM),
+            ],
+        )
+        # 光ONで芽になる（成長時に光は自動でOFF）
+        plot = engine.garden.sync(1)
+        self.assertEqual(plot.growth_stage, GrowthStage.SPROUT)
+        self.assertEqual(engine.garden.sync(0).growth_stage, GrowthStage.SEED)
+        # 水やり（+20）の分だけ他の区画より水分が多い
+        self.assertAlmostEqual(
+            plot.water_level - engine.garden.sync(0).water_level, 20.0
+        )
+
+    def test_leave_garden(self):
+        """
+        仕様: 一覧画面の最後の「戻る」か NAV_CANCEL で一覧画面を抜けられる
+        """
+        engine = GameEngine(headless=True)
+        engine.flower.save = Mock(return_value=True)
+        engine.initialize()
+        engine.start_garden(2)
+        engine.run_headless(1, [(0, InputAction.NAV_LEFT), (0, InputAction.NAV_CONFIRM)])
+        self.assertEqual(engine.screen_state, ScreenState.TITLE)
+
+        engine.seed_selection_mode = False
+        engine.start_garden(2)
+        engine.run_headless(1, [(0, InputAction.NAV_CANCEL)])
+        self.assertEqual(engine.screen_state, ScreenState.MAIN)
+
+
+if __name__ == "__main__":
+    unittest.main()
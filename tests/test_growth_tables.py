@@ -0,0 +1,144 @@
+"""
+成長分岐テーブル（コンパイル済みキャッシュ）のテスト
+
+仕様書参照:
+- docs/specifications/05_成長分岐表.md: 成長分岐表（集約）
+- src/game/data/growth_tables.json
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.game.data.growth_tables import (
+    DEFAULT_GROWTH_TABLES,
+    GrowthTables,
+    get_growth_tables,
+)
+
+
+def _linear_phase2(raw, score):
+    """従来の線形探索（並び順で最初に一致したもの）"""
+    phase2 = raw["phase2_branch"]
+    for r in phase2["score_ranges"]:
+        if r["min"] <= score <= r["max"]:
+            return r["result"]
+    return phase2["default"]
+
+
+class TestGrowthTables(unittest.TestCase):
+    """GrowthTables のテストクラス"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "growth_tables.json"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, raw, mtime_ns=None):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(raw, f, ensure_ascii=False)
+        if mtime_ns is not None:
+            os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_bisect_matches_linear_scan(self):
+        """
+        仕様: 05_成長分岐表.md - フェーズ2: スコア帯で分岐
+        テスト: bisect 検索が従来の線形探索と同じ結果になる
+        """
+        tables = GrowthTables(DEFAULT_GROWTH_TABLES)
+        for tenths in range(-50, 1200):
+            score = tenths / 10.0
+            with self.subTest(score=score):
+                self.assertEqual(
+                    tables.phase2_branch(score),
+                    _linear_phase2(DEFAULT_GROWTH_TABLES, score),
+                )
+
+    def test_gap_is_reported(self):
+        """
+        仕様: スコア帯の隙間を検出する
+        テスト: 現行テーブルの (49, 50) が警告され、default になる
+        """
+        tables = GrowthTables(DEFAULT_GROWTH_TABLES)
+        self.assertEqual(len(tables.warnings), 1)
+        self.assertIn("(49, 50)", tables.warnings[0])
+        self.assertEqual(tables.phase2_branch(49.5), "ふつう")
+
+    def test_overlap_keeps_first_match(self):
+        """
+        テスト: 重なりがある場合は並び順で先に一致したものを優先
+        """
+        raw = json.loads(json.dumps(DEFAULT_GROWTH_TABLES))
+        raw["phase2_branch"]["score_ranges"] = [
+            {"min": 40, "max": 100, "result": "しなる"},
+            {"min": 0, "max": 60, "result": "つる"},
+        ]
+        tables = GrowthTables(raw)
+        self.assertTrue(tables.has_overlaps)
+        self.assertEqual(tables.phase2_branch(50), "しなる")
+        self.assertEqual(tables.phase2_branch(10), "つる")
+
+    def test_nested_ranges_are_checked_against_widest(self):
+        """
+        仕様: 隙間・重なりはそれまでで一番上まで届くスコア帯と比べる
+        テスト: [0, 100] に含まれる帯は重なりになり、偽の隙間は出ない
+        """
+        raw = json.loads(json.dumps(DEFAULT_GROWTH_TABLES))
+        raw["phase2_branch"]["score_ranges"] = [
+            {"min": 0, "max": 100, "result": "しなる"},
+            {"min": 10, "max": 20, "result": "つる"},
+            {"min": 30, "max": 40, "result": "ふつう"},
+            {"min": 110, "max": 120, "result": "つる"},
+        ]
+        tables = GrowthTables(raw)
+        self.assertEqual(len(tables.warnings), 3)
+        self.assertIn("[0, 100]=しなる と [10, 20]=つる", tables.warnings[0])
+        self.assertIn("[0, 100]=しなる と [30, 40]=ふつう", tables.warnings[1])
+        self.assertIn("(100, 110)", tables.warnings[2])
+        self.assertTrue(tables.has_overlaps)
+
+    def test_phase3_candidates_keep_json_order(self):
+        """
+        仕様: 05_成長分岐表.md - フェーズ3: ベース値以上の候補から乱択
+        テスト: 有効候補は従来どおりJSONの並び順
+        """
+        tables = GrowthTables(DEFAULT_GROWTH_TABLES)
+        candidates = DEFAULT_GROWTH_TABLES["phase3_shape"]["shape_candidates"]
+        for base in (-1000, -5, 0, 5, 9, 10, 15, 19, 20, 30):
+            expected = tuple(c["name"] for c in candidates if base >= c["min_base"])
+            with self.subTest(base=base):
+                self.assertEqual(tables.phase3_candidates(base), expected)
+
+    def test_reload_only_on_mtime_change(self):
+        """
+        仕様: ファイルの更新時刻が変わったときのみ再読み込み
+        テスト: 変更がなければJSONを読み直さず、変更後は新しい内容になる
+        """
+        self._write(DEFAULT_GROWTH_TABLES, mtime_ns=1_000_000_000)
+        first = get_growth_tables(self.path)
+        with patch("src.game.data.growth_tables.json.load") as load:
+            self.assertIs(get_growth_tables(self.path), first)
+            load.assert_not_called()
+
+        raw = json.loads(json.dumps(DEFAULT_GROWTH_TABLES))
+        raw["phase2_branch"]["default"] = "まっすぐ"
+        self._write(raw, mtime_ns=2_000_000_000)
+        reloaded = get_growth_tables(self.path)
+        self.assertIsNot(reloaded, first)
+        self.assertEqual(reloaded.phase2_branch(49.5), "まっすぐ")
+
+    def test_missing_file_uses_defaults(self):
+        """
+        テスト: ファイルがなければデフォルト値を使う
+        """
+        tables = get_growth_tables(Path(self._tmp.name) / "missing.json")
+        self.assertEqual(tables.raw, DEFAULT_GROWTH_TABLES)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+ヘッドレス実行のテスト
+
+仕様書参照:
+- docs/specifications/01_UI定義書.md: 画面遷移の定義
+- src/main.py --headless --ticks N --seed S
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from src import main as game_main
+
+from src.game.core.game_engine import GameEngine
+from src.game.core.input_handler import InputAction, parse_input_script
+from src.game.core.screen_state import ScreenState
+from src.game.data.config import config
+from src.game.entities.flower import SeedType
+
+
+class TestHeadless(unittest.TestCase):
+    """ヘッドレスエンジンのテストクラス"""
+
+    def _make_engine(self) -> GameEngine:
+        engine = GameEngine(headless=True)
+        engine.flower.save = Mock(return_value=True)
+        return engine
+
+    def test_initialize_without_display(self):
+        """
+        仕様: ヘッドレスではウィンドウ・フォントを初期化しない
+        テスト: pygame の初期化が呼ばれない
+        """
+        with patch('pygame.init') as init, patch('pygame.font.init') as font_init:
+            engine = self._make_engine()
+            self.assertTrue(engine.initialize())
+        init.assert_not_called()
+        font_init.assert_not_called()
+        self.assertIsNone(engine.display_manager)
+        self.assertIsNone(engine.render_manager)
+
+    def test_scripted_run_reaches_main(self):
+        """
+        仕様: 01_UI定義書.md - タイトル→種選択→時間設定→メイン
+        テスト: スクリプト入力で画面遷移し、花が更新される
+        """
+        script = parse_input_script(
+            """
+            # 新規開始 → 陰の種
+            0 NAV_CONFIRM
+            1 NAV_CONFIRM
+            2 NAV_RIGHT
+            2 NAV_RIGHT
+            3 NAV_CONFIRM   # 時間設定を決定
+            """
+        )
+        engine = self._make_engine()
+        engine.initialize()
+        result = engine.run_headless(100, script)
+
+        self.assertEqual(result["ticks"], 100)
+        self.assertGreater(result["ticks_per_second"], 0)
+        self.assertEqual(engine.screen_state, ScreenState.MAIN)
+        self.assertEqual(engine.flower.stats.seed_type, SeedType.YIN)
+        self.assertAlmostEqual(
+            engine.flower.stats.age_seconds, 97 * config.game.sim_tick, places=6
+        )
+
+    def test_autosave_runs_headless(self):
+        """
+        テスト: ヘッドレスでも自動セーブが動く
+        """
+        engine = self._make_engine()
+        engine.initialize()
+        engine.seed_selection_mode = False
+        ticks = int(config.data.auto_save_interval / config.game.sim_tick) + 1
+        engine.run_headless(ticks)
+        engine.flower.save.assert_called()
+
+    def test_headless_cli_does_not_touch_player_save(self):
+        """
+        仕様: --headless は既定で一時ファイルにセーブし、--use-save の時だけ実際のセーブを使う
+        テスト: 種選択を抜けて終了しても、プレイヤーのセーブは書き換わらない
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            script = os.path.join(tmp, "inputs.txt")
+            Path(script).write_text("0 NAV_CONFIRM\n1 NAV_CONFIRM\n2 NAV_CONFIRM\n3 NAV_CONFIRM\n")
+            save_path = Path(tmp) / "state.sav"
+            saved = (config.data.save_path, config.data.async_save)
+            config.data.save_path = str(save_path)
+            config.data.async_save = False
+            try:
+                self.assertEqual(game_main.run_headless(100, script), 0)
+                self.assertEqual(config.data.save_path, str(save_path))
+                self.assertFalse(save_path.exists())
+                self.assertEqual(game_main.run_headless(100, script, use_save=True), 0)
+                self.assertTrue(save_path.exists())
+            finally:
+                config.data.save_path, config.data.async_save = saved
+
+    def test_quit_action_stops_run(self):
+        """
+        テスト: QUIT アクションで実行が止まる
+        """
+        engine = self._make_engine()
+        engine.initialize()
+        result = engine.run_headless(1000, [(10, InputAction.QUIT)])
+        self.assertEqual(result["ticks"], 10)
+        self.assertFalse(engine.running)
+
+    def test_parse_input_script_rejects_bad_line(self):
+        """
+        テスト: 不正な行はエラーになる
+        """
+        with self.assertRaises(ValueError):
+            parse_input_script("abc NAV_CONFIRM")
+        with self.assertRaises(ValueError):
+            parse_input_script("1 JUMP")
+
+
+if __name__ == "__main__":
+    unittest.main()
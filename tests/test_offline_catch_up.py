@@ -0,0 +1,192 @@
+"""
+オフライン進行（ロード時の経過時間キャッチアップ）のテスト
+
+仕様書参照:
+- docs/specifications/02_状態パラメータ.md: 水分の自然減少と枯死
+- config.py - DataConfig.offline_catch_up
+"""
+
+import json
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from src.game.core.event_system import EventType
+from src.game.core.game_engine import GameEngine
+from src.game.core.screen_state import ScreenState
+from src.game.data.config import config
+from src.game.data.save_manager import SAVE_DATA_VERSION, SaveManager
+from src.game.entities.flower import Flower, FlowerStats, GrowthStage, SeedType
+from src.game.utils.random_manager import get_rng
+
+
+class TestOfflineCatchUp(unittest.TestCase):
+    """オフライン進行のテストクラス"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.save_path = Path(self._tmp.name) / "state.json"
+        self._saved = (
+            config.data.offline_catch_up,
+            config.data.offline_catch_up_max_seconds,
+            config.game.weed_growth_chance,
+            config.game.pest_growth_chance,
+        )
+        config.data.offline_catch_up = True
+        config.game.weed_growth_chance = 0.0
+        config.game.pest_growth_chance = 0.0
+        get_rng().set_seed(5)
+
+    def tearDown(self):
+        (
+            config.data.offline_catch_up,
+            config.data.offline_catch_up_max_seconds,
+            config.game.weed_growth_chance,
+            config.game.pest_growth_chance,
+        ) = self._saved
+        self._tmp.cleanup()
+
+    def _write_save(self, stats: FlowerStats, seconds_ago: float) -> None:
+        timestamp = datetime.now() - timedelta(seconds=seconds_ago)
+        with open(self.save_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": SAVE_DATA_VERSION,
+                    "timestamp": timestamp.isoformat(),
+                    "data": stats.to_dict(),
+                },
+                f,
+                ensure_ascii=False,
+            )
+
+    def _load(self) -> Flower:
+        return Flower(SaveManager(str(self.save_path)))
+
+    def test_disabled_by_default(self):
+        """
+        仕様: オフライン進行はオプトイン
+        テスト: 無効時はセーブ時の状態のままロードされる
+        """
+        config.data.offline_catch_up = False
+        self._write_save(FlowerStats(age_seconds=10.0, water_level=80.0), 3600)
+        flower = self._load()
+        self.assertIsNone(flower.offline_report)
+        self.assertAlmostEqual(flower.stats.age_seconds, 10.0)
+        self.assertAlmostEqual(flower.stats.water_level, 80.0)
+
+    def test_elapsed_time_is_applied(self):
+        """
+        仕様: ロード時にセーブ時刻からの経過時間だけ花を進める
+        テスト: 年齢と水分が経過時間分だけ変化する
+        """
+        self._write_save(FlowerStats(age_seconds=10.0, water_level=80.0), 200)
+        flower = self._load()
+        report = flower.offline_report
+        self.assertIsNotNone(report)
+        self.assertAlmostEqual(report.elapsed_seconds, 200.0, delta=2.0)
+        self.assertAlmostEqual(
+            flower.stats.age_seconds, 10.0 + report.elapsed_seconds, places=6
+        )
+        self.assertAlmostEqual(
+            flower.stats.water_level,
+            80.0 - config.game.water_decay_rate * report.elapsed_seconds,
+            places=6,
+        )
+
+    def test_growth_events_are_reported(self):
+        """
+        仕様: 05_成長分岐表.md - フェーズ4: 年齢到達で花になる
+        テスト: 留守中の成長がイベントとして報告される
+        """
+        stats = FlowerStats(
+            seed_type=SeedType.YANG, growth_stage=GrowthStage.BUD, water_level=100.0
+        )
+        self._write_save(stats, 300)
+        flower = self._load()
+        self.assertEqual(flower.stats.growth_stage, GrowthStage.FLOWER)
+        growth = flower.offline_report.growth_events
+        self.assertEqual(len(growth), 1)
+        self.assertEqual(growth[0].old_stage, GrowthStage.BUD)
+        self.assertEqual(growth[0].new_stage, GrowthStage.FLOWER)
+
+    def test_stops_at_wither(self):
+        """
+        仕様: 水分が枯死ライン以下で枯れる
+        テスト: 枯死した時点で進行を止め、残り時間はスキップ扱い
+        """
+        self._write_save(FlowerStats(water_level=20.0), 7 * 86_400)
+        flower = self._load()
+        report = flower.offline_report
+        self.assertTrue(report.withered)
+        self.assertFalse(flower.is_alive)
+        self.assertGreater(report.skipped_seconds, 6 * 86_400)
+
+    def test_cap_limits_progress(self):
+        """
+        仕様: config.data.offline_catch_up_max_seconds で上限を設ける
+        テスト: 上限を超える経過時間は切り捨てられる
+        """
+        config.data.offline_catch_up_max_seconds = 120.0
+        self._write_save(FlowerStats(water_level=100.0), 3600)
+        flower = self._load()
+        self.assertAlmostEqual(flower.offline_report.elapsed_seconds, 120.0)
+        self.assertAlmostEqual(flower.stats.age_seconds, 120.0)
+
+    def test_thirty_days_is_cheap(self):
+        """
+        仕様: キャッチアップはティックを積まず、イベントごとに1回だけ進む
+        テスト: 30日分でも update は呼ばれず、ループはイベント数+1回（枯死させずに全期間進める。
+        所要時間は benchmarks/bench_advance.py）
+        """
+        config.game.weed_growth_chance = 0.01
+        config.game.pest_growth_chance = 0.01
+        saved_decay = config.game.water_decay_rate
+        config.game.water_decay_rate = 0.0
+        try:
+            self._write_save(FlowerStats(water_level=100.0), 0)
+            flower = self._load()
+            flower.stats = FlowerStats(water_level=100.0, is_light_on=True)
+            flower.save_manager.last_saved_at = datetime.now() - timedelta(days=30)
+            with patch.object(
+                FlowerStats, "_time_to_growth", autospec=True,
+                side_effect=FlowerStats._time_to_growth,
+            ) as steps, patch.object(FlowerStats, "update", autospec=True) as update:
+                report = flower._catch_up_offline()
+        finally:
+            config.game.water_decay_rate = saved_decay
+        update.assert_not_called()
+        self.assertEqual(steps.call_count, len(report.events) + 1)
+        self.assertFalse(report.withered)
+        self.assertAlmostEqual(report.elapsed_seconds, 30 * 86_400.0, delta=1.0)
+        self.assertEqual(flower.stats.growth_stage, GrowthStage.SPROUT)
+
+    def test_engine_reports_offline_growth(self):
+        """
+        仕様: 留守中の成長も通常の成長イベントとして通知される
+        テスト: セーブから再開すると成長イベントが発行され花言葉選択へ進む
+        """
+        stats = FlowerStats(
+            seed_type=SeedType.YANG, growth_stage=GrowthStage.BUD, water_level=100.0
+        )
+        self._write_save(stats, 300)
+        with patch('pygame.init'), \
+             patch('pygame.font.init'), \
+             patch('src.game.ui.display.DisplayManager.initialize'), \
+             patch('src.game.ui.renderer.RenderManager'):
+            engine = GameEngine()
+            engine.render_manager = Mock()
+        engine.flower = self._load()
+        received = []
+        engine.event_manager.subscribe(
+            EventType.FLOWER_GROWTH_CHANGED, lambda e: received.append(e.data)
+        )
+        engine._load_save_game()
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0]["new_stage"], GrowthStage.FLOWER.value)
+        self.assertEqual(engine.screen_state, ScreenState.FLOWER_LANGUAGE)
+
+
+if __name__ == "__main__":
+    unittest.main()
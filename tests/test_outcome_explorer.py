@@ -0,0 +1,82 @@
+"""
+結果分布エクスプローラのテスト
+
+仕様書参照:
+- docs/specifications/05_成長分岐表.md: 成長分岐表（最終キャラクター名）
+"""
+
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+from src.game.entities.flower import SeedType
+from src.game.simulation.outcome_explorer import (
+    OUTCOME_WITHERED,
+    explore,
+    simulate_one,
+)
+
+
+class TestOutcomeExplorer(unittest.TestCase):
+    """outcome_explorer のテストクラス"""
+
+    def test_simulate_one_is_deterministic(self):
+        """
+        仕様: シードごとに決定的
+        テスト: 同じシード・方針なら同じ結果と開花時間
+        """
+        first = simulate_one(42, "attentive", SeedType.YANG)
+        second = simulate_one(42, "attentive", SeedType.YANG)
+        self.assertEqual(first, second)
+        self.assertIsNotNone(first.time_to_flower)
+
+    def test_neglect_withers(self):
+        """
+        テスト: 何もしなければ枯れる
+        """
+        result = simulate_one(0, "neglect", SeedType.YIN)
+        self.assertEqual(result.outcome, OUTCOME_WITHERED)
+        self.assertIsNone(result.time_to_flower)
+
+    def test_results_independent_of_workers(self):
+        """
+        仕様: ワーカー数に依存せず同じ結果
+        テスト: 1プロセスと2プロセスの結果が一致
+        """
+        kwargs = dict(policies=["attentive", "neglect"], shard_size=10)
+        serial = explore(range(30), workers=1, **kwargs)
+        parallel = explore(range(30), workers=2, **kwargs)
+        self.assertEqual(serial.results, parallel.results)
+        self.assertEqual(len(serial.results), 30 * 2 * len(SeedType))
+
+    def test_unknown_policy_rejected(self):
+        with self.assertRaises(ValueError):
+            explore(range(1), policies=["nope"], workers=1)
+
+    def test_reports_written(self):
+        """
+        テスト: 集計をCSV/JSONに出力できる
+        """
+        report = explore(range(20), policies=["attentive"], workers=1)
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = os.path.join(tmp, "out.csv")
+            json_path = os.path.join(tmp, "out.json")
+            report.to_csv(csv_path)
+            report.to_json(json_path)
+
+            with open(csv_path, encoding="utf-8") as f:
+                rows = list(csv.DictReader(f))
+            with open(json_path, encoding="utf-8") as f:
+                data = json.load(f)
+
+        self.assertEqual(sum(int(r["count"]) for r in rows), 40)
+        self.assertEqual(data["runs"], 40)
+        for group in data["groups"]:
+            self.assertEqual(sum(group["histogram"].values()), 20)
+            self.assertIsNotNone(group["time_to_flower"]["p50"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+最終的な花の確率モデルのテスト
+
+仕様書参照:
+- docs/specifications/05_成長分岐表.md: フェーズ2/フェーズ3の分岐
+- src/game/simulation/outcome_model.py
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from collections import Counter
+from unittest.mock import patch
+
+from src.game.data.growth_tables import DEFAULT_GROWTH_TABLES, get_growth_tables
+from src.game.entities.flower import FlowerStats, GrowthStage, SeedType
+from src.game.simulation import outcome_model
+from src.game.simulation.outcome_explorer import exact_outcomes, explore
+from src.game.simulation.outcome_model import OutcomeModel, get_outcome_model
+from src.game.utils.random_manager import get_rng
+
+
+class TestOutcomeModel(unittest.TestCase):
+    """OutcomeModel のテストクラス"""
+
+    def setUp(self):
+        self.model = get_outcome_model()
+
+    def test_stem_matches_sampling(self):
+        """
+        仕様: 茎以降の形は有効候補から等確率に選ばれる
+        テスト: 茎の状態の分布が実際に成長させた結果の頻度と一致
+        """
+        stats = FlowerStats(
+            seed_type=SeedType.YANG,
+            growth_stage=GrowthStage.STEM,
+            phase2_branch="しなる",
+            light_level=80.0,
+            water_level=80.0,
+            is_light_on=True,
+        )
+        distribution = self.model.distribution(stats)
+        self.assertAlmostEqual(sum(distribution.values()), 1.0)
+
+        get_rng().set_seed(3)
+        counts = Counter()
+        for _ in range(2000):
+            grown = stats.copy()
+            grown.advance(100.0)
+            self.assertEqual(grown.growth_stage, GrowthStage.FLOWER)
+            counts[grown.character_name] += 1
+        self.assertEqual(set(counts), set(distribution))
+        for name, probability in distribution.items():
+            self.assertAlmostEqual(counts[name] / 2000, probability, delta=0.05)
+
+    def test_fixed_stages(self):
+        """
+        テスト: 蕾・花は形まで確定しているので確率1
+        """
+        stats = FlowerStats(
+            growth_stage=GrowthStage.BUD, phase2_branch="しなる", phase3_shape="大輪"
+        )
+        self.assertEqual(self.model.distribution(stats), {"ひまわり": 1.0})
+        self.assertEqual(self.model.probability(stats, "ばら"), 0.0)
+
+    def test_sprout_projects_branch(self):
+        """
+        仕様: 芽は茎になる時点（光量リセット後）のフェーズ2スコアを見込む
+        テスト: 見込みの分岐が実際に茎になったときの分岐と同じ
+        """
+        for water in (10.0, 60.0, 95.0, 100.0):
+            stats = FlowerStats(
+                growth_stage=GrowthStage.SPROUT,
+                light_level=20.0,
+                water_level=water,
+                mental_level=80,
+            )
+            key = self.model.key(stats)
+            stats.light_level = stats.light_required_for_stem
+            stats._check_growth()
+            self.assertEqual(stats.growth_stage, GrowthStage.STEM)
+            self.assertEqual(key[2], stats.phase2_branch)
+
+    def test_exact_outcomes_match_explorer(self):
+        """
+        テスト: 方針ごとの厳密な分布がモンテカルロ集計とほぼ一致
+        """
+        exact = exact_outcomes("attentive", SeedType.YANG)
+        self.assertAlmostEqual(sum(exact.values()), 1.0)
+        report = explore(range(400), ["attentive"], [SeedType.YANG], workers=1)
+        counts = report.histogram()[("attentive", SeedType.YANG.value)]
+        for name, probability in exact.items():
+            self.assertAlmostEqual(counts.get(name, 0) / 400, probability, delta=0.1)
+
+    def test_model_rebuilt_when_tables_change(self):
+        """
+        仕様: growth_tables.json が更新されると確率表も作り直す
+        """
+        raw = json.loads(json.dumps(DEFAULT_GROWTH_TABLES))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "growth_tables.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(raw, f)
+            with patch.object(
+                outcome_model, "get_growth_tables", lambda: get_growth_tables(path)
+            ):
+                first = outcome_model.get_outcome_model()
+                self.assertIs(outcome_model.get_outcome_model(), first)
+
+                raw["phase2_branch"]["score_ranges"] = [
+                    {"min": 0, "max": 100, "result": "つる"}
+                ]
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(raw, f)
+                stat = os.stat(path)
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+                second = outcome_model.get_outcome_model()
+                self.assertIsNot(second, first)
+                self.assertIsInstance(second, OutcomeModel)
+                stats = FlowerStats(growth_stage=GrowthStage.SPROUT, water_level=80.0)
+                self.assertEqual(second.key(stats)[2], "つる")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+RandomManager（バッファ付き乱数）のテスト
+
+仕様書参照:
+- src/game/utils/random_manager.py
+"""
+
+import threading
+import unittest
+
+import numpy as np
+
+from src.game.utils.random_manager import BUFFER_SIZE, RandomManager, get_rng, use_rng
+
+
+class TestRandomManager(unittest.TestCase):
+    """RandomManager のテストクラス"""
+
+    def test_matches_unbuffered_generator(self):
+        """
+        仕様: バッファの有無によらず、同じシードなら PCG64 を1個ずつ引いた値と同じ
+        """
+        manager = RandomManager(42)
+        generator = np.random.Generator(
+            np.random.PCG64(np.random.SeedSequence(manager.get_state()[0]))
+        )
+        count = 3 * BUFFER_SIZE + 5
+        self.assertEqual(
+            [manager.random() for _ in range(count)],
+            [generator.random() for _ in range(count)],
+        )
+
+    def test_random_array_equals_scalar_draws(self):
+        """
+        仕様: random_array(n) は random() を n 回呼んだのと同じ値
+        テスト: 途中まで使ったバッファをまたいでも一致する
+        """
+        a, b = RandomManager(7), RandomManager(7)
+        a.random()
+        b.random()
+        batch = a.random_array(2 * BUFFER_SIZE)
+        self.assertEqual(list(batch), [b.random() for _ in range(2 * BUFFER_SIZE)])
+        self.assertEqual(a.draws, b.draws)
+        self.assertEqual(a.random(), b.random())
+
+    def test_state_round_trip(self):
+        """
+        仕様: 状態は (エントロピー, 消費数) で、set_state / fork で同じ位置に戻る
+        """
+        for draws in (0, 1, 31, 32, 1000, 5000):
+            manager = RandomManager(3)
+            manager.random_array(draws)
+            state = manager.get_state()
+            self.assertEqual(state[1], draws)
+            forked = manager.fork()
+            restored = RandomManager()
+            restored.set_state(state)
+            expected = manager.random()
+            self.assertEqual(forked.random(), expected)
+            self.assertEqual(restored.random(), expected)
+
+    def test_use_rng_is_thread_local(self):
+        """
+        仕様: use_rng の差し替えはそのスレッドの get_rng() だけに効く
+        """
+        override = RandomManager(1)
+        seen = []
+        with use_rng(override):
+            self.assertIs(get_rng(), override)
+            thread = threading.Thread(target=lambda: seen.append(get_rng()))
+            thread.start()
+            thread.join()
+        self.assertIsNot(seen[0], override)
+        self.assertIsNot(get_rng(), override)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+"""
+花ごとの乱数ストリームのテスト
+
+仕様書参照:
+- src/game/utils/rng_streams.py
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from src.game.data.config import config
+from src.game.data.save_manager import SaveManager
+from src.game.entities.flower import Flower, FlowerStats, GrowthStage
+from src.game.entities.garden import Garden
+from src.game.utils.rng_streams import FlowerStreams, RngStream
+
+
+class TestRngStreams(unittest.TestCase):
+    """RngStream / FlowerStreams のテストクラス"""
+
+    def test_batch_equals_scalar_draws(self):
+        """
+        仕様: まとめて引いた一様乱数は1個ずつ引いた値と同じ
+        """
+        a = RngStream(42, (0, 0, 1))
+        b = RngStream(42, (0, 0, 1))
+        batch = a.random_array(10)
+        self.assertEqual(list(batch), [b.random() for _ in range(10)])
+        self.assertEqual(a.draws, b.draws)
+
+    def test_draw_pair_equals_scalar_draws(self):
+        """
+        仕様: draw_pair() は雑草・害虫のストリームを1個ずつ引いたのと同じ値
+        テスト: 1個ずつ引くのと混ぜても、バッファをまたいでも値と回数が一致する
+        """
+        a = FlowerStreams.for_flower(5)
+        b = FlowerStreams.for_flower(5)
+        a.weeds.random()
+        b.weeds.random()
+        pairs = [a.draw_pair() for _ in range(3000)]
+        self.assertEqual(pairs, [(b.weeds.random(), b.pests.random()) for _ in range(3000)])
+        self.assertEqual(a, b)
+        self.assertEqual(a.pests.random(), b.pests.random())
+
+    def test_restore_from_state(self):
+        """
+        仕様: 状態（エントロピーと引いた回数）から同じ位置に戻せる
+        テスト: JSON を経由して復元すると続きの値が一致する
+        """
+        for draws in (0, 1, 3, 4, 7, 1001):
+            stream = RngStream(7, (3, 0, 2))
+            stream.random_array(draws)
+            restored = RngStream.from_state(json.loads(json.dumps(stream.to_state())))
+            self.assertEqual(restored.random(), stream.random())
+
+    def test_streams_are_independent(self):
+        """
+        仕様: 他の花・他の用途がいつ引いても結果は変わらない
+        """
+        first = FlowerStreams.for_flower(5, flower_id=0)
+        second = FlowerStreams.for_flower(5, flower_id=1)
+        reference = FlowerStreams.for_flower(5, flower_id=0)
+        second.weeds.random_array(100)
+        first.pests.random_array(50)
+        self.assertEqual(first.weeds.random(), reference.weeds.random())
+        self.assertNotEqual(
+            FlowerStreams.for_flower(5, 0).weeds.random(),
+            FlowerStreams.for_flower(5, 1).weeds.random(),
+        )
+
+    def test_next_generation(self):
+        """
+        テスト: 植え直しの世代ごとに別の乱数列になる
+        """
+        streams = FlowerStreams.for_flower(5)
+        renewed = streams.next_generation()
+        self.assertEqual(renewed.generation, 1)
+        self.assertEqual(renewed.entropy, streams.entropy)
+        self.assertNotEqual(renewed.phase3.random(), streams.phase3.random())
+
+
+class TestFlowerStatsStreams(unittest.TestCase):
+    """FlowerStats の乱数ストリーム利用のテストクラス"""
+
+    def setUp(self):
+        self._saved = (config.game.weed_growth_chance, config.game.pest_growth_chance)
+        config.game.weed_growth_chance = 0.05
+        config.game.pest_growth_chance = 0.05
+
+    def tearDown(self):
+        config.game.weed_growth_chance, config.game.pest_growth_chance = self._saved
+
+    def test_save_round_trip_continues_sequence(self):
+        """
+        仕様: ストリームの状態はセーブに含まれ、ロード後も同じ続きになる
+        """
+        stats = FlowerStats(rng_streams=FlowerStreams.for_flower(11))
+        for _ in range(100):
+            stats.update(0.1)
+        restored = FlowerStats.from_dict(json.loads(json.dumps(stats.to_dict())))
+        self.assertEqual(restored.rng_streams, stats.rng_streams)
+        for _ in range(300):
+            stats.update(0.1)
+            restored.update(0.1)
+        self.assertEqual(restored, stats)
+        self.assertEqual(restored.rng_streams, stats.rng_streams)
+
+    def test_copy_does_not_advance_original(self):
+        """
+        テスト: コピーを進めても元の花のストリームは進まない
+        """
+        stats = FlowerStats(rng_streams=FlowerStreams.for_flower(11))
+        state = stats.rng_streams.to_state()
+        stats.copy().advance(1000.0)
+        self.assertEqual(stats.rng_streams.to_state(), state)
+
+    def test_garden_independent_of_view_frequency(self):
+        """
+        仕様: 表示の頻度（view の回数）で区画の結果が変わらない
+        """
+        gardens = [Garden.with_size(4, seed=3), Garden.with_size(4, seed=3)]
+        for garden in gardens:
+            for index in range(4):
+                garden.apply(index, FlowerStats.turn_light_on)
+        for step in range(600):
+            for garden in gardens:
+                garden.update(0.5)
+            for index in range(4):
+                gardens[1].view(index)
+        for a, b in zip(gardens[0].sync_all(), gardens[1].sync_all()):
+            self.assertEqual(a, b)
+            self.assertEqual(a.rng_streams, b.rng_streams)
+
+    def test_flower_reset_uses_next_generation(self):
+        """
+        テスト: やりなおしでは同じ花IDの次の世代のストリームになる
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            flower = Flower(SaveManager(os.path.join(tmp, "state.json")))
+            entropy = flower.stats.rng_streams.entropy
+            flower.reset()
+        self.assertEqual(flower.stats.rng_streams.entropy, entropy)
+        self.assertEqual(flower.stats.rng_streams.generation, 1)
+        self.assertEqual(flower.stats.growth_stage, GrowthStage.SEED)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+"""
+セーブの差分ジャーナル（操作の追記＋定期スナップショット）のテスト
+
+仕様書参照:
+- src/game/data/save_journal.py: レコードの形式・切り詰め・詰め直し・再生
+- config.py - DataConfig.save_journal / journal_snapshot_interval
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.game.core.save_scheduler import SaveScheduler
+from src.game.data.config import config
+from src.game.data.save_journal import RECORD_SIZE, SaveJournal
+from src.game.data.save_manager import SaveManager
+from src.game.data.save_writer import SAVE_THREAD_NAME
+from src.game.entities.flower import Flower, SeedType
+
+
+class _Clock:
+    """手で進める時計"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSaveJournal(unittest.TestCase):
+    """ジャーナルモードのセーブのテストクラス"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.save_path = Path(self._tmp.name) / "state.sav"
+        self._saved = (
+            config.data.save_journal,
+            config.data.async_save,
+            config.game.weed_growth_chance,
+            config.game.pest_growth_chance,
+        )
+        config.data.save_journal = True
+        config.data.async_save = False
+        config.game.weed_growth_chance = 0.0
+        config.game.pest_growth_chance = 0.0
+
+    def tearDown(self):
+        (
+            config.data.save_journal,
+            config.data.async_save,
+            config.game.weed_growth_chance,
+            config.game.pest_growth_chance,
+        ) = self._saved
+        self._tmp.cleanup()
+
+    def _flower(self) -> Flower:
+        return Flower(SaveManager(str(self.save_path)))
+
+    @property
+    def journal_path(self) -> Path:
+        return self.save_path.with_suffix(".journal")
+
+    def test_actions_are_appended_and_replayed(self):
+        """
+        仕様: スナップショットの後の操作は1件数十バイトの追記で、ロード時に再生される
+        """
+        flower = self._flower()
+        flower.select_seed(SeedType.YIN)
+        self.assertTrue(flower.save())
+        snapshot = self.save_path.read_bytes()
+
+        flower.update(30.0)
+        flower.water()
+        flower.turn_light_on()
+        flower.update(20.0)
+        flower.adjust_mental(5.0)
+        flower.fertilize()
+        self.assertEqual(self.journal_path.stat().st_size, 4 * RECORD_SIZE)
+        self.assertLess(RECORD_SIZE, 48)
+        # スナップショットは書き直していない
+        self.assertEqual(self.save_path.read_bytes(), snapshot)
+
+        loaded = self._flower().stats
+        self.assertEqual(loaded.seed_type, SeedType.YIN)
+        # 光ONのまま芽に育ち、成長時に光がOFFになるところまで再現する
+        self.assertEqual(loaded.growth_stage, flower.stats.growth_stage)
+        self.assertEqual(loaded.is_light_on, flower.stats.is_light_on)
+        self.assertEqual(loaded.mental_level, flower.stats.mental_level)
+        self.assertAlmostEqual(loaded.age_seconds, flower.stats.age_seconds)
+        self.assertAlmostEqual(loaded.water_level, flower.stats.water_level)
+        self.assertAlmostEqual(loaded.light_level, flower.stats.light_level)
+
+    def test_snapshot_compacts_journal(self):
+        """
+        仕様: スナップショットを書いたらジャーナルを詰める。詰める前に落ちても
+        古い土台のレコードは二重に適用しない
+        """
+        flower = self._flower()
+        flower.save(force=True)
+        flower.adjust_mental(5.0)
+        with patch.object(SaveJournal, "compact", side_effect=OSError("disk full")):
+            self.assertTrue(flower.save(force=True))
+        self.assertEqual(self.journal_path.stat().st_size, RECORD_SIZE)
+        self.assertEqual(self._flower().stats.mental_level, 5.0)
+
+        flower.adjust_mental(5.0)
+        flower.save(force=True)
+        self.assertFalse(self.journal_path.exists())
+        self.assertEqual(self._flower().stats.mental_level, 10.0)
+
+    def test_torn_record_loses_only_last_action(self):
+        """
+        仕様: 追記の途中で落ちたら最後の1件だけを失い、次の追記は正しく読める
+        """
+        flower = self._flower()
+        flower.save(force=True)
+        flower.adjust_mental(5.0)
+        flower.adjust_mental(5.0)
+        raw = self.journal_path.read_bytes()
+        self.journal_path.write_bytes(raw[: -RECORD_SIZE // 2])
+
+        reloaded = self._flower()
+        self.assertEqual(reloaded.stats.mental_level, 5.0)
+        self.assertEqual(self.journal_path.stat().st_size, RECORD_SIZE)
+        reloaded.adjust_mental(5.0)
+        self.assertEqual(self._flower().stats.mental_level, 10.0)
+
+    def test_reset_deletes_journal(self):
+        """
+        仕様: リセットでジャーナルも消える。最初のスナップショットの前の操作は、
+        その操作を含めたスナップショットを書いて残す（落ちても失わない）
+        """
+        flower = self._flower()
+        flower.save(force=True)
+        flower.water()
+        flower.reset()
+        self.assertFalse(self.journal_path.exists())
+        self.assertFalse(self.save_path.exists())
+        flower.adjust_mental(5.0)
+        self.assertFalse(self.journal_path.exists())
+        self.assertEqual(self._flower().stats.mental_level, 5.0)
+        flower.adjust_mental(5.0)
+        self.assertEqual(self.journal_path.stat().st_size, RECORD_SIZE)
+        self.assertEqual(self._flower().stats.mental_level, 10.0)
+
+    def test_fsync_runs_on_writer_thread(self):
+        """
+        仕様: 非同期セーブ有効時、ジャーナルの追記はゲームスレッドで fsync せず、
+        書き込みスレッドがまとめて fsync する
+        """
+        config.data.async_save = True
+        flower = self._flower()
+        flower.save(force=True)
+        self.assertTrue(flower.flush_saves(5.0))
+        threads = []
+        real_fsync = os.fsync
+
+        def fsync(fd):
+            threads.append(threading.current_thread().name)
+            real_fsync(fd)
+
+        with patch("src.game.data.save_journal.os.fsync", side_effect=fsync):
+            flower.water()
+            flower.fertilize()
+            self.assertTrue(flower.flush_saves(5.0))
+        flower.close()
+        self.assertGreaterEqual(len(threads), 1)
+        self.assertLessEqual(len(threads), 2)
+        self.assertEqual(set(threads), {SAVE_THREAD_NAME})
+        self.assertEqual(self.journal_path.stat().st_size, 2 * RECORD_SIZE)
+
+    def test_scheduler_checkpoints_between_snapshots(self):
+        """
+        仕様: ジャーナルモードの自動セーブは経過時間だけを追記し、
+        スナップショットは snapshot_interval ごとと終了時だけ書く
+        """
+        flower = self._flower()
+        clock = _Clock()
+        scheduler = SaveScheduler(
+            flower, interval=10.0, max_staleness=60.0, clock=clock, snapshot_interval=300.0
+        )
+        self.assertTrue(scheduler.request("quit"))
+        snapshot = self.save_path.read_bytes()
+
+        flower.update(10.0)
+        self.assertTrue(scheduler.update(10.0))
+        self.assertEqual(self.save_path.read_bytes(), snapshot)
+        self.assertEqual(self.journal_path.stat().st_size, RECORD_SIZE)
+        self.assertAlmostEqual(self._flower().stats.age_seconds, 10.0)
+
+        clock.now = 300.0
+        flower.update(10.0)
+        self.assertTrue(scheduler.update(10.0))
+        self.assertNotEqual(self.save_path.read_bytes(), snapshot)
+        self.assertFalse(self.journal_path.exists())
+        self.assertEqual(scheduler.counters["written"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,323 @@
+"""
+SaveManager（原子的なセーブ・バイナリ形式）のテスト
+
+仕様書参照:
+- src/game/data/atomic_file.py: 一時ファイル → fsync → os.replace
+- src/game/data/save_format.py: ヘッダ・CRC32・FlowerStats の固定レイアウト
+- config.py - DataConfig.save_durability / save_format / save_backup
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.game.data import save_format
+from src.game.data.atomic_file import temp_path_for
+from src.game.data.config import config
+from src.game.data.save_manager import SAVE_DATA_VERSION, SaveManager
+from src.game.entities.flower import FlowerStats, SeedType
+from src.game.utils.rng_streams import FlowerStreams
+
+# 障害を注入する os の操作（書き込みの各段階）
+FAULT_OPS = ("open", "write", "fsync", "close", "unlink", "link", "replace")
+
+
+class _Crash(BaseException):
+    """プロセスが落ちたことを表す（except Exception では捕まらない）"""
+
+
+class _FaultyOS:
+    """n 回目の操作でプロセスが落ちたように振る舞う os の代わり
+
+    落ちた後の操作はすべて失敗させ、後片付けもディスクに反映させない。
+    write で落ちる時は半分だけ書いてから落ちる。
+    """
+
+    def __init__(self, crash_at: int):
+        self.crash_at = crash_at
+        self.calls = []
+        self.crashed = False
+        self.open_fds = []
+
+    def __getattr__(self, name):
+        real = getattr(os, name)
+        if name not in FAULT_OPS:
+            return real
+
+        def op(*args, **kwargs):
+            if self.crashed:
+                raise _Crash()
+            self.calls.append(name)
+            if len(self.calls) == self.crash_at:
+                self.crashed = True
+                if name == "write":
+                    fd, data = args
+                    os.write(fd, bytes(data[: len(data) // 2]))
+                raise _Crash()
+            result = real(*args, **kwargs)
+            if name == "open":
+                self.open_fds.append(result)
+            elif name == "close":
+                self.open_fds.remove(args[0])
+            return result
+
+        return op
+
+    def release(self):
+        for fd in self.open_fds:
+            os.close(fd)
+
+
+class TestSaveManager(unittest.TestCase):
+    """SaveManager のテストクラス"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.save_path = Path(self._tmp.name) / "state.json"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _save_with_faults(self, crash_at: int, data, durability: str) -> _FaultyOS:
+        faulty = _FaultyOS(crash_at)
+        with patch("src.game.data.atomic_file.os", faulty):
+            try:
+                SaveManager(str(self.save_path), durability).save(data)
+            except _Crash:
+                pass
+            finally:
+                faulty.release()
+        return faulty
+
+    def test_valid_save_survives_crash_at_every_step(self):
+        """
+        仕様: 書き込みのどの段階で落ちても、前回か今回のセーブが読める
+        テスト: n 回目の操作で落とす（n を増やして最後まで成功するまで）
+        """
+        old = FlowerStats(water_level=10.0).to_dict()
+        new = FlowerStats(water_level=90.0).to_dict()
+        for durability in ("none", "file", "dir"):
+            crash_at = 1
+            while True:
+                with self.subTest(durability=durability, crash_at=crash_at):
+                    self.assertTrue(SaveManager(str(self.save_path), durability).save(old))
+                    faulty = self._save_with_faults(crash_at, new, durability)
+                    loaded = SaveManager(str(self.save_path)).load()
+                    if faulty.crashed:
+                        self.assertIn(loaded, (old, new))
+                    else:
+                        self.assertEqual(loaded, new)
+                    # 残った一時ファイルがあっても次のセーブは成功する
+                    self.assertTrue(SaveManager(str(self.save_path)).save(old))
+                    self.assertEqual(SaveManager(str(self.save_path)).load(), old)
+                if not faulty.crashed:
+                    break
+                crash_at += 1
+            # 既定では .backup を残すので unlink/link も含めて全段階で落とす（none は fsync なし）
+            self.assertGreaterEqual(crash_at, len(FAULT_OPS))
+
+    def test_metadata_operations_per_save(self):
+        """
+        仕様: 1回のセーブは一時ファイルの作成と置き換えだけ
+        （.backup を残す時は前の内容をリンクし直す。セーブファイル自体は動かさない）
+        """
+        manager = SaveManager(str(self.save_path), "file")
+        manager.save(FlowerStats().to_dict())
+        saved = config.data.save_backup
+        config.data.save_backup = False
+        try:
+            faulty = self._save_with_faults(0, FlowerStats().to_dict(), "file")
+        finally:
+            config.data.save_backup = saved
+        self.assertEqual(faulty.calls, ["open", "write", "fsync", "close", "replace"])
+
+        faulty = self._save_with_faults(0, FlowerStats().to_dict(), "file")
+        self.assertEqual(
+            faulty.calls, ["open", "write", "fsync", "close", "unlink", "link", "replace"]
+        )
+        self.assertEqual(
+            sorted(p.name for p in self.save_path.parent.iterdir()),
+            ["state.backup", "state.json"],
+        )
+
+    def test_backup_keeps_primary_at_every_step(self):
+        """
+        仕様: .backup を残す時も、どの段階で落ちてもセーブファイルは存在し続ける
+        """
+        old = FlowerStats(water_level=10.0).to_dict()
+        new = FlowerStats(water_level=90.0).to_dict()
+        saved = config.data.save_backup
+        config.data.save_backup = True
+        try:
+            SaveManager(str(self.save_path)).save(old)
+            for crash_at in range(1, len(FAULT_OPS) + 2):
+                with self.subTest(crash_at=crash_at):
+                    SaveManager(str(self.save_path)).save(old)
+                    self._save_with_faults(crash_at, new, "file")
+                    self.assertTrue(self.save_path.exists())
+                    self.assertIn(SaveManager(str(self.save_path)).load(), (old, new))
+        finally:
+            config.data.save_backup = saved
+
+    def test_failed_save_keeps_previous(self):
+        """
+        テスト: 置き換えに失敗したら False を返し、前のセーブと一時ファイルなしの状態に戻る
+        """
+        manager = SaveManager(str(self.save_path))
+        manager.save(FlowerStats(weed_count=1).to_dict())
+        with patch("src.game.data.atomic_file.os.replace", side_effect=OSError("disk full")):
+            self.assertFalse(manager.save(FlowerStats(weed_count=2).to_dict()))
+        self.assertEqual(manager.load()["weed_count"], 1)
+        self.assertFalse(temp_path_for(self.save_path).exists())
+
+    def test_corrupt_save_restores_backup_by_default(self):
+        """
+        仕様: 既定の設定で壊れたセーブを読んだら .backup（1世代前）から復元する
+        壊れたファイルは別名で残し、次のセーブで上書きしない
+        """
+        self.assertTrue(config.data.save_backup)
+        manager = SaveManager(str(self.save_path))
+        manager.save(FlowerStats(weed_count=1).to_dict())
+        manager.save(FlowerStats(weed_count=2).to_dict())
+        raw = bytearray(self.save_path.read_bytes())
+        raw[-1] ^= 0xFF
+        self.save_path.write_bytes(bytes(raw))
+
+        with self.assertLogs("src.game.data.save_manager", "ERROR") as logs:
+            restored = manager.load()
+        self.assertIsNotNone(restored)
+        self.assertEqual(restored["weed_count"], 1)
+        self.assertTrue(any("Corrupt save kept at" in line for line in logs.output))
+        kept = list(self.save_path.parent.glob(f"{self.save_path.name}.corrupt-*"))
+        self.assertEqual(len(kept), 1)
+        self.assertEqual(kept[0].read_bytes(), bytes(raw))
+
+        manager.save(FlowerStats(weed_count=3).to_dict())
+        self.assertEqual(kept[0].read_bytes(), bytes(raw))
+        self.assertEqual(manager.load()["weed_count"], 3)
+
+    def test_legacy_backup_is_recovered(self):
+        """
+        仕様: 旧方式のセーブがリネーム直後に中断された場合は .backup から読む
+        """
+        backup = self.save_path.with_suffix(".backup")
+        backup.write_text(
+            json.dumps({"version": SAVE_DATA_VERSION, "data": {"a": 1}}), encoding="utf-8"
+        )
+        manager = SaveManager(str(self.save_path))
+        self.assertTrue(manager.has_save())
+        self.assertEqual(manager.load(), {"a": 1})
+
+    def test_unknown_durability(self):
+        """
+        テスト: 未知の耐久性レベルはセーブ失敗になる
+        """
+        self.assertFalse(
+            SaveManager(str(self.save_path), "paranoid").save(FlowerStats().to_dict())
+        )
+        self.assertFalse(self.save_path.exists())
+
+
+class TestBinarySaveFormat(unittest.TestCase):
+    """バイナリ形式のセーブのテストクラス"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.save_path = Path(self._tmp.name) / "state.sav"
+        self.manager = SaveManager(str(self.save_path))
+        self._saved_backup = config.data.save_backup
+        config.data.save_backup = True
+        self.stats = FlowerStats(
+            seed_type=SeedType.YIN,
+            water_level=42.5,
+            weed_count=3,
+            phase2_branch="まっすぐ",
+            rng_streams=FlowerStreams.for_flower(12345, flower_id=2, generation=1),
+        )
+        self.stats.rng_streams.weeds.random_array(7)
+
+    def tearDown(self):
+        config.data.save_backup = self._saved_backup
+        self._tmp.cleanup()
+
+    def test_round_trip(self):
+        """
+        仕様: マジックで始まる CRC 付きのバイナリで、乱数ストリームの位置も含めて元に戻る
+        """
+        self.assertTrue(self.manager.save(self.stats.to_dict()))
+        raw = self.save_path.read_bytes()
+        self.assertTrue(save_format.is_binary(raw))
+        self.assertLess(len(raw), len(save_format.to_json({"data": self.stats.to_dict()})))
+        loaded = FlowerStats.from_dict(self.manager.load())
+        self.assertEqual(loaded, self.stats)
+        self.assertEqual(loaded.rng_streams, self.stats.rng_streams)
+        self.assertIsNotNone(self.manager.last_saved_at)
+
+    def test_corruption_falls_back_to_backup(self):
+        """
+        仕様: CRC が合わなければ解釈せずに .backup（1世代前）から読む
+        """
+        self.manager.save(FlowerStats(weed_count=1).to_dict())
+        self.manager.save(FlowerStats(weed_count=2).to_dict())
+        raw = bytearray(self.save_path.read_bytes())
+        raw[-1] ^= 0xFF
+        self.save_path.write_bytes(bytes(raw))
+        with self.assertRaises(save_format.SaveFormatError):
+            save_format.decode(bytes(raw))
+        self.assertEqual(self.manager.load()["weed_count"], 1)
+
+    def test_migration_runs_on_binary(self):
+        """
+        仕様: バイナリのセーブもデータバージョンが違えば _migrate_data を通す
+        """
+        raw = save_format.encode(
+            {"version": "0.9.0", "timestamp": "2024-01-01T00:00:00", "data": self.stats.to_dict()}
+        )
+        self.save_path.write_bytes(raw)
+        with patch.object(
+            SaveManager, "_migrate_data", autospec=True, side_effect=lambda self, d, v: d
+        ) as migrate:
+            self.manager.load()
+        self.assertEqual(migrate.call_args[0][2], "0.9.0")
+
+    def test_long_entropy_and_version1(self):
+        """
+        仕様: 255バイトを超えるエントロピーも保存でき、形式バージョン1のセーブも読める
+        """
+        data = self.stats.to_dict()
+        data["rng_streams"]["entropy"] = 1 << 2400
+        save_data = {"version": "1.0.0", "timestamp": "2024-01-01T00:00:00", "data": data}
+        self.assertEqual(save_format.decode(save_format.encode(save_data))["data"], data)
+
+        with patch.object(save_format, "FORMAT_VERSION", 1):
+            old = save_format.encode({**save_data, "data": self.stats.to_dict()})
+            with self.assertRaises(save_format.SaveFormatError):
+                save_format.encode(save_data)
+        self.assertEqual(save_format.decode(old)["data"], self.stats.to_dict())
+
+    def test_export_and_import_json(self):
+        """
+        仕様: デバッグ用に JSON へ書き出し、JSON から読み込んでバイナリのセーブにできる
+        テスト: 以前の state.json は新しいセーブが無い時に読む
+        """
+        self.manager.save(self.stats.to_dict())
+        exported = Path(self._tmp.name) / "export.json"
+        self.assertTrue(self.manager.export_json(str(exported)))
+        with open(exported, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["data"]["weed_count"], 3)
+
+        other = SaveManager(str(Path(self._tmp.name) / "other.sav"))
+        self.assertTrue(other.import_json(str(exported)))
+        self.assertTrue(save_format.is_binary(other.save_path.read_bytes()))
+        self.assertEqual(other.load(), self.manager.load())
+
+        legacy = SaveManager(str(Path(self._tmp.name) / "export.sav"))
+        self.assertEqual(legacy.load()["weed_count"], 3)
+        self.assertFalse(other.import_json(str(Path(self._tmp.name) / "missing.json")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+自動セーブのスケジューラのテスト
+
+仕様書参照:
+- src/game/core/save_scheduler.py: 間隔・大きな変化・終了時・古さの上限
+- config.py - DataConfig.auto_save_interval / save_max_staleness
+"""
+
+import unittest
+from unittest.mock import Mock
+
+from src.game.core.game_engine import GameEngine
+from src.game.core.input_handler import InputAction
+from src.game.core.save_scheduler import SaveScheduler
+from src.game.core.screen_state import ScreenState
+from src.game.data.config import config
+from src.game.entities.flower import Flower, GrowthStage, SeedType
+
+
+class _Clock:
+    """手で進める時計"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSaveScheduler(unittest.TestCase):
+    """SaveScheduler のテストクラス"""
+
+    def setUp(self):
+        self._saved_async = config.data.async_save
+        config.data.async_save = False
+        self.save_manager = Mock()
+        self.save_manager.load.return_value = None
+        self.save_manager.save.return_value = True
+        self.flower = Flower(self.save_manager)
+        self.clock = _Clock()
+        self.scheduler = SaveScheduler(
+            self.flower, interval=10.0, max_staleness=60.0, clock=self.clock
+        )
+
+    def tearDown(self):
+        config.data.async_save = self._saved_async
+
+    def test_interval_skips_unchanged_state(self):
+        """
+        仕様: 間隔ごとにセーブし、前回から変わっていなければ書かない
+        """
+        self.assertTrue(self.scheduler.update(10.0))
+        self.assertFalse(self.scheduler.update(10.0))
+        self.flower.stats.water_level -= 1.0
+        self.assertFalse(self.scheduler.update(5.0))
+        self.assertTrue(self.scheduler.update(5.0))
+        self.assertEqual(self.scheduler.counters, {"written": 2, "skipped": 1, "failed": 0})
+        self.assertEqual(self.save_manager.save.call_count, 2)
+        self.assertEqual(self.scheduler.last_reason, "interval")
+
+    def test_significant_change_saves_next_update(self):
+        """
+        仕様: 成長段階・種が変わったら次の update ですぐセーブし、間隔のタイマーを戻す
+        """
+        self.flower.select_seed(SeedType.YIN)
+        self.assertTrue(self.scheduler.update(0.0))
+        self.assertEqual(self.scheduler.last_reason, "seed")
+        self.scheduler.update(9.0)
+        self.flower.stats.growth_stage = GrowthStage.SPROUT
+        self.flower.tracker.commit()
+        self.assertTrue(self.scheduler.update(0.0))
+        self.assertEqual(self.scheduler.last_reason, "growth")
+        self.flower.stats.water_level -= 1.0
+        self.assertFalse(self.scheduler.update(9.0))
+        self.assertEqual(self.save_manager.save.call_count, 2)
+
+    def test_max_staleness(self):
+        """
+        仕様: 間隔のタイマーが進まなくても、実時間で古さの上限を超えたらセーブする
+        """
+        self.scheduler.request("quit")
+        self.flower.stats.water_level -= 1.0
+        self.clock.now = 59.0
+        self.assertFalse(self.scheduler.update(0.0))
+        self.clock.now = 60.0
+        self.assertTrue(self.scheduler.update(0.0))
+        self.assertEqual(self.scheduler.last_reason, "staleness")
+
+    def test_can_save_blocks(self):
+        """
+        テスト: can_save が False の間は書かず、スキップとしても数えない
+        """
+        self.scheduler.can_save = lambda: False
+        self.assertFalse(self.scheduler.request("quit"))
+        self.assertEqual(self.scheduler.counters, {"written": 0, "skipped": 0, "failed": 0})
+
+
+class TestEngineAutoSave(unittest.TestCase):
+    """GameEngine の自動セーブのテストクラス"""
+
+    def test_one_save_per_interval(self):
+        """
+        仕様: 自動セーブはエンジンのスケジューラだけが行い、1間隔に1回だけ書く
+        """
+        engine = GameEngine(headless=True)
+        engine.flower.save = Mock(return_value=True)
+        engine.flower.has_unsaved_changes = Mock(return_value=True)
+        engine.initialize()
+        engine.seed_selection_mode = False
+        engine.screen_state = ScreenState.MAIN
+        ticks = int(3 * config.data.auto_save_interval / config.game.sim_tick) + 1
+        engine.run_headless(ticks)
+        self.assertEqual(engine.flower.save.call_count, 3)
+        engine.quit()
+        self.assertEqual(engine.save_scheduler.last_reason, "quit")
+
+    def test_leaving_run_loop_saves_on_quit(self):
+        """
+        仕様: 終了時のセーブは ESC やウィンドウを閉じて run() を抜けた時にも行う
+        テスト: quit() を直接呼ばず、ゲームループの終了経路だけで "quit" のセーブが書かれる
+        """
+        engine = GameEngine(headless=True)
+        engine.flower.save = Mock(return_value=True)
+        engine.flower.has_unsaved_changes = Mock(return_value=True)
+        engine.initialize()
+        engine.seed_selection_mode = False
+        engine.screen_state = ScreenState.MAIN
+        engine.input_handler.queue_action(InputAction.QUIT)
+        engine.run()
+        self.assertEqual(engine.save_scheduler.last_reason, "quit")
+        self.assertEqual(engine.save_scheduler.counters["written"], 1)
+        engine.flower.save.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
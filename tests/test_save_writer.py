@@ -0,0 +1,167 @@
+"""
+バックグラウンドのセーブ書き込みのテスト
+
+仕様書参照:
+- src/game/data/save_writer.py: 1枠・最新優先の待ち行列、flush / close、統計
+- config.py - DataConfig.async_save
+"""
+
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
+from src.game.core.game_engine import GameEngine
+from src.game.core.input_handler import InputAction
+from src.game.data.config import config
+from src.game.data.save_manager import SaveManager
+from src.game.data.save_writer import AsyncSaveWriter
+from src.game.entities.flower import Flower
+
+
+class _BlockingSave:
+    """release されるまで書き込みを止めるセーブ関数"""
+
+    def __init__(self, delay: float = 0.0):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.written = []
+        self.delay = delay
+
+    def __call__(self, data) -> bool:
+        self.started.set()
+        self.release.wait(5.0)
+        time.sleep(self.delay)
+        self.written.append(data)
+        return True
+
+
+class TestAsyncSaveWriter(unittest.TestCase):
+    """AsyncSaveWriter のテストクラス"""
+
+    def test_latest_snapshot_wins(self):
+        """
+        仕様: 書き込み中に来たスナップショットは1枠で待ち、新しい方で上書きされる
+        """
+        save = _BlockingSave()
+        writer = AsyncSaveWriter(save)
+        writer.submit({"n": 1})
+        self.assertTrue(save.started.wait(5.0))
+        writer.submit({"n": 2})
+        writer.submit({"n": 3})
+        self.assertTrue(writer.busy)
+        save.release.set()
+        self.assertTrue(writer.flush(5.0))
+        self.assertEqual(save.written, [{"n": 1}, {"n": 3}])
+        metrics = writer.metrics
+        self.assertEqual((metrics.submitted, metrics.written, metrics.coalesced), (3, 2, 1))
+        self.assertTrue(writer.close(5.0))
+
+    def test_submit_does_not_wait_for_write(self):
+        """
+        仕様: submit は書き込みを待たずに戻る。統計に待ち時間と書き込み時間が残る
+        """
+        save = _BlockingSave(delay=0.05)
+        writer = AsyncSaveWriter(save)
+        writer.submit({"n": 1})
+        # 書き込みは release まで止まっているので、戻った時点ではまだ書かれていない
+        self.assertTrue(save.started.wait(5.0))
+        self.assertEqual(save.written, [])
+        self.assertTrue(writer.busy)
+        save.release.set()
+        writer.close(5.0)
+        metrics = writer.metrics
+        self.assertGreaterEqual(metrics.last_write_duration, 0.05)
+        self.assertGreaterEqual(metrics.max_queue_latency, 0.0)
+        self.assertEqual(save.written, [{"n": 1}])
+        with self.assertRaises(RuntimeError):
+            writer.submit({"n": 2})
+
+    def test_failure_is_reported(self):
+        """
+        テスト: 書き込みの例外は失敗として数え、コールバックに False を渡す
+        """
+        writer = AsyncSaveWriter(Mock(side_effect=OSError("disk full")))
+        results = []
+        writer.submit({"n": 1}, results.append)
+        writer.flush(5.0)
+        self.assertEqual(results, [False])
+        self.assertEqual(writer.metrics.failed, 1)
+        writer.close(5.0)
+
+
+class TestFlowerBackgroundSave(unittest.TestCase):
+    """Flower / GameEngine からのバックグラウンドセーブのテストクラス"""
+
+    def setUp(self):
+        self._saved_async = config.data.async_save
+        config.data.async_save = True
+        self._tmp = tempfile.TemporaryDirectory()
+        self.save_path = Path(self._tmp.name) / "state.json"
+
+    def tearDown(self):
+        config.data.async_save = self._saved_async
+        self._tmp.cleanup()
+
+    def test_failed_background_save_is_retried(self):
+        """
+        仕様: バックグラウンドの書き込みに失敗したら、次の save で書き直す
+        """
+        save_manager = Mock()
+        save_manager.load.return_value = None
+        save_manager.save.return_value = False
+        flower = Flower(save_manager)
+        self.assertTrue(flower.save())
+        self.assertTrue(flower.flush_saves(5.0))
+        save_manager.save.return_value = True
+        flower.save()
+        flower.close()
+        self.assertEqual(save_manager.save.call_count, 2)
+
+    def test_quit_flushes_pending_save(self):
+        """
+        仕様: GameEngine.quit は書き込み待ちのセーブを書き終えてから終了する
+        """
+        engine = GameEngine(headless=True)
+        engine.flower.save_manager = SaveManager(str(self.save_path))
+        engine.initialize()
+        engine.seed_selection_mode = False
+        engine.flower.stats.weed_count = 2
+        engine.quit()
+        self.assertIsNone(engine.flower.save_writer)
+        self.assertEqual(SaveManager(str(self.save_path)).load()["weed_count"], 2)
+
+    def test_leaving_run_loop_flushes_pending_save(self):
+        """
+        仕様: ESC やウィンドウを閉じて run() を抜けたら quit で書き込み待ちのセーブを書き終える
+        """
+        engine = GameEngine(headless=True)
+        engine.flower.save_manager = SaveManager(str(self.save_path))
+        engine.initialize()
+        engine.seed_selection_mode = False
+        engine.flower.stats.weed_count = 2
+        engine.input_handler.queue_action(InputAction.QUIT)
+        engine.run()
+        self.assertFalse(engine.running)
+        self.assertIsNone(engine.flower.save_writer)
+        self.assertEqual(SaveManager(str(self.save_path)).load()["weed_count"], 2)
+        # main の後始末でもう一度呼ばれても何もしない
+        engine.flower.save = Mock()
+        engine.quit()
+        engine.flower.save.assert_not_called()
+
+    def test_reset_discards_pending_save(self):
+        """
+        テスト: リセット後に古いセーブが書かれてセーブファイルが復活しない
+        """
+        flower = Flower(SaveManager(str(self.save_path)))
+        flower.save()
+        flower.reset()
+        flower.close()
+        self.assertFalse(self.save_path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
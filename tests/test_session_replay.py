@@ -0,0 +1,227 @@
+"""
+入力セッションの記録と再生のテスト
+
+仕様書参照:
+- src/main.py --record FILE / --replay FILE --headless
+- src/game/core/session_recorder.py: 記録ファイル形式
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
+import src.main as game_main
+
+from src.game.core.game_engine import GameEngine
+from src.game.core.input_handler import InputAction, parse_input_script
+from src.game.core.screen_state import ScreenState
+from src.game.core.session_recorder import SessionRecorder, SessionReplayer
+from src.game.data.config import config
+from src.game.data.save_manager import SaveManager
+from src.game.entities.flower import FlowerStats, GrowthStage
+
+# 新規開始 → 陰の種 → 時間設定を決定 → 水やり → 肥料（自動でメインへ戻る）
+START_SCRIPT = """
+0 NAV_CONFIRM
+1 NAV_CONFIRM
+2 NAV_RIGHT
+2 NAV_RIGHT
+3 NAV_CONFIRM
+50 NAV_RIGHT
+51 NAV_CONFIRM
+52 NAV_CONFIRM
+53 NAV_RIGHT
+53 NAV_RIGHT
+54 NAV_CONFIRM
+80 FERTILIZER
+"""
+
+
+class TestSessionReplay(unittest.TestCase):
+    """SessionRecorder / SessionReplayer のテストクラス"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "session.rec")
+        self._saved = (
+            config.data.random_seed,
+            config.data.offline_catch_up,
+            config.game.sim_tick,
+            config.game.weed_growth_chance,
+            config.game.queued_input_events,
+        )
+        config.data.random_seed = 1234
+
+    def tearDown(self):
+        (
+            config.data.random_seed,
+            config.data.offline_catch_up,
+            config.game.sim_tick,
+            config.game.weed_growth_chance,
+            config.game.queued_input_events,
+        ) = self._saved
+        self._tmp.cleanup()
+
+    def _make_engine(self) -> GameEngine:
+        engine = GameEngine(headless=True)
+        engine.flower.save = Mock(return_value=True)
+        engine.initialize()
+        return engine
+
+    def _replay(self):
+        engine = self._make_engine()
+        return engine, SessionReplayer.load(self.path).run(engine)
+
+    def test_scripted_session_replays_identically(self):
+        """
+        仕様: 同じ入力列からは同じ FlowerStats と画面遷移になる
+        テスト: 記録した実行を再生すると終了状態と画面遷移の履歴が一致
+        """
+        engine = self._make_engine()
+        recorder = SessionRecorder.open(engine, self.path)
+        engine.run_headless(3000, parse_input_script(START_SCRIPT))
+        recorder.close()
+        self.assertEqual(engine.screen_state, ScreenState.MAIN)
+
+        replayed, result = self._replay()
+        self.assertTrue(result.matched)
+        self.assertEqual(result.ticks, engine.tick_count)
+        self.assertEqual(replayed.flower.stats, engine.flower.stats)
+        self.assertIn((80, "MODE_WATER"), result.screens)
+        self.assertEqual(result.screens[-1][1], "MAIN")
+
+    def test_queued_input_replays_identically(self):
+        """
+        仕様: 入力キューモードの記録もキューモードで再生し、同じ結果になる
+        テスト: 今の設定が即時配信でも、記録時の設定で再生すれば一致
+        """
+        config.game.queued_input_events = True
+        engine = self._make_engine()
+        recorder = SessionRecorder.open(engine, self.path)
+        engine.run_headless(3000, parse_input_script(START_SCRIPT))
+        recorder.close()
+        self.assertEqual(engine.screen_state, ScreenState.MAIN)
+
+        for queued in (True, False):
+            config.game.queued_input_events = queued
+            replayed, result = self._replay()
+            self.assertTrue(result.matched)
+            self.assertEqual(replayed.flower.stats, engine.flower.stats)
+            self.assertEqual(result.screens[-1][1], "MAIN")
+        self.assertFalse(config.game.queued_input_events)
+
+    def test_fast_forward_is_recorded(self):
+        """
+        仕様: 早送りで閉形式に回した分も記録され、再生で同じ結果になる
+        """
+        engine = self._make_engine()
+        recorder = SessionRecorder.open(engine, self.path)
+        engine.run_headless(10, parse_input_script(START_SCRIPT))
+        engine.time_scale = 1000.0
+        for _ in range(200):
+            engine.step_frame(1 / 30)
+        recorder.close()
+
+        with open(self.path, encoding="utf-8") as f:
+            kinds = [json.loads(line)["type"] for line in f]
+        self.assertIn("advance", kinds)
+
+        _, result = self._replay()
+        self.assertTrue(result.matched)
+        # 早送り中に水切れで枯れるところまで再現される
+        self.assertEqual(result.screens[-1][1], "DEATH")
+
+    def test_load_uses_recorded_result(self):
+        """
+        仕様: セーブデータからの開始は記録したロード結果で再現する
+        テスト: 再生側にセーブファイルがなくても同じ状態になる
+        """
+        save_manager = SaveManager(os.path.join(self._tmp.name, "state.json"))
+        save_manager.save(
+            FlowerStats(growth_stage=GrowthStage.STEM, age_seconds=5000.0).to_dict()
+        )
+        engine = self._make_engine()
+        engine.flower.save_manager = save_manager
+        recorder = SessionRecorder.open(engine, self.path)
+        engine.run_headless(
+            500, [(0, InputAction.NAV_RIGHT), (0, InputAction.NAV_CONFIRM)]
+        )
+        recorder.close()
+        self.assertEqual(engine.screen_state, ScreenState.MAIN)
+
+        replayed, result = self._replay()
+        self.assertTrue(result.matched)
+        self.assertEqual(replayed.flower.stats.growth_stage, GrowthStage.STEM)
+
+    def test_mismatch_is_detected(self):
+        """
+        テスト: 記録時の終了状態と異なれば不一致になる
+        """
+        engine = self._make_engine()
+        recorder = SessionRecorder.open(engine, self.path)
+        engine.run_headless(200, parse_input_script(START_SCRIPT))
+        recorder.close()
+
+        with open(self.path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        records[-1]["stats"]["water_level"] = 99.0
+        result = SessionReplayer(records).run(self._make_engine())
+        self.assertFalse(result.stats_match)
+        self.assertTrue(result.screens_match)
+        self.assertFalse(result.matched)
+
+    def test_recorded_settings_apply_only_during_replay(self):
+        """
+        仕様: 記録時のシミュレーション設定で再生し、今の設定と違えば警告する
+        テスト: 再生後は config が再生前の値に戻る
+        """
+        config.game.weed_growth_chance = 0.05
+        engine = self._make_engine()
+        recorder = SessionRecorder.open(engine, self.path)
+        engine.run_headless(3000, parse_input_script(START_SCRIPT))
+        recorder.close()
+        self.assertGreater(engine.flower.stats.weed_count, 0)
+
+        config.game.weed_growth_chance = 0.0
+        config.data.offline_catch_up = True
+        with self.assertLogs("src.game.core.session_recorder", "WARNING") as logs:
+            _, result = self._replay()
+        self.assertTrue(result.matched)
+        self.assertIn("weed_growth_chance=0.05 (now 0.0)", logs.output[0])
+        self.assertEqual(config.game.weed_growth_chance, 0.0)
+        self.assertTrue(config.data.offline_catch_up)
+
+    def test_cli_replay_leaves_player_save_alone(self):
+        """
+        仕様: --replay はプレイヤーのセーブを読まない（壊れたセーブも退避しない）
+        """
+        engine = self._make_engine()
+        recorder = SessionRecorder.open(engine, self.path)
+        engine.run_headless(200, parse_input_script(START_SCRIPT))
+        recorder.close()
+
+        save_path = Path(self._tmp.name) / "state.sav"
+        save_path.write_bytes(b"not a save")
+        saved_path = config.data.save_path
+        config.data.save_path = str(save_path)
+        try:
+            self.assertEqual(game_main.run_replay(self.path), 0)
+            self.assertEqual(config.data.save_path, str(save_path))
+        finally:
+            config.data.save_path = saved_path
+        self.assertEqual(save_path.read_bytes(), b"not a save")
+        self.assertEqual(sorted(os.listdir(self._tmp.name)), ["session.rec", "state.sav"])
+
+    def test_rejects_file_without_header(self):
+        """
+        テスト: ヘッダーのない記録はエラー
+        """
+        with self.assertRaises(ValueError):
+            SessionReplayer([{"type": "action", "tick": 0, "action": "QUIT"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+"""
+FlowerStats のフィールド単位の変更追跡のテスト
+
+仕様書参照:
+- src/game/entities/stats_tracker.py: 版番号・グループ・まとめた通知
+- src/game/entities/flower.py: STATS_KEYS / STATS_GROUPS、Flower.save
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+
+from src.game.core.game_engine import GameEngine
+from src.game.core.screen_state import ScreenState
+from src.game.data.config import config
+from src.game.entities.flower import (
+    STATS_GROUPS,
+    STATS_KEYS,
+    Flower,
+    FlowerStats,
+    GrowthStage,
+)
+from src.game.entities.stats_tracker import StatsTracker
+
+
+class TestStatsTracker(unittest.TestCase):
+    """StatsTracker のテストクラス"""
+
+    def setUp(self):
+        self.stats = FlowerStats()
+        self.tracker = StatsTracker(self.stats, STATS_KEYS, STATS_GROUPS)
+
+    def test_versions_per_field_and_group(self):
+        """
+        仕様: commit で変わったキーとそのグループの版だけが進む
+        テスト: 表示の刻みに満たない水分の変化は visible を進めない
+        """
+        self.stats.water_level += 0.1
+        self.assertEqual(self.tracker.commit(), frozenset({"water_level"}))
+        self.assertEqual(self.tracker.version_of("water_level"), 1)
+        self.assertEqual(self.tracker.group_version("persisted"), 1)
+        self.assertEqual(self.tracker.group_version("visible"), 0)
+
+        self.stats.weed_count += 1
+        self.tracker.commit()
+        self.assertEqual(self.tracker.group_version("visible"), 1)
+        self.assertEqual(self.tracker.commit(), frozenset())
+        self.assertEqual(self.tracker.version, 2)
+
+    def test_subscribers_keyed_by_field(self):
+        """
+        仕様: 購読したキーが変わった時だけ、変わったキーの集合で呼ばれる
+        """
+        callback = Mock()
+        self.tracker.subscribe(("weed_count", "pest_count"), callback)
+        self.stats.water_level = 10.0
+        self.tracker.commit()
+        callback.assert_not_called()
+        self.stats.weed_count = 2
+        self.stats.pest_count = 1
+        self.tracker.commit()
+        callback.assert_called_once_with(frozenset({"weed_count", "pest_count"}))
+        with self.assertRaises(KeyError):
+            self.tracker.subscribe(("no_such_field",), callback)
+
+    def test_transaction_batches_notifications(self):
+        """
+        仕様: transaction 内の変更は抜けた時の1回の通知にまとまる
+        """
+        callback = Mock()
+        self.tracker.subscribe(("weed_count",), callback)
+        with self.tracker.transaction():
+            for _ in range(3):
+                self.stats.weed_count += 1
+                self.tracker.commit()
+            callback.assert_not_called()
+        callback.assert_called_once_with(frozenset({"weed_count"}))
+        self.assertEqual(self.tracker.version_of("weed_count"), 1)
+
+
+class TestFlowerDirtySave(unittest.TestCase):
+    """Flower.save の変更判定のテストクラス"""
+
+    def setUp(self):
+        # 書き込みの回数をその場で数えるため同期セーブにする
+        self._saved_async = config.data.async_save
+        config.data.async_save = False
+        self.save_manager = Mock()
+        self.save_manager.load.return_value = None
+        self.save_manager.save.return_value = True
+        self.flower = Flower(self.save_manager)
+
+    def tearDown(self):
+        config.data.async_save = self._saved_async
+
+    def test_save_skipped_when_unchanged(self):
+        """
+        仕様: セーブ内容が前回のセーブから変わっていなければ書かない
+        テスト: force=True なら変わっていなくても書く
+        """
+        self.assertTrue(self.flower.save())
+        self.assertTrue(self.flower.save())
+        self.assertEqual(self.save_manager.save.call_count, 1)
+
+        self.flower.stats.water_level -= 1.0
+        self.assertTrue(self.flower.save())
+        self.assertEqual(self.save_manager.save.call_count, 2)
+
+        self.assertTrue(self.flower.save(force=True))
+        self.assertEqual(self.save_manager.save.call_count, 3)
+
+    def test_failed_save_is_retried(self):
+        """
+        テスト: 書き込みに失敗したら次の save で書き直す
+        """
+        self.save_manager.save.return_value = False
+        self.assertFalse(self.flower.save())
+        self.save_manager.save.return_value = True
+        self.assertTrue(self.flower.save())
+        self.assertEqual(self.save_manager.save.call_count, 2)
+
+    def test_replaced_stats_are_tracked(self):
+        """
+        仕様: stats を差し替えると新しい状態を追跡し、成長段階の変化を通知する
+        """
+        self.flower.save()
+        with patch("builtins.print") as mock_print:
+            self.flower.stats = FlowerStats(growth_stage=GrowthStage.SPROUT)
+        self.assertIn("花が成長しました", mock_print.call_args[0][0])
+        self.assertTrue(self.flower.save())
+        self.assertEqual(self.save_manager.save.call_count, 2)
+
+
+class TestRenderInvalidation(unittest.TestCase):
+    """表示に関わる変更がない時の描画省略のテストクラス"""
+
+    def setUp(self):
+        with patch("pygame.init"), patch("pygame.font.init"), patch(
+            "src.game.ui.display.DisplayManager.initialize"
+        ):
+            self.engine = GameEngine()
+        self.engine.flower.save = Mock(return_value=True)
+        self.engine.render_manager = Mock()
+        self.engine.render_manager.is_animated.return_value = False
+        self.engine.display_manager = Mock()
+        self.engine.screen_state = ScreenState.SETTINGS
+
+    def test_static_screen_renders_once(self):
+        """
+        仕様: 表示に関わる値が変わらなければ描き直さない
+        テスト: カーソル移動で描き直し、アニメーション中は毎回描く
+        """
+        self.engine.render()
+        self.engine.render()
+        self.assertEqual(self.engine.render_manager.render.call_count, 1)
+
+        self.engine.get_current_cursor().move_next()
+        self.engine.render()
+        self.assertEqual(self.engine.render_manager.render.call_count, 2)
+
+        self.engine.render_manager.is_animated.return_value = True
+        self.engine.render()
+        self.engine.render()
+        self.assertEqual(self.engine.render_manager.render.call_count, 4)
+
+    def test_visible_field_change_redraws(self):
+        """
+        テスト: 表示される値（雑草の数）が変わると描き直し、表示されない値では描き直さない
+        """
+        self.engine.screen_state = ScreenState.MAIN
+        self.engine.render()
+        self.engine.flower.stats.environment_level += 5.0
+        self.engine.flower.tracker.commit()
+        self.engine.render()
+        self.assertEqual(self.engine.render_manager.render.call_count, 1)
+        self.engine.flower.stats.weed_count += 1
+        self.engine.flower.tracker.commit()
+        self.engine.render()
+        self.assertEqual(self.engine.render_manager.render.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()